@@ -0,0 +1,22 @@
+import asyncio
+
+from daytona_sdk import AsyncDaytona
+
+
+async def run(daytona: AsyncDaytona, index: int):
+    sandbox = await daytona.create()
+    try:
+        await sandbox.fs.upload_file(f"print('Hello from sandbox {index}')".encode(), "main.py")
+        response = await sandbox.process.exec("python main.py")
+        print(response.result.strip())
+    finally:
+        await daytona.delete(sandbox)
+
+
+async def main():
+    async with AsyncDaytona() as daytona:
+        await asyncio.gather(*(run(daytona, i) for i in range(5)))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,23 +1,34 @@
 from daytona_api_client import WorkspaceState as SandboxState
 
+from ._async.daytona import AsyncDaytona
+from ._async.sandbox import AsyncSandbox
+
 # Create deprecated aliases with proper warnings
 from ._utils.deprecation import deprecated_alias
+from ._utils.metadata_cache import MetadataCacheStats
 from .charts import BarChart, BoxAndWhiskerChart, Chart, ChartType, CompositeChart, LineChart, PieChart, ScatterChart
 from .common.code_run_params import CodeRunParams
+from .common.compression import Compression
+from .common.filesystem import FileDownload, FileDownloadResult, FileUpload, SyncResult, UploadProgress, WalkEntry
 from .daytona import (
     CodeLanguage,
+    CreateManyResult,
     CreateSandboxParams,
     Daytona,
     DaytonaConfig,
     DaytonaError,
+    SandboxCreationFailure,
     SandboxResources,
     SessionExecuteResponse,
     VolumeMount,
 )
-from .filesystem import FileUpload
+from .instrumentation import InstrumentationHook, LatencyHistogram, LatencySummary, OpenTelemetryHook, OperationEvent
 from .lsp_server import LspLanguageId
+from .pool import SandboxPool, SandboxPoolMetrics, SandboxReturnPolicy
 from .process import SessionExecuteRequest
+from .rate_limit import RateLimit, RateLimitConfig
 from .sandbox import Sandbox, SandboxState, SandboxTargetRegion
+from .transport import RetryConfig, TransportConfig
 
 CreateWorkspaceParams = deprecated_alias("CreateWorkspaceParams", "CreateSandboxParams")(CreateSandboxParams)
 Workspace = deprecated_alias("Workspace", "Sandbox")(Sandbox)
@@ -27,7 +38,17 @@ WorkspaceState = deprecated_alias("WorkspaceState", "SandboxState")(SandboxState
 
 __all__ = [
     "Daytona",
+    "AsyncDaytona",
     "DaytonaConfig",
+    "TransportConfig",
+    "RetryConfig",
+    "RateLimit",
+    "RateLimitConfig",
+    "InstrumentationHook",
+    "OperationEvent",
+    "LatencyHistogram",
+    "LatencySummary",
+    "OpenTelemetryHook",
     "CodeLanguage",
     "SessionExecuteRequest",
     "SessionExecuteResponse",
@@ -36,7 +57,13 @@ __all__ = [
     "WorkspaceTargetRegion",
     "CodeRunParams",
     "CreateSandboxParams",
+    "CreateManyResult",
+    "SandboxCreationFailure",
     "Sandbox",
+    "AsyncSandbox",
+    "SandboxPool",
+    "SandboxPoolMetrics",
+    "SandboxReturnPolicy",
     "SandboxTargetRegion",
     "SandboxResources",
     "SandboxState",
@@ -53,6 +80,13 @@ __all__ = [
     "PieChart",
     "BoxAndWhiskerChart",
     "CompositeChart",
+    "Compression",
+    "FileDownload",
+    "FileDownloadResult",
     "FileUpload",
+    "SyncResult",
+    "UploadProgress",
+    "WalkEntry",
+    "MetadataCacheStats",
     "VolumeMount",
 ]
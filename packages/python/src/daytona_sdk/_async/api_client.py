@@ -0,0 +1,113 @@
+import inspect
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+from daytona_api_client import ApiClient
+
+from ..transport import HttpTransport, HttpxRESTResponse, RequestTimeout, get_transport, request_content
+
+
+class AsyncApiClient:
+    """Sends requests over an `httpx.AsyncClient`.
+
+    Requests are built and responses are deserialized by the generated (synchronous) API client, so the
+    async SDK supports exactly the same operations and models as the sync one, without blocking the event loop.
+
+    Attributes:
+        api_client (ApiClient): Generated API client used for request serialization and response deserialization.
+        transport (HttpTransport): Transport whose connection pool is used for the requests.
+    """
+
+    def __init__(self, api_client: ApiClient, http_client: Optional[httpx.AsyncClient] = None):
+        """Initializes a new AsyncApiClient instance.
+
+        Args:
+            api_client (ApiClient): Generated API client holding the host and the default headers.
+            http_client (Optional[httpx.AsyncClient]): HTTP client to send the requests with. If not provided,
+                the client of the API client transport for the running event loop is used.
+        """
+        self.api_client = api_client
+        self.transport: HttpTransport = get_transport(api_client)
+        self._http_client = http_client
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """HTTP client used to send the requests."""
+        return self._http_client or self.transport.async_client()
+
+    @http_client.setter
+    def http_client(self, http_client: httpx.AsyncClient) -> None:
+        self._http_client = http_client
+
+    def serialize(self, api: Any, operation: str, **params: Any) -> Tuple[str, str, Dict[str, str], Any, Any]:
+        """Serializes an operation of a generated API group into an HTTP request.
+
+        Args:
+            api (Any): Generated API group, e.g. `ToolboxApi` or `WorkspaceApi`.
+            operation (str): Name of the operation, e.g. `list_files`.
+            **params: Operation parameters. Optional parameters that are not provided are set to None.
+
+        Returns:
+            Tuple[str, str, Dict[str, str], Any, Any]: Method, URL, headers, body and post params.
+        """
+        serialize = getattr(api, f"_{operation}_serialize")
+        for name in inspect.signature(serialize).parameters:
+            params.setdefault(name, 0 if name == "_host_index" else None)
+        return serialize(**params)
+
+    async def call(
+        self,
+        api: Any,
+        operation: str,
+        response_type: Optional[str] = None,
+        _request_timeout: RequestTimeout = None,
+        **params: Any,
+    ) -> Any:
+        """Calls an operation of a generated API group.
+
+        Args:
+            api (Any): Generated API group, e.g. `ToolboxApi` or `WorkspaceApi`.
+            operation (str): Name of the operation, e.g. `list_files`.
+            response_type (Optional[str]): Response model as declared by the generated client,
+                e.g. `"List[FileInfo]"`. None if the operation has no response body.
+            _request_timeout (RequestTimeout): Timeout for the request in seconds, or a
+                (connect, read) tuple. None means no timeout. A single timeout is capped by the
+                time left to the deadline of the enclosing timed operation.
+            **params: Operation parameters.
+
+        Returns:
+            Any: The deserialized response.
+
+        Raises:
+            ApiException: If the API responds with a non-2xx status code.
+        """
+        method, url, headers, body, post_params = self.serialize(api, operation, **params)
+
+        response = await self.http_client.request(
+            method,
+            url,
+            timeout=self.transport.timeout(_request_timeout),
+            **request_content(headers, body, post_params),
+        )
+
+        return self.api_client.response_deserialize(
+            response_data=HttpxRESTResponse(response),
+            response_types_map={"2XX": response_type},
+        ).data
+
+    def timeout(self, timeout: RequestTimeout) -> httpx.Timeout:
+        """Converts a request timeout of the generated client to an `httpx.Timeout`.
+
+        Args:
+            timeout (RequestTimeout): Timeout in seconds, a (connect, read) tuple or None for no timeout.
+
+        Returns:
+            httpx.Timeout: The equivalent httpx timeout, capped by the deadline of the enclosing timed operation.
+        """
+        return self.transport.timeout(timeout)
+
+    async def aclose(self) -> None:
+        """Closes the HTTP connections of the running event loop."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+        await self.transport.aclose()
@@ -0,0 +1,489 @@
+import asyncio
+import json
+import time
+from typing import Dict, List, Optional
+
+from daytona_api_client import ToolboxApi, VolumesApi
+from daytona_api_client import WorkspaceApi as SandboxApi
+
+from .._utils.errors import intercept_errors
+from .._utils.root_dir_cache import RootDirCache
+from .._utils.root_dir_cache import prefetch_root_dirs_async as _prefetch_root_dirs
+from .._utils.timeout import time_left, with_timeout
+from ..code_toolbox.sandbox_python_code_toolbox import SandboxPythonCodeToolbox
+from ..common.errors import DaytonaError
+from ..daytona import (
+    CodeLanguage,
+    CreateManyResult,
+    CreateSandboxParams,
+    DaytonaConfig,
+    SandboxCreationFailure,
+    _create_api_client,
+    _get_code_toolbox,
+    _load_config,
+    _to_create_request,
+    _validate_language_label,
+    _with_default_language,
+)
+from ..instrumentation import InstrumentationHook
+from ..sandbox import Sandbox
+from .api_client import AsyncApiClient
+from .sandbox import AsyncSandbox
+from .state_watcher import AsyncSandboxStateWatcher
+from .volume import AsyncVolumeService
+
+
+class AsyncDaytona:
+    """Main class for interacting with the Daytona API from asyncio code.
+
+    This class is the asyncio counterpart of `Daytona`. All requests are sent over a single
+    `httpx.AsyncClient`, so many Sandbox operations can run concurrently on one event loop
+    without a thread per in-flight request.
+
+    Attributes:
+        api_key (str): API key for authentication.
+        api_url (str): URL of the Daytona API.
+        target (str): Default target location for Sandboxes.
+        volume (AsyncVolumeService): Service for managing volumes.
+
+    Example:
+        ```python
+        async with AsyncDaytona() as daytona:
+            sandbox = await daytona.create()
+            response = await sandbox.process.exec("echo 'Hello'")
+            print(response.result)
+            await daytona.delete(sandbox)
+        ```
+    """
+
+    def __init__(self, config: Optional[DaytonaConfig] = None):
+        """Initializes AsyncDaytona instance with optional configuration.
+
+        Configuration is resolved in the same way as for `Daytona`: values that are not set
+        are read from the `DAYTONA_*` environment variables.
+
+        Args:
+            config (Optional[DaytonaConfig]): Object containing api_key, api_url, and target.
+
+        Raises:
+            DaytonaError: If API key is not provided either through config or environment variables
+        """
+        self.default_language = CodeLanguage.PYTHON
+
+        config = _load_config(config)
+        self.api_key = config.api_key
+        self.jwt_token = config.jwt_token
+        self.organization_id = config.organization_id
+        self.api_url = config.api_url
+        self.target = config.target
+
+        api_client = _create_api_client(config)
+        self._api = AsyncApiClient(api_client)
+
+        # API groups are only used to build requests, which are sent through the async client
+        self.sandbox_api = SandboxApi(api_client)
+        self.toolbox_api = ToolboxApi(api_client)
+
+        # Initialize volume service
+        self.volume = AsyncVolumeService(VolumesApi(api_client), self._api)
+
+    def add_hook(self, hook: InstrumentationHook) -> None:
+        """Registers an instrumentation hook that is notified when any request of this client, or of a
+        Sandbox created by it, starts and ends.
+
+        Args:
+            hook (InstrumentationHook): The hook, e.g. a `LatencyHistogram` or an `OpenTelemetryHook`.
+        """
+        self._api.transport.instrumentation.add(hook)
+
+    def remove_hook(self, hook: InstrumentationHook) -> None:
+        """Unregisters an instrumentation hook added with `add_hook`.
+
+        Args:
+            hook (InstrumentationHook): The hook to remove.
+        """
+        self._api.transport.instrumentation.remove(hook)
+
+    async def __aenter__(self) -> "AsyncDaytona":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Closes the HTTP connections held by this client. Sandboxes created by this client can no
+        longer be used afterwards.
+        """
+        await self._api.aclose()
+
+    @intercept_errors(message_prefix="Failed to create sandbox: ")
+    async def create(
+        self,
+        params: Optional[CreateSandboxParams] = None,
+        timeout: Optional[float] = 60,
+    ) -> AsyncSandbox:
+        """Creates Sandboxes with default or custom configurations. You can specify various parameters,
+        including language, image, resources, environment variables, and volumes for the Sandbox.
+
+        Args:
+            params (Optional[CreateSandboxParams]): Parameters for Sandbox creation. If not provided,
+                   defaults to Python language.
+            timeout (Optional[float]): Timeout (in seconds) for sandbox creation. 0 means no timeout.
+                Default is 60 seconds.
+
+        Returns:
+            AsyncSandbox: The created Sandbox instance.
+
+        Raises:
+            DaytonaError: If timeout or auto_stop_interval is negative; If sandbox fails to start or times out
+
+        Example:
+            ```python
+            sandbox = await daytona.create(CreateSandboxParams(language="python"), 40)
+            ```
+        """
+        # If no params provided, create default params for Python
+        params = _with_default_language(params, self.default_language)
+
+        effective_timeout = params.timeout if params.timeout else timeout
+
+        return await self._create(params, effective_timeout)
+
+    @with_timeout(
+        error_message=lambda self, timeout: (
+            f"Failed to create and start sandbox within {timeout} seconds timeout period."
+        )
+    )
+    async def _create(
+        self,
+        params: Optional[CreateSandboxParams] = None,
+        timeout: Optional[float] = 60,
+    ) -> AsyncSandbox:
+        """Creates a new Sandbox and waits for it to start.
+
+        Args:
+            params (Optional[CreateSandboxParams]): Parameters for Sandbox creation.
+            timeout (Optional[float]): Timeout (in seconds) for sandbox creation. 0 means no timeout.
+
+        Returns:
+            AsyncSandbox: The created Sandbox instance.
+        """
+        sandbox = await self._create_sandbox(params, timeout)
+
+        # The overall timeout is enforced by this method
+        await sandbox.wait_for_sandbox_start(0)
+
+        # Fill the root directory cache, so the first file system, git or process call does not resolve it
+        await sandbox.prefetch_root_dir()
+
+        return sandbox
+
+    async def _create_sandbox(self, params: CreateSandboxParams, timeout: Optional[float] = 60) -> AsyncSandbox:
+        """Sends the Sandbox creation request without waiting for the Sandbox to start.
+
+        Args:
+            params (CreateSandboxParams): Parameters for Sandbox creation.
+            timeout (Optional[float]): Timeout (in seconds) for the creation request. 0 means no timeout.
+
+        Returns:
+            AsyncSandbox: The created Sandbox instance.
+        """
+        code_toolbox = _get_code_toolbox(params)
+        sandbox_data = _to_create_request(params, self.target, timeout)
+
+        response = await self._api.call(
+            self.sandbox_api,
+            "create_workspace",
+            "Workspace",
+            _request_timeout=timeout or None,
+            create_workspace=sandbox_data,
+        )
+        response.info = Sandbox.to_sandbox_info(response)
+
+        return AsyncSandbox(
+            response.id,
+            response,
+            self.sandbox_api,
+            self.toolbox_api,
+            self._api,
+            code_toolbox,
+        )
+
+    @intercept_errors(message_prefix="Failed to create sandboxes: ")
+    async def create_many(
+        self,
+        params_list: List[Optional[CreateSandboxParams]],
+        concurrency: int = 10,
+        timeout: Optional[float] = 60,
+    ) -> CreateManyResult:
+        """Creates multiple Sandboxes concurrently and waits for all of them to start.
+
+        Creation requests are sent concurrently, and all Sandboxes are then awaited by a single
+        poller instead of one polling loop per Sandbox. A Sandbox that fails to be created or started
+        does not fail the whole batch; it is reported in `CreateManyResult.failures` instead.
+
+        Args:
+            params_list (List[Optional[CreateSandboxParams]]): Parameters for each Sandbox. None entries
+                create a default Python Sandbox.
+            concurrency (int): Maximum number of creation requests in flight at the same time. Default is 10.
+            timeout (Optional[float]): Timeout (in seconds) for the whole batch to be created and started.
+                0 means no timeout. Default is 60 seconds.
+
+        Returns:
+            CreateManyResult: The started Sandboxes (as `AsyncSandbox`) and the per-Sandbox failures.
+
+        Raises:
+            DaytonaError: If concurrency is not positive or timeout is negative.
+
+        Example:
+            ```python
+            result = await daytona.create_many([CreateSandboxParams(language="python")] * 50, concurrency=20)
+            for failure in result.failures:
+                print(f"Sandbox #{failure.index} failed: {failure.error}")
+            ```
+        """
+        if concurrency < 1:
+            raise DaytonaError("Concurrency must be a positive integer")
+        if timeout is not None and timeout < 0:
+            raise DaytonaError("Timeout must be a non-negative number")
+
+        deadline = time.monotonic() + timeout if timeout else None
+        params_list = [_with_default_language(params, self.default_language) for params in params_list]
+        semaphore = asyncio.Semaphore(concurrency)
+
+        @intercept_errors(message_prefix="Failed to create sandbox: ")
+        async def create(params: CreateSandboxParams) -> AsyncSandbox:
+            async with semaphore:
+                # Requests that waited for the semaphore only get the time left of the batch
+                return await self._create_sandbox(params, time_left(deadline, timeout))
+
+        results = await asyncio.gather(*[create(params) for params in params_list], return_exceptions=True)
+
+        created: Dict[int, AsyncSandbox] = {}
+        failures: List[SandboxCreationFailure] = []
+        for i, sandbox in enumerate(results):
+            if isinstance(sandbox, DaytonaError):
+                failures.append(SandboxCreationFailure(i, params_list[i], sandbox))
+            elif isinstance(sandbox, BaseException):
+                raise sandbox
+            else:
+                created[i] = sandbox
+
+        errors = await self._wait_for_sandboxes_start(list(created.values()), deadline)
+
+        result = CreateManyResult()
+        for i, sandbox in created.items():
+            if sandbox.id in errors:
+                failures.append(SandboxCreationFailure(i, params_list[i], errors[sandbox.id], sandbox))
+            else:
+                result.sandboxes.append(sandbox)
+        result.failures = sorted(failures, key=lambda failure: failure.index)
+        await _prefetch_root_dirs(result.sandboxes, concurrency)
+        return result
+
+    async def _wait_for_sandboxes_start(
+        self, sandboxes: List[AsyncSandbox], deadline: Optional[float] = None
+    ) -> Dict[str, DaytonaError]:
+        """Waits for multiple Sandboxes to reach the 'started' state. The states are polled by the shared
+        state watcher, which fetches Sandboxes with the same labels in one `list_workspaces` call per round.
+
+        Args:
+            sandboxes (List[AsyncSandbox]): Sandboxes to wait for.
+            deadline (Optional[float]): `time.monotonic()` value after which waiting stops. None means no deadline.
+
+        Returns:
+            Dict[str, DaytonaError]: Errors of the Sandboxes that failed to start, keyed by Sandbox ID.
+        """
+        if not sandboxes:
+            return {}
+
+        watcher = AsyncSandboxStateWatcher.for_api(self.sandbox_api, self._api)
+        futures = {
+            watcher.watch(sandbox.id, {"started"}, labels=sandbox.instance.labels): sandbox for sandbox in sandboxes
+        }
+        _, pending = await asyncio.wait(
+            futures, timeout=None if deadline is None else max(0.0, deadline - time.monotonic())
+        )
+        errors: Dict[str, DaytonaError] = {}
+
+        for future, sandbox in futures.items():
+            if future in pending:
+                future.cancel()
+                errors[sandbox.id] = DaytonaError(
+                    f"Sandbox {sandbox.id} failed to become ready within the timeout period"
+                )
+                continue
+            if future.exception() is not None:
+                errors[sandbox.id] = DaytonaError(f"Failed to get state of sandbox {sandbox.id}: {future.exception()}")
+                continue
+
+            instance = future.result()
+            sandbox.instance.state = instance.state
+            if instance.state == "error":
+                errors[sandbox.id] = DaytonaError(
+                    f"Sandbox {sandbox.id} failed to start with state: {instance.state}, "
+                    f"error reason: {instance.error_reason}"
+                )
+
+        return errors
+
+    @intercept_errors(message_prefix="Failed to remove sandbox: ")
+    async def delete(self, sandbox: AsyncSandbox, timeout: Optional[float] = 60) -> None:
+        """Deletes a Sandbox.
+
+        Args:
+            sandbox (AsyncSandbox): The Sandbox instance to delete.
+            timeout (Optional[float]): Timeout (in seconds) for sandbox deletion. 0 means no timeout.
+                Default is 60 seconds.
+
+        Raises:
+            DaytonaError: If sandbox fails to delete or times out
+
+        Example:
+            ```python
+            sandbox = await daytona.create()
+            # ... use sandbox ...
+            await daytona.delete(sandbox)
+            ```
+        """
+        RootDirCache.for_api_client(self.sandbox_api.api_client).discard(sandbox.id)
+        await self._api.call(
+            self.sandbox_api,
+            "delete_workspace",
+            _request_timeout=timeout or None,
+            workspace_id=sandbox.id,
+            force=True,
+        )
+
+    remove = delete
+
+    @intercept_errors(message_prefix="Failed to get sandbox: ")
+    async def get_current_sandbox(self, sandbox_id: str) -> AsyncSandbox:
+        """Gets a Sandbox by its ID.
+
+        Args:
+            sandbox_id (str): The ID of the Sandbox to retrieve.
+
+        Returns:
+            AsyncSandbox: The Sandbox instance.
+
+        Raises:
+            DaytonaError: If sandbox_id is not provided.
+
+        Example:
+            ```python
+            sandbox = await daytona.get_current_sandbox("my-sandbox-id")
+            ```
+        """
+        if not sandbox_id:
+            raise DaytonaError("sandbox_id is required")
+
+        # Get the sandbox instance
+        sandbox_instance = await self._api.call(self.sandbox_api, "get_workspace", "Workspace", workspace_id=sandbox_id)
+        sandbox_instance.info = Sandbox.to_sandbox_info(sandbox_instance)
+
+        # Create and return sandbox with Python code toolbox as default
+        return AsyncSandbox(
+            sandbox_id,
+            sandbox_instance,
+            self.sandbox_api,
+            self.toolbox_api,
+            self._api,
+            SandboxPythonCodeToolbox(),
+        )
+
+    @intercept_errors(message_prefix="Failed to find sandbox: ")
+    async def find_one(self, sandbox_id: Optional[str] = None, labels: Optional[Dict[str, str]] = None) -> AsyncSandbox:
+        """Finds a Sandbox by its ID or labels.
+
+        Args:
+            sandbox_id (Optional[str]): The ID of the Sandbox to retrieve.
+            labels (Optional[Dict[str, str]]): Labels to filter Sandboxes.
+
+        Returns:
+            AsyncSandbox: First Sandbox that matches the ID or labels.
+
+        Raises:
+            DaytonaError: If no Sandbox is found.
+
+        Example:
+            ```python
+            sandbox = await daytona.find_one(labels={"my-label": "my-value"})
+            ```
+        """
+        if sandbox_id:
+            return await self.get_current_sandbox(sandbox_id)
+        sandboxes = await self.list(labels)
+        if len(sandboxes) == 0:
+            raise DaytonaError(f"No sandbox found with labels {labels}")
+        return sandboxes[0]
+
+    @intercept_errors(message_prefix="Failed to list sandboxes: ")
+    async def list(
+        self, labels: Optional[Dict[str, str]] = None, prefetch_root_dirs: bool = False
+    ) -> List[AsyncSandbox]:
+        """Lists Sandboxes filtered by labels.
+
+        Args:
+            labels (Optional[Dict[str, str]]): Labels to filter Sandboxes.
+            prefetch_root_dirs (bool): Whether to resolve the root directories of the started Sandboxes
+                concurrently before returning, instead of on the first operation of each Sandbox. Default is False.
+
+        Returns:
+            List[AsyncSandbox]: List of Sandbox instances that match the labels.
+
+        Example:
+            ```python
+            for sandbox in await daytona.list(labels={"my-label": "my-value"}):
+                print(f"{sandbox.id}: {sandbox.instance.state}")
+            ```
+        """
+        sandboxes = await self._api.call(
+            self.sandbox_api, "list_workspaces", "List[Workspace]", labels=json.dumps(labels)
+        )
+
+        for sandbox in sandboxes:
+            sandbox.info = Sandbox.to_sandbox_info(sandbox)
+
+        result = [
+            AsyncSandbox(
+                sandbox.id,
+                sandbox,
+                self.sandbox_api,
+                self.toolbox_api,
+                self._api,
+                _get_code_toolbox(
+                    CreateSandboxParams(language=_validate_language_label(sandbox.labels.get("code-toolbox-language")))
+                ),
+            )
+            for sandbox in sandboxes
+        ]
+        if prefetch_root_dirs:
+            await _prefetch_root_dirs(result)
+        return result
+
+    async def start(self, sandbox: AsyncSandbox, timeout: Optional[float] = 60) -> None:
+        """Starts a Sandbox and waits for it to be ready.
+
+        Args:
+            sandbox (AsyncSandbox): The Sandbox to start.
+            timeout (Optional[float]): Optional timeout in seconds to wait for the Sandbox to start.
+                0 means no timeout. Default is 60 seconds.
+
+        Raises:
+            DaytonaError: If timeout is negative; If Sandbox fails to start or times out
+        """
+        await sandbox.start(timeout)
+
+    async def stop(self, sandbox: AsyncSandbox, timeout: Optional[float] = 60) -> None:
+        """Stops a Sandbox and waits for it to be stopped.
+
+        Args:
+            sandbox (AsyncSandbox): The sandbox to stop
+            timeout (Optional[float]): Optional timeout (in seconds) for sandbox stop.
+                0 means no timeout. Default is 60 seconds.
+
+        Raises:
+            DaytonaError: If timeout is negative; If Sandbox fails to stop or times out
+        """
+        await sandbox.stop(timeout)
@@ -0,0 +1,598 @@
+import io
+import os
+import posixpath
+from contextlib import ExitStack, contextmanager
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    BinaryIO,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Union,
+    overload,
+)
+
+from daytona_api_client import FileInfo, Match, ReplaceRequest, ReplaceResult, SearchFilesResponse, ToolboxApi
+from daytona_sdk._utils import walk as walk_utils
+from daytona_sdk._utils.errors import intercept_errors
+from daytona_sdk._utils.metadata_cache import FILE_INFO, LISTING, AsyncMetadataCacheControl
+from daytona_sdk._utils.multipart import encode_multipart_async, is_replayable, new_boundary
+from daytona_sdk._utils.path import prefix_relative_path
+from daytona_sdk._utils.ranged_download import DEFAULT_RANGE_SIZE, download_to_file_async
+
+from ..common.filesystem import FileUpload, UploadSource, WalkEntry
+from ..protocols import SandboxInstance
+from ..transport import NO_RETRY_EXTENSION
+from .api_client import AsyncApiClient
+
+
+class AsyncFileSystem:
+    """Provides asynchronous file system operations within a Sandbox.
+
+    This class is the asyncio counterpart of `FileSystem` and exposes its core methods as coroutines. The
+    following features of `FileSystem` are not supported by the asyncio client; use a sync `Sandbox` for them,
+    e.g. one returned by `Daytona.get_current_sandbox`, from a worker thread:
+
+    - Transfers of many files through archives: `download_files`, `iter_download_files`, `upload_dir`,
+      `download_dir` and `sync_dir`.
+    - Streamed reads and searches: `open_read`, `iter_find_files` and `iter_search_files`, and the paging
+      options of `find_files` and `search_files`.
+    - The `resume`, `compression` and `delta` options of `upload_file` and `download_file`, the batching,
+      concurrency and progress options of `upload_files`, and upload deduplication (`upload_dedup`).
+
+    Attributes:
+        instance (SandboxInstance): The Sandbox instance this file system belongs to.
+        metadata_cache (AsyncMetadataCacheControl): Opt-in cache of the results of `get_file_info` and
+            `list_files`.
+    """
+
+    def __init__(
+        self,
+        instance: SandboxInstance,
+        toolbox_api: ToolboxApi,
+        api: AsyncApiClient,
+        get_root_dir: Callable[[], Awaitable[str]],
+    ):
+        """Initializes a new AsyncFileSystem instance.
+
+        Args:
+            instance (SandboxInstance): The Sandbox instance this file system belongs to.
+            toolbox_api (ToolboxApi): API client used to build toolbox requests.
+            api (AsyncApiClient): Client used to send the requests.
+            get_root_dir (Callable[[], Awaitable[str]]): A coroutine function to get the default root directory
+                of the Sandbox.
+        """
+        self.instance = instance
+        self.toolbox_api = toolbox_api
+        self._api = api
+        self._get_root_dir = get_root_dir
+        self.metadata_cache = AsyncMetadataCacheControl(get_root_dir)
+
+    @intercept_errors(message_prefix="Failed to create folder: ")
+    async def create_folder(self, path: str, mode: str) -> None:
+        """Creates a new directory in the Sandbox at the specified path with the given
+        permissions.
+
+        Args:
+            path (str): Path where the folder should be created. Relative paths are resolved based
+            on the user's root directory.
+            mode (str): Folder permissions in octal format (e.g., "755" for rwxr-xr-x).
+
+        Example:
+            ```python
+            await sandbox.fs.create_folder("workspace/data", "755")
+            ```
+        """
+        path = prefix_relative_path(await self._get_root_dir(), path)
+        with self.__changing(path):
+            await self._api.call(self.toolbox_api, "create_folder", workspace_id=self.instance.id, path=path, mode=mode)
+
+    @intercept_errors(message_prefix="Failed to delete file: ")
+    async def delete_file(self, path: str) -> None:
+        """Deletes a file from the Sandbox.
+
+        Args:
+            path (str): Absolute path to the file to delete.
+
+        Example:
+            ```python
+            await sandbox.fs.delete_file("workspace/data/old_file.txt")
+            ```
+        """
+        path = prefix_relative_path(await self._get_root_dir(), path)
+        with self.__changing(path):
+            await self._api.call(self.toolbox_api, "delete_file", workspace_id=self.instance.id, path=path)
+
+    @overload
+    async def download_file(self, remote_path: str, timeout: int = 10 * 60) -> bytes:
+        """Downloads a file from the Sandbox. Returns the file contents as a bytes object.
+        It can only be used for smaller files.
+
+        Args:
+            remote_path (str): Path to the file in the Sandbox. Relative paths are resolved based on the user's
+            root directory.
+            timeout (int): Timeout for the download operation in seconds. 0 means no timeout. Default is 10 minutes.
+
+        Returns:
+            bytes: The file contents as a bytes object.
+
+        Example:
+            ```python
+            content = await sandbox.fs.download_file("workspace/data/config.json")
+            config = json.loads(content.decode('utf-8'))
+            ```
+        """
+
+    @overload
+    async def download_file(
+        self,
+        remote_path: str,
+        local_path: str,
+        timeout: int = 10 * 60,
+        *,
+        concurrency: int = 1,
+        range_size: int = DEFAULT_RANGE_SIZE,
+    ) -> None:
+        """Downloads a file from the Sandbox and saves it to a local file using stream.
+        This method is useful when you want to download larger files that may not fit into memory.
+
+        With a `concurrency` above 1, the file is split into byte ranges that are downloaded concurrently and
+        written straight to their offset in the local file. If the server does not support range requests,
+        the file is downloaded over a single connection instead.
+
+        Args:
+            remote_path (str): Path to the file in the Sandbox. Relative paths are resolved based on the user's
+            root directory.
+            local_path (str): Path to save the file locally.
+            timeout (int): Timeout for the download operation in seconds. 0 means no timeout. Default is 10 minutes.
+                With a `concurrency` above 1, the timeout applies to each byte range.
+            concurrency (int): Maximum number of byte ranges downloaded at the same time. 1 streams the file over a
+                single connection. Default is 1.
+            range_size (int): Size of each byte range in bytes. Default is 16 MiB.
+
+        Raises:
+            DaytonaError: If the download fails, is incomplete or the file changes during the download.
+
+        Example:
+            ```python
+            await sandbox.fs.download_file("tmp/large_file.txt", "local_copy.txt")
+            await sandbox.fs.download_file("tmp/model.bin", "model.bin", concurrency=8)
+            ```
+        """
+
+    @intercept_errors(message_prefix="Failed to download file: ")
+    async def download_file(
+        self, *args: str, concurrency: int = 1, range_size: int = DEFAULT_RANGE_SIZE
+    ) -> Union[bytes, None]:
+        if len(args) == 1 or (len(args) == 2 and isinstance(args[1], int)):
+            remote_path = args[0]
+            timeout = args[1] if len(args) == 2 else 10 * 60
+            return await self._api.call(
+                self.toolbox_api,
+                "download_file",
+                "bytearray",
+                _request_timeout=timeout or None,
+                workspace_id=self.instance.id,
+                path=prefix_relative_path(await self._get_root_dir(), remote_path),
+            )
+
+        remote_path = args[0]
+        local_path = args[1]
+        timeout = args[2] if len(args) == 3 else 10 * 60
+        _, url, headers, *_ = self._api.serialize(
+            self.toolbox_api,
+            "download_file",
+            workspace_id=self.instance.id,
+            path=prefix_relative_path(await self._get_root_dir(), remote_path),
+        )
+
+        await download_to_file_async(
+            self._api.http_client,
+            url,
+            headers,
+            local_path,
+            self._api.timeout(timeout),
+            concurrency=concurrency,
+            range_size=range_size,
+        )
+        return None
+
+    @intercept_errors(message_prefix="Failed to find files: ")
+    async def find_files(self, path: str, pattern: str) -> List[Match]:
+        """Searches for files containing a pattern, similar to
+        the grep command.
+
+        Args:
+            path (str): Path to the file or directory to search. If the path is a directory,
+                the search will be performed recursively. Relative paths are resolved based on the user's
+                root directory.
+            pattern (str): Search pattern to match against file contents.
+
+        Returns:
+            List[Match]: List of matches found in files. Each Match object includes:
+                - file: Path to the file containing the match
+                - line: The line number where the match was found
+                - content: The matching line content
+
+        Example:
+            ```python
+            matches = await sandbox.fs.find_files("workspace/src", "TODO:")
+            for match in matches:
+                print(f"{match.file}:{match.line}: {match.content.strip()}")
+            ```
+        """
+        return await self._api.call(
+            self.toolbox_api,
+            "find_in_files",
+            "List[Match]",
+            workspace_id=self.instance.id,
+            path=prefix_relative_path(await self._get_root_dir(), path),
+            pattern=pattern,
+        )
+
+    @intercept_errors(message_prefix="Failed to get file info: ")
+    async def get_file_info(self, path: str) -> FileInfo:
+        """Gets detailed information about a file or directory, including its
+        size, permissions, and timestamps.
+
+        Args:
+            path (str): Path to the file or directory. Relative paths are resolved based on the user's
+            root directory.
+
+        Returns:
+            FileInfo: Detailed file information. See `FileSystem.get_file_info` for the list of fields.
+
+        Example:
+            ```python
+            info = await sandbox.fs.get_file_info("workspace/data/file.txt")
+            print(f"Size: {info.size} bytes")
+            ```
+        """
+        path = prefix_relative_path(await self._get_root_dir(), path)
+        return await self.metadata_cache.fetch(FILE_INFO, path, lambda: self.__get_file_info(path))
+
+    @intercept_errors(message_prefix="Failed to list files: ")
+    async def list_files(self, path: str) -> List[FileInfo]:
+        """Lists files and directories in a given path and returns their information, similar to the ls -l command.
+
+        Args:
+            path (str): Path to the directory to list contents from. Relative paths are resolved based on the user's
+            root directory.
+
+        Returns:
+            List[FileInfo]: List of file and directory information.
+
+        Example:
+            ```python
+            files = await sandbox.fs.list_files("workspace/data")
+            for file in files:
+                print(f"{file.name}: {file.size} bytes")
+            ```
+        """
+        path = prefix_relative_path(await self._get_root_dir(), path)
+        return await self.metadata_cache.fetch(LISTING, path, lambda: self.__list_files(path))
+
+    @intercept_errors(message_prefix="Failed to walk directory: ")
+    async def walk(
+        self, path: str, max_depth: Optional[int] = None, concurrency: int = walk_utils.DEFAULT_CONCURRENCY
+    ) -> AsyncIterator[WalkEntry]:
+        """Walks a directory tree of the Sandbox and yields its files and directories as they are found.
+
+        Directories are listed with up to `concurrency` `list_files` requests at the same time. Unlike
+        `FileSystem.walk`, large trees are not walked with `find`. Every directory is yielded before the
+        entries below it; the order is otherwise unspecified. Stopping the iteration early stops the walk.
+
+        Args:
+            path (str): Path to the directory to walk. Relative paths are resolved based on the user's
+                root directory.
+            max_depth (Optional[int]): Depth to walk to, 1 yields only the direct children of the directory.
+                None walks the whole tree.
+            concurrency (int): Maximum number of directories listed at the same time. Default is 8.
+
+        Yields:
+            WalkEntry: The path, information and depth of each file and directory below the directory.
+
+        Example:
+            ```python
+            async for entry in sandbox.fs.walk("workspace/data", max_depth=2):
+                print("  " * (entry.depth - 1) + entry.info.name)
+            ```
+        """
+        root = posixpath.normpath(prefix_relative_path(await self._get_root_dir(), path))
+        async for entry in walk_utils.walk_tree_async(self.list_files, root, max_depth, concurrency):
+            yield entry
+
+    @intercept_errors(message_prefix="Failed to move files: ")
+    async def move_files(self, source: str, destination: str) -> None:
+        """Moves or renames a file or directory. The parent directory of the destination must exist.
+
+        Args:
+            source (str): Path to the source file or directory. Relative paths are resolved based on the user's
+            root directory.
+            destination (str): Path to the destination. Relative paths are resolved based on the user's
+            root directory.
+
+        Example:
+            ```python
+            await sandbox.fs.move_files("workspace/data/old_name.txt", "workspace/data/new_name.txt")
+            ```
+        """
+        root_dir = await self._get_root_dir()
+        source = prefix_relative_path(root_dir, source)
+        destination = prefix_relative_path(root_dir, destination)
+        with self.__changing(source, destination):
+            await self._api.call(
+                self.toolbox_api,
+                "move_file",
+                workspace_id=self.instance.id,
+                source=source,
+                destination=destination,
+            )
+
+    @intercept_errors(message_prefix="Failed to replace in files: ")
+    async def replace_in_files(self, files: List[str], pattern: str, new_value: str) -> List[ReplaceResult]:
+        """Performs search and replace operations across multiple files.
+
+        Args:
+            files (List[str]): List of file paths to perform replacements in. Relative paths are
+            resolved based on the user's root directory.
+            pattern (str): Pattern to search for.
+            new_value (str): Text to replace matches with.
+
+        Returns:
+            List[ReplaceResult]: List of results indicating replacements made in each file.
+
+        Example:
+            ```python
+            results = await sandbox.fs.replace_in_files(
+                files=["workspace/src/file1.py", "workspace/src/file2.py"],
+                pattern="old_function",
+                new_value="new_function"
+            )
+            ```
+        """
+        root_dir = await self._get_root_dir()
+        for i, file in enumerate(files):
+            files[i] = prefix_relative_path(root_dir, file)
+
+        replace_request = ReplaceRequest(files=files, new_value=new_value, pattern=pattern)
+
+        with self.__changing(*files):
+            return await self._api.call(
+                self.toolbox_api,
+                "replace_in_files",
+                "List[ReplaceResult]",
+                workspace_id=self.instance.id,
+                replace_request=replace_request,
+            )
+
+    @intercept_errors(message_prefix="Failed to search files: ")
+    async def search_files(self, path: str, pattern: str) -> SearchFilesResponse:
+        """Searches for files and directories whose names match the
+        specified pattern. The pattern can be a simple string or a glob pattern.
+
+        Args:
+            path (str): Path to the root directory to start search from. Relative paths are resolved based on the user's
+            root directory.
+            pattern (str): Pattern to match against file names. Supports glob
+                patterns (e.g., "*.py" for Python files).
+
+        Returns:
+            SearchFilesResponse: Search results containing:
+                - files: List of matching file and directory paths
+
+        Example:
+            ```python
+            result = await sandbox.fs.search_files("workspace", "*.py")
+            for file in result.files:
+                print(file)
+            ```
+        """
+        return await self._api.call(
+            self.toolbox_api,
+            "search_files",
+            "SearchFilesResponse",
+            workspace_id=self.instance.id,
+            path=prefix_relative_path(await self._get_root_dir(), path),
+            pattern=pattern,
+        )
+
+    @intercept_errors(message_prefix="Failed to set file permissions: ")
+    async def set_file_permissions(
+        self, path: str, mode: Optional[str] = None, owner: Optional[str] = None, group: Optional[str] = None
+    ) -> None:
+        """Sets permissions and ownership for a file or directory. Any of the parameters can be None
+        to leave that attribute unchanged.
+
+        Args:
+            path (str): Path to the file or directory. Relative paths are resolved based on the user's
+            root directory.
+            mode (Optional[str]): File mode/permissions in octal format
+                (e.g., "644" for rw-r--r--).
+            owner (Optional[str]): User owner of the file.
+            group (Optional[str]): Group owner of the file.
+
+        Example:
+            ```python
+            await sandbox.fs.set_file_permissions(path="workspace/scripts/run.sh", mode="755")
+            ```
+        """
+        path = prefix_relative_path(await self._get_root_dir(), path)
+        with self.__changing(path):
+            await self._api.call(
+                self.toolbox_api,
+                "set_file_permissions",
+                workspace_id=self.instance.id,
+                path=path,
+                mode=mode,
+                owner=owner,
+                group=group,
+            )
+
+    @overload
+    async def upload_file(self, file: bytes, remote_path: str, timeout: int = 10 * 60) -> None:
+        """Uploads a file to the specified path in the Sandbox. If a file already exists at
+        the destination path, it will be overwritten.
+
+        Args:
+            file (bytes): File contents as a bytes object.
+            remote_path (str): Path to the destination file. Relative paths are resolved based on the user's
+            root directory.
+            timeout (int): Timeout for the upload operation in seconds. 0 means no timeout. Default is 10 minutes.
+
+        Example:
+            ```python
+            await sandbox.fs.upload_file(b"Hello, World!", "tmp/hello.txt")
+            ```
+        """
+
+    @overload
+    async def upload_file(self, local_path: str, remote_path: str, timeout: int = 10 * 60) -> None:
+        """Uploads a file from the local file system to the specified path in the Sandbox.
+        If a file already exists at the destination path, it will be overwritten. The file
+        content is streamed to the Sandbox.
+
+        Args:
+            local_path (str): Path to the local file to upload.
+            remote_path (str): Path to the destination file in the Sandbox. Relative paths are
+            resolved based on the user's root directory.
+            timeout (int): Timeout for the upload operation in seconds. 0 means no timeout. Default is 10 minutes.
+
+        Example:
+            ```python
+            await sandbox.fs.upload_file("local_file.txt", "tmp/large_file.txt")
+            ```
+        """
+
+    @overload
+    async def upload_file(
+        self,
+        stream: Union[BinaryIO, Iterable[bytes], AsyncIterable[bytes]],
+        remote_path: str,
+        timeout: int = 10 * 60,
+    ) -> None:
+        """Uploads data that is produced on the fly to the specified path in the Sandbox. If a file already
+        exists at the destination path, it will be overwritten.
+
+        The data is sent with chunked transfer encoding as it is read, so it is never held in memory or
+        written to a temporary file. Because the data can not be read twice, a failed upload is not retried.
+
+        Args:
+            stream (Union[BinaryIO, Iterable[bytes], AsyncIterable[bytes]]): A readable binary stream (sync, or
+                async like an `asyncio` subprocess pipe), or a sync or async iterator of bytes chunks.
+            remote_path (str): Path to the destination file in the Sandbox. Relative paths are
+            resolved based on the user's root directory.
+            timeout (int): Timeout for the upload operation in seconds. 0 means no timeout. Default is 10 minutes.
+
+        Example:
+            ```python
+            async def render():
+                async for record in fetch_records():
+                    yield (json.dumps(record) + "\n").encode()
+
+            await sandbox.fs.upload_file(render(), "data/records.jsonl")
+            ```
+        """
+
+    async def upload_file(self, src: UploadSource, dst: str, timeout: int = 10 * 60) -> None:
+        await self.upload_files([FileUpload(src, dst)], timeout)
+
+    @intercept_errors(message_prefix="Failed to upload files: ")
+    async def upload_files(self, files: List[FileUpload], timeout: int = 10 * 60) -> None:
+        """Uploads multiple files to the Sandbox. If files already exist at the destination paths,
+        they will be overwritten.
+
+        Args:
+            files (List[FileUpload]): List of files to upload.
+            timeout (int): Timeout for the upload operation in seconds. 0 means no timeout. Default is 10 minutes.
+
+        Example:
+            ```python
+            await sandbox.fs.upload_files([
+                FileUpload(source=b"Content of file 1", destination="/tmp/file1.txt"),
+                FileUpload(source="workspace/data/file2.txt", destination="/tmp/file2.txt"),
+            ])
+            ```
+        """
+        root_dir = await self._get_root_dir()
+        with self.__changing(*(prefix_relative_path(root_dir, f.destination) for f in files)):
+            await self.__upload(files, root_dir, timeout)
+
+    async def __upload(self, files: List[FileUpload], root_dir: str, timeout: int) -> None:
+        _, url, *_ = self._api.serialize(self.toolbox_api, "upload_files", workspace_id=self.instance.id)
+        if not all(is_replayable(f.source) for f in files):
+            await self.__upload_streamed(url, files, root_dir, timeout)
+            return
+
+        data = {}
+        multipart_files = []
+        with ExitStack() as stack:
+            for i, f in enumerate(files):
+                dst = prefix_relative_path(root_dir, f.destination)
+                # metadata field
+                data[f"files[{i}].path"] = dst
+                # file field: wrap bytes in BytesIO or open file stream
+                if isinstance(f.source, bytes):
+                    stream = io.BytesIO(f.source)
+                    fname = dst
+                else:
+                    stream = stack.enter_context(open(f.source, "rb"))
+                    fname = os.path.basename(f.source)
+                multipart_files.append((f"files[{i}].file", (fname, stream)))
+
+            response = await self._api.http_client.post(
+                url,
+                data=data,
+                files=multipart_files,
+                headers=self.toolbox_api.api_client.default_headers,
+                timeout=self._api.timeout(timeout),
+            )
+            response.raise_for_status()
+
+    async def __upload_streamed(self, url: str, files: List[FileUpload], root_dir: str, timeout: int) -> None:
+        """Sends files of which some are streams or iterators in a multipart body that is encoded as it is sent.
+        httpx only encodes sync sources, so the body is built here to also read async ones."""
+        data = {}
+        multipart_files = []
+        for i, f in enumerate(files):
+            dst = prefix_relative_path(root_dir, f.destination)
+            data[f"files[{i}].path"] = dst
+            fname = os.path.basename(f.source) if isinstance(f.source, str) else os.path.basename(dst)
+            multipart_files.append((f"files[{i}].file", fname, f.source))
+
+        boundary = new_boundary()
+        response = await self._api.http_client.post(
+            url,
+            content=encode_multipart_async(data, multipart_files, boundary),
+            headers={
+                **self.toolbox_api.api_client.default_headers,
+                "Content-Type": f"multipart/form-data; boundary={boundary}",
+            },
+            timeout=self._api.timeout(timeout),
+            extensions={NO_RETRY_EXTENSION: True},
+        )
+        response.raise_for_status()
+
+    @contextmanager
+    def __changing(self, *paths: str) -> Iterator[None]:
+        """Invalidates the cached metadata of the (absolute) paths an operation changes once it ends, also if
+        it fails."""
+        try:
+            yield
+        finally:
+            if paths:
+                self.metadata_cache.invalidate_paths(*paths)
+
+    async def __get_file_info(self, path: str) -> FileInfo:
+        return await self._api.call(
+            self.toolbox_api, "get_file_info", "FileInfo", workspace_id=self.instance.id, path=path
+        )
+
+    async def __list_files(self, path: str) -> List[FileInfo]:
+        return await self._api.call(
+            self.toolbox_api, "list_files", "List[FileInfo]", workspace_id=self.instance.id, path=path
+        )
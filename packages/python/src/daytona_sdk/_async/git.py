@@ -0,0 +1,294 @@
+from typing import TYPE_CHECKING, Awaitable, Callable, List, Optional
+
+from daytona_api_client import (
+    GitAddRequest,
+    GitCloneRequest,
+    GitCommitRequest,
+    GitRepoRequest,
+    GitStatus,
+    ListBranchResponse,
+    ToolboxApi,
+)
+from daytona_sdk._utils.errors import intercept_errors
+from daytona_sdk._utils.path import prefix_relative_path
+
+from ..git import GitCommitResponse
+from ..protocols import SandboxInstance
+from .api_client import AsyncApiClient
+
+if TYPE_CHECKING:
+    from .sandbox import AsyncSandbox
+
+
+class AsyncGit:
+    """Provides asynchronous Git operations within a Sandbox.
+
+    This class is the asyncio counterpart of `Git` and exposes the same methods as coroutines.
+
+    Attributes:
+        sandbox (AsyncSandbox): The parent Sandbox instance.
+        instance (SandboxInstance): The Sandbox instance this Git handler belongs to.
+
+    Example:
+        ```python
+        await sandbox.git.clone(
+            url="https://github.com/user/repo.git",
+            path="workspace/repo"
+        )
+        status = await sandbox.git.status("workspace/repo")
+        print(f"Modified files: {status.modified}")
+        ```
+    """
+
+    def __init__(
+        self,
+        sandbox: "AsyncSandbox",
+        toolbox_api: ToolboxApi,
+        api: AsyncApiClient,
+        instance: SandboxInstance,
+        get_root_dir: Callable[[], Awaitable[str]],
+    ):
+        """Initializes a new AsyncGit handler instance.
+
+        Args:
+            sandbox (AsyncSandbox): The parent Sandbox instance.
+            toolbox_api (ToolboxApi): API client used to build toolbox requests.
+            api (AsyncApiClient): Client used to send the requests.
+            instance (SandboxInstance): The Sandbox instance this Git handler belongs to.
+            get_root_dir (Callable[[], Awaitable[str]]): A coroutine function to get the default root directory
+                of the Sandbox.
+        """
+        self.sandbox = sandbox
+        self.toolbox_api = toolbox_api
+        self._api = api
+        self.instance = instance
+        self._get_root_dir = get_root_dir
+
+    @intercept_errors(message_prefix="Failed to add files: ")
+    async def add(self, path: str, files: List[str]) -> None:
+        """Stages the specified files for the next commit, similar to
+        running 'git add' on the command line.
+
+        Args:
+            path (str): Path to the Git repository root. Relative paths are resolved based on the user's
+            root directory.
+            files (List[str]): List of file paths or directories to stage, relative to the repository root.
+
+        Example:
+            ```python
+            await sandbox.git.add("workspace/repo", ["src/main.py", "README.md"])
+            ```
+        """
+        await self._api.call(
+            self.toolbox_api,
+            "git_add_files",
+            workspace_id=self.instance.id,
+            git_add_request=GitAddRequest(path=prefix_relative_path(await self._get_root_dir(), path), files=files),
+        )
+
+    @intercept_errors(message_prefix="Failed to list branches: ")
+    async def branches(self, path: str) -> ListBranchResponse:
+        """Lists branches in the repository.
+
+        Args:
+            path (str): Path to the Git repository root. Relative paths are resolved based on the user's
+            root directory.
+
+        Returns:
+            ListBranchResponse: List of branches in the repository.
+
+        Example:
+            ```python
+            response = await sandbox.git.branches("workspace/repo")
+            print(f"Branches: {response.branches}")
+            ```
+        """
+        return await self._api.call(
+            self.toolbox_api,
+            "git_list_branches",
+            "ListBranchResponse",
+            workspace_id=self.instance.id,
+            path=prefix_relative_path(await self._get_root_dir(), path),
+        )
+
+    @intercept_errors(message_prefix="Failed to clone repository: ")
+    async def clone(
+        self,
+        url: str,
+        path: str,
+        branch: Optional[str] = None,
+        commit_id: Optional[str] = None,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+    ) -> None:
+        """Clones a Git repository into the specified path. It supports
+        cloning specific branches or commits, and can authenticate with the remote
+        repository if credentials are provided.
+
+        Args:
+            url (str): Repository URL to clone from.
+            path (str): Path where the repository should be cloned. Relative paths are resolved based on the user's
+            root directory.
+            branch (Optional[str]): Specific branch to clone. If not specified,
+                clones the default branch.
+            commit_id (Optional[str]): Specific commit to clone. If specified,
+                the repository will be left in a detached HEAD state at this commit.
+            username (Optional[str]): Git username for authentication.
+            password (Optional[str]): Git password or token for authentication.
+
+        Example:
+            ```python
+            await sandbox.git.clone(
+                url="https://github.com/user/private-repo.git",
+                path="workspace/private",
+                branch="develop",
+                username="user",
+                password="token"
+            )
+            ```
+        """
+        await self._api.call(
+            self.toolbox_api,
+            "git_clone_repository",
+            workspace_id=self.instance.id,
+            git_clone_request=GitCloneRequest(
+                url=url,
+                branch=branch,
+                path=prefix_relative_path(await self._get_root_dir(), path),
+                username=username,
+                password=password,
+                commitId=commit_id,
+            ),
+        )
+
+    @intercept_errors(message_prefix="Failed to commit changes: ")
+    async def commit(self, path: str, message: str, author: str, email: str) -> GitCommitResponse:
+        """Creates a new commit with the staged changes. Make sure to stage
+        changes using the add() method before committing.
+
+        Args:
+            path (str): Path to the Git repository root. Relative paths are resolved based on the user's
+            root directory.
+            message (str): Commit message describing the changes.
+            author (str): Name of the commit author.
+            email (str): Email address of the commit author.
+
+        Example:
+            ```python
+            await sandbox.git.add("workspace/repo", ["README.md"])
+            await sandbox.git.commit(
+                path="workspace/repo",
+                message="Update documentation",
+                author="John Doe",
+                email="john@example.com"
+            )
+            ```
+        """
+        response = await self._api.call(
+            self.toolbox_api,
+            "git_commit_changes",
+            "GitCommitResponse",
+            workspace_id=self.instance.id,
+            git_commit_request=GitCommitRequest(
+                path=prefix_relative_path(await self._get_root_dir(), path),
+                message=message,
+                author=author,
+                email=email,
+            ),
+        )
+        return GitCommitResponse(sha=response.hash)
+
+    @intercept_errors(message_prefix="Failed to push changes: ")
+    async def push(
+        self,
+        path: str,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+    ) -> None:
+        """Pushes all local commits on the current branch to the remote
+        repository. If the remote repository requires authentication, provide
+        username and password/token.
+
+        Args:
+            path (str): Path to the Git repository root. Relative paths are resolved based on the user's
+            root directory.
+            username (Optional[str]): Git username for authentication.
+            password (Optional[str]): Git password or token for authentication.
+
+        Example:
+            ```python
+            await sandbox.git.push(path="workspace/repo", username="user", password="github_token")
+            ```
+        """
+        await self._api.call(
+            self.toolbox_api,
+            "git_push_changes",
+            workspace_id=self.instance.id,
+            git_repo_request=GitRepoRequest(
+                path=prefix_relative_path(await self._get_root_dir(), path),
+                username=username,
+                password=password,
+            ),
+        )
+
+    @intercept_errors(message_prefix="Failed to pull changes: ")
+    async def pull(
+        self,
+        path: str,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+    ) -> None:
+        """Pulls changes from the remote repository. If the remote repository requires authentication,
+        provide username and password/token.
+
+        Args:
+            path (str): Path to the Git repository root. Relative paths are resolved based on the user's
+            root directory.
+            username (Optional[str]): Git username for authentication.
+            password (Optional[str]): Git password or token for authentication.
+
+        Example:
+            ```python
+            await sandbox.git.pull("workspace/repo")
+            ```
+        """
+        await self._api.call(
+            self.toolbox_api,
+            "git_pull_changes",
+            workspace_id=self.instance.id,
+            git_repo_request=GitRepoRequest(
+                path=prefix_relative_path(await self._get_root_dir(), path),
+                username=username,
+                password=password,
+            ),
+        )
+
+    @intercept_errors(message_prefix="Failed to get status: ")
+    async def status(self, path: str) -> GitStatus:
+        """Gets the current Git repository status.
+
+        Args:
+            path (str): Path to the Git repository root. Relative paths are resolved based on the user's
+            root directory.
+
+        Returns:
+            GitStatus: Repository status information including:
+                - current_branch: Current branch name
+                - file_status: List of file statuses
+                - ahead: Number of local commits not pushed to remote
+                - behind: Number of remote commits not pulled locally
+                - branch_published: Whether the branch has been published to the remote repository
+
+        Example:
+            ```python
+            status = await sandbox.git.status("workspace/repo")
+            print(f"On branch: {status.current_branch}")
+            ```
+        """
+        return await self._api.call(
+            self.toolbox_api,
+            "git_get_status",
+            "GitStatus",
+            workspace_id=self.instance.id,
+            path=prefix_relative_path(await self._get_root_dir(), path),
+        )
@@ -0,0 +1,226 @@
+from typing import List
+
+from daytona_api_client import (
+    CompletionList,
+    LspCompletionParams,
+    LspDocumentRequest,
+    LspServerRequest,
+    LspSymbol,
+    ToolboxApi,
+)
+from daytona_sdk._utils.errors import intercept_errors
+from daytona_sdk._utils.path import prefix_relative_path
+
+from ..lsp_server import LspLanguageId, Position
+from ..protocols import SandboxInstance
+from .api_client import AsyncApiClient
+
+
+class AsyncLspServer:
+    """Provides asynchronous Language Server Protocol functionality for code intelligence.
+
+    This class is the asyncio counterpart of `LspServer` and exposes the same methods as coroutines.
+
+    Attributes:
+        language_id (LspLanguageId): The language server type (e.g., "python", "typescript").
+        path_to_project (str): Absolute path to the project root directory.
+        instance (SandboxInstance): The Sandbox instance this server belongs to.
+    """
+
+    def __init__(
+        self,
+        language_id: LspLanguageId,
+        path_to_project: str,
+        toolbox_api: ToolboxApi,
+        api: AsyncApiClient,
+        instance: SandboxInstance,
+    ):
+        """Initializes a new async LSP server instance.
+
+        Args:
+            language_id (LspLanguageId): The language server type (e.g., LspLanguageId.TYPESCRIPT).
+            path_to_project (str): Absolute path to the project root directory.
+            toolbox_api (ToolboxApi): API client used to build toolbox requests.
+            api (AsyncApiClient): Client used to send the requests.
+            instance (SandboxInstance): The Sandbox instance this server belongs to.
+        """
+        self.language_id = str(language_id)
+        self.path_to_project = path_to_project
+        self.toolbox_api = toolbox_api
+        self._api = api
+        self.instance = instance
+
+    @intercept_errors(message_prefix="Failed to start LSP server: ")
+    async def start(self) -> None:
+        """Starts the language server.
+
+        This method must be called before using any other LSP functionality.
+
+        Example:
+            ```python
+            lsp = sandbox.create_lsp_server("typescript", "workspace/project")
+            await lsp.start()
+            ```
+        """
+        await self._api.call(
+            self.toolbox_api,
+            "lsp_start",
+            workspace_id=self.instance.id,
+            lsp_server_request=LspServerRequest(
+                language_id=self.language_id,
+                path_to_project=self.path_to_project,
+            ),
+        )
+
+    @intercept_errors(message_prefix="Failed to stop LSP server: ")
+    async def stop(self) -> None:
+        """Stops the language server.
+
+        Example:
+            ```python
+            await lsp.stop()
+            ```
+        """
+        await self._api.call(
+            self.toolbox_api,
+            "lsp_stop",
+            workspace_id=self.instance.id,
+            lsp_server_request=LspServerRequest(
+                language_id=self.language_id,
+                path_to_project=self.path_to_project,
+            ),
+        )
+
+    @intercept_errors(message_prefix="Failed to open file: ")
+    async def did_open(self, path: str) -> None:
+        """Notifies the language server that a file has been opened.
+
+        Args:
+            path (str): Path to the opened file. Relative paths are resolved based on the project path
+            set in the LSP server constructor.
+
+        Example:
+            ```python
+            await lsp.did_open("workspace/project/src/index.ts")
+            ```
+        """
+        await self._api.call(
+            self.toolbox_api,
+            "lsp_did_open",
+            workspace_id=self.instance.id,
+            lsp_document_request=LspDocumentRequest(
+                language_id=self.language_id,
+                path_to_project=self.path_to_project,
+                uri=f"file://{prefix_relative_path(self.path_to_project, path)}",
+            ),
+        )
+
+    @intercept_errors(message_prefix="Failed to close file: ")
+    async def did_close(self, path: str) -> None:
+        """Notify the language server that a file has been closed.
+
+        Args:
+            path (str): Path to the closed file. Relative paths are resolved based on the project path
+            set in the LSP server constructor.
+
+        Example:
+            ```python
+            await lsp.did_close("workspace/project/src/index.ts")
+            ```
+        """
+        await self._api.call(
+            self.toolbox_api,
+            "lsp_did_close",
+            workspace_id=self.instance.id,
+            lsp_document_request=LspDocumentRequest(
+                language_id=self.language_id,
+                path_to_project=self.path_to_project,
+                uri=f"file://{prefix_relative_path(self.path_to_project, path)}",
+            ),
+        )
+
+    @intercept_errors(message_prefix="Failed to get symbols from document: ")
+    async def document_symbols(self, path: str) -> List[LspSymbol]:
+        """Gets symbol information (functions, classes, variables, etc.) from a document.
+
+        Args:
+            path (str): Path to the file to get symbols from. Relative paths are resolved based on the project path
+            set in the LSP server constructor.
+
+        Returns:
+            List[LspSymbol]: List of symbols in the document.
+
+        Example:
+            ```python
+            symbols = await lsp.document_symbols("workspace/project/src/index.ts")
+            for symbol in symbols:
+                print(f"{symbol.kind} {symbol.name}: {symbol.location}")
+            ```
+        """
+        return await self._api.call(
+            self.toolbox_api,
+            "lsp_document_symbols",
+            "List[LspSymbol]",
+            workspace_id=self.instance.id,
+            language_id=self.language_id,
+            path_to_project=self.path_to_project,
+            uri=f"file://{prefix_relative_path(self.path_to_project, path)}",
+        )
+
+    @intercept_errors(message_prefix="Failed to get symbols from sandbox: ")
+    async def sandbox_symbols(self, query: str) -> List[LspSymbol]:
+        """Searches for symbols matching the query string across all files
+        in the Sandbox.
+
+        Args:
+            query (str): Search query to match against symbol names.
+
+        Returns:
+            List[LspSymbol]: List of matching symbols from all files.
+
+        Example:
+            ```python
+            symbols = await lsp.sandbox_symbols("User")
+            ```
+        """
+        return await self._api.call(
+            self.toolbox_api,
+            "lsp_workspace_symbols",
+            "List[LspSymbol]",
+            workspace_id=self.instance.id,
+            language_id=self.language_id,
+            path_to_project=self.path_to_project,
+            query=query,
+        )
+
+    @intercept_errors(message_prefix="Failed to get completions: ")
+    async def completions(self, path: str, position: Position) -> CompletionList:
+        """Gets completion suggestions at a position in a file.
+
+        Args:
+            path (str): Path to the file. Relative paths are resolved based on the project path
+            set in the LSP server constructor.
+            position (Position): Cursor position to get completions for.
+
+        Returns:
+            CompletionList: List of completion suggestions.
+
+        Example:
+            ```python
+            completions = await lsp.completions("workspace/project/src/index.ts", Position(line=10, character=15))
+            for item in completions.items:
+                print(f"{item.label} ({item.kind}): {item.detail}")
+            ```
+        """
+        return await self._api.call(
+            self.toolbox_api,
+            "lsp_completions",
+            "CompletionList",
+            workspace_id=self.instance.id,
+            lsp_completion_params=LspCompletionParams(
+                language_id=self.language_id,
+                path_to_project=self.path_to_project,
+                uri=f"file://{prefix_relative_path(self.path_to_project, path)}",
+                position=position,
+            ),
+        )
@@ -0,0 +1,369 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional, Union
+
+from daytona_api_client import (
+    Command,
+    CreateSessionRequest,
+    ExecuteRequest,
+    Session,
+    SessionExecuteResponse,
+    ToolboxApi,
+)
+from daytona_sdk._utils import compression as compression_utils
+from daytona_sdk._utils.errors import intercept_errors
+
+from ..code_toolbox.sandbox_python_code_toolbox import SandboxPythonCodeToolbox
+from ..common.code_run_params import CodeRunParams
+from ..common.compression import DEFAULT_COMPRESSION_THRESHOLD, Compression
+from ..common.execute_response import ExecuteResponse
+from ..process import Process, SessionExecuteRequest
+from ..protocols import SandboxInstance
+from .api_client import AsyncApiClient
+
+
+class AsyncProcess:
+    """Handles process and code execution within a Sandbox asynchronously.
+
+    This class is the asyncio counterpart of `Process` and exposes the same methods as coroutines.
+
+    Attributes:
+        code_toolbox (SandboxPythonCodeToolbox): Language-specific code execution toolbox.
+        toolbox_api (ToolboxApi): API client used to build toolbox requests.
+        instance (SandboxInstance): The Sandbox instance this process belongs to.
+    """
+
+    def __init__(
+        self,
+        code_toolbox: SandboxPythonCodeToolbox,
+        toolbox_api: ToolboxApi,
+        api: AsyncApiClient,
+        instance: SandboxInstance,
+        get_root_dir: Callable[[], Awaitable[str]],
+    ):
+        """Initialize a new AsyncProcess instance.
+
+        Args:
+            code_toolbox (SandboxPythonCodeToolbox): Language-specific code execution toolbox.
+            toolbox_api (ToolboxApi): API client used to build toolbox requests.
+            api (AsyncApiClient): Client used to send the requests.
+            instance (SandboxInstance): The Sandbox instance this process belongs to.
+            get_root_dir (Callable[[], Awaitable[str]]): A coroutine function to get the default root directory
+                of the Sandbox.
+        """
+        self.code_toolbox = code_toolbox
+        self.toolbox_api = toolbox_api
+        self._api = api
+        self.instance = instance
+        self._get_root_dir = get_root_dir
+
+    @intercept_errors(message_prefix="Failed to execute command: ")
+    async def exec(
+        self,
+        command: str,
+        cwd: Optional[str] = None,
+        env: Optional[Dict[str, str]] = None,
+        timeout: Optional[int] = None,
+        compression: Optional[Union[Compression, str]] = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+    ) -> ExecuteResponse:
+        """Execute a shell command in the Sandbox.
+
+        Args:
+            command (str): Shell command to execute.
+            cwd (Optional[str]): Working directory for command execution. If not
+                specified, uses the Sandbox root directory. Default is the user's root directory.
+            env (Optional[Dict[str, str]]): Environment variables to set for the command.
+            timeout (Optional[int]): Maximum time in seconds to wait for the command
+                to complete. 0 means wait indefinitely.
+            compression (Optional[Union[Compression, str]]): Algorithm to compress large output with in the
+                Sandbox before it is sent back. With compression, standard error is merged into the output.
+                Not compressed by default.
+            compression_threshold (int): Size of the output in bytes from which it is compressed. Default is
+                64 KiB.
+
+        Returns:
+            ExecuteResponse: Command execution results containing:
+                - exit_code: The command's exit status
+                - result: Standard output from the command
+                - artifacts: ExecutionArtifacts object containing `stdout` (same as result)
+                and `charts` (matplotlib charts metadata)
+
+        Example:
+            ```python
+            response = await sandbox.process.exec("echo 'Hello'")
+            print(response.artifacts.stdout)  # Prints: Hello
+            ```
+        """
+        # pylint: disable=protected-access
+        if compression is not None:
+            compression = compression_utils.resolve(compression)
+            wrapped = Process._build_compressed_command(command, env, compression, compression_threshold)
+        else:
+            wrapped = Process._build_command(command, env)
+        execute_request = ExecuteRequest(command=wrapped, cwd=cwd or await self._get_root_dir(), timeout=timeout)
+
+        response = await self._api.call(
+            self.toolbox_api,
+            "execute_command",
+            "ExecuteResponse",
+            workspace_id=self.instance.id,
+            execute_request=execute_request,
+        )
+        if compression is not None:
+            response = Process._decompress_response(response, compression)
+
+        return Process._to_execute_response(response)
+
+    async def code_run(
+        self,
+        code: str,
+        params: Optional[CodeRunParams] = None,
+        timeout: Optional[int] = None,
+    ) -> ExecuteResponse:
+        """Executes code in the Sandbox using the appropriate language runtime.
+
+        Args:
+            code (str): Code to execute.
+            params (Optional[CodeRunParams]): Parameters for code execution.
+            timeout (Optional[int]): Maximum time in seconds to wait for the code
+                to complete. 0 means wait indefinitely.
+
+        Returns:
+            ExecuteResponse: Code execution result. Matplotlib charts are automatically detected and returned
+            in the `charts` field of the `ExecutionArtifacts` object.
+
+        Example:
+            ```python
+            response = await sandbox.process.code_run('print("Sum:", 10 + 20)')
+            print(response.artifacts.stdout)  # Prints: Sum: 30
+            ```
+        """
+        command = self.code_toolbox.get_run_command(code, params)
+        return await self.exec(command, env=params.env if params else None, timeout=timeout)
+
+    @intercept_errors(message_prefix="Failed to create session: ")
+    async def create_session(self, session_id: str) -> None:
+        """Creates a new long-running background session in the Sandbox.
+
+        Args:
+            session_id (str): Unique identifier for the new session.
+
+        Example:
+            ```python
+            await sandbox.process.create_session("my-session")
+            # Do work...
+            await sandbox.process.delete_session("my-session")
+            ```
+        """
+        await self._api.call(
+            self.toolbox_api,
+            "create_session",
+            workspace_id=self.instance.id,
+            create_session_request=CreateSessionRequest(sessionId=session_id),
+        )
+
+    @intercept_errors(message_prefix="Failed to get session: ")
+    async def get_session(self, session_id: str) -> Session:
+        """Gets a session in the Sandbox.
+
+        Args:
+            session_id (str): Unique identifier of the session to retrieve.
+
+        Returns:
+            Session: Session information including:
+                - session_id: The session's unique identifier
+                - commands: List of commands executed in the session
+
+        Example:
+            ```python
+            session = await sandbox.process.get_session("my-session")
+            for cmd in session.commands:
+                print(f"Command: {cmd.command}")
+            ```
+        """
+        return await self._api.call(
+            self.toolbox_api, "get_session", "Session", workspace_id=self.instance.id, session_id=session_id
+        )
+
+    @intercept_errors(message_prefix="Failed to get session command: ")
+    async def get_session_command(self, session_id: str, command_id: str) -> Command:
+        """Gets information about a specific command executed in a session.
+
+        Args:
+            session_id (str): Unique identifier of the session.
+            command_id (str): Unique identifier of the command.
+
+        Returns:
+            Command: Command information including:
+                - id: The command's unique identifier
+                - command: The executed command string
+                - exit_code: Command's exit status (if completed)
+
+        Example:
+            ```python
+            cmd = await sandbox.process.get_session_command("my-session", "cmd-123")
+            if cmd.exit_code == 0:
+                print(f"Command {cmd.command} completed successfully")
+            ```
+        """
+        return await self._api.call(
+            self.toolbox_api,
+            "get_session_command",
+            "Command",
+            workspace_id=self.instance.id,
+            session_id=session_id,
+            command_id=command_id,
+        )
+
+    @intercept_errors(message_prefix="Failed to execute session command: ")
+    async def execute_session_command(
+        self,
+        session_id: str,
+        req: SessionExecuteRequest,
+        timeout: Optional[int] = None,
+    ) -> SessionExecuteResponse:
+        """Executes a command in the session.
+
+        Args:
+            session_id (str): Unique identifier of the session to use.
+            req (SessionExecuteRequest): Command execution request containing:
+                - command: The command to execute
+                - run_async: Whether to execute asynchronously
+
+        Returns:
+            SessionExecuteResponse: Command execution results containing:
+                - cmd_id: Unique identifier for the executed command
+                - output: Command output (if synchronous execution)
+                - exit_code: Command exit status (if synchronous execution)
+
+        Example:
+            ```python
+            req = SessionExecuteRequest(command="echo 'Hello'")
+            result = await sandbox.process.execute_session_command("my-session", req)
+            print(result.output)  # Prints: Hello
+            ```
+        """
+        return await self._api.call(
+            self.toolbox_api,
+            "execute_session_command",
+            "SessionExecuteResponse",
+            _request_timeout=timeout or None,
+            workspace_id=self.instance.id,
+            session_id=session_id,
+            session_execute_request=req,
+        )
+
+    @intercept_errors(message_prefix="Failed to get session command logs: ")
+    async def get_session_command_logs(self, session_id: str, command_id: str) -> str:
+        """Get the logs for a command executed in a session. Retrieves the complete output
+        (stdout and stderr) from a command executed in a session.
+
+        Args:
+            session_id (str): Unique identifier of the session.
+            command_id (str): Unique identifier of the command.
+
+        Returns:
+            str: Complete command output including both stdout and stderr.
+
+        Example:
+            ```python
+            logs = await sandbox.process.get_session_command_logs("my-session", "cmd-123")
+            print(f"Command output: {logs}")
+            ```
+        """
+        return await self._api.call(
+            self.toolbox_api,
+            "get_session_command_logs",
+            "str",
+            workspace_id=self.instance.id,
+            session_id=session_id,
+            command_id=command_id,
+        )
+
+    @intercept_errors(message_prefix="Failed to get session command logs: ")
+    async def get_session_command_logs_async(
+        self, session_id: str, command_id: str, on_logs: Callable[[str], None]
+    ) -> None:
+        """Retrieves and processes the logs for a command executed in a session as they become available.
+
+        Args:
+            session_id (str): Unique identifier of the session.
+            command_id (str): Unique identifier of the command.
+            on_logs (Callable[[str], None]): Callback function to handle log chunks.
+
+        Example:
+            ```python
+            await sandbox.process.get_session_command_logs_async(
+                "my-session",
+                "cmd-123",
+                lambda chunk: print(f"Log chunk: {chunk}")
+            )
+            ```
+        """
+        url = (
+            f"{self.toolbox_api.api_client.configuration.host}/toolbox/{self.instance.id}"
+            + f"/toolbox/process/session/{session_id}/command/{command_id}/logs?follow=true"
+        )
+        headers = self.toolbox_api.api_client.default_headers
+
+        async with self._api.http_client.stream("GET", url, headers=headers, timeout=None) as response:
+            stream = response.aiter_bytes()
+            next_chunk = None
+            exit_code_seen_count = 0
+
+            while True:
+                if next_chunk is None:
+                    next_chunk = asyncio.create_task(anext(stream, None))
+                timeout = asyncio.create_task(asyncio.sleep(2))
+
+                done, pending = await asyncio.wait([next_chunk, timeout], return_when=asyncio.FIRST_COMPLETED)
+
+                if next_chunk in done:
+                    timeout.cancel()
+                    chunk = next_chunk.result()
+                    next_chunk = None
+
+                    if chunk is None:
+                        break
+
+                    on_logs(chunk.decode("utf-8"))
+                elif timeout in done:
+                    cmd_status = await self.get_session_command(session_id, command_id)
+
+                    if cmd_status.exit_code is not None:
+                        exit_code_seen_count += 1
+                        if exit_code_seen_count > 1:
+                            if next_chunk in pending:
+                                next_chunk.cancel()
+                            break
+
+    @intercept_errors(message_prefix="Failed to list sessions: ")
+    async def list_sessions(self) -> List[Session]:
+        """Lists all sessions in the Sandbox.
+
+        Returns:
+            List[Session]: List of all sessions in the Sandbox.
+
+        Example:
+            ```python
+            sessions = await sandbox.process.list_sessions()
+            for session in sessions:
+                print(f"Session {session.session_id}: {len(session.commands)} commands")
+            ```
+        """
+        return await self._api.call(self.toolbox_api, "list_sessions", "List[Session]", workspace_id=self.instance.id)
+
+    @intercept_errors(message_prefix="Failed to delete session: ")
+    async def delete_session(self, session_id: str) -> None:
+        """Terminates and removes a session from the Sandbox, cleaning up any resources
+        associated with it.
+
+        Args:
+            session_id (str): Unique identifier of the session to delete.
+
+        Example:
+            ```python
+            await sandbox.process.delete_session("temp-session")
+            ```
+        """
+        await self._api.call(self.toolbox_api, "delete_session", workspace_id=self.instance.id, session_id=session_id)
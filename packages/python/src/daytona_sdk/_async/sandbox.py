@@ -0,0 +1,338 @@
+from typing import Dict, Optional
+
+from daytona_api_client import PortPreviewUrl, ToolboxApi
+from daytona_api_client import WorkspaceApi as SandboxApi
+from daytona_sdk._utils.path import prefix_relative_path
+
+from .._utils.errors import intercept_errors
+from .._utils.root_dir_cache import RootDirCache
+from .._utils.timeout import with_timeout
+from ..common.errors import DaytonaError
+from ..lsp_server import LspLanguageId
+from ..protocols import SandboxCodeToolbox
+from ..sandbox import Sandbox, SandboxInfo, SandboxInstance
+from .api_client import AsyncApiClient
+from .filesystem import AsyncFileSystem
+from .git import AsyncGit
+from .lsp_server import AsyncLspServer
+from .process import AsyncProcess
+from .state_watcher import AsyncSandboxStateWatcher
+
+
+class AsyncSandbox:
+    """Represents a Daytona Sandbox used from asyncio code.
+
+    This class is the asyncio counterpart of `Sandbox` and exposes the same methods as coroutines.
+
+    Attributes:
+        id (str): Unique identifier for the Sandbox.
+        instance (SandboxInstance): The underlying Sandbox instance.
+        code_toolbox (SandboxCodeToolbox): Language-specific toolbox implementation.
+        fs (AsyncFileSystem): File system operations interface.
+        git (AsyncGit): Git operations interface.
+        process (AsyncProcess): Process execution interface.
+    """
+
+    def __init__(
+        self,
+        id: str,
+        instance: SandboxInstance,
+        sandbox_api: SandboxApi,
+        toolbox_api: ToolboxApi,
+        api: AsyncApiClient,
+        code_toolbox: SandboxCodeToolbox,
+    ):
+        """Initialize a new AsyncSandbox instance.
+
+        Args:
+            id (str): Unique identifier for the Sandbox.
+            instance (SandboxInstance): The underlying Sandbox instance.
+            sandbox_api (SandboxApi): API client used to build Sandbox requests.
+            toolbox_api (ToolboxApi): API client used to build toolbox requests.
+            api (AsyncApiClient): Client used to send the requests.
+            code_toolbox (SandboxCodeToolbox): Language-specific toolbox implementation.
+        """
+        self.id = id
+        self.instance = instance
+        self.sandbox_api = sandbox_api
+        self.toolbox_api = toolbox_api
+        self._api = api
+        self._code_toolbox = code_toolbox
+        # Root directories are shared by all Sandbox objects of a client, so only the first one resolves it
+        self._root_dir_cache = RootDirCache.for_api_client(toolbox_api.api_client)
+        self._root_dir = self._root_dir_cache.get(id) or ""
+
+        self.fs = AsyncFileSystem(instance, toolbox_api, api, self.__get_root_dir)
+        self.git = AsyncGit(self, toolbox_api, api, instance, self.__get_root_dir)
+        self.process = AsyncProcess(code_toolbox, toolbox_api, api, instance, self.__get_root_dir)
+
+    async def info(self) -> SandboxInfo:
+        """Gets structured information about the Sandbox.
+
+        Returns:
+            SandboxInfo: Detailed information about the Sandbox including its
+                configuration, resources, and current state.
+
+        Example:
+            ```python
+            info = await sandbox.info()
+            print(f"Sandbox {info.id}: {info.state}")
+            ```
+        """
+        instance = await self._api.call(self.sandbox_api, "get_workspace", "Workspace", workspace_id=self.id)
+        return Sandbox.to_sandbox_info(instance)
+
+    @intercept_errors(message_prefix="Failed to get sandbox root directory: ")
+    async def get_user_root_dir(self) -> str:
+        """Gets the root directory path for the logged in user inside the Sandbox.
+
+        Returns:
+            str: The absolute path to the Sandbox root directory for the logged in user.
+
+        Example:
+            ```python
+            root_dir = await sandbox.get_user_root_dir()
+            print(f"Sandbox root: {root_dir}")
+            ```
+        """
+        response = await self._api.call(
+            self.toolbox_api, "get_project_dir", "ProjectDirResponse", workspace_id=self.instance.id
+        )
+        self._root_dir_cache.set(self.id, response.dir)
+        return response.dir
+
+    async def prefetch_root_dir(self) -> None:
+        """Resolves the root directory ahead of the first operation with a relative path, so that operation
+        does not pay for the extra round trip. Does nothing if the root directory is already known. Errors are
+        ignored, as the root directory is then resolved on first use.
+
+        Example:
+            ```python
+            await sandbox.prefetch_root_dir()
+            await sandbox.fs.upload_file(b"Hello", "hello.txt")
+            ```
+        """
+        try:
+            await self.__get_root_dir()
+        except DaytonaError:
+            pass
+
+    def create_lsp_server(self, language_id: LspLanguageId, path_to_project: str) -> AsyncLspServer:
+        """Creates a new Language Server Protocol (LSP) server instance.
+
+        Args:
+            language_id (LspLanguageId): The language server type (e.g., LspLanguageId.PYTHON).
+            path_to_project (str): Path to the project root directory. Relative paths are resolved based on the user's
+            root directory.
+
+        Returns:
+            AsyncLspServer: A new LSP server instance configured for the specified language.
+
+        Example:
+            ```python
+            lsp = sandbox.create_lsp_server("python", "workspace/project")
+            await lsp.start()
+            ```
+        """
+        return AsyncLspServer(
+            language_id,
+            prefix_relative_path(self._root_dir, path_to_project),
+            self.toolbox_api,
+            self._api,
+            self.instance,
+        )
+
+    @intercept_errors(message_prefix="Failed to set labels: ")
+    async def set_labels(self, labels: Dict[str, str]) -> Dict[str, str]:
+        """Sets labels for the Sandbox.
+
+        Args:
+            labels (Dict[str, str]): Dictionary of key-value pairs representing Sandbox labels.
+
+        Returns:
+            Dict[str, str]: Dictionary containing the updated Sandbox labels.
+
+        Example:
+            ```python
+            new_labels = await sandbox.set_labels({"project": "my-project"})
+            ```
+        """
+        # Convert all values to strings and create the expected labels structure
+        string_labels = {k: str(v).lower() if isinstance(v, bool) else str(v) for k, v in labels.items()}
+        return await self._api.call(
+            self.sandbox_api,
+            "replace_labels",
+            "WorkspaceLabels",
+            workspace_id=self.id,
+            workspace_labels={"labels": string_labels},
+        )
+
+    @intercept_errors(message_prefix="Failed to start sandbox: ")
+    @with_timeout(
+        error_message=lambda self, timeout: (
+            f"Sandbox {self.id} failed to start within the {timeout} seconds timeout period"
+        )
+    )
+    async def start(self, timeout: Optional[float] = 60):
+        """Starts the Sandbox and waits for it to be ready.
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait in seconds. 0 means no timeout. Default is 60 seconds.
+
+        Raises:
+            DaytonaError: If timeout is negative. If sandbox fails to start or times out.
+
+        Example:
+            ```python
+            await sandbox.start(timeout=40)
+            ```
+        """
+        await self._api.call(
+            self.sandbox_api, "start_workspace", _request_timeout=timeout or None, workspace_id=self.id
+        )
+        await self.wait_for_sandbox_start(0)
+
+    @intercept_errors(message_prefix="Failed to stop sandbox: ")
+    @with_timeout(
+        error_message=lambda self, timeout: (
+            f"Sandbox {self.id} failed to stop within the {timeout} seconds timeout period"
+        )
+    )
+    async def stop(self, timeout: Optional[float] = 60):
+        """Stops the Sandbox and waits for it to be fully stopped.
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait in seconds. 0 means no timeout. Default is 60 seconds.
+
+        Raises:
+            DaytonaError: If timeout is negative; If sandbox fails to stop or times out
+
+        Example:
+            ```python
+            await sandbox.stop()
+            ```
+        """
+        await self._api.call(self.sandbox_api, "stop_workspace", _request_timeout=timeout or None, workspace_id=self.id)
+        await self.wait_for_sandbox_stop(0)
+
+    async def delete(self) -> None:
+        """Deletes the Sandbox."""
+        await self._api.call(self.sandbox_api, "delete_workspace", workspace_id=self.id, force=True)
+
+    @intercept_errors(message_prefix="Failure during waiting for sandbox to start: ")
+    @with_timeout(
+        error_message=lambda self, timeout: (
+            f"Sandbox {self.id} failed to become ready within the {timeout} seconds timeout period"
+        )
+    )
+    async def wait_for_sandbox_start(
+        self,
+        timeout: Optional[float] = 60,  # pylint: disable=unused-argument
+    ) -> None:
+        """Waits for the Sandbox to reach the 'started' state. Polls the Sandbox status until it
+        reaches the 'started' state, encounters an error or times out.
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait in seconds. 0 means no timeout. Default is 60 seconds.
+
+        Raises:
+            DaytonaError: If timeout is negative; If Sandbox fails to start or times out
+        """
+        # State checks of all waiting Sandboxes are batched by the shared watcher
+        response = await AsyncSandboxStateWatcher.for_api(self.sandbox_api, self._api).wait(
+            self.id, {"started"}, labels=self.instance.labels
+        )
+        self.instance.state = response.state
+
+        if response.state == "error":
+            raise DaytonaError(
+                f"Sandbox {self.id} failed to start with state: {response.state}, error reason: {response.error_reason}"
+            )
+
+    @intercept_errors(message_prefix="Failure during waiting for sandbox to stop: ")
+    @with_timeout(
+        error_message=lambda self, timeout: (
+            f"Sandbox {self.id} failed to become stopped within the {timeout} seconds timeout period"
+        )
+    )
+    async def wait_for_sandbox_stop(
+        self,
+        timeout: Optional[float] = 60,  # pylint: disable=unused-argument
+    ) -> None:
+        """Waits for the Sandbox to reach the 'stopped' state. Polls the Sandbox status until it
+        reaches the 'stopped' state, encounters an error or times out.
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait in seconds. 0 means no timeout. Default is 60 seconds.
+
+        Raises:
+            DaytonaError: If timeout is negative. If Sandbox fails to stop or times out.
+        """
+        # State checks of all waiting Sandboxes are batched by the shared watcher; validation errors
+        # are expected while the Sandbox is stopping, so the watcher keeps waiting on them
+        response = await AsyncSandboxStateWatcher.for_api(self.sandbox_api, self._api).wait(
+            self.id, {"stopped"}, ignore_validation_errors=True, labels=self.instance.labels
+        )
+        self.instance.state = response.state
+
+        if response.state == "error":
+            raise DaytonaError(
+                f"Sandbox {self.id} failed to stop with status: {response.state}, error reason: {response.error_reason}"
+            )
+
+    @intercept_errors(message_prefix="Failed to set auto-stop interval: ")
+    async def set_autostop_interval(self, interval: int) -> None:
+        """Sets the auto-stop interval for the Sandbox.
+
+        Args:
+            interval (int): Number of minutes of inactivity before auto-stopping.
+                Set to 0 to disable auto-stop. Defaults to 15.
+
+        Raises:
+            DaytonaError: If interval is negative
+
+        Example:
+            ```python
+            await sandbox.set_autostop_interval(60)
+            ```
+        """
+        if not isinstance(interval, int) or interval < 0:
+            raise DaytonaError("Auto-stop interval must be a non-negative integer")
+
+        await self._api.call(self.sandbox_api, "set_autostop_interval", workspace_id=self.id, interval=interval)
+        self.instance.auto_stop_interval = interval
+
+    @intercept_errors(message_prefix="Failed to get preview link: ")
+    async def get_preview_link(self, port: int) -> PortPreviewUrl:
+        """Retrieves the preview link for the sandbox at the specified port. If the port is closed,
+        it will be opened automatically. For private sandboxes, a token is included to grant access
+        to the URL.
+
+        Args:
+            port (int): The port to open the preview link on.
+
+        Returns:
+            PortPreviewUrl: The response object for the preview link, which includes the `url`
+            and the `token` (to access private sandboxes).
+
+        Example:
+            ```python
+            preview_link = await sandbox.get_preview_link(3000)
+            print(f"Preview URL: {preview_link.url}")
+            ```
+        """
+        return await self._api.call(
+            self.sandbox_api, "get_port_preview_url", "PortPreviewUrl", workspace_id=self.id, port=port
+        )
+
+    @intercept_errors(message_prefix="Failed to archive sandbox: ")
+    async def archive(self) -> None:
+        """Archives the sandbox, making it inactive and preserving its state.
+        Sandbox must be stopped before archiving.
+        """
+        await self._api.call(self.sandbox_api, "archive_workspace", workspace_id=self.id)
+
+    async def __get_root_dir(self) -> str:
+        if not self._root_dir:
+            self._root_dir = self._root_dir_cache.get(self.id) or await self.get_user_root_dir()
+        return self._root_dir
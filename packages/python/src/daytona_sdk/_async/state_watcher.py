@@ -0,0 +1,184 @@
+import asyncio
+import json
+import weakref
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+from daytona_api_client import Workspace as ApiSandbox
+from daytona_api_client import WorkspaceApi as SandboxApi
+
+from .._utils.state_watcher import (
+    MAX_CONCURRENT_FETCHES,
+    MIN_POLL_INTERVAL,
+    POLL_REQUEST_TIMEOUT,
+    StateWatcherBase,
+    _Waiter,
+)
+from .api_client import AsyncApiClient
+
+
+class AsyncSandboxStateWatcher(StateWatcherBase):
+    """Waits for Sandboxes to reach a state on behalf of all coroutines of an event loop.
+
+    This is the asyncio counterpart of `SandboxStateWatcher`. One watcher exists per API client and event loop,
+    and a single task polls the states of all watched Sandboxes, so waiting takes no thread. Sandboxes with the
+    same labels are fetched with one `list_workspaces` call per round, and the others one by one with at most
+    `MAX_CONCURRENT_FETCHES` requests in flight. The polling interval backs off like that of `SandboxStateWatcher`.
+    """
+
+    # Watchers by event loop, and by API client within each loop
+    _watchers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, weakref.WeakKeyDictionary]" = (
+        weakref.WeakKeyDictionary()
+    )
+
+    def __init__(self, sandbox_api: SandboxApi, api: AsyncApiClient):
+        super().__init__()
+        self._sandbox_api = sandbox_api
+        self._api = api
+        self._wakeup = asyncio.Event()
+        self._fetches = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    @classmethod
+    def for_api(cls, sandbox_api: SandboxApi, api: AsyncApiClient) -> "AsyncSandboxStateWatcher":
+        """Returns the watcher of the running event loop for the API client of the given Sandbox API.
+
+        Args:
+            sandbox_api (SandboxApi): API used to build the state requests.
+            api (AsyncApiClient): Client used to send the state requests.
+
+        Returns:
+            AsyncSandboxStateWatcher: The shared watcher.
+        """
+        watchers = cls._watchers.setdefault(asyncio.get_running_loop(), weakref.WeakKeyDictionary())
+        watcher: Optional[AsyncSandboxStateWatcher] = watchers.get(sandbox_api.api_client)
+        if watcher is None:
+            watcher = cls(sandbox_api, api)
+            watchers[sandbox_api.api_client] = watcher
+        return watcher
+
+    def watch(
+        self,
+        sandbox_id: str,
+        states: Set[str],
+        ignore_validation_errors: bool = False,
+        labels: Optional[Dict[str, str]] = None,
+    ) -> "asyncio.Future[ApiSandbox]":
+        """Starts watching a Sandbox. Cancelling the returned future stops watching it.
+
+        Args:
+            sandbox_id (str): ID of the Sandbox.
+            states (Set[str]): States that resolve the future. The "error" state always resolves it.
+            ignore_validation_errors (bool): Whether to keep waiting when the Sandbox state can not be parsed,
+                which happens while a Sandbox is being stopped.
+            labels (Optional[Dict[str, str]]): Labels of the Sandbox, which let the states of Sandboxes with the
+                same labels be fetched together.
+
+        Returns:
+            asyncio.Future[ApiSandbox]: Future resolved with the Sandbox once it reaches one of the states.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(self._new_waiter(sandbox_id, states, ignore_validation_errors, labels, future))
+        self._interval = MIN_POLL_INTERVAL
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+        self._wakeup.set()
+        return future
+
+    async def wait(
+        self,
+        sandbox_id: str,
+        states: Set[str],
+        ignore_validation_errors: bool = False,
+        labels: Optional[Dict[str, str]] = None,
+    ) -> ApiSandbox:
+        """Waits until a Sandbox reaches one of the states or the "error" state. Bound the wait with
+        `asyncio.wait_for`, which stops watching the Sandbox on timeout.
+
+        Args:
+            sandbox_id (str): ID of the Sandbox.
+            states (Set[str]): States to wait for.
+            ignore_validation_errors (bool): Whether to keep waiting when the Sandbox state can not be parsed.
+            labels (Optional[Dict[str, str]]): Labels of the Sandbox, see `watch`.
+
+        Returns:
+            ApiSandbox: The Sandbox in the reached state.
+        """
+        future = self.watch(sandbox_id, states, ignore_validation_errors, labels)
+        try:
+            return await future
+        finally:
+            future.cancel()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            waiters = self._pending_waiters()
+            if not waiters:
+                self._task = None
+                return
+
+            self._last_poll = loop.time()
+            self._wakeup.clear()
+            changed = await self._poll(waiters)
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._next_interval(changed))
+            except asyncio.TimeoutError:
+                pass
+            # Newly watched Sandboxes wake the task early, but rounds never run closer than the minimum interval
+            remaining = self._last_poll + MIN_POLL_INTERVAL - loop.time()
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+
+    async def _poll(self, waiters: List[_Waiter]) -> bool:
+        """Fetches the states of the watched Sandboxes and resolves the waiters that are done.
+
+        Returns:
+            bool: Whether the state of any watched Sandbox changed since the previous round.
+        """
+        sandbox_ids = {waiter.sandbox_id for waiter in waiters}
+        instances: Dict[str, ApiSandbox] = {}
+        errors: Dict[str, Exception] = {}
+
+        groups = self._label_groups(waiters)
+        for listed in await asyncio.gather(*(self._list(labels, ids) for labels, ids in groups.items())):
+            instances.update(listed)
+
+        remaining = sorted(sandbox_ids - set(instances))
+        results = await asyncio.gather(*(self._get(sandbox_id) for sandbox_id in remaining), return_exceptions=True)
+        for sandbox_id, result in zip(remaining, results):
+            if isinstance(result, Exception):
+                errors[sandbox_id] = result
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                instances[sandbox_id] = result
+
+        return self._resolve(waiters, instances, errors)
+
+    async def _get(self, sandbox_id: str) -> ApiSandbox:
+        """Fetches a single Sandbox."""
+        async with self._fetches:
+            return await self._api.call(
+                self._sandbox_api,
+                "get_workspace",
+                "Workspace",
+                _request_timeout=POLL_REQUEST_TIMEOUT,
+                workspace_id=sandbox_id,
+            )
+
+    async def _list(self, labels: FrozenSet[Tuple[str, str]], sandbox_ids: Set[str]) -> Dict[str, ApiSandbox]:
+        """Fetches the Sandboxes with the labels and returns those that are watched."""
+        try:
+            async with self._fetches:
+                listed = await self._api.call(
+                    self._sandbox_api,
+                    "list_workspaces",
+                    "List[Workspace]",
+                    _request_timeout=POLL_REQUEST_TIMEOUT,
+                    labels=json.dumps(dict(labels)),
+                )
+        except Exception:  # pylint: disable=broad-exception-caught
+            # A single Sandbox that can not be parsed fails the whole list, so fall back to single requests
+            return {}
+        return self._watched(labels, sandbox_ids, listed)
@@ -0,0 +1,90 @@
+import re
+from typing import List
+
+from daytona_api_client import CreateVolume, VolumesApi
+from daytona_api_client.exceptions import NotFoundException
+
+from ..volume import Volume
+from .api_client import AsyncApiClient
+
+
+class AsyncVolumeService:
+    """Service for managing Daytona Volumes from asyncio code. Can be used to list, get, create and delete Volumes."""
+
+    def __init__(self, volumes_api: VolumesApi, api: AsyncApiClient):
+        self.__volumes_api = volumes_api
+        self.__api = api
+
+    async def list(self) -> List[Volume]:
+        """List all Volumes.
+
+        Returns:
+            List[Volume]: List of all Volumes.
+
+        Example:
+            ```python
+            volumes = await daytona.volume.list()
+            for volume in volumes:
+                print(f"{volume.name} ({volume.id})")
+            ```
+        """
+        volumes = await self.__api.call(self.__volumes_api, "list_volumes", "List[VolumeDto]")
+        return [Volume.from_dto(volume) for volume in volumes]
+
+    async def get(self, name: str, create: bool = False) -> Volume:
+        """Get a Volume by name.
+
+        Args:
+            name (str): Name of the Volume to get.
+            create (bool): If True, create a new Volume if it doesn't exist.
+
+        Returns:
+            Volume: The Volume object.
+
+        Example:
+            ```python
+            volume = await daytona.volume.get("test-volume-name", create=True)
+            print(f"{volume.name} ({volume.id})")
+            ```
+        """
+        try:
+            dto = await self.__api.call(self.__volumes_api, "get_volume_by_name", "VolumeDto", name=name)
+            return Volume.from_dto(dto)
+        except NotFoundException as e:
+            if create and re.search(r"Volume with name ([\w\-]+) not found", str(e)):
+                return await self.create(name)
+            raise e
+
+    async def create(self, name: str) -> Volume:
+        """Create a new Volume.
+
+        Args:
+            name (str): Name of the Volume to create.
+
+        Returns:
+            Volume: The Volume object.
+
+        Example:
+            ```python
+            volume = await daytona.volume.create("test-volume")
+            print(f"{volume.name} ({volume.id}); state: {volume.state}")
+            ```
+        """
+        dto = await self.__api.call(
+            self.__volumes_api, "create_volume", "VolumeDto", create_volume=CreateVolume(name=name)
+        )
+        return Volume.from_dto(dto)
+
+    async def delete(self, volume: Volume) -> None:
+        """Delete a Volume.
+
+        Args:
+            volume (Volume): Volume to delete.
+
+        Example:
+            ```python
+            volume = await daytona.volume.get("test-volume")
+            await daytona.volume.delete(volume)
+            ```
+        """
+        await self.__api.call(self.__volumes_api, "delete_volume", volume_id=volume.id)
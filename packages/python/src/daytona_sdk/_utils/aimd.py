@@ -0,0 +1,63 @@
+import threading
+import time
+
+
+class AimdController:
+    """Concurrency limit that adapts to measured throughput, additive-increase/multiplicative-decrease style.
+
+    Completed operations are grouped into rounds of `limit` operations. After each round, the limit grows by
+    one if the throughput of the round held up compared to the previous round, and is cut by `decrease`
+    otherwise. A failed operation cuts the limit right away, as it usually signals an overloaded link or
+    server.
+
+    Attributes:
+        limit (int): Current number of operations that may run at the same time.
+    """
+
+    def __init__(self, maximum: int, initial: int = 2, minimum: int = 1, decrease: float = 0.5, tolerance: float = 0.1):
+        """Initializes the controller.
+
+        Args:
+            maximum (int): Upper bound of the limit.
+            initial (int): Limit to start with.
+            minimum (int): Lower bound of the limit.
+            decrease (float): Factor the limit is multiplied with when it is cut.
+            tolerance (float): Relative drop of throughput between rounds that is still treated as steady.
+        """
+        self._maximum = max(1, maximum)
+        self._minimum = max(1, min(minimum, self._maximum))
+        self._decrease = decrease
+        self._tolerance = tolerance
+        self.limit = max(self._minimum, min(initial, self._maximum))
+        self._lock = threading.Lock()
+        self._previous_throughput = 0.0
+        self.__start_round()
+
+    def record_success(self, size: int) -> None:
+        """Records a completed operation that transferred `size` bytes."""
+        with self._lock:
+            self._round_bytes += size
+            self._round_count += 1
+            if self._round_count < self.limit:
+                return
+            elapsed = max(time.monotonic() - self._round_start, 1e-6)
+            throughput = self._round_bytes / elapsed
+            if throughput >= self._previous_throughput * (1 - self._tolerance):
+                self.limit = min(self._maximum, self.limit + 1)
+            else:
+                self.limit = max(self._minimum, int(self.limit * self._decrease))
+            self._previous_throughput = throughput
+            self.__start_round()
+
+    def record_failure(self) -> None:
+        """Records a failed operation."""
+        with self._lock:
+            self.limit = max(self._minimum, int(self.limit * self._decrease))
+            # Throughput of the rounds before the failure is no baseline for the reduced limit
+            self._previous_throughput = 0.0
+            self.__start_round()
+
+    def __start_round(self) -> None:
+        self._round_start = time.monotonic()
+        self._round_bytes = 0
+        self._round_count = 0
@@ -0,0 +1,154 @@
+import os
+import posixpath
+import shlex
+import shutil
+from contextlib import closing
+from typing import BinaryIO, Dict, Iterator, List, Tuple
+
+from ..common.errors import DaytonaError
+from ..common.filesystem import FileDownload, FileDownloadResult, FileUpload
+from .sync import PathFilter, walk_local
+from .tar_stream import (
+    CHUNK_SIZE,
+    IteratorStream,
+    ProducerStream,
+    archive_files_command,
+    extract_archive,
+    parse_archive_output,
+    path_list,
+    read_archive,
+    write_archive,
+)
+from .toolbox_files import ToolboxFiles
+
+
+def upload_dir(
+    files: ToolboxFiles, local_dir: str, remote_dir: str, path_filter: PathFilter, compress: bool, timeout: int
+) -> None:
+    """Packs a local directory tree into an archive while it is sent and unpacks it into a Sandbox directory,
+    see `FileSystem.upload_dir`."""
+    if not os.path.isdir(local_dir):
+        raise DaytonaError(f"Local directory {local_dir} does not exist")
+    archive = files.staging_path("tar.gz" if compress else "tar")
+
+    entries = walk_local(local_dir, path_filter, include_dirs=True)
+    stream = ProducerStream(lambda f: write_archive(f, entries, compress))
+    try:
+        files.upload([FileUpload(stream, archive)], timeout)
+    finally:
+        stream.close()
+    with files.changing(remote_dir, archive):
+        files.run(
+            f"mkdir -p {shlex.quote(remote_dir)} && "
+            f"tar -x{'z' if compress else ''}f {shlex.quote(archive)} -C {shlex.quote(remote_dir)}; "
+            f"status=$?; rm -f {shlex.quote(archive)}; exit $status",
+            timeout,
+        )
+
+
+def download_dir(files: ToolboxFiles, remote_dir: str, local_dir: str, compress: bool, timeout: int) -> None:
+    """Packs a Sandbox directory tree into an archive and unpacks it locally while it is received, see
+    `FileSystem.download_dir`."""
+    archive = files.staging_path("tar.gz" if compress else "tar")
+    files.run(f"tar -c{'z' if compress else ''}f {shlex.quote(archive)} -C {shlex.quote(remote_dir)} .", timeout)
+    try:
+        with closing(files.iter_file(archive, timeout)) as chunks:
+            extract_archive(IteratorStream(chunks), local_dir, compress)
+    finally:
+        files.remove(archive, timeout=timeout)
+
+
+def download_files(
+    files: ToolboxFiles, downloads: List[FileDownload], timeout: int, compress: bool
+) -> List[FileDownloadResult]:
+    """Downloads Sandbox files to local files through one archive, see `FileSystem.download_files`."""
+    paths = [posixpath.normpath(files.resolve(f.source)) for f in downloads]
+    # Files requested more than once are downloaded once and copied locally
+    sources: Dict[str, List[FileDownload]] = {}
+    for f, path in zip(downloads, paths):
+        sources.setdefault(path, []).append(f)
+
+    errors: Dict[str, str] = {}
+    received = set()
+    for path, contents in _stream_archive(files, list(sources), timeout, compress, errors):
+        targets = sources.get(path)
+        if not targets:
+            continue
+        try:
+            for target in targets:
+                parent = os.path.dirname(target.destination)
+                if parent:
+                    os.makedirs(parent, exist_ok=True)
+            first = targets[0].destination
+            with open(first, "wb") as out:
+                shutil.copyfileobj(contents, out, CHUNK_SIZE)
+            for target in targets[1:]:
+                shutil.copyfile(first, target.destination)
+            received.add(path)
+        except OSError as e:
+            errors[path] = str(e)
+
+    return [
+        FileDownloadResult(
+            f.source, f.destination, None if path in received else errors.get(path, "missing from the archive")
+        )
+        for f, path in zip(downloads, paths)
+    ]
+
+
+def iter_download_files(
+    files: ToolboxFiles, paths: List[str], timeout: int, compress: bool
+) -> Iterator[Tuple[str, bytes]]:
+    """Downloads Sandbox files through one archive and yields their contents, see
+    `FileSystem.iter_download_files`."""
+    requested: Dict[str, List[str]] = {}
+    for path in paths:
+        requested.setdefault(posixpath.normpath(files.resolve(path)), []).append(path)
+
+    errors: Dict[str, str] = {}
+    received = set()
+    for path, contents in _stream_archive(files, list(requested), timeout, compress, errors):
+        if path not in requested:
+            continue
+        data = contents.read()
+        received.add(path)
+        for requested_path in requested[path]:
+            yield requested_path, data
+
+    failed = [
+        f"{requested_path}: {errors.get(path, 'missing from the archive')}"
+        for path, requested_paths in requested.items()
+        if path not in received
+        for requested_path in requested_paths
+    ]
+    if failed:
+        raise DaytonaError(f"{len(failed)} files could not be downloaded: {'; '.join(failed)}")
+
+
+def _stream_archive(
+    files: ToolboxFiles, paths: List[str], timeout: int, compress: bool, errors: Dict[str, str]
+) -> Iterator[Tuple[str, BinaryIO]]:
+    """Packs Sandbox files into an archive and streams it back.
+
+    Yields:
+        Tuple[str, BinaryIO]: The absolute path and contents of each archived file. The reasons the other
+        files could not be archived are added to `errors`.
+    """
+    archive = files.staging_path("tar.gz" if compress else "tar")
+    listed = f"{archive}.paths"
+    try:
+        files.upload([FileUpload(path_list(paths), listed)], timeout)
+        output = files.run(archive_files_command(listed, archive, compress), timeout)
+    except BaseException:
+        files.remove(listed, timeout=timeout)
+        raise
+    archived, skipped = parse_archive_output(output)
+    errors.update(skipped)
+    if not archived:
+        return
+    try:
+        with closing(files.iter_file(archive, timeout)) as chunks:
+            for name, contents in read_archive(IteratorStream(chunks), compress):
+                yield posixpath.normpath("/" + name), contents
+    finally:
+        files.remove(archive, timeout=timeout)
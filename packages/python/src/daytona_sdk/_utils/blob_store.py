@@ -0,0 +1,151 @@
+import hashlib
+import os
+import posixpath
+import shlex
+import threading
+import uuid
+import weakref
+from collections import OrderedDict
+from typing import Iterator, List, Optional, Sequence, Set, Tuple
+
+from daytona_api_client import ApiClient
+
+# Store of a Sandbox, relative to the user's root directory
+DEFAULT_STORE_DIR = ".daytona/blobs"
+# Store of a volume, relative to its mount path
+VOLUME_STORE_DIR = ".daytona-blobs"
+# Number of blobs and local file hashes remembered per client
+MAX_ENTRIES = 100000
+# Number of files handled per command, which keeps the commands well below the argument size limit
+COMMAND_BATCH = 200
+# Keeps error messages of the commands out of the output they report results in
+_QUIET = "exec 2>/dev/null; "
+
+
+class BlobIndex:
+    """Client-side index of the blobs known to exist in the content-addressed stores of Sandboxes and volumes,
+    and of the hashes of local files, shared by all Sandboxes of an API client.
+
+    Stores are identified by keys, so the blobs of a volume are known to every Sandbox it is mounted in. The
+    least recently used entries are evicted above `MAX_ENTRIES`.
+    """
+
+    _indexes: "weakref.WeakKeyDictionary[ApiClient, BlobIndex]" = weakref.WeakKeyDictionary()
+    _indexes_lock = threading.Lock()
+
+    def __init__(self):
+        self._blobs: "OrderedDict[Tuple[str, str], None]" = OrderedDict()
+        self._file_hashes: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_api_client(cls, api_client: ApiClient) -> "BlobIndex":
+        """Returns the index shared by all Sandboxes of an API client.
+
+        Args:
+            api_client (ApiClient): API client of the Sandboxes.
+
+        Returns:
+            BlobIndex: The shared index.
+        """
+        with cls._indexes_lock:
+            index = cls._indexes.get(api_client)
+            if index is None:
+                index = cls._indexes[api_client] = cls()
+            return index
+
+    def contains(self, store: str, digest: str) -> bool:
+        with self._lock:
+            key = (store, digest)
+            if key not in self._blobs:
+                return False
+            self._blobs.move_to_end(key)
+            return True
+
+    def add(self, store: str, digests: Sequence[str]) -> None:
+        with self._lock:
+            for digest in digests:
+                self._blobs[(store, digest)] = None
+                self._blobs.move_to_end((store, digest))
+            while len(self._blobs) > MAX_ENTRIES:
+                self._blobs.popitem(last=False)
+
+    def discard(self, store: str, digest: str) -> None:
+        with self._lock:
+            self._blobs.pop((store, digest), None)
+
+    def file_sha256(self, path: str) -> str:
+        """Returns the SHA-256 hash of a local file, hashing it again only if its size or mtime changed."""
+        stat = os.stat(path)
+        key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            digest = self._file_hashes.get(key)
+            if digest is not None:
+                self._file_hashes.move_to_end(key)
+                return digest
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        with self._lock:
+            self._file_hashes[key] = digest.hexdigest()
+            while len(self._file_hashes) > MAX_ENTRIES:
+                self._file_hashes.popitem(last=False)
+        return digest.hexdigest()
+
+
+def _batches(items: List, size: int = COMMAND_BATCH) -> Iterator[List]:
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+def lookup_commands(store: str, digests: List[str]) -> Iterator[str]:
+    """Commands that print those of the digests that have a blob in the store, one per line."""
+    for batch in _batches(digests):
+        yield (
+            f"{_QUIET}cd {shlex.quote(store)} || exit 0; "
+            f"for h in {' '.join(batch)}; do [ -f $h ] && echo $h; done; true"
+        )
+
+
+def materialize_commands(store: str, files: List[Tuple[str, str]], link: bool) -> Iterator[Tuple[int, str]]:
+    """Commands that create files from the blobs of the store, given as (digest, destination) pairs.
+
+    Each command prints the positions of the files it created, one per line, and is yielded with the position
+    of its first file. Copies are written next to the destination and moved over it, so a destination that is
+    a hard link to a blob never has the blob overwritten.
+    """
+    for start in range(0, len(files), COMMAND_BATCH):
+        commands = []
+        for i, (digest, destination) in enumerate(files[start : start + COMMAND_BATCH]):
+            blob = shlex.quote(f"{store}/{digest}")
+            dst = shlex.quote(destination)
+            temp = shlex.quote(f"{destination}.daytona-blob")
+            copy = f"cp {blob} {temp} && mv -f {temp} {dst}"
+            create = f"{{ ln -f {blob} {dst} || {{ {copy}; }}; }}" if link else f"{{ {copy}; }}"
+            parent = shlex.quote(posixpath.dirname(destination) or "/")
+            commands.append(f"[ -f {blob} ] && mkdir -p {parent} && {create} && echo {i}")
+        yield start, _QUIET + "; ".join(commands) + "; true"
+
+
+def store_commands(store: str, files: List[Tuple[str, str]]) -> Iterator[str]:
+    """Commands that copy uploaded files, given as (digest, path) pairs, into the store and print the digests
+    of the blobs that exist afterwards."""
+    for batch in _batches(files):
+        commands = [f"{_QUIET}mkdir -p {shlex.quote(store)}"]
+        for digest, path in batch:
+            blob = shlex.quote(f"{store}/{digest}")
+            # Sandboxes sharing a volume may store the same blob at the same time
+            temp = shlex.quote(f"{store}/{digest}.{uuid.uuid4().hex[:8]}.tmp")
+            copy = f"cp {shlex.quote(path)} {temp} && mv -f {temp} {blob}"
+            commands.append(f"{{ [ -f {blob} ] || {{ {copy}; }}; }} && echo {digest}")
+        yield "; ".join(commands) + "; true"
+
+
+def parse_lines(output: str) -> Set[str]:
+    return {line.strip() for line in output.splitlines() if line.strip()}
+
+
+def store_key(sandbox_id: str, store: str, volume_id: Optional[str]) -> str:
+    """Identifies a store in the index: a volume store is shared by all Sandboxes that mount the volume."""
+    return f"volume:{volume_id}" if volume_id else f"sandbox:{sandbox_id}:{store}"
@@ -0,0 +1,108 @@
+import shlex
+import zlib
+from typing import Any, BinaryIO, Iterator, Union
+
+from ..common.compression import Compression
+from ..common.errors import DaytonaError
+
+# Size of the chunks read from a source while it is compressed
+_READ_CHUNK_SIZE = 256 * 1024
+# zlib window bits selecting the gzip container format
+_GZIP_WBITS = 31
+
+_SHELL_TOOLS = {Compression.GZIP: "gzip", Compression.ZSTD: "zstd -q"}
+_EXTENSIONS = {Compression.GZIP: "gz", Compression.ZSTD: "zst"}
+
+
+def _zstandard() -> Any:
+    try:
+        import zstandard  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        raise DaytonaError(  # pylint: disable=raise-missing-from
+            "Zstandard compression requires the 'zstandard' package. "
+            "Install it with `pip install daytona_sdk[zstd]`."
+        )
+    return zstandard
+
+
+def resolve(compression: Union[Compression, str]) -> Compression:
+    """Validates a compression algorithm and checks that it is supported locally."""
+    try:
+        algorithm = Compression(compression)
+    except ValueError:
+        raise DaytonaError(f"Unsupported compression: {compression}")  # pylint: disable=raise-missing-from
+    if algorithm == Compression.ZSTD:
+        _zstandard()
+    return algorithm
+
+
+def extension(compression: Compression) -> str:
+    return _EXTENSIONS[compression]
+
+
+def shell_compress(compression: Compression) -> str:
+    """Returns the shell command compressing its standard input to its standard output."""
+    return f"{_SHELL_TOOLS[compression]} -c"
+
+
+def shell_decompress(compression: Compression) -> str:
+    """Returns the shell command decompressing its standard input to its standard output."""
+    return f"{_SHELL_TOOLS[compression]} -dc"
+
+
+def decompress_files_command(manifest_file: str, compression: Compression) -> str:
+    """Builds the shell command that decompresses staged files of the Sandbox into their destinations.
+
+    The (staged file, destination) pairs are read from `manifest_file`, a file with the flattened pairs encoded
+    by `path_list`, rather than passed as arguments, so any number of them fits into the command. The staged
+    files and the manifest are removed by the command, which fails if one of the files could not be
+    decompressed.
+    """
+    manifest = shlex.quote(manifest_file)
+    decompress = f'{shell_decompress(compression)} < "$0" > "$1"; status=$?; rm -f "$0"; exit $status'
+    return f"xargs -0 -n 2 sh -c {shlex.quote(decompress)} < {manifest}\nstatus=$?; rm -f {manifest}; exit $status"
+
+
+def _compressor(compression: Compression) -> Any:
+    if compression == Compression.ZSTD:
+        return _zstandard().ZstdCompressor().compressobj()
+    return zlib.compressobj(wbits=_GZIP_WBITS)
+
+
+def decompressor(compression: Compression) -> Any:
+    """Returns an object whose `decompress` method decompresses a stream chunk by chunk."""
+    if compression == Compression.ZSTD:
+        return _zstandard().ZstdDecompressor().decompressobj()
+    return zlib.decompressobj(wbits=_GZIP_WBITS)
+
+
+def compress_bytes(data: bytes, compression: Compression) -> bytes:
+    compressor = _compressor(compression)
+    return compressor.compress(data) + compressor.flush()
+
+
+def decompress_bytes(data: bytes, compression: Compression) -> bytes:
+    return decompressor(compression).decompress(data)
+
+
+def compress_chunks(f: BinaryIO, compression: Compression) -> Iterator[bytes]:
+    """Compresses a stream as it is read, yielding the compressed chunks."""
+    compressor = _compressor(compression)
+    for chunk in iter(lambda: f.read(_READ_CHUNK_SIZE), b""):
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def decompress_chunks(chunks: Iterator[bytes], compression: Compression) -> Iterator[bytes]:
+    """Decompresses a stream of compressed chunks, yielding the decompressed chunks."""
+    stream = decompressor(compression)
+    for chunk in chunks:
+        decompressed = stream.decompress(chunk)
+        if decompressed:
+            yield decompressed
+    if hasattr(stream, "flush"):
+        rest = stream.flush()
+        if rest:
+            yield rest
@@ -0,0 +1,213 @@
+import hashlib
+import json
+import shlex
+from dataclasses import dataclass
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+
+# Size of the blocks files are compared in
+DEFAULT_BLOCK_SIZE = 64 * 1024
+# Maximum number of changed byte ranges packed in the Sandbox for a delta download. Downloads of files with more
+# scattered changes send the whole file instead, which costs about as much as seeking to every range.
+MAX_PACK_RANGES = 2048
+COPY_CHUNK_SIZE = 1024 * 1024
+
+# An operation of a delta: ["c", first block, block count] copies blocks of the old file,
+# ["d", offset, length] takes `length` bytes of new data, which start at `offset` in the new file.
+Operation = List[Union[str, int]]
+
+# Runs in the Sandbox with python3. "sig" prints the size and SHA-256 of a file followed by the digests of its
+# blocks, "pack" writes byte ranges of a file into another one and "patch" rebuilds a file from a delta.
+_HELPER = r"""
+import hashlib, json, os, shutil, sys
+
+def copy(source, target, length, digest):
+    while length > 0:
+        data = source.read(min(length, 1 << 20))
+        if not data:
+            break
+        target.write(data)
+        digest.update(data)
+        length -= len(data)
+
+mode, path = sys.argv[1], sys.argv[2]
+if mode == "sig":
+    size = int(sys.argv[3])
+    digest = hashlib.sha256()
+    blocks = []
+    with open(path, "rb") as f:
+        for data in iter(lambda: f.read(size), b""):
+            digest.update(data)
+            blocks.append(hashlib.blake2b(data, digest_size=16).hexdigest())
+    print(os.path.getsize(path), digest.hexdigest())
+    print("\n".join(blocks))
+elif mode == "pack":
+    try:
+        with open(path, "rb") as f, open(sys.argv[3], "wb") as out, open(sys.argv[4]) as ranges:
+            for item in ranges:
+                offset, length = map(int, item.split())
+                f.seek(offset)
+                copy(f, out, length, hashlib.sha256())
+    finally:
+        os.remove(sys.argv[4])
+elif mode == "patch":
+    temp = path + ".daytona-patch"
+    try:
+        with open(sys.argv[3], "rb") as delta:
+            header = json.loads(delta.readline())
+            size = header["block_size"]
+            digest = hashlib.sha256()
+            with open(path, "rb") as old, open(temp, "wb") as new:
+                for op in header["ops"]:
+                    if op[0] == "c":
+                        old.seek(op[1] * size)
+                        copy(old, new, op[2] * size, digest)
+                    else:
+                        copy(delta, new, op[2], digest)
+        if digest.hexdigest() != header["sha256"]:
+            sys.exit("The patched file does not match the local file, it may have changed during the transfer")
+        shutil.copymode(path, temp)
+        os.replace(temp, path)
+    finally:
+        for leftover in (temp, sys.argv[3]):
+            if os.path.exists(leftover):
+                os.remove(leftover)
+"""
+
+
+@dataclass
+class Signature:
+    """Block digests of a file, which tell which of its blocks another version of the file already has.
+
+    Attributes:
+        size (int): Size of the file in bytes.
+        sha256 (str): SHA-256 hash of the whole file.
+        blocks (List[str]): Digests of the consecutive blocks of the file.
+    """
+
+    size: int
+    sha256: str
+    blocks: List[str]
+
+
+def _block_digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def file_signature(path: str, block_size: int) -> Signature:
+    """Computes the signature of a local file."""
+    digest = hashlib.sha256()
+    blocks = []
+    size = 0
+    with open(path, "rb") as f:
+        for data in iter(lambda: f.read(block_size), b""):
+            digest.update(data)
+            blocks.append(_block_digest(data))
+            size += len(data)
+    return Signature(size, digest.hexdigest(), blocks)
+
+
+def signature_command(path: str, block_size: int) -> str:
+    """Command that prints the signature of a Sandbox file, or nothing if the file does not exist or python3 is
+    not available."""
+    quoted = shlex.quote(path)
+    return (
+        f"if [ -f {quoted} ] && command -v python3 >/dev/null 2>&1; then "
+        f"python3 -c {shlex.quote(_HELPER)} sig {quoted} {block_size}; fi"
+    )
+
+
+def parse_signature(output: str) -> Optional[Signature]:
+    lines = output.split()
+    if len(lines) < 2:
+        return None
+    return Signature(int(lines[0]), lines[1], lines[2:])
+
+
+def range_list(ranges: List[Tuple[int, int]]) -> bytes:
+    """Encodes (offset, length) ranges as the list read by the command built by `pack_command`."""
+    return "".join(f"{offset} {length}\n" for offset, length in ranges).encode()
+
+
+def pack_command(path: str, target: str, ranges_path: str) -> str:
+    """Command that writes byte ranges of a Sandbox file one after another into `target`. The ranges are read
+    from `ranges_path`, a file with the list built by `range_list`, which is removed afterwards."""
+    return (
+        f"python3 -c {shlex.quote(_HELPER)} pack {shlex.quote(path)} {shlex.quote(target)} {shlex.quote(ranges_path)}"
+    )
+
+
+def patch_command(path: str, delta_path: str) -> str:
+    """Command that rebuilds a Sandbox file from a delta uploaded to `delta_path`, which is removed afterwards."""
+    return f"python3 -c {shlex.quote(_HELPER)} patch {shlex.quote(path)} {shlex.quote(delta_path)}"
+
+
+def plan(new: Signature, old: Signature, block_size: int) -> List[Operation]:
+    """Describes the new version of a file as blocks of the old version and new data.
+
+    Blocks are matched at block boundaries, anywhere in the old file, which finds in-place edits, appends,
+    truncations and moved blocks. Consecutive blocks are merged into a single operation.
+    """
+    old_blocks: Dict[str, int] = {}
+    for index, digest in enumerate(old.blocks):
+        old_blocks.setdefault(digest, index)
+
+    ops: List[Operation] = []
+    for index, digest in enumerate(new.blocks):
+        match = old_blocks.get(digest)
+        if match is not None:
+            if ops and ops[-1][0] == "c" and ops[-1][1] + ops[-1][2] == match:
+                ops[-1][2] += 1
+            else:
+                ops.append(["c", match, 1])
+            continue
+        offset = index * block_size
+        length = min(block_size, new.size - offset)
+        if ops and ops[-1][0] == "d":
+            ops[-1][2] += length
+        else:
+            ops.append(["d", offset, length])
+    return ops
+
+
+def data_ranges(ops: List[Operation]) -> List[Tuple[int, int]]:
+    """Returns the (offset, length) ranges of the new data of a delta."""
+    return [(op[1], op[2]) for op in ops if op[0] == "d"]
+
+
+def delta_chunks(path: str, new: Signature, ops: List[Operation], block_size: int) -> Iterator[bytes]:
+    """Encodes the delta of a local file for the `patch` helper: a JSON header with the operations, followed by
+    the new data read from the file."""
+    header = {"block_size": block_size, "sha256": new.sha256, "ops": ops}
+    yield json.dumps(header, separators=(",", ":")).encode() + b"\n"
+    with open(path, "rb") as f:
+        for offset, length in data_ranges(ops):
+            f.seek(offset)
+            while length > 0:
+                data = f.read(min(length, COPY_CHUNK_SIZE))
+                if not data:
+                    raise ValueError(f"{path} changed while its delta was sent")
+                yield data
+                length -= len(data)
+
+
+def apply_delta(old: BinaryIO, data: BinaryIO, ops: List[Operation], block_size: int, target: BinaryIO) -> str:
+    """Writes the new version of a file from its old version and the new data of a delta.
+
+    Returns:
+        str: SHA-256 hash of the written file.
+    """
+    digest = hashlib.sha256()
+    for op in ops:
+        if op[0] == "c":
+            old.seek(op[1] * block_size)
+            source, length = old, op[2] * block_size
+        else:
+            source, length = data, op[2]
+        while length > 0:
+            chunk = source.read(min(length, COPY_CHUNK_SIZE))
+            if not chunk:
+                break
+            target.write(chunk)
+            digest.update(chunk)
+            length -= len(chunk)
+    return digest.hexdigest()
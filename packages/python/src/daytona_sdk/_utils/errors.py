@@ -1,4 +1,5 @@
 import functools
+import inspect
 import json
 from typing import Callable, ParamSpec, TypeVar
 
@@ -19,20 +20,66 @@ def intercept_errors(
         message_prefix (str): Custom message prefix for the error.
     """
 
+    def process_error(e: Exception) -> DaytonaError:
+        if isinstance(e, OpenApiException):
+            message = _get_open_api_exception_message(e)
+            return DaytonaError(f"{message_prefix}{message}")
+        if message_prefix:
+            return DaytonaError(f"{message_prefix}{str(e)}")
+        return DaytonaError(str(e))
+
     def decorator(func: Callable[P, T]) -> Callable[P, T]:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+                try:
+                    return await func(*args, **kwargs)
+                except OpenApiException as e:
+                    raise process_error(e) from None
+                except Exception as e:
+                    raise process_error(e)  # pylint: disable=raise-missing-from
+
+            return async_wrapper
+
+        if inspect.isasyncgenfunction(func):
+
+            @functools.wraps(func)
+            async def async_generator_wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+                generator = func(*args, **kwargs)
+                try:
+                    async for item in generator:
+                        yield item
+                except OpenApiException as e:
+                    raise process_error(e) from None
+                except Exception as e:
+                    raise process_error(e)  # pylint: disable=raise-missing-from
+                finally:
+                    await generator.aclose()
+
+            return async_generator_wrapper
+
+        if inspect.isgeneratorfunction(func):
+
+            @functools.wraps(func)
+            def generator_wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+                try:
+                    return (yield from func(*args, **kwargs))
+                except OpenApiException as e:
+                    raise process_error(e) from None
+                except Exception as e:
+                    raise process_error(e)  # pylint: disable=raise-missing-from
+
+            return generator_wrapper
+
         @functools.wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
             try:
                 return func(*args, **kwargs)
             except OpenApiException as e:
-                message = _get_open_api_exception_message(e)
-
-                raise DaytonaError(f"{message_prefix}{message}") from None
+                raise process_error(e) from None
             except Exception as e:
-                if message_prefix:
-                    message = f"{message_prefix}{str(e)}"
-                    raise DaytonaError(message)  # pylint: disable=raise-missing-from
-                raise DaytonaError(str(e))  # pylint: disable=raise-missing-from
+                raise process_error(e)  # pylint: disable=raise-missing-from
 
         return wrapper
 
@@ -0,0 +1,316 @@
+import hashlib
+import math
+import os
+import shlex
+import shutil
+import tempfile
+import uuid
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+
+from ..common.compression import Compression
+from ..common.errors import DaytonaError
+from ..common.filesystem import FileUpload, UploadSource
+from ..transport import get_transport
+from . import compression as compression_utils
+from . import delta as delta_utils
+from .multipart import LimitedReader
+from .ranged_download import download_to_file, resume_download_to_file
+from .toolbox_files import ToolboxFiles
+from .transfer_journal import DOWNLOAD_JOURNAL_SUFFIX, TransferJournal
+
+# Size of the parts of a resumable upload
+DEFAULT_PART_SIZE = 64 * 1024 * 1024
+# Suffix of the Sandbox directory holding the parts of a resumable upload until they are joined
+UPLOAD_PARTS_SUFFIX = ".daytona-parts"
+
+
+def download_compressed(
+    files: ToolboxFiles, remote_path: str, timeout: int, compression: Compression, threshold: int
+) -> Optional[Iterator[bytes]]:
+    """Compresses a Sandbox file into a staging file if it is at least `threshold` bytes large.
+
+    Returns:
+        Optional[Iterator[bytes]]: The decompressed contents of the file streamed from the staging file, which
+        is removed once they are consumed, or None if the file is too small to be compressed.
+    """
+    staged = files.staging_path(compression_utils.extension(compression))
+    quoted = shlex.quote(remote_path)
+    # A missing file falls through to the regular download, which reports it
+    output = files.run(
+        f"[ -f {quoted} ] && [ $(stat -c %s {quoted}) -ge {threshold} ] || exit 0; "
+        f"{compression_utils.shell_compress(compression)} < {quoted} > {shlex.quote(staged)} && echo staged",
+        timeout,
+    )
+    if output.strip() != "staged":
+        return None
+    return compression_utils.decompress_chunks(files.iter_staged(staged, timeout), compression)
+
+
+def download_compressed_to_file(
+    files: ToolboxFiles, remote_path: str, local_path: str, timeout: int, compression: Compression, threshold: int
+) -> bool:
+    """Downloads a Sandbox file compressed to a local file if it is at least `threshold` bytes large.
+
+    Returns:
+        bool: Whether the file was downloaded, False if it is too small to be compressed.
+    """
+    chunks = download_compressed(files, remote_path, timeout, compression, threshold)
+    if chunks is None:
+        return False
+    parent = os.path.dirname(local_path)
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+    with open(local_path, "wb") as f:
+        for chunk in chunks:
+            f.write(chunk)
+    return True
+
+
+def download_ranges(
+    files: ToolboxFiles,
+    remote_path: str,
+    local_path: str,
+    timeout: int,
+    concurrency: int,
+    range_size: int,
+    resume: bool,
+) -> None:
+    """Downloads a Sandbox file to a local file in byte ranges, see `FileSystem.download_file`."""
+    url = files.download_url(remote_path)
+    api_client = files.toolbox_api.api_client
+    transport = get_transport(api_client)
+    if not resume:
+        download_to_file(
+            transport.client,
+            url,
+            api_client.default_headers,
+            local_path,
+            transport.timeout(timeout),
+            concurrency=concurrency,
+            range_size=range_size,
+        )
+        return
+
+    info = files.toolbox_api.get_file_info(files.instance.id, path=remote_path)
+    # A changed remote file invalidates the ranges downloaded before
+    identity = {
+        "sandbox_id": files.instance.id,
+        "remote_path": remote_path,
+        "size": int(info.size),
+        "mod_time": info.mod_time,
+        "range_size": range_size,
+    }
+    resume_download_to_file(
+        transport.client,
+        url,
+        api_client.default_headers,
+        local_path,
+        transport.timeout(timeout),
+        int(info.size),
+        TransferJournal(f"{local_path}{DOWNLOAD_JOURNAL_SUFFIX}", identity),
+        concurrency=concurrency,
+        range_size=range_size,
+    )
+
+
+def upload_in_place(
+    files: ToolboxFiles,
+    local_path: UploadSource,
+    remote_path: str,
+    timeout: int,
+    resume: bool,
+    part_size: int,
+    compression: Optional[Compression],
+    compression_threshold: int,
+    delta_block_size: Optional[int],
+) -> bool:
+    """Uploads a local file as a delta if `delta_block_size` is set, or else in parts with `resume`, see
+    `FileSystem.upload_file`.
+
+    Returns:
+        bool: Whether the Sandbox file is up to date, False if the whole file has to be sent instead.
+    """
+    if delta_block_size is not None:
+        if resume:
+            raise DaytonaError("Delta uploads can not be combined with resume")
+        with files.changing(remote_path):
+            return upload_delta(
+                files, local_path, remote_path, timeout, delta_block_size, compression, compression_threshold
+            )
+    if not resume:
+        return False
+    if compression is not None:
+        raise DaytonaError("Compression can not be combined with resume")
+    with files.changing(remote_path, f"{remote_path}{UPLOAD_PARTS_SUFFIX}"):
+        upload_resumable(files, local_path, remote_path, timeout, part_size)
+    return True
+
+
+def upload_resumable(
+    files: ToolboxFiles, local_path: UploadSource, remote_path: str, timeout: int, part_size: int
+) -> None:
+    """Uploads a local file in parts that survive a failed attempt, see `FileSystem.upload_file`."""
+    if not isinstance(local_path, str):
+        raise DaytonaError("Only uploads from a local file can be resumed")
+    if part_size < 1:
+        raise DaytonaError("Part size must be a positive integer")
+
+    staging_dir = f"{remote_path}{UPLOAD_PARTS_SUFFIX}"
+    stat = os.stat(local_path)
+    # A changed local file invalidates the parts uploaded before
+    journal = TransferJournal.for_upload(
+        {
+            "sandbox_id": files.instance.id,
+            "local_path": os.path.abspath(local_path),
+            "remote_path": remote_path,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "part_size": part_size,
+        }
+    )
+
+    if journal.load() and journal.completed:
+        # Parts of the previous attempt only count if they are still intact in the Sandbox
+        remote_hashes = files.sha256_files(staging_dir, timeout)
+        for name, digest in list(journal.completed.items()):
+            if remote_hashes.get(name) != digest:
+                journal.discard(name)
+    else:
+        files.run(f"rm -rf {shlex.quote(staging_dir)} && mkdir -p {shlex.quote(staging_dir)}", timeout)
+        journal.reset()
+
+    part_count = max(1, math.ceil(stat.st_size / part_size))
+    with open(local_path, "rb") as f:
+        for index in range(part_count):
+            name = f"{index:06d}"
+            if name in journal.completed:
+                continue
+            # The part is streamed from the file and hashed as it is sent, so it is never held in memory
+            f.seek(index * part_size)
+            digest = hashlib.sha256()
+            files.upload([FileUpload(LimitedReader(f, part_size, digest.update), f"{staging_dir}/{name}")], timeout)
+            journal.mark(name, digest.hexdigest())
+
+    temp_path = f"{staging_dir}.tmp"
+    size = files.run(
+        f"set -e; cd {shlex.quote(staging_dir)}; "
+        f"for i in $(seq 0 {part_count - 1}); do cat $(printf '%06d' $i); done > {shlex.quote(temp_path)}; "
+        f"mv {shlex.quote(temp_path)} {shlex.quote(remote_path)}; cd /; rm -rf {shlex.quote(staging_dir)}; "
+        f"stat -c %s {shlex.quote(remote_path)}",
+        timeout,
+    )
+    if int(size.strip()) != stat.st_size:
+        raise DaytonaError(f"Uploaded file has {size.strip()} bytes, expected {stat.st_size}")
+    journal.delete()
+
+
+def upload_delta(
+    files: ToolboxFiles,
+    local_path: UploadSource,
+    remote_path: str,
+    timeout: int,
+    block_size: int,
+    compression: Optional[Compression],
+    compression_threshold: int,
+) -> bool:
+    """Sends the blocks of a local file that differ from the Sandbox file it replaces, see
+    `FileSystem.upload_file`.
+
+    Returns:
+        bool: Whether the Sandbox file is up to date, False if the whole file has to be sent instead.
+    """
+    if not isinstance(local_path, str):
+        raise DaytonaError("Only uploads from a local file can be sent as a delta")
+    if block_size < 1:
+        raise DaytonaError("Block size must be a positive integer")
+
+    old = delta_utils.parse_signature(files.run(delta_utils.signature_command(remote_path, block_size), timeout))
+    if old is None:
+        return False
+    new = delta_utils.file_signature(local_path, block_size)
+    if new.sha256 == old.sha256:
+        return True
+
+    ops = delta_utils.plan(new, old, block_size)
+    delta_path = f"{remote_path}.daytona-{uuid.uuid4().hex[:8]}.delta"
+    files.upload(
+        [FileUpload(delta_utils.delta_chunks(local_path, new, ops, block_size), delta_path)],
+        timeout,
+        compression,
+        compression_threshold,
+    )
+    # The helper verifies the hash of the rebuilt file and removes the delta
+    files.run(delta_utils.patch_command(remote_path, delta_path), timeout)
+    return True
+
+
+def download_delta(
+    files: ToolboxFiles,
+    remote_path: str,
+    local_path: str,
+    timeout: int,
+    block_size: int,
+    compression: Optional[Compression],
+    compression_threshold: int,
+) -> bool:
+    """Downloads the blocks of a Sandbox file that differ from the local file it replaces, see
+    `FileSystem.download_file`.
+
+    Returns:
+        bool: Whether the local file is up to date, False if the whole file has to be downloaded instead.
+    """
+    if block_size < 1:
+        raise DaytonaError("Block size must be a positive integer")
+    if not os.path.isfile(local_path):
+        return False
+    new = delta_utils.parse_signature(files.run(delta_utils.signature_command(remote_path, block_size), timeout))
+    if new is None:
+        return False
+    old = delta_utils.file_signature(local_path, block_size)
+    if new.sha256 == old.sha256:
+        return True
+    ops = delta_utils.plan(new, old, block_size)
+    ranges = delta_utils.data_ranges(ops)
+    if len(ranges) > delta_utils.MAX_PACK_RANGES:
+        return False
+
+    temp_path = f"{local_path}.daytona-{uuid.uuid4().hex[:8]}"
+    try:
+        with tempfile.TemporaryFile() as data:
+            if ranges:
+                _download_pack(files, remote_path, ranges, data, timeout, compression, compression_threshold)
+                data.seek(0)
+            with open(local_path, "rb") as old_file, open(temp_path, "wb") as target:
+                digest = delta_utils.apply_delta(old_file, data, ops, block_size, target)
+        if digest != new.sha256:
+            raise DaytonaError(f"{remote_path} changed during the download")
+        shutil.copymode(local_path, temp_path)
+        os.replace(temp_path, local_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    return True
+
+
+def _download_pack(
+    files: ToolboxFiles,
+    remote_path: str,
+    ranges: List[Tuple[int, int]],
+    target: BinaryIO,
+    timeout: int,
+    compression: Optional[Compression],
+    compression_threshold: int,
+) -> None:
+    """Packs byte ranges of a Sandbox file into a staging file and downloads it into `target`."""
+    pack = files.staging_path("pack")
+    listed = f"{pack}.ranges"
+    try:
+        files.upload([FileUpload(delta_utils.range_list(ranges), listed)], timeout)
+        files.run(delta_utils.pack_command(remote_path, pack, listed), timeout)
+        chunks = None
+        if compression is not None:
+            chunks = download_compressed(files, pack, timeout, compression, compression_threshold)
+        for chunk in chunks if chunks is not None else files.iter_file(pack, timeout):
+            target.write(chunk)
+    finally:
+        files.remove(pack, listed, timeout=timeout)
@@ -0,0 +1,234 @@
+import copy
+import posixpath
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional, Tuple, TypeVar
+
+from ..common.errors import DaytonaError
+from .path import prefix_relative_path
+
+# Kinds of cached entries
+FILE_INFO = "info"
+LISTING = "list"
+# Defaults of the opt-in cache
+DEFAULT_TTL = 5.0
+DEFAULT_MAX_ENTRIES = 1024
+
+T = TypeVar("T")
+
+
+@dataclass
+class MetadataCacheStats:
+    """Usage statistics of the metadata cache of a Sandbox file system.
+
+    Attributes:
+        hits (int): Lookups answered from the cache.
+        misses (int): Lookups that had to call the API, including those of expired entries.
+        expirations (int): Entries dropped because they outlived the TTL.
+        evictions (int): Entries dropped because the cache was full.
+        invalidations (int): Entries dropped because the SDK changed the paths they describe.
+        size (int): Number of entries currently cached.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    expirations: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups answered from the cache, between 0 and 1."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class MetadataCache:
+    """File infos and directory listings of one Sandbox, keyed by absolute path.
+
+    Entries expire `ttl` seconds after they were stored, and the least recently used entries are evicted
+    above `max_entries`. Writes invalidate the entries of the written path, of everything below it and of
+    its ancestor directories, whose listings change when the write creates or removes directories.
+    """
+
+    def __init__(self, ttl: float, max_entries: int):
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, Any]]" = OrderedDict()
+        self._stats = MetadataCacheStats()
+        self._lock = threading.Lock()
+
+    def get(self, kind: str, path: str) -> Optional[Any]:
+        key = (kind, posixpath.normpath(path))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                del self._entries[key]
+                self._stats.expirations += 1
+                entry = None
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return entry[1]
+
+    def put(self, kind: str, path: str, value: Any) -> None:
+        key = (kind, posixpath.normpath(path))
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def invalidate(self, path: str) -> None:
+        """Drops the entries of a changed path, of the paths below it and of its ancestor directories."""
+        path = posixpath.normpath(path)
+        prefix = path.rstrip("/") + "/"
+        exact = {path}
+        while posixpath.dirname(path) != path:
+            path = posixpath.dirname(path)
+            exact.add(path)
+        with self._lock:
+            stale = [key for key in self._entries if key[1] in exact or key[1].startswith(prefix)]
+            for key in stale:
+                del self._entries[key]
+            self._stats.invalidations += len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._stats.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def stats(self) -> MetadataCacheStats:
+        with self._lock:
+            return MetadataCacheStats(**{**self._stats.__dict__, "size": len(self._entries)})
+
+
+class _MetadataCacheSettings:
+    """Enables and disables the metadata cache of a file system, and invalidates the paths it changes."""
+
+    def __init__(self):
+        self.cache: Optional[MetadataCache] = None
+
+    def enable(self, ttl: float = DEFAULT_TTL, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """Caches the results of `get_file_info` and `list_files`, so repeated lookups of the same paths do not
+        call the API. Enabling the cache again replaces it with an empty one.
+
+        Writes through the file system (uploads, deletes, moves, new folders, permission changes and
+        replacements) invalidate the entries of the paths they change. Changes made in other ways, e.g. by
+        commands run with `sandbox.process.exec`, only show once the entries expire after `ttl` seconds, or
+        after `invalidate` was called.
+
+        Args:
+            ttl (float): Time in seconds an entry is served from the cache. Default is 5 seconds.
+            max_entries (int): Maximum number of cached file infos and listings. The least recently used entries
+                are evicted first. Default is 1024.
+
+        Example:
+            ```python
+            sandbox.fs.metadata_cache.enable(ttl=30)
+            for _ in range(10):
+                sandbox.fs.get_file_info("workspace/data/file.txt")
+            print(f"Hit rate: {sandbox.fs.metadata_cache.stats.hit_rate:.0%}")
+            ```
+        """
+        if ttl <= 0 or max_entries < 1:
+            raise DaytonaError("Metadata cache TTL and size must be positive")
+        self.cache = MetadataCache(ttl, max_entries)
+
+    def disable(self) -> None:
+        """Disables the metadata cache and drops its entries."""
+        self.cache = None
+
+    @property
+    def stats(self) -> MetadataCacheStats:
+        """Snapshot of the metadata cache usage statistics. All zero while the cache is disabled.
+
+        Returns:
+            MetadataCacheStats: Hit/miss counters and number of cached entries.
+        """
+        cache = self.cache
+        return cache.stats() if cache is not None else MetadataCacheStats()
+
+    def invalidate_paths(self, *paths: str) -> None:
+        """Drops the entries of absolute paths that were changed, or all entries if no path is given."""
+        cache = self.cache
+        if cache is None:
+            return
+        if not paths:
+            cache.clear()
+        for path in paths:
+            cache.invalidate(path)
+
+
+class MetadataCacheControl(_MetadataCacheSettings):
+    """Opt-in cache of the file infos and directory listings of a Sandbox, available as
+    `sandbox.fs.metadata_cache`. Disabled by default."""
+
+    def __init__(self, get_root_dir: Callable[[], str]):
+        super().__init__()
+        self._get_root_dir = get_root_dir
+
+    def fetch(self, kind: str, path: str, load: Callable[[], T]) -> T:
+        """Returns the metadata of a path of the given kind from the cache, or loads and caches it. Copies keep
+        changes of the caller out of the cache."""
+        cache = self.cache
+        if cache is None:
+            return load()
+        value = cache.get(kind, path)
+        if value is None:
+            value = load()
+            cache.put(kind, path, value)
+        return copy.deepcopy(value)
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """Drops cached metadata, e.g. after files were changed by a command.
+
+        Args:
+            path (Optional[str]): Path whose entries, and those of everything below it and of its ancestor
+                directories, are dropped. Relative paths are resolved based on the user's root directory.
+                Drops all entries if None.
+        """
+        if path is None:
+            self.invalidate_paths()
+        elif self.cache is not None:
+            self.invalidate_paths(prefix_relative_path(self._get_root_dir(), path))
+
+
+class AsyncMetadataCacheControl(_MetadataCacheSettings):
+    """Opt-in cache of the file infos and directory listings of a Sandbox, available as
+    `sandbox.fs.metadata_cache` of an `AsyncSandbox`. Disabled by default."""
+
+    def __init__(self, get_root_dir: Callable[[], Awaitable[str]]):
+        super().__init__()
+        self._get_root_dir = get_root_dir
+
+    async def fetch(self, kind: str, path: str, load: Callable[[], Awaitable[T]]) -> T:
+        """Returns the metadata of a path of the given kind from the cache, or loads and caches it. Copies keep
+        changes of the caller out of the cache."""
+        cache = self.cache
+        if cache is None:
+            return await load()
+        value = cache.get(kind, path)
+        if value is None:
+            value = await load()
+            cache.put(kind, path, value)
+        return copy.deepcopy(value)
+
+    async def invalidate(self, path: Optional[str] = None) -> None:
+        """Drops cached metadata, e.g. after files were changed by a command.
+
+        Args:
+            path (Optional[str]): Path whose entries, and those of everything below it and of its ancestor
+                directories, are dropped. Relative paths are resolved based on the user's root directory.
+                Drops all entries if None.
+        """
+        if path is None:
+            self.invalidate_paths()
+        elif self.cache is not None:
+            self.invalidate_paths(prefix_relative_path(await self._get_root_dir(), path))
@@ -0,0 +1,154 @@
+import inspect
+import io
+import os
+from typing import Any, AsyncIterable, AsyncIterator, BinaryIO, Callable, Dict, Iterator, List, Tuple
+
+# Size of the chunks read from upload sources
+READ_CHUNK_SIZE = 64 * 1024
+
+
+def is_replayable(source: Any) -> bool:
+    """Whether an upload source can be sent again, which is required to retry the request."""
+    return isinstance(source, (bytes, str))
+
+
+def is_stream(source: Any) -> bool:
+    """Whether an upload source is a readable binary stream, e.g. an open file or a pipe."""
+    return not isinstance(source, (bytes, str)) and hasattr(source, "read")
+
+
+def is_async_iterable(source: Any) -> bool:
+    return isinstance(source, AsyncIterable)
+
+
+def read_chunks(stream: BinaryIO) -> Iterator[bytes]:
+    """Reads a stream in chunks. Sending the chunks instead of the stream keeps HTTP clients from taking the
+    size of a pipe or socket reported by the file system for the length of the stream."""
+    return iter(lambda: stream.read(READ_CHUNK_SIZE), b"")
+
+
+async def _source_chunks(source: Any) -> AsyncIterator[bytes]:
+    if isinstance(source, bytes):
+        yield source
+    elif isinstance(source, str):
+        with open(source, "rb") as f:
+            for chunk in iter(lambda: f.read(READ_CHUNK_SIZE), b""):
+                yield chunk
+    elif is_stream(source):
+        while True:
+            # Streams of asyncio libraries return awaitables
+            chunk = source.read(READ_CHUNK_SIZE)
+            if inspect.isawaitable(chunk):
+                chunk = await chunk
+            if not chunk:
+                return
+            yield bytes(chunk)
+    elif is_async_iterable(source):
+        async for chunk in source:
+            yield bytes(chunk)
+    else:
+        for chunk in source:
+            yield bytes(chunk)
+
+
+def _quote(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', "%22")
+
+
+async def encode_multipart_async(
+    fields: Dict[str, str], files: List[Tuple[str, str, Any]], boundary: str
+) -> AsyncIterator[bytes]:
+    """Encodes a multipart/form-data body as it is sent, reading each file source only when its part is reached.
+
+    Args:
+        fields (Dict[str, str]): Form fields by name.
+        files (List[Tuple[str, str, Any]]): The (field name, file name, source) of the files. A source is bytes, a
+            local file path, a readable binary stream (sync or async), or a sync or async iterator of bytes.
+        boundary (str): Boundary of the parts, which must also be set in the Content-Type header.
+
+    Yields:
+        bytes: Chunks of the body.
+    """
+    for name, value in fields.items():
+        yield f'--{boundary}\r\nContent-Disposition: form-data; name="{_quote(name)}"\r\n\r\n{value}\r\n'.encode()
+    for name, filename, source in files:
+        yield (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="{_quote(name)}"; filename="{_quote(filename)}"\r\n'
+            "Content-Type: application/octet-stream\r\n\r\n"
+        ).encode()
+        async for chunk in _source_chunks(source):
+            if chunk:
+                yield chunk
+        yield b"\r\n"
+    yield f"--{boundary}--\r\n".encode()
+
+
+class CountingReader(io.RawIOBase):
+    """Wraps a readable binary stream and reports the number of bytes read from it.
+
+    `fileno`, `tell` and `seek` are passed through, so HTTP clients can still determine the length of files
+    and rewind them to resend a request. Rewinding to the start resets the count.
+    """
+
+    def __init__(self, stream: BinaryIO, on_read: Callable[[int], None]):
+        super().__init__()
+        self._stream = stream
+        self._on_read = on_read
+        self._count = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        data = self._stream.read(len(b))
+        if not data:
+            return 0
+        size = len(data)
+        b[:size] = data
+        self._count += size
+        self._on_read(self._count)
+        return size
+
+    def fileno(self) -> int:
+        return self._stream.fileno()
+
+    def seekable(self) -> bool:
+        return hasattr(self._stream, "seek") and self._stream.seekable()
+
+    def tell(self) -> int:
+        return self._stream.tell()
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        position = self._stream.seek(offset, whence)
+        if position == 0:
+            self._count = 0
+        return position
+
+
+class LimitedReader(io.RawIOBase):
+    """Reads at most `limit` bytes of a binary stream from its current position, e.g. one part of a file, and
+    passes the bytes to `on_data` as they are read."""
+
+    def __init__(self, stream: BinaryIO, limit: int, on_data: Callable[[bytes], None]):
+        super().__init__()
+        self._stream = stream
+        self._remaining = limit
+        self._on_data = on_data
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        data = self._stream.read(min(len(b), self._remaining)) if self._remaining > 0 else b""
+        if not data:
+            return 0
+        size = len(data)
+        b[:size] = data
+        self._remaining -= size
+        self._on_data(data)
+        return size
+
+
+def new_boundary() -> str:
+    return os.urandom(16).hex()
@@ -0,0 +1,301 @@
+import asyncio
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import BinaryIO, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from ..common.errors import DaytonaError
+from .transfer_journal import TransferJournal
+
+# Size of the byte ranges a file is split into when downloaded over multiple connections
+DEFAULT_RANGE_SIZE = 16 * 1024 * 1024
+# Size of the chunks read from a response and written to disk
+WRITE_CHUNK_SIZE = 64 * 1024
+
+_CONTENT_RANGE_PATTERN = re.compile(r"bytes\s+(\d+)-(\d+)/(\d+|\*)")
+
+
+@dataclass
+class ContentRange:
+    start: int
+    end: int
+    total: Optional[int]
+
+
+def parse_content_range(value: Optional[str]) -> Optional[ContentRange]:
+    """Parses a `Content-Range` response header of the form `bytes <start>-<end>/<total>`."""
+    match = _CONTENT_RANGE_PATTERN.fullmatch((value or "").strip())
+    if not match:
+        return None
+    total = None if match.group(3) == "*" else int(match.group(3))
+    return ContentRange(int(match.group(1)), int(match.group(2)), total)
+
+
+def split_ranges(start: int, total: int, range_size: int) -> List[Tuple[int, int]]:
+    """Splits the bytes from `start` to the end of a file into inclusive (start, end) ranges."""
+    return [(offset, min(offset + range_size, total) - 1) for offset in range(start, total, range_size)]
+
+
+def _prepare(local_path: str) -> None:
+    parent = os.path.dirname(local_path)
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+
+
+def _range_headers(headers: Dict[str, str], start: int, end: int) -> Dict[str, str]:
+    # Ranges refer to the encoded body, so ask for the file as it is
+    return {**headers, "Range": f"bytes={start}-{end}", "Accept-Encoding": "identity"}
+
+
+def _probe(response: httpx.Response) -> Optional[ContentRange]:
+    """Returns the range of the first response if the server honored the range request, or None if it sent the
+    whole file instead."""
+    if response.status_code != 206:
+        return None
+    content_range = parse_content_range(response.headers.get("Content-Range"))
+    if content_range is None or content_range.start != 0 or content_range.total is None:
+        raise DaytonaError(f"Invalid Content-Range header: {response.headers.get('Content-Range')}")
+    return content_range
+
+
+def _check_range(response: httpx.Response, start: int, end: int, total: int) -> None:
+    content_range = parse_content_range(response.headers.get("Content-Range"))
+    if response.status_code != 206 or content_range is None:
+        raise DaytonaError(f"Server did not honor the request for bytes {start}-{end}")
+    if (content_range.start, content_range.end, content_range.total) != (start, end, total):
+        raise DaytonaError("File changed while it was being downloaded")
+
+
+def _check_length(written: int, expected: int) -> None:
+    if written != expected:
+        raise DaytonaError(f"Download is incomplete: received {written} of {expected} bytes")
+
+
+def _check_size(local_path: str, total: int) -> None:
+    size = os.path.getsize(local_path)
+    if size != total:
+        raise DaytonaError(f"Downloaded file has {size} bytes, expected {total}")
+
+
+def _write_stream(response: httpx.Response, f: BinaryIO) -> int:
+    written = 0
+    for chunk in response.iter_bytes(chunk_size=WRITE_CHUNK_SIZE):
+        f.write(chunk)
+        written += len(chunk)
+    return written
+
+
+async def _write_stream_async(response: httpx.Response, f: BinaryIO) -> int:
+    written = 0
+    async for chunk in response.aiter_bytes(chunk_size=WRITE_CHUNK_SIZE):
+        f.write(chunk)
+        written += len(chunk)
+    return written
+
+
+def _expected_length(response: httpx.Response) -> Optional[int]:
+    content_length = response.headers.get("Content-Length")
+    # Compressed responses are decoded while streaming, so their length differs from the header
+    if content_length is None or response.headers.get("Content-Encoding", "identity") != "identity":
+        return None
+    return int(content_length)
+
+
+def download_to_file(
+    client: httpx.Client,
+    url: str,
+    headers: Dict[str, str],
+    local_path: str,
+    timeout: httpx.Timeout,
+    concurrency: int = 1,
+    range_size: int = DEFAULT_RANGE_SIZE,
+) -> None:
+    """Downloads a file into a local file.
+
+    With a concurrency above 1, the file is split into byte ranges that are fetched over parallel connections
+    and written straight to their offset in a preallocated local file. If the server does not support range
+    requests, the file is streamed over a single connection instead.
+
+    Args:
+        client (httpx.Client): Client to send the requests with.
+        url (str): URL of the file.
+        headers (Dict[str, str]): Request headers.
+        local_path (str): Path of the local file, which is overwritten.
+        timeout (httpx.Timeout): Timeout of each request.
+        concurrency (int): Maximum number of ranges downloaded at the same time.
+        range_size (int): Size of each range in bytes.
+
+    Raises:
+        DaytonaError: If the downloaded file is incomplete or the file changed during the download.
+    """
+    if concurrency < 1 or range_size < 1:
+        raise DaytonaError("Concurrency and range size must be positive integers")
+    _prepare(local_path)
+
+    request_headers = headers if concurrency == 1 else _range_headers(headers, 0, range_size - 1)
+    with client.stream("GET", url, headers=request_headers, timeout=timeout) as response:
+        if response.status_code == 416:
+            # Ranges of an empty file can not be satisfied. Release the connection before fetching the whole file.
+            response.close()
+            download_to_file(client, url, headers, local_path, timeout)
+            return
+        response.raise_for_status()
+        first = _probe(response)
+        with open(local_path, "wb") as f:
+            if first is None:
+                written = _write_stream(response, f)
+                expected = _expected_length(response)
+                if expected is not None:
+                    _check_length(written, expected)
+                return
+            total = first.total
+            f.truncate(total)
+            _check_length(_write_stream(response, f), first.end + 1)
+
+    def download_range(byte_range: Tuple[int, int]) -> None:
+        _download_range(client, url, headers, local_path, timeout, byte_range, total)
+
+    _run_parallel(download_range, split_ranges(first.end + 1, total, range_size), concurrency)
+    _check_size(local_path, total)
+
+
+def resume_download_to_file(
+    client: httpx.Client,
+    url: str,
+    headers: Dict[str, str],
+    local_path: str,
+    timeout: httpx.Timeout,
+    size: int,
+    journal: TransferJournal,
+    concurrency: int = 1,
+    range_size: int = DEFAULT_RANGE_SIZE,
+) -> None:
+    """Downloads a file of known size into a local file as byte ranges, recording each completed range in a
+    journal. If the journal of a previous attempt of the same download exists and the partial local file is
+    still in place, only the missing ranges are downloaded. The journal is removed once the download completes.
+
+    Args:
+        client (httpx.Client): Client to send the requests with.
+        url (str): URL of the file.
+        headers (Dict[str, str]): Request headers.
+        local_path (str): Path of the local file.
+        timeout (httpx.Timeout): Timeout of each request.
+        size (int): Size of the remote file in bytes.
+        journal (TransferJournal): Journal of the download. Its identity must change when the remote file does.
+        concurrency (int): Maximum number of ranges downloaded at the same time.
+        range_size (int): Size of each range in bytes.
+
+    Raises:
+        DaytonaError: If the server does not support range requests, the download is incomplete or the file
+            changed during the download.
+    """
+    if concurrency < 1 or range_size < 1:
+        raise DaytonaError("Concurrency and range size must be positive integers")
+    _prepare(local_path)
+
+    resumed = journal.load() and os.path.isfile(local_path) and os.path.getsize(local_path) == size
+    if not resumed:
+        with open(local_path, "wb") as f:
+            f.truncate(size)
+        journal.reset()
+
+    def download_range(byte_range: Tuple[int, int]) -> None:
+        _download_range(client, url, headers, local_path, timeout, byte_range, size)
+        journal.mark(str(byte_range[0]))
+
+    ranges = [
+        byte_range for byte_range in split_ranges(0, size, range_size) if str(byte_range[0]) not in journal.completed
+    ]
+    _run_parallel(download_range, ranges, concurrency)
+    _check_size(local_path, size)
+    journal.delete()
+
+
+def _download_range(
+    client: httpx.Client,
+    url: str,
+    headers: Dict[str, str],
+    local_path: str,
+    timeout: httpx.Timeout,
+    byte_range: Tuple[int, int],
+    total: int,
+) -> None:
+    start, end = byte_range
+    with client.stream("GET", url, headers=_range_headers(headers, start, end), timeout=timeout) as response:
+        response.raise_for_status()
+        _check_range(response, start, end, total)
+        with open(local_path, "r+b") as f:
+            f.seek(start)
+            _check_length(_write_stream(response, f), end - start + 1)
+
+
+def _run_parallel(func: Callable[[Tuple[int, int]], None], ranges: List[Tuple[int, int]], concurrency: int) -> None:
+    if not ranges:
+        return
+    executor = ThreadPoolExecutor(max_workers=min(concurrency, len(ranges)))
+    try:
+        list(executor.map(func, ranges))
+    finally:
+        # Stop scheduling the remaining ranges as soon as one of them fails
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+async def download_to_file_async(
+    client: httpx.AsyncClient,
+    url: str,
+    headers: Dict[str, str],
+    local_path: str,
+    timeout: httpx.Timeout,
+    concurrency: int = 1,
+    range_size: int = DEFAULT_RANGE_SIZE,
+) -> None:
+    """Asyncio counterpart of `download_to_file`."""
+    if concurrency < 1 or range_size < 1:
+        raise DaytonaError("Concurrency and range size must be positive integers")
+    _prepare(local_path)
+
+    request_headers = headers if concurrency == 1 else _range_headers(headers, 0, range_size - 1)
+    async with client.stream("GET", url, headers=request_headers, timeout=timeout) as response:
+        if response.status_code == 416:
+            await response.aclose()
+            await download_to_file_async(client, url, headers, local_path, timeout)
+            return
+        response.raise_for_status()
+        first = _probe(response)
+        with open(local_path, "wb") as f:
+            if first is None:
+                written = await _write_stream_async(response, f)
+                expected = _expected_length(response)
+                if expected is not None:
+                    _check_length(written, expected)
+                return
+            total = first.total
+            f.truncate(total)
+            _check_length(await _write_stream_async(response, f), first.end + 1)
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def download_range(start: int, end: int) -> None:
+        async with semaphore:
+            async with client.stream(
+                "GET", url, headers=_range_headers(headers, start, end), timeout=timeout
+            ) as response:
+                response.raise_for_status()
+                _check_range(response, start, end, total)
+                with open(local_path, "r+b") as f:
+                    f.seek(start)
+                    _check_length(await _write_stream_async(response, f), end - start + 1)
+
+    ranges = split_ranges(first.end + 1, total, range_size)
+    tasks = [asyncio.ensure_future(download_range(start, end)) for start, end in ranges]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        # Stop the remaining ranges as soon as one of them fails, and wait until their connections are released
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    _check_size(local_path, total)
@@ -0,0 +1,149 @@
+import io
+import os
+import re
+from typing import Dict, Iterator, Optional
+
+import httpx
+
+from ..common.errors import DaytonaError
+from .ranged_download import WRITE_CHUNK_SIZE, parse_content_range
+
+_UNSATISFIED_RANGE_PATTERN = re.compile(r"bytes\s+\*/(\d+)")
+
+
+class RemoteFileReader(io.RawIOBase):
+    """An unbuffered binary stream of a Sandbox file, read over HTTP as it is consumed.
+
+    The file is requested from the current position with an open-ended range request. If the server honors
+    range requests, the stream is seekable: seeking only moves the position, and the next read requests the
+    file from there. Otherwise the file can only be read from start to end.
+
+    Attributes:
+        name (str): Path to the file in the Sandbox.
+    """
+
+    def __init__(self, client: httpx.Client, url: str, headers: Dict[str, str], timeout: httpx.Timeout, name: str):
+        super().__init__()
+        self.name = name
+        self._client = client
+        self._url = url
+        self._headers = headers
+        self._timeout = timeout
+        self._size: Optional[int] = None
+        self._seekable = False
+        self._position = 0
+        # Position of the next byte of the open response, which differs from `_position` after a seek
+        self._stream_position = 0
+        self._response: Optional[httpx.Response] = None
+        self._chunks: Iterator[bytes] = iter(())
+        self._pending = memoryview(b"")
+        # Request the file right away, so a missing file fails here and the stream knows whether it is seekable
+        self.__open(0)
+
+    @property
+    def size(self) -> Optional[int]:
+        """Size of the file in bytes, if the server reported it."""
+        return self._size
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return self._seekable
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if self.closed:
+            raise ValueError("I/O operation on closed file")
+        if whence == os.SEEK_SET:
+            position = offset
+        elif whence == os.SEEK_CUR:
+            position = self._position + offset
+        elif whence == os.SEEK_END:
+            if self._size is None:
+                raise io.UnsupportedOperation("The size of the file is unknown")
+            position = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}")
+        if position != self._position and not self._seekable:
+            raise io.UnsupportedOperation("The server does not support range requests for this file")
+        self._position = position
+        return position
+
+    def readinto(self, b) -> int:
+        if self.closed:
+            raise ValueError("I/O operation on closed file")
+        if self._position != self._stream_position:
+            self.__skip_or_reopen()
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._pending = memoryview(chunk)
+        size = min(len(b), len(self._pending))
+        b[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        self._position += size
+        self._stream_position += size
+        return size
+
+    def close(self) -> None:
+        if not self.closed:
+            self.__close_response()
+        super().close()
+
+    def __skip_or_reopen(self) -> None:
+        ahead = self._position - self._stream_position
+        # Seeking forward within the data already received does not need a new request
+        if 0 < ahead <= len(self._pending):
+            self._pending = self._pending[ahead:]
+            self._stream_position = self._position
+            return
+        self.__open(self._position)
+
+    def __open(self, offset: int) -> None:
+        self.__close_response()
+        self._stream_position = offset
+        headers = {**self._headers, "Range": f"bytes={offset}-", "Accept-Encoding": "identity"}
+        request = self._client.build_request("GET", self._url, headers=headers, timeout=self._timeout)
+        response = self._client.send(request, stream=True)
+
+        if response.status_code == 416:
+            # Reading at or past the end of the file (or of an empty file)
+            response.close()
+            match = _UNSATISFIED_RANGE_PATTERN.fullmatch(response.headers.get("Content-Range", "").strip())
+            if match:
+                self._size = int(match.group(1))
+            self._seekable = True
+            return
+        if response.is_error:
+            response.read()
+            response.close()
+            response.raise_for_status()
+
+        if response.status_code == 206:
+            content_range = parse_content_range(response.headers.get("Content-Range"))
+            if content_range is None or content_range.start != offset:
+                response.close()
+                raise DaytonaError(f"Invalid Content-Range header: {response.headers.get('Content-Range')}")
+            self._size = content_range.total
+            self._seekable = True
+        elif offset != 0:
+            response.close()
+            raise DaytonaError("The server does not support range requests for this file")
+        else:
+            content_length = response.headers.get("Content-Length")
+            self._size = int(content_length) if content_length is not None else None
+        self._response = response
+        self._chunks = response.iter_bytes(WRITE_CHUNK_SIZE)
+
+    def __close_response(self) -> None:
+        if self._response is not None:
+            self._response.close()
+            self._response = None
+        self._chunks = iter(())
+        self._pending = memoryview(b"")
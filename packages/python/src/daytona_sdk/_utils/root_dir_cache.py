@@ -0,0 +1,109 @@
+import asyncio
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, List, Optional
+
+from daytona_api_client import ApiClient
+
+from .state_watcher import _state_value
+
+if TYPE_CHECKING:
+    from .._async.sandbox import AsyncSandbox
+    from ..sandbox import Sandbox
+
+# Number of Sandboxes whose root directory is remembered per client
+MAX_ENTRIES = 10000
+
+
+class RootDirCache:
+    """Root directories of the Sandboxes of one API client, keyed by Sandbox ID.
+
+    The root directory of a Sandbox never changes, so it is resolved once per client instead of once per
+    `Sandbox` object. The least recently used entries are evicted above `MAX_ENTRIES`.
+    """
+
+    _caches: "weakref.WeakKeyDictionary[ApiClient, RootDirCache]" = weakref.WeakKeyDictionary()
+    _caches_lock = threading.Lock()
+
+    def __init__(self):
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_api_client(cls, api_client: ApiClient) -> "RootDirCache":
+        """Returns the cache shared by all Sandboxes of an API client.
+
+        Args:
+            api_client (ApiClient): API client of the Sandboxes.
+
+        Returns:
+            RootDirCache: The shared cache.
+        """
+        with cls._caches_lock:
+            cache = cls._caches.get(api_client)
+            if cache is None:
+                cache = cls._caches[api_client] = cls()
+            return cache
+
+    def get(self, sandbox_id: str) -> Optional[str]:
+        with self._lock:
+            root_dir = self._entries.get(sandbox_id)
+            if root_dir is not None:
+                self._entries.move_to_end(sandbox_id)
+            return root_dir
+
+    def set(self, sandbox_id: str, root_dir: str) -> None:
+        with self._lock:
+            self._entries[sandbox_id] = root_dir
+            self._entries.move_to_end(sandbox_id)
+            while len(self._entries) > MAX_ENTRIES:
+                self._entries.popitem(last=False)
+
+    def discard(self, sandbox_id: str) -> None:
+        with self._lock:
+            self._entries.pop(sandbox_id, None)
+
+
+def prefetch_root_dirs(sandboxes: List["Sandbox"], concurrency: int = 10) -> None:
+    """Resolves the root directories of started Sandboxes in parallel with `Sandbox.prefetch_root_dir`, so their
+    first operation with a relative path does not pay for the extra round trip. Sandboxes whose root directory
+    is already cached are skipped.
+
+    Args:
+        sandboxes (List[Sandbox]): Sandboxes to resolve the root directory for.
+        concurrency (int): Maximum number of requests in flight at the same time.
+    """
+    pending = _pending(sandboxes)
+    if not pending:
+        return
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(pending))) as executor:
+        list(executor.map(lambda sandbox: sandbox.prefetch_root_dir(), pending))
+
+
+async def prefetch_root_dirs_async(sandboxes: List["AsyncSandbox"], concurrency: int = 10) -> None:
+    """Asyncio counterpart of `prefetch_root_dirs`, resolving the root directories concurrently with
+    `AsyncSandbox.prefetch_root_dir`.
+
+    Args:
+        sandboxes (List[AsyncSandbox]): Sandboxes to resolve the root directory for.
+        concurrency (int): Maximum number of requests in flight at the same time.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def prefetch(sandbox: "AsyncSandbox") -> None:
+        async with semaphore:
+            await sandbox.prefetch_root_dir()
+
+    await asyncio.gather(*(prefetch(sandbox) for sandbox in _pending(sandboxes)))
+
+
+def _pending(sandboxes: list) -> list:
+    """Returns the started Sandboxes whose root directory is not cached yet."""
+    return [
+        sandbox
+        for sandbox in sandboxes
+        if _state_value(sandbox.instance) == "started"
+        and RootDirCache.for_api_client(sandbox.toolbox_api.api_client).get(sandbox.id) is None
+    ]
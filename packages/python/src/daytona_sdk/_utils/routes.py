@@ -0,0 +1,176 @@
+import re
+from dataclasses import dataclass
+from typing import List, Optional, Pattern
+
+# Classes of API endpoints that are rate limited separately
+LIFECYCLE = "lifecycle"
+TOOLBOX = "toolbox"
+FILE_TRANSFER = "file_transfer"
+
+FILE_TRANSFER_OPERATIONS = {"download_file", "upload_file", "upload_files"}
+
+# Operations of the generated API clients that can be sent again without changing the outcome
+# (besides all GET requests)
+IDEMPOTENT_OPERATIONS = {
+    "replace_labels",
+    "set_autostop_interval",
+    "set_auto_archive_interval",
+    "update_public_status",
+    "upload_file",
+    "upload_files",
+    "set_file_permissions",
+    "git_add_files",
+    "lsp_completions",
+}
+
+# Method, resource path and operation name of every endpoint of the generated API clients
+_ROUTES = [
+    ("POST", "/workspace/{workspaceId}/archive", "archive_workspace"),
+    ("POST", "/workspace/{workspaceId}/snapshot", "create_snapshot"),
+    ("POST", "/workspace", "create_workspace"),
+    ("DELETE", "/workspace/{workspaceId}", "delete_workspace"),
+    ("GET", "/workspace/{workspaceId}/build-logs", "get_build_logs"),
+    ("GET", "/workspace/{workspaceId}/ports/{port}/preview-url", "get_port_preview_url"),
+    ("GET", "/workspace/{workspaceId}", "get_workspace"),
+    ("GET", "/workspace", "list_workspaces"),
+    ("PUT", "/workspace/{workspaceId}/labels", "replace_labels"),
+    ("POST", "/workspace/{workspaceId}/autoarchive/{interval}", "set_auto_archive_interval"),
+    ("POST", "/workspace/{workspaceId}/autostop/{interval}", "set_autostop_interval"),
+    ("POST", "/workspace/{workspaceId}/start", "start_workspace"),
+    ("POST", "/workspace/{workspaceId}/stop", "stop_workspace"),
+    ("POST", "/workspace/{workspaceId}/public/{isPublic}", "update_public_status"),
+    ("POST", "/toolbox/{workspaceId}/toolbox/files/folder", "create_folder"),
+    ("POST", "/toolbox/{workspaceId}/toolbox/process/session", "create_session"),
+    ("DELETE", "/toolbox/{workspaceId}/toolbox/files", "delete_file"),
+    ("DELETE", "/toolbox/{workspaceId}/toolbox/process/session/{sessionId}", "delete_session"),
+    ("GET", "/toolbox/{workspaceId}/toolbox/files/download", "download_file"),
+    ("POST", "/toolbox/{workspaceId}/toolbox/process/execute", "execute_command"),
+    ("POST", "/toolbox/{workspaceId}/toolbox/process/session/{sessionId}/exec", "execute_session_command"),
+    ("GET", "/toolbox/{workspaceId}/toolbox/files/find", "find_in_files"),
+    ("GET", "/toolbox/{workspaceId}/toolbox/files/info", "get_file_info"),
+    ("GET", "/toolbox/{workspaceId}/toolbox/project-dir", "get_project_dir"),
+    ("GET", "/toolbox/{workspaceId}/toolbox/process/session/{sessionId}", "get_session"),
+    ("GET", "/toolbox/{workspaceId}/toolbox/process/session/{sessionId}/command/{commandId}", "get_session_command"),
+    (
+        "GET",
+        "/toolbox/{workspaceId}/toolbox/process/session/{sessionId}/command/{commandId}/logs",
+        "get_session_command_logs",
+    ),
+    ("POST", "/toolbox/{workspaceId}/toolbox/git/add", "git_add_files"),
+    ("POST", "/toolbox/{workspaceId}/toolbox/git/checkout", "git_checkout_branch"),
+    ("POST", "/toolbox/{workspaceId}/toolbox/git/clone", "git_clone_repository"),
+    ("POST", "/toolbox/{workspaceId}/toolbox/git/commit", "git_commit_changes"),
+    ("POST", "/toolbox/{workspaceId}/toolbox/git/branches", "git_create_branch"),
+    ("DELETE", "/toolbox/{workspaceId}/toolbox/git/branches", "git_delete_branch"),
+    ("GET", "/toolbox/{workspaceId}/toolbox/git/history", "git_get_history"),
+    ("GET", "/toolbox/{workspaceId}/toolbox/git/status", "git_get_status"),
+    ("GET", "/toolbox/{workspaceId}/toolbox/git/branches", "git_list_branches"),
+    ("POST", "/toolbox/{workspaceId}/toolbox/git/pull", "git_pull_changes"),
+    ("POST", "/toolbox/{workspaceId}/toolbox/git/push", "git_push_changes"),
+    ("GET", "/toolbox/{workspaceId}/toolbox/files", "list_files"),
+    ("GET", "/toolbox/{workspaceId}/toolbox/process/session", "list_sessions"),
+    ("POST", "/toolbox/{workspaceId}/toolbox/lsp/completions", "lsp_completions"),
+    ("POST", "/toolbox/{workspaceId}/toolbox/lsp/did-close", "lsp_did_close"),
+    ("POST", "/toolbox/{workspaceId}/toolbox/lsp/did-open", "lsp_did_open"),
+    ("GET", "/toolbox/{workspaceId}/toolbox/lsp/document-symbols", "lsp_document_symbols"),
+    ("POST", "/toolbox/{workspaceId}/toolbox/lsp/start", "lsp_start"),
+    ("POST", "/toolbox/{workspaceId}/toolbox/lsp/stop", "lsp_stop"),
+    ("GET", "/toolbox/{workspaceId}/toolbox/lsp/workspace-symbols", "lsp_workspace_symbols"),
+    ("POST", "/toolbox/{workspaceId}/toolbox/files/move", "move_file"),
+    ("POST", "/toolbox/{workspaceId}/toolbox/files/replace", "replace_in_files"),
+    ("GET", "/toolbox/{workspaceId}/toolbox/files/search", "search_files"),
+    ("POST", "/toolbox/{workspaceId}/toolbox/files/permissions", "set_file_permissions"),
+    ("POST", "/toolbox/{workspaceId}/toolbox/files/upload", "upload_file"),
+    ("POST", "/toolbox/{workspaceId}/toolbox/files/bulk-upload", "upload_files"),
+    ("POST", "/volumes", "create_volume"),
+    ("DELETE", "/volumes/{volumeId}", "delete_volume"),
+    ("GET", "/volumes/by-name/{name}", "get_volume_by_name"),
+    ("GET", "/volumes/{volumeId}", "get_volume"),
+    ("GET", "/volumes", "list_volumes"),
+]
+
+
+@dataclass(frozen=True)
+class Route:
+    """An endpoint of the Daytona API.
+
+    Attributes:
+        method (str): HTTP method.
+        operation (str): Name of the operation in the generated API clients, e.g. `list_files`.
+        idempotent (bool): Whether sending the request again can not change the outcome.
+        endpoint_class (str): Class of the endpoint: `lifecycle`, `toolbox` or `file_transfer`.
+    """
+
+    method: str
+    operation: str
+    idempotent: bool
+    endpoint_class: str
+
+
+@dataclass(frozen=True)
+class _CompiledRoute:
+    route: Route
+    pattern: Pattern[str]
+
+
+def _endpoint_class(path: str, operation: str) -> str:
+    if operation in FILE_TRANSFER_OPERATIONS:
+        return FILE_TRANSFER
+    return TOOLBOX if "/toolbox/" in path else LIFECYCLE
+
+
+def _compile(path: str) -> Pattern[str]:
+    # Paths are matched as a suffix, so they match regardless of the API base path
+    return re.compile(re.sub(r"\\{\w+\\}", "[^/]+", re.escape(path)) + "$")
+
+
+# Longer paths first, so the most specific route wins
+_COMPILED_ROUTES: List[_CompiledRoute] = [
+    _CompiledRoute(
+        Route(
+            method,
+            operation,
+            method == "GET" or operation in IDEMPOTENT_OPERATIONS,
+            _endpoint_class(path, operation),
+        ),
+        _compile(path),
+    )
+    for method, path, operation in sorted(_ROUTES, key=lambda route: -len(route[1]))
+]
+
+
+_SANDBOX_ID_PATTERN = re.compile(r"/(?:workspace|toolbox)/([^/]+)")
+
+
+def sandbox_id(path: str) -> Optional[str]:
+    """Extracts the ID of the Sandbox a request targets from its URL path.
+
+    Args:
+        path (str): URL path of the request.
+
+    Returns:
+        Optional[str]: ID of the Sandbox, or None if the request does not target a single Sandbox.
+    """
+    match = _SANDBOX_ID_PATTERN.search(path)
+    return match.group(1) if match else None
+
+
+def classify(method: str, path: str) -> Route:
+    """Finds the API endpoint of a request.
+
+    Args:
+        method (str): HTTP method of the request.
+        path (str): URL path of the request.
+
+    Returns:
+        Route: The matching endpoint. Requests that do not match a known endpoint are named after their method
+            and path, are idempotent only for safe HTTP methods and belong to the `toolbox` class if they
+            target the toolbox.
+    """
+    method = method.upper()
+    for compiled in _COMPILED_ROUTES:
+        if compiled.route.method == method and compiled.pattern.search(path):
+            return compiled.route
+    return Route(
+        method, f"{method} {path}", method in ("GET", "HEAD", "OPTIONS"), _endpoint_class(path, f"{method} {path}")
+    )
@@ -0,0 +1,295 @@
+import json
+import random
+import threading
+import time
+import weakref
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple, Union
+
+from daytona_api_client import ApiClient
+from daytona_api_client import Workspace as ApiSandbox
+from daytona_api_client import WorkspaceApi as SandboxApi
+
+# Polling interval bounds in seconds; the interval doubles while no watched state changes
+MIN_POLL_INTERVAL = 0.1
+MAX_POLL_INTERVAL = 2.0
+# Below this number of watched Sandboxes with the same labels, their states are fetched one by one instead of
+# listing the Sandboxes with the labels
+BATCH_THRESHOLD = 4
+# Labels whose listing returns more than this many Sandboxes per watched one are not listed again, since they
+# also match many Sandboxes that are not watched
+MAX_LISTED_PER_WATCHED = 4
+# Timeout of a single state request, so a hanging request can not stall all waiters
+POLL_REQUEST_TIMEOUT = 30
+# Maximum number of state requests in flight during a polling round
+MAX_CONCURRENT_FETCHES = 8
+
+
+@dataclass
+class _Waiter:
+    sandbox_id: str
+    states: Set[str]
+    ignore_validation_errors: bool
+    labels: FrozenSet[Tuple[str, str]] = frozenset()
+    # A `concurrent.futures.Future`, or an `asyncio.Future` for the asyncio watcher
+    future: Any = field(default_factory=Future)
+
+
+class StateWatcherBase:
+    """Bookkeeping of the polling rounds shared by the threaded and the asyncio state watchers."""
+
+    def __init__(self):
+        self._waiters: List[_Waiter] = []
+        self._last_states: Dict[str, str] = {}
+        self._interval = MIN_POLL_INTERVAL
+        self._last_poll = 0.0
+        self._unselective_labels: Set[FrozenSet[Tuple[str, str]]] = set()
+
+    @staticmethod
+    def _new_waiter(
+        sandbox_id: str,
+        states: Set[str],
+        ignore_validation_errors: bool,
+        labels: Optional[Dict[str, str]],
+        future: Any,
+    ) -> _Waiter:
+        return _Waiter(
+            sandbox_id, set(states) | {"error"}, ignore_validation_errors, frozenset((labels or {}).items()), future
+        )
+
+    def _pending_waiters(self) -> List[_Waiter]:
+        """Drops the waiters that are done and returns the others. Once none are left, the watched states are
+        forgotten."""
+        self._waiters = [waiter for waiter in self._waiters if not waiter.future.done()]
+        if not self._waiters:
+            self._last_states.clear()
+        return list(self._waiters)
+
+    def _next_interval(self, changed: bool) -> float:
+        """Updates the polling interval after a round and returns the time to wait before the next one."""
+        if changed:
+            self._interval = MIN_POLL_INTERVAL
+        else:
+            self._interval = min(self._interval * 2, MAX_POLL_INTERVAL)
+        # Full jitter keeps many processes from polling the API in lockstep
+        return random.uniform(MIN_POLL_INTERVAL, max(MIN_POLL_INTERVAL, self._interval))
+
+    def _resolve(self, waiters: List[_Waiter], instances: Dict[str, ApiSandbox], errors: Dict[str, Exception]) -> bool:
+        """Resolves the waiters whose Sandbox reached an awaited state or could not be fetched.
+
+        Returns:
+            bool: Whether the state of any watched Sandbox changed since the previous round.
+        """
+        changed = False
+        for sandbox_id, instance in instances.items():
+            state = _state_value(instance)
+            if self._last_states.get(sandbox_id) != state:
+                self._last_states[sandbox_id] = state
+                changed = True
+
+        for waiter in waiters:
+            if waiter.future.done():
+                continue
+            error = errors.get(waiter.sandbox_id)
+            try:
+                if error is not None:
+                    if waiter.ignore_validation_errors and "validation error" in str(error):
+                        continue
+                    waiter.future.set_exception(error)
+                elif _state_value(instances[waiter.sandbox_id]) in waiter.states:
+                    waiter.future.set_result(instances[waiter.sandbox_id])
+            except InvalidStateError:
+                # The waiter gave up (timeout or cancellation) while this round was running
+                continue
+
+        return changed
+
+    def _label_groups(self, waiters: List[_Waiter]) -> Dict[FrozenSet[Tuple[str, str]], Set[str]]:
+        """Groups the watched Sandboxes by their labels, keeping the groups worth listing."""
+        groups: Dict[FrozenSet[Tuple[str, str]], Set[str]] = {}
+        labelled: Set[str] = set()
+        for waiter in waiters:
+            if waiter.labels and waiter.sandbox_id not in labelled:
+                labelled.add(waiter.sandbox_id)
+                groups.setdefault(waiter.labels, set()).add(waiter.sandbox_id)
+        return {
+            labels: ids
+            for labels, ids in groups.items()
+            if len(ids) >= BATCH_THRESHOLD and labels not in self._unselective_labels
+        }
+
+    def _watched(
+        self, labels: FrozenSet[Tuple[str, str]], sandbox_ids: Set[str], listed: List[ApiSandbox]
+    ) -> Dict[str, ApiSandbox]:
+        """Returns the watched Sandboxes of a listing by labels. Labels that also match many Sandboxes that are
+        not watched are not listed again."""
+        if len(listed) > MAX_LISTED_PER_WATCHED * len(sandbox_ids):
+            self._unselective_labels.add(labels)
+        return {instance.id: instance for instance in listed if instance.id in sandbox_ids}
+
+
+class SandboxStateWatcher(StateWatcherBase):
+    """Waits for Sandboxes to reach a state on behalf of all callers in the process.
+
+    One watcher exists per API client. A single background thread polls the states of all watched
+    Sandboxes. When many watched Sandboxes have the same labels, their states are fetched with one
+    `list_workspaces` call filtered by the labels per round, unless the labels also match many Sandboxes
+    that are not watched. Other Sandboxes are fetched one by one, concurrently over a bounded pool of
+    threads, so the cost of a round never grows with the number of Sandboxes in the organization. The
+    polling interval backs off exponentially with jitter while nothing changes and is reset when a state
+    changes or a new Sandbox is watched. Each caller gets a future resolved with the Sandbox once it
+    reaches one of the awaited states or the "error" state.
+    """
+
+    _watchers: "weakref.WeakKeyDictionary[ApiClient, SandboxStateWatcher]" = weakref.WeakKeyDictionary()
+    _watchers_lock = threading.Lock()
+
+    def __init__(self, sandbox_api: SandboxApi):
+        super().__init__()
+        self._sandbox_api = sandbox_api
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=MAX_CONCURRENT_FETCHES, thread_name_prefix="daytona-state-watcher"
+        )
+
+    @classmethod
+    def for_api(cls, sandbox_api: SandboxApi) -> "SandboxStateWatcher":
+        """Returns the process-wide watcher for the API client of the given Sandbox API.
+
+        Args:
+            sandbox_api (SandboxApi): API used to fetch the Sandbox states.
+
+        Returns:
+            SandboxStateWatcher: The shared watcher.
+        """
+        with cls._watchers_lock:
+            watcher = cls._watchers.get(sandbox_api.api_client)
+            if watcher is None:
+                watcher = cls(sandbox_api)
+                cls._watchers[sandbox_api.api_client] = watcher
+            return watcher
+
+    def watch(
+        self,
+        sandbox_id: str,
+        states: Set[str],
+        ignore_validation_errors: bool = False,
+        labels: Optional[Dict[str, str]] = None,
+    ) -> "Future[ApiSandbox]":
+        """Starts watching a Sandbox. Cancelling the returned future stops watching it.
+
+        Args:
+            sandbox_id (str): ID of the Sandbox.
+            states (Set[str]): States that resolve the future. The "error" state always resolves it.
+            ignore_validation_errors (bool): Whether to keep waiting when the Sandbox state can not be parsed,
+                which happens while a Sandbox is being stopped.
+            labels (Optional[Dict[str, str]]): Labels of the Sandbox, which let the states of Sandboxes with the
+                same labels be fetched together.
+
+        Returns:
+            Future[ApiSandbox]: Future resolved with the Sandbox once it reaches one of the states.
+        """
+        waiter = self._new_waiter(sandbox_id, states, ignore_validation_errors, labels, Future())
+        with self._condition:
+            self._waiters.append(waiter)
+            self._interval = MIN_POLL_INTERVAL
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="daytona-state-watcher", daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+        return waiter.future
+
+    def wait(
+        self,
+        sandbox_id: str,
+        states: Set[str],
+        timeout: Optional[float] = None,
+        ignore_validation_errors: bool = False,
+        labels: Optional[Dict[str, str]] = None,
+    ) -> ApiSandbox:
+        """Blocks until a Sandbox reaches one of the states or the "error" state.
+
+        Args:
+            sandbox_id (str): ID of the Sandbox.
+            states (Set[str]): States to wait for.
+            timeout (Optional[float]): Maximum time to wait in seconds. None means no timeout.
+            ignore_validation_errors (bool): Whether to keep waiting when the Sandbox state can not be parsed.
+            labels (Optional[Dict[str, str]]): Labels of the Sandbox, see `watch`.
+
+        Returns:
+            ApiSandbox: The Sandbox in the reached state.
+
+        Raises:
+            TimeoutError: If the Sandbox does not reach the states in time.
+        """
+        future = self.watch(sandbox_id, states, ignore_validation_errors, labels)
+        try:
+            return future.result(timeout=timeout)
+        finally:
+            future.cancel()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                waiters = self._pending_waiters()
+                if not waiters:
+                    self._thread = None
+                    return
+
+            self._last_poll = time.monotonic()
+            changed = self._poll(waiters)
+
+            with self._condition:
+                self._condition.wait(timeout=self._next_interval(changed))
+                # Newly watched Sandboxes wake the thread early, but rounds never run closer than the minimum
+                # interval
+                remaining = self._last_poll + MIN_POLL_INTERVAL - time.monotonic()
+                if remaining > 0:
+                    self._condition.wait(timeout=remaining)
+
+    def _poll(self, waiters: List[_Waiter]) -> bool:
+        """Fetches the states of the watched Sandboxes and resolves the waiters that are done.
+
+        Returns:
+            bool: Whether the state of any watched Sandbox changed since the previous round.
+        """
+        sandbox_ids = {waiter.sandbox_id for waiter in waiters}
+        instances: Dict[str, ApiSandbox] = {}
+        errors: Dict[str, Exception] = {}
+
+        groups = self._label_groups(waiters)
+        for listed in self._executor.map(lambda group: self._list(*group), groups.items()):
+            instances.update(listed)
+
+        remaining = sorted(sandbox_ids - set(instances))
+        for sandbox_id, result in zip(remaining, self._executor.map(self._get, remaining)):
+            if isinstance(result, Exception):
+                errors[sandbox_id] = result
+            else:
+                instances[sandbox_id] = result
+
+        return self._resolve(waiters, instances, errors)
+
+    def _get(self, sandbox_id: str) -> Union[ApiSandbox, Exception]:
+        """Fetches a single Sandbox, returning the error instead of raising it."""
+        try:
+            return self._sandbox_api.get_workspace(sandbox_id, _request_timeout=POLL_REQUEST_TIMEOUT)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            return e
+
+    def _list(self, labels: FrozenSet[Tuple[str, str]], sandbox_ids: Set[str]) -> Dict[str, ApiSandbox]:
+        """Fetches the Sandboxes with the labels and returns those that are watched."""
+        try:
+            listed = self._sandbox_api.list_workspaces(
+                labels=json.dumps(dict(labels)), _request_timeout=POLL_REQUEST_TIMEOUT
+            )
+        except Exception:  # pylint: disable=broad-exception-caught
+            # A single Sandbox that can not be parsed fails the whole list, so fall back to single requests
+            return {}
+        return self._watched(labels, sandbox_ids, listed)
+
+
+def _state_value(instance: ApiSandbox) -> str:
+    return getattr(instance.state, "value", instance.state)
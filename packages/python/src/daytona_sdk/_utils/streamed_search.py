@@ -0,0 +1,211 @@
+import shlex
+import time
+from contextlib import closing
+from itertools import islice
+from typing import Callable, Iterator, List, Optional, Tuple, TypeVar
+
+from daytona_api_client import Match
+
+from ..common.errors import DaytonaError
+from .timeout import remaining_timeout
+from .toolbox_files import ToolboxFiles
+
+T = TypeVar("T")
+
+# Written to the output of a search once it completes. Records never start with it, because they start with
+# an absolute path or, for grep, continue with a line number after the NUL byte that ends the path.
+DONE_MARKER = b"\0daytona-search-done\0"
+# Separators of the records of the searches
+GREP_SEPARATOR = b"\n"
+FIND_SEPARATOR = b"\0"
+# Bounds of the interval at which the output of a search is polled while no new records arrive
+POLL_INTERVAL = 0.05
+MAX_POLL_INTERVAL = 1.0
+# Number of bytes of the output read by one request
+READ_SIZE = 1024 * 1024
+
+
+def grep_command(path: str, pattern: str) -> str:
+    """Command that prints the lines of the text files below a path that contain a literal pattern, as
+    `<path>\\0<line>:<content>` records."""
+    return f"grep -rnFIZ -e {shlex.quote(pattern)} -- {shlex.quote(path)}"
+
+
+def find_command(path: str, pattern: str) -> str:
+    """Command that prints the paths below a path whose names match a glob pattern, as NUL-terminated records."""
+    return f"find {shlex.quote(path)} -mindepth 1 -name {shlex.quote(pattern)} -print0"
+
+
+def start_command(search: str, path: Optional[str], output: str) -> str:
+    """Command that starts a search in the background in its own process group. The search writes its records
+    to `output`, followed by `DONE_MARKER` once it completes.
+
+    The command prints the ID of the process group, and fails if the searched path is given and does not exist.
+    """
+    quoted_output = shlex.quote(output)
+    marker = "".join(f"\\{byte:03o}" if byte < 32 else chr(byte) for byte in DONE_MARKER)
+    job = f"{search} >> {quoted_output} 2>/dev/null; printf '{marker}' >> {quoted_output}"
+    check = ""
+    if path is not None:
+        message = shlex.quote(f"No such file or directory: {path}")
+        check = f"[ -e {shlex.quote(path)} ] || {{ echo {message}; exit 1; }}\n"
+    return (
+        f"{check}: > {quoted_output} || exit 1\n"
+        f"$(command -v setsid) sh -c {shlex.quote(job)} </dev/null >/dev/null 2>&1 &\n"
+        "echo $!"
+    )
+
+
+def stop_command(pid: str, output: str) -> str:
+    """Command that stops a search started by `start_command`, if it is still running, and removes its output."""
+    return f"kill -- -{pid} 2>/dev/null || kill {pid} 2>/dev/null; rm -f {shlex.quote(output)}; true"
+
+
+def alive_command(pid: str) -> str:
+    """Command that prints `alive` if a search started by `start_command` is still running."""
+    return f"kill -0 {pid} 2>/dev/null && echo alive; true"
+
+
+class RecordReader:
+    """Splits the output of a search into records while it is read, and tells when the search completed."""
+
+    def __init__(self, separator: bytes):
+        self._separator = separator
+        self._buffer = bytearray()
+        self.done = False
+
+    def feed(self, data: bytes) -> List[bytes]:
+        """Adds the next bytes of the output and returns the records they complete."""
+        self._buffer += data
+        end = self._buffer.find(DONE_MARKER)
+        if end != -1:
+            self.done = True
+            del self._buffer[end:]
+            records = self._buffer.split(self._separator)
+            self._buffer = bytearray()
+            return [bytes(record) for record in records if record]
+        # The end of the buffer may be the beginning of the marker, so it is kept until more bytes arrive
+        last = self._buffer.rfind(self._separator, 0, max(len(self._buffer) - len(DONE_MARKER) + 1, 0))
+        if last == -1:
+            return []
+        records = self._buffer[:last].split(self._separator)
+        del self._buffer[: last + 1]
+        return [bytes(record) for record in records if record]
+
+    def drain(self) -> List[bytes]:
+        """Returns the records held back for an output that ended without the marker. An incomplete last record
+        is dropped."""
+        records = self._buffer.split(self._separator)[:-1]
+        self._buffer = bytearray()
+        return [bytes(record) for record in records if record]
+
+
+def parse_match(record: bytes) -> Optional[Tuple[str, int, str]]:
+    """Parses a record of a grep search into the path, line number and content of a match."""
+    path, separator, rest = record.partition(b"\0")
+    line, _, content = rest.partition(b":")
+    if not separator or not line.isdigit():
+        return None
+    return path.decode(errors="replace"), int(line), content.decode(errors="replace")
+
+
+def stream_records(
+    run: Callable[[str, Optional[float]], str],
+    read_range: Callable[[str, int, int, Optional[float]], bytes],
+    search: str,
+    path: Optional[str],
+    output: str,
+    separator: bytes,
+    timeout: Optional[float],
+) -> Iterator[bytes]:
+    """Runs a search in the background of the Sandbox and yields the records it writes to a staging file while
+    they are written. Closing the iterator stops the search and removes the file.
+
+    Args:
+        run (Callable[[str, Optional[float]], str]): Runs a shell command in the Sandbox with a timeout and
+            returns its output.
+        read_range (Callable[[str, int, int, Optional[float]], bytes]): Reads the bytes from a start up to an end
+            offset of a Sandbox file with a timeout.
+        search (str): Command of the search, which prints its records to its standard output.
+        path (Optional[str]): Path the search fails for if it does not exist.
+        output (str): Path of the staging file in the Sandbox.
+        separator (bytes): Separator of the records.
+        timeout (Optional[float]): Time the whole search may take in seconds. None or 0 means no limit.
+
+    Raises:
+        DaytonaError: If the path does not exist, or the search ended without completing.
+        TimeoutError: If the search did not complete in time.
+    """
+    deadline = time.monotonic() + timeout if timeout else None
+
+    def time_left() -> Optional[float]:
+        left = None
+        if deadline is not None:
+            left = deadline - time.monotonic()
+            if left <= 0:
+                raise TimeoutError(f"Search did not complete within {timeout} seconds")
+        return remaining_timeout(left)
+
+    pid = run(start_command(search, path, output), time_left()).strip()
+    try:
+        reader = RecordReader(separator)
+        position = 0
+        interval = POLL_INTERVAL
+        while True:
+            data = read_range(output, position, position + READ_SIZE, time_left())
+            position += len(data)
+            yield from reader.feed(data)
+            if reader.done:
+                return
+            if data:
+                interval = POLL_INTERVAL
+                continue
+            # The output stopped growing for a while, so make sure the search is still there to complete it
+            if interval >= MAX_POLL_INTERVAL and run(alive_command(pid), time_left()).strip() != "alive":
+                yield from reader.feed(read_range(output, position, position + READ_SIZE, time_left()))
+                if reader.done:
+                    return
+                yield from reader.drain()
+                raise DaytonaError("The search ended in the Sandbox without completing")
+            left = time_left()
+            time.sleep(interval if left is None else min(interval, left))
+            interval = min(interval * 2, MAX_POLL_INTERVAL)
+    finally:
+        run(stop_command(pid, output), timeout or None)
+
+
+def find_matches(
+    files: ToolboxFiles, path: str, pattern: str, offset: int, max_results: Optional[int], timeout: Optional[float]
+) -> Iterator[Match]:
+    """Streams the matches of a search of file contents, see `FileSystem.iter_find_files`. Reaching
+    `max_results` stops the search."""
+    path = files.resolve(path)
+    output = files.staging_path("search")
+    records = stream_records(
+        files.run, files.read_range, grep_command(path, pattern), path, output, GREP_SEPARATOR, timeout
+    )
+    for file, line, content in _page(filter(None, map(parse_match, records)), records, offset, max_results):
+        yield Match(file=file, line=line, content=content)
+
+
+def search_paths(
+    files: ToolboxFiles, path: str, pattern: str, offset: int, max_results: Optional[int], timeout: Optional[float]
+) -> Iterator[str]:
+    """Streams the paths found by a search of file names, see `FileSystem.iter_search_files`. Reaching
+    `max_results` stops the search."""
+    path = files.resolve(path)
+    output = files.staging_path("search")
+    records = stream_records(
+        files.run, files.read_range, find_command(path, pattern), path, output, FIND_SEPARATOR, timeout
+    )
+    yield from _page((record.decode(errors="replace") for record in records), records, offset, max_results)
+
+
+def _page(results: Iterator[T], records: Iterator[bytes], offset: int, max_results: Optional[int]) -> Iterator[T]:
+    """Yields the results from `offset` on, up to `max_results` of them, and then closes the records of the
+    search, which stops it."""
+    if offset < 0 or (max_results is not None and max_results < 0):
+        records.close()
+        raise DaytonaError("offset and max_results must not be negative")
+    with closing(records):
+        yield from islice(results, offset, offset + max_results if max_results is not None else None)
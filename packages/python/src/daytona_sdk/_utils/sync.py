@@ -0,0 +1,369 @@
+import fnmatch
+import hashlib
+import os
+import re
+import shlex
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Pattern, Tuple
+
+from ..common.errors import DaytonaError
+from ..common.filesystem import FileUpload, SyncResult
+from .toolbox_files import ToolboxFiles
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+# Number of files handled per command, which keeps the commands well below the argument size limit
+COMMAND_BATCH = 500
+# Number of ignored local directories that are also skipped by the remote listing. Ignored directories beyond
+# it are listed in the Sandbox and filtered out locally.
+MAX_PRUNED_DIRS = 256
+# Difference up to which modification times are equal. Uploaded files get the modification time of their local
+# file to the microsecond.
+_MTIME_TOLERANCE = 1e-6
+
+
+@dataclass
+class ManifestEntry:
+    """A file of a directory manifest.
+
+    Attributes:
+        size (int): Size of the file in bytes.
+        mtime (float): Modification time as a Unix timestamp.
+        sha256 (Optional[str]): SHA-256 hash of the file contents, if computed.
+    """
+
+    size: int
+    mtime: float = 0.0
+    sha256: Optional[str] = None
+
+
+@dataclass
+class _IgnoreRule:
+    pattern: Pattern[str]
+    negated: bool
+    directory_only: bool
+
+
+def _glob_to_regex(pattern: str) -> str:
+    """Translates a gitignore glob, where `*` does not cross directories and `**` does, into a regular expression."""
+    regex = ""
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            regex += "(?:.*/)?"
+            i += 3
+        elif pattern.startswith("**", i):
+            regex += ".*"
+            i += 2
+        elif pattern[i] == "*":
+            regex += "[^/]*"
+            i += 1
+        elif pattern[i] == "?":
+            regex += "[^/]"
+            i += 1
+        elif pattern[i] == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                regex += re.escape(pattern[i])
+                i += 1
+            else:
+                regex += "[" + pattern[i + 1 : end].replace("!", "^", 1) + "]"
+                i = end + 1
+        else:
+            regex += re.escape(pattern[i])
+            i += 1
+    return regex
+
+
+def parse_gitignore(content: str) -> List[_IgnoreRule]:
+    """Parses the rules of a `.gitignore` file."""
+    rules = []
+    for line in content.splitlines():
+        line = line.rstrip()
+        if not line or line.startswith("#"):
+            continue
+        negated = line.startswith("!")
+        if negated:
+            line = line[1:]
+        line = line.replace("\\#", "#").replace("\\!", "!")
+        directory_only = line.endswith("/")
+        line = line.strip("/") if directory_only else line
+        # Patterns with a slash are relative to the .gitignore, others match at any depth
+        anchored = "/" in line
+        regex = _glob_to_regex(line.lstrip("/"))
+        if not anchored:
+            regex = "(?:.*/)?" + regex
+        rules.append(_IgnoreRule(re.compile(regex + "$"), negated, directory_only))
+    return rules
+
+
+def _escape_glob(path: str) -> str:
+    """Escapes the characters of a literal path that find would match as a glob pattern."""
+    return re.sub(r"([*?\[\\])", r"\\\1", path)
+
+
+class PathFilter:
+    """Decides which paths of a directory tree take part in a sync.
+
+    Paths are relative to the synced directory and use forward slashes. A path is selected if it matches one
+    of the include patterns (or there are none), does not match an exclude pattern, and is not ignored by a
+    `.gitignore` file in the tree. Patterns are matched against the full relative path and the file name.
+    """
+
+    def __init__(
+        self,
+        include: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+        respect_gitignore: bool = False,
+    ):
+        self._include = include or []
+        self._exclude = exclude or []
+        self._respect_gitignore = respect_gitignore
+        # Rules of the .gitignore files by the directory (relative path) they apply to
+        self._gitignore: Dict[str, List[_IgnoreRule]] = {}
+        # Directories of the local tree that were skipped by `walk_local`
+        self.pruned_dirs: List[str] = []
+
+    def load_gitignore(self, root: str, directory: str) -> None:
+        """Loads the `.gitignore` file of a directory of the local tree, if there is one."""
+        if not self._respect_gitignore:
+            return
+        path = os.path.join(root, directory, ".gitignore")
+        try:
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                self._gitignore[directory] = parse_gitignore(f.read())
+        except OSError:
+            pass
+
+    def selects_dir(self, path: str) -> bool:
+        """Whether a directory may contain selected files."""
+        if self._respect_gitignore and (path == ".git" or path.endswith("/.git")):
+            return False
+        return not self.__excluded(path) and not self.__ignored(path, True)
+
+    def selects_file(self, path: str) -> bool:
+        """Whether a file takes part in the sync."""
+        if self._include and not self.__matches(path, self._include):
+            return False
+        return not self.__excluded(path) and not self.__ignored(path, False)
+
+    def selects_path(self, path: str) -> bool:
+        """Whether a file takes part in the sync, including the checks of its parent directories."""
+        parts = path.split("/")
+        for i in range(1, len(parts)):
+            if not self.selects_dir("/".join(parts[:i])):
+                return False
+        return self.selects_file(path)
+
+    def find_expression(self) -> str:
+        """Expression for `find .` that lists the regular files this filter may select, skipping the excluded
+        and pruned directories without descending into them. The rules of `.gitignore` files other than the
+        pruned directories are not applied, so the listed files still have to be checked with `selects_path`."""
+        pruned = ["-name .git"] if self._respect_gitignore else []
+        pruned += [f"-name {shlex.quote(p)} -o -path {shlex.quote('./' + p)}" for p in self._exclude]
+        pruned += [f"-path {shlex.quote('./' + _escape_glob(d))}" for d in self.pruned_dirs[:MAX_PRUNED_DIRS]]
+        expression = "-type f"
+        if self._include:
+            included = [f"-name {shlex.quote(p)} -o -path {shlex.quote('./' + p)}" for p in self._include]
+            expression += f" \\( {' -o '.join(included)} \\)"
+        if pruned:
+            expression = f"\\( {' -o '.join(pruned)} \\) -prune -o {expression}"
+        return expression
+
+    def __excluded(self, path: str) -> bool:
+        return bool(self._exclude) and self.__matches(path, self._exclude)
+
+    @staticmethod
+    def __matches(path: str, patterns: List[str]) -> bool:
+        name = path.rsplit("/", 1)[-1]
+        return any(fnmatch.fnmatchcase(path, pattern) or fnmatch.fnmatchcase(name, pattern) for pattern in patterns)
+
+    def __ignored(self, path: str, is_dir: bool) -> bool:
+        ignored = False
+        # Rules of deeper .gitignore files take precedence, as do later rules within a file
+        for directory, rules in sorted(self._gitignore.items(), key=lambda item: item[0].count("/")):
+            if directory and not path.startswith(directory + "/"):
+                continue
+            relative = path[len(directory) + 1 :] if directory else path
+            for rule in rules:
+                if rule.directory_only and not is_dir:
+                    continue
+                if rule.pattern.match(relative):
+                    ignored = not rule.negated
+        return ignored
+
+
+def walk_local(root: str, path_filter: PathFilter, include_dirs: bool = False) -> Iterator[Tuple[str, str]]:
+    """Yields the (relative path, absolute path) of the selected files of a local directory tree, and of its
+    directories if `include_dirs` is set. Directories are yielded before their contents."""
+    for directory, dirnames, filenames in os.walk(root):
+        relative_dir = os.path.relpath(directory, root).replace(os.sep, "/")
+        relative_dir = "" if relative_dir == "." else relative_dir
+        path_filter.load_gitignore(root, relative_dir)
+        # Prune ignored directories so their contents are never visited
+        selected = []
+        for name in sorted(dirnames):
+            relative = f"{relative_dir}/{name}" if relative_dir else name
+            if path_filter.selects_dir(relative):
+                selected.append(name)
+            else:
+                path_filter.pruned_dirs.append(relative)
+        dirnames[:] = selected
+        if include_dirs:
+            for name in dirnames:
+                relative = f"{relative_dir}/{name}" if relative_dir else name
+                yield relative, os.path.join(directory, name)
+        for name in sorted(filenames):
+            relative = f"{relative_dir}/{name}" if relative_dir else name
+            if path_filter.selects_file(relative):
+                yield relative, os.path.join(directory, name)
+
+
+def local_manifest(root: str, path_filter: PathFilter) -> Dict[str, ManifestEntry]:
+    """Builds the manifest of a local directory tree. Hashes are computed on demand with `file_sha256`."""
+    manifest = {}
+    for relative, path in walk_local(root, path_filter):
+        stat = os.stat(path)
+        manifest[relative] = ManifestEntry(stat.st_size, stat.st_mtime)
+    return manifest
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def remote_manifest_command(remote_dir: str, path_filter: PathFilter, output: str) -> str:
+    """Builds the shell command that writes the manifest of a Sandbox directory to `output`: the size,
+    modification time and relative path of every file the filter may select, as NUL-terminated records. A
+    missing directory has an empty manifest."""
+    quoted = shlex.quote(remote_dir)
+    quoted_output = shlex.quote(output)
+    return (
+        f"[ -d {quoted} ] || {{ : > {quoted_output}; exit 0; }}; cd {quoted} && "
+        f"find . {path_filter.find_expression()} -printf '%s\\t%T@\\t%P\\0' > {quoted_output}"
+    )
+
+
+def parse_remote_manifest(output: bytes) -> Dict[str, ManifestEntry]:
+    """Parses the manifest written by the command built by `remote_manifest_command`."""
+    manifest = {}
+    for record in output.split(b"\0"):
+        size, mtime, path = (record.decode(errors="surrogateescape").split("\t", 2) + ["", ""])[:3]
+        if path and size.isdigit():
+            try:
+                manifest[path] = ManifestEntry(int(size), float(mtime))
+            except ValueError:
+                continue
+    return manifest
+
+
+def compare_manifests(
+    local: Dict[str, ManifestEntry], remote: Dict[str, ManifestEntry]
+) -> Tuple[List[str], List[str], List[str]]:
+    """Compares the manifests of a local and a Sandbox directory without hashing any file.
+
+    Files are considered unchanged if their sizes and their modification times are equal, as the modification
+    time of uploaded files is set to the one of their local file.
+
+    Returns:
+        Tuple[List[str], List[str], List[str]]: The local files that are missing or have a different size in the
+        Sandbox, those that are unchanged, and those of equal size that have to be hashed to tell whether they
+        changed.
+    """
+    changed, unchanged, undecided = [], [], []
+    for path, entry in local.items():
+        remote_entry = remote.get(path)
+        if remote_entry is None or remote_entry.size != entry.size:
+            changed.append(path)
+        elif abs(remote_entry.mtime - entry.mtime) < _MTIME_TOLERANCE:
+            unchanged.append(path)
+        else:
+            undecided.append(path)
+    return changed, unchanged, undecided
+
+
+def _batches(paths: List[str]) -> Iterator[List[str]]:
+    for i in range(0, len(paths), COMMAND_BATCH):
+        yield paths[i : i + COMMAND_BATCH]
+
+
+def hash_commands(remote_dir: str, paths: List[str]) -> Iterator[str]:
+    """Commands that print the SHA-256 hashes of Sandbox files, given by their paths relative to `remote_dir`,
+    in the format of `sha256sum`."""
+    for batch in _batches(paths):
+        quoted = " ".join(shlex.quote(path) for path in batch)
+        yield f"cd {shlex.quote(remote_dir)} && sha256sum -- {quoted} 2>/dev/null; true"
+
+
+def parse_hashes(output: str) -> Dict[str, str]:
+    """Parses the output of the commands built by `hash_commands` into the hashes by path."""
+    hashes = {}
+    for line in output.splitlines():
+        digest, separator, path = line.partition("  ")
+        # sha256sum escapes the lines of unusual file names, which are treated as unknown
+        if separator and not digest.startswith("\\"):
+            hashes[path] = digest
+    return hashes
+
+
+def touch_commands(remote_dir: str, entries: Dict[str, ManifestEntry]) -> Iterator[str]:
+    """Commands that set the modification times of Sandbox files, given by their paths relative to `remote_dir`,
+    to the ones of the manifest entries, so the next sync can tell they are unchanged without hashing them."""
+    for batch in _batches(sorted(entries)):
+        commands = [f"touch -c -m -d @{entries[path].mtime:.6f} -- {shlex.quote(path)}" for path in batch]
+        yield f"cd {shlex.quote(remote_dir)} && {{ {'; '.join(commands)}; }} 2>/dev/null; true"
+
+
+def delete_commands(remote_dir: str, paths: List[str]) -> Iterator[str]:
+    """Commands that remove files of a Sandbox directory."""
+    for batch in _batches(paths):
+        yield f"cd {shlex.quote(remote_dir)} && rm -f -- {' '.join(shlex.quote(path) for path in batch)}"
+
+
+def sync_dir(
+    files: ToolboxFiles,
+    upload_files: Callable[[List[FileUpload], int], None],
+    local_dir: str,
+    remote_dir: str,
+    path_filter: PathFilter,
+    delete: bool,
+    timeout: int,
+) -> SyncResult:
+    """Uploads the files of a local directory that differ from a Sandbox directory, see `FileSystem.sync_dir`."""
+    if not os.path.isdir(local_dir):
+        raise DaytonaError(f"Local directory {local_dir} does not exist")
+    local = local_manifest(local_dir, path_filter)
+    staged = files.staging_path("manifest")
+    try:
+        files.run(remote_manifest_command(remote_dir, path_filter, staged), timeout)
+    except BaseException:
+        files.remove(staged, timeout=timeout)
+        raise
+    remote = parse_remote_manifest(b"".join(files.iter_staged(staged, timeout)))
+
+    changed, unchanged, undecided = compare_manifests(local, remote)
+    remote_hashes: Dict[str, str] = {}
+    for command in hash_commands(remote_dir, undecided):
+        remote_hashes.update(parse_hashes(files.run(command, timeout)))
+    for path in undecided:
+        local[path].sha256 = file_sha256(os.path.join(local_dir, path))
+        (unchanged if remote_hashes.get(path) == local[path].sha256 else changed).append(path)
+    result = SyncResult(uploaded=sorted(changed), deleted=[], unchanged=sorted(unchanged))
+
+    upload_files(
+        [FileUpload(os.path.join(local_dir, path), f"{remote_dir}/{path}") for path in result.uploaded], timeout
+    )
+    # Files with their local modification time are recognized as unchanged by the next sync without hashing
+    touched = {path: local[path] for path in result.uploaded + undecided}
+    for command in touch_commands(remote_dir, touched):
+        files.run(command, timeout)
+
+    if delete:
+        result.deleted = sorted(path for path in remote if path not in local and path_filter.selects_path(path))
+        with files.changing(remote_dir):
+            for command in delete_commands(remote_dir, result.deleted):
+                files.run(command, timeout)
+    return result
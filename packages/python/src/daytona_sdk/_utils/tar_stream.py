@@ -0,0 +1,257 @@
+import io
+import os
+import queue
+import shlex
+import tarfile
+import threading
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..common.errors import DaytonaError
+
+# Size of the chunks an archive is produced and consumed in
+CHUNK_SIZE = 64 * 1024
+# Number of chunks buffered between the producer of an archive and its consumer
+_MAX_PENDING_CHUNKS = 16
+# Last line of the output of the command built by `archive_files_command` if an archive was written
+_ARCHIVED_MARKER = "__DAYTONA_ARCHIVED__"
+_END = object()
+
+
+class _ProducerClosed(Exception):
+    """Raised in the producer thread of a `ProducerStream` once its reader was closed."""
+
+
+class _QueueWriter(io.RawIOBase):
+    def __init__(self, stream: "ProducerStream"):
+        self._stream = stream
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        data = bytes(b)
+        if data:
+            self._stream._put(data)  # pylint: disable=protected-access
+        return len(data)
+
+
+class ProducerStream(io.RawIOBase):
+    """A readable stream of the bytes written by a function running in a background thread.
+
+    The producer blocks once `_MAX_PENDING_CHUNKS` chunks are waiting to be read, so memory use stays constant
+    no matter how much data is produced. Errors of the producer are raised to the reader. Closing the stream
+    stops the producer.
+
+    The stream is neither seekable nor of known length, so HTTP clients send it with chunked transfer encoding.
+    """
+
+    def __init__(self, produce: Callable[[BinaryIO], None]):
+        super().__init__()
+        self._produce = produce
+        self._queue: "queue.Queue[object]" = queue.Queue(maxsize=_MAX_PENDING_CHUNKS)
+        self._buffer = b""
+        self._error: Optional[BaseException] = None
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.__run, name="daytona-producer", daemon=True)
+            self._thread.start()
+        while not self._buffer:
+            chunk = self._queue.get()
+            if chunk is _END:
+                # Keep reporting the end of the stream to repeated reads
+                self._queue.put(_END)
+                if self._error is not None:
+                    raise self._error
+                return 0
+            self._buffer = chunk
+        size = min(len(b), len(self._buffer))
+        b[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+    def close(self) -> None:
+        if not self.closed:
+            self._stopped.set()
+            if self._thread is not None:
+                # Unblock the producer so it notices the stream was closed
+                while self._thread.is_alive():
+                    try:
+                        self._queue.get(timeout=0.1)
+                    except queue.Empty:
+                        pass
+        super().close()
+
+    def _put(self, chunk: bytes) -> None:
+        while True:
+            if self._stopped.is_set():
+                raise _ProducerClosed()
+            try:
+                self._queue.put(chunk, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def __run(self) -> None:
+        try:
+            writer = io.BufferedWriter(_QueueWriter(self), buffer_size=CHUNK_SIZE)
+            self._produce(writer)
+            writer.flush()
+        except _ProducerClosed:
+            return
+        except BaseException as e:  # pylint: disable=broad-exception-caught
+            self._error = e
+        try:
+            self._put(_END)
+        except _ProducerClosed:
+            pass
+
+
+class IteratorStream(io.RawIOBase):
+    """A readable stream of the chunks of a bytes iterator, e.g. of a streamed HTTP response."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        super().__init__()
+        self._chunks: Iterator[bytes] = iter(chunks)
+        self._buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        while not self._buffer:
+            self._buffer = next(self._chunks, b"")
+            if not self._buffer:
+                return 0
+        size = min(len(b), len(self._buffer))
+        b[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
+def write_archive(f: BinaryIO, entries: Iterable[Tuple[str, str]], compress: bool = True) -> None:
+    """Writes a tar archive of local files and directories to a stream.
+
+    Args:
+        f (BinaryIO): Stream to write the archive to.
+        entries (Iterable[Tuple[str, str]]): The (path in the archive, local path) of the entries. Directories are
+            added without their contents and symbolic links are kept as links.
+        compress (bool): Whether to gzip the archive.
+    """
+    with tarfile.open(fileobj=f, mode="w|gz" if compress else "w|", bufsize=CHUNK_SIZE) as tar:
+        for arcname, path in entries:
+            tar.add(path, arcname=arcname, recursive=False)
+
+
+def _check_member(member: tarfile.TarInfo, destination: str) -> None:
+    target = os.path.realpath(os.path.join(destination, member.name))
+    if os.path.isabs(member.name) or os.path.commonpath([destination, target]) != destination:
+        raise DaytonaError(f"Archive entry {member.name} points outside of the destination directory")
+    if member.issym() or member.islnk():
+        link = os.path.join(os.path.dirname(target), member.linkname) if member.issym() else member.linkname
+        link_target = os.path.realpath(os.path.join(destination, link))
+        if os.path.isabs(member.linkname) or os.path.commonpath([destination, link_target]) != destination:
+            raise DaytonaError(f"Archive entry {member.name} links outside of the destination directory")
+    if not (member.isfile() or member.isdir() or member.issym() or member.islnk()):
+        raise DaytonaError(f"Archive entry {member.name} is not a regular file, directory or link")
+
+
+def extract_archive(f: BinaryIO, destination: str, compressed: bool = True) -> None:
+    """Extracts a tar archive read sequentially from a stream, so it never has to be held in memory or on disk.
+
+    Entries that would be written outside of the destination directory are rejected.
+
+    Args:
+        f (BinaryIO): Stream to read the archive from.
+        destination (str): Local directory to extract the archive into, which is created if it does not exist.
+        compressed (bool): Whether the archive is gzipped.
+
+    Raises:
+        DaytonaError: If the archive contains unsafe entries.
+    """
+    os.makedirs(destination, exist_ok=True)
+    destination = os.path.realpath(destination)
+    with tarfile.open(fileobj=f, mode="r|gz" if compressed else "r|", bufsize=CHUNK_SIZE) as tar:
+        if hasattr(tarfile, "data_filter"):
+            try:
+                tar.extractall(destination, filter="data")
+            except tarfile.FilterError as e:
+                raise DaytonaError(f"Unsafe archive entry: {e}") from e
+            return
+        for member in tar:
+            _check_member(member, destination)
+            tar.extract(member, destination)
+
+
+def path_list(paths: List[str]) -> bytes:
+    """Encodes paths as the NUL-separated list read by the commands built by `archive_files_command` and
+    `compression.decompress_files_command`."""
+    return b"".join(path.encode() + b"\0" for path in paths)
+
+
+def archive_files_command(path_list_file: str, archive: str, compress: bool = True) -> str:
+    """Builds the shell command that packs Sandbox files into a tar archive.
+
+    The paths are read from `path_list_file`, a file with the list built by `path_list`, rather than passed as
+    arguments, so any number of them fits into the command. The file is removed by the command.
+
+    Files that can not be archived are skipped and reported as `<reason>\\t<path>` lines. Symbolic and hard
+    links are archived as the files they point to, so every entry of the archive is a regular file named after
+    its absolute path without the leading slash.
+    """
+    paths = shlex.quote(path_list_file)
+    archivable = shlex.quote(f"{path_list_file}.ok")
+    check = (
+        "for p; do\n"
+        '  if [ ! -e "$p" ]; then printf "not found\\t%s\\n" "$p"\n'
+        '  elif [ ! -f "$p" ]; then printf "not a regular file\\t%s\\n" "$p"\n'
+        '  elif [ ! -r "$p" ]; then printf "permission denied\\t%s\\n" "$p"\n'
+        '  else printf "%s\\000" "$p" >> "$0"; fi\n'
+        "done"
+    )
+    return (
+        f": > {archivable} || exit $?\n"
+        f"xargs -0 sh -c {shlex.quote(check)} {archivable} < {paths}\n"
+        f"rm -f {paths}\n"
+        f"[ -s {archivable} ] || {{ rm -f {archivable}; exit 0; }}\n"
+        "opts=; tar --hard-dereference --version >/dev/null 2>&1 && opts=--hard-dereference\n"
+        f'tar -c{"z" if compress else ""}hf {shlex.quote(archive)} $opts --null -T {archivable} 2>/dev/null\n'
+        f"status=$?; rm -f {archivable}; [ $status -eq 0 ] || exit $status\n"
+        f"echo {_ARCHIVED_MARKER}"
+    )
+
+
+def parse_archive_output(output: str) -> Tuple[bool, Dict[str, str]]:
+    """Parses the output of the command built by `archive_files_command`.
+
+    Returns:
+        Tuple[bool, Dict[str, str]]: Whether an archive was written, and the reasons the skipped files could
+        not be archived by path.
+    """
+    archived = False
+    errors = {}
+    for line in output.splitlines():
+        if line == _ARCHIVED_MARKER:
+            archived = True
+            continue
+        reason, separator, path = line.partition("\t")
+        if separator:
+            errors[path] = reason
+    return archived, errors
+
+
+def read_archive(f: BinaryIO, compressed: bool = True) -> Iterator[Tuple[str, BinaryIO]]:
+    """Reads the regular files of a tar archive sequentially from a stream.
+
+    Yields:
+        Tuple[str, BinaryIO]: The name and contents of each file. The contents must be read before the next file.
+    """
+    with tarfile.open(fileobj=f, mode="r|gz" if compressed else "r|", bufsize=CHUNK_SIZE) as tar:
+        for member in tar:
+            if member.isfile():
+                yield member.name, tar.extractfile(member)
@@ -1,17 +1,84 @@
+import asyncio
 import concurrent.futures
+import contextvars
 import functools
+import inspect
+import time
 from typing import Any, Callable, Optional, ParamSpec, TypeVar
 
+import httpx
+import urllib3
 from daytona_sdk._utils.errors import DaytonaError
 
 P = ParamSpec("P")
 T = TypeVar("T")
 
+# Deadline (as a `time.monotonic()` value) of the innermost timed operation running in the current context
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar("daytona_deadline", default=None)
+# Errors of waits and requests cut short by a timeout
+_TIMEOUT_ERRORS = (
+    TimeoutError,
+    concurrent.futures.TimeoutError,
+    asyncio.TimeoutError,
+    httpx.TimeoutException,
+    urllib3.exceptions.TimeoutError,
+)
+
+
+def remaining_timeout(timeout: Optional[float] = None) -> Optional[float]:
+    """Returns the time budget left for a blocking call made inside a timed operation.
+
+    Args:
+        timeout (Optional[float]): Timeout of the call itself in seconds. None or 0 means no timeout.
+
+    Returns:
+        Optional[float]: The smaller of the timeout and the time left until the deadline of the current
+            operation, or None if neither is set.
+
+    Raises:
+        TimeoutError: If the deadline of the current operation has already passed.
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return timeout or None
+
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise TimeoutError("Operation deadline exceeded")
+    return min(remaining, timeout) if timeout else remaining
+
+
+def time_left(deadline: Optional[float], timeout: Optional[float] = None) -> Optional[float]:
+    """Returns the time budget left for work that started after the deadline of its batch was set, e.g. a
+    request that waited for a free worker.
+
+    Args:
+        deadline (Optional[float]): `time.monotonic()` value the batch must be done by. None means no deadline.
+        timeout (Optional[float]): Timeout to use if there is no deadline. None or 0 means no timeout.
+
+    Returns:
+        Optional[float]: The time left until the deadline, or the timeout if there is no deadline.
+
+    Raises:
+        TimeoutError: If the deadline has already passed.
+    """
+    if deadline is None:
+        return timeout or None
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise TimeoutError("Operation deadline exceeded")
+    return remaining
+
 
 def with_timeout(
     error_message: Optional[Callable[[Any, float], str]] = None,
 ) -> Callable[[Callable[P, T]], Callable[P, T]]:
     """Decorator to add a timeout mechanism with an optional custom error message.
+    Works with both regular functions and coroutine functions.
+
+    The function runs in the calling thread with a deadline that is visible to nested calls through
+    `remaining_timeout`, so HTTP requests and polling loops only get the budget that is left. Nested timed
+    functions never extend the deadline of the outer one.
 
     Args:
         error_message (Optional[Callable[[Any, float], str]]): A callable that accepts `self` and `timeout`,
@@ -19,37 +86,83 @@ def with_timeout(
     """
 
     def decorator(func: Callable[P, T]) -> Callable[P, T]:
-        @functools.wraps(func)
-        def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-            # Get function argument names
-            arg_names = func.__code__.co_varnames[: func.__code__.co_argcount]
-            arg_dict = dict(zip(arg_names, args))
+        signature = inspect.signature(func)
 
-            # Extract self if method is bound
-            self_instance = args[0] if args else None
+        def get_timeout(args: tuple, kwargs: dict) -> Optional[float]:
+            # Resolve 'timeout' from kwargs, positional arguments or the default value of the parameter
+            arguments = signature.bind_partial(*args, **kwargs)
+            arguments.apply_defaults()
+            timeout = arguments.arguments.get("timeout", None)
 
-            # Check for 'timeout' in kwargs first, then in positional arguments
-            timeout = kwargs.get("timeout", arg_dict.get("timeout", None))
+            if timeout is not None and timeout < 0:
+                raise DaytonaError("Timeout must be a non-negative number or None.")
+            return timeout
 
-            if timeout is None or timeout == 0:
-                # If timeout is None or 0, run the function normally
-                return func(*args, **kwargs)
+        def timeout_error(self_instance: Any, timeout: float) -> TimeoutError:
+            # Use custom error message if provided, otherwise default
+            msg = (
+                error_message(self_instance, timeout)
+                if error_message
+                else f"Function '{func.__name__}' exceeded timeout of {timeout} seconds."
+            )
+            return TimeoutError(msg)
 
-            if timeout < 0:
-                raise DaytonaError("Timeout must be a non-negative number or None.")
+        def set_deadline(timeout: float) -> tuple:
+            deadline = time.monotonic() + timeout
+            outer_deadline = _deadline.get()
+            # The timeout of this function only applies if it ends before the deadline of the caller
+            binding = outer_deadline is None or deadline <= outer_deadline
+            return deadline, binding, _deadline.set(deadline if binding else outer_deadline)
+
+        def is_timeout(e: Optional[BaseException]) -> bool:
+            # Nested SDK calls wrap the timeouts of their requests in a DaytonaError
+            seen = set()
+            while e is not None and id(e) not in seen:
+                if isinstance(e, _TIMEOUT_ERRORS):
+                    return True
+                seen.add(id(e))
+                e = e.__cause__ or e.__context__
+            return False
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+                timeout = get_timeout(args, kwargs)
+
+                if timeout is None or timeout == 0:
+                    # If timeout is None or 0, run the coroutine under the deadline of the caller, if any
+                    return await func(*args, **kwargs)
 
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(func, *args, **kwargs)
+                deadline, binding, token = set_deadline(timeout)
                 try:
-                    return future.result(timeout=timeout)
-                except concurrent.futures.TimeoutError:
-                    # Use custom error message if provided, otherwise default
-                    msg = (
-                        error_message(self_instance, timeout)
-                        if error_message
-                        else f"Function '{func.__name__}' exceeded timeout of {timeout} seconds."
-                    )
-                    raise TimeoutError(msg)  # pylint: disable=raise-missing-from
+                    return await asyncio.wait_for(func(*args, **kwargs), timeout=deadline - time.monotonic())
+                except Exception as e:
+                    if binding and is_timeout(e):
+                        raise timeout_error(args[0] if args else None, timeout)  # pylint: disable=raise-missing-from
+                    raise
+                finally:
+                    _deadline.reset(token)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            timeout = get_timeout(args, kwargs)
+
+            if timeout is None or timeout == 0:
+                # If timeout is None or 0, run the function under the deadline of the caller, if any
+                return func(*args, **kwargs)
+
+            _, binding, token = set_deadline(timeout)
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                if binding and is_timeout(e):
+                    raise timeout_error(args[0] if args else None, timeout)  # pylint: disable=raise-missing-from
+                raise
+            finally:
+                _deadline.reset(token)
 
         return wrapper
 
@@ -0,0 +1,259 @@
+import io
+import os
+import shlex
+import uuid
+from contextlib import ExitStack, contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from daytona_api_client import ExecuteRequest, ToolboxApi
+
+from ..common.compression import DEFAULT_COMPRESSION_THRESHOLD, Compression
+from ..common.errors import DaytonaError
+from ..common.filesystem import FileUpload, UploadSource
+from ..process import Process
+from ..protocols import SandboxInstance
+from ..transport import NO_RETRY_EXTENSION, get_transport
+from . import compression as compression_utils
+from .metadata_cache import MetadataCacheControl
+from .multipart import CountingReader, is_async_iterable, is_stream, read_chunks
+from .path import prefix_relative_path
+from .ranged_download import parse_content_range
+from .remote_file import RemoteFileReader
+from .tar_stream import CHUNK_SIZE, IteratorStream, path_list
+
+# Sandbox directory the archives, manifests and other files of transfers are staged in
+STAGING_DIR = "/tmp"
+
+
+class ToolboxFiles:
+    """Low-level file operations of a Sandbox that the `FileSystem` methods are built on: housekeeping
+    commands, streamed and ranged reads of Sandbox files, and multipart uploads.
+
+    Args:
+        instance (SandboxInstance): The Sandbox instance the files belong to.
+        toolbox_api (ToolboxApi): API client for Sandbox operations.
+        get_root_dir (Callable[[], str]): A function to get the default root directory of the Sandbox.
+        metadata_cache (MetadataCacheControl): Metadata cache whose entries are invalidated by writes.
+    """
+
+    def __init__(
+        self,
+        instance: SandboxInstance,
+        toolbox_api: ToolboxApi,
+        get_root_dir: Callable[[], str],
+        metadata_cache: MetadataCacheControl,
+    ):
+        self.instance = instance
+        self.toolbox_api = toolbox_api
+        self._get_root_dir = get_root_dir
+        self._metadata_cache = metadata_cache
+
+    def resolve(self, path: str) -> str:
+        """Resolves a path relative to the user's root directory."""
+        return prefix_relative_path(self._get_root_dir(), path)
+
+    @contextmanager
+    def changing(self, *paths: str) -> Iterator[None]:
+        """Invalidates the cached metadata of the (absolute) paths an operation changes once it ends. Failed
+        operations invalidate as well, as they may have changed some of the paths."""
+        try:
+            yield
+        finally:
+            if paths:
+                self._metadata_cache.invalidate_paths(*paths)
+
+    def run(self, command: str, timeout: Optional[int] = None) -> str:
+        """Runs a shell command in the Sandbox for file system housekeeping.
+
+        Returns:
+            str: Output of the command.
+
+        Raises:
+            DaytonaError: If the command exits with a non-zero exit code.
+        """
+        response = self.toolbox_api.execute_command(
+            self.instance.id,
+            # pylint: disable-next=protected-access
+            ExecuteRequest(command=Process._build_command(command), timeout=timeout or None),
+        )
+        if response.exit_code != 0:
+            raise DaytonaError(f"Command failed with exit code {response.exit_code}: {response.result}")
+        return response.result
+
+    def remove(self, *paths: str, timeout: Optional[int] = None) -> None:
+        """Removes Sandbox files, ignoring those that do not exist."""
+        self.run(f"rm -f {' '.join(shlex.quote(path) for path in paths)}", timeout)
+
+    @staticmethod
+    def staging_path(extension: str) -> str:
+        """Returns a new path in the Sandbox directory that transfers are staged in."""
+        return f"{STAGING_DIR}/daytona-{uuid.uuid4().hex}.{extension}"
+
+    def download_url(self, remote_path: str) -> str:
+        # pylint: disable=protected-access
+        _, url, *_ = self.toolbox_api._download_file_serialize(
+            self.instance.id,
+            path=remote_path,
+            x_daytona_organization_id=None,
+            _request_auth=None,
+            _content_type=None,
+            _headers=None,
+            _host_index=None,
+        )
+        return url
+
+    def open(self, remote_path: str, timeout: int) -> RemoteFileReader:
+        """Opens a Sandbox file as an unbuffered stream that downloads it as it is read."""
+        transport = get_transport(self.toolbox_api.api_client)
+        return RemoteFileReader(
+            transport.client,
+            self.download_url(remote_path),
+            self.toolbox_api.api_client.default_headers,
+            transport.timeout(timeout),
+            remote_path,
+        )
+
+    def iter_file(self, remote_path: str, timeout: int) -> Iterator[bytes]:
+        """Streams the contents of a Sandbox file over one connection, which is released once they are consumed
+        or the iterator is closed."""
+        transport = get_transport(self.toolbox_api.api_client)
+        with transport.client.stream(
+            "GET",
+            self.download_url(remote_path),
+            headers=self.toolbox_api.api_client.default_headers,
+            timeout=transport.timeout(timeout),
+        ) as response:
+            response.raise_for_status()
+            yield from response.iter_bytes(CHUNK_SIZE)
+
+    def iter_staged(self, staged: str, timeout: int) -> Iterator[bytes]:
+        """Streams the contents of a staging file of the Sandbox, which is removed once they are consumed."""
+        try:
+            yield from self.iter_file(staged, timeout)
+        finally:
+            self.remove(staged, timeout=timeout)
+
+    def read_range(self, remote_path: str, start: int, end: int, timeout: int = 10 * 60) -> bytes:
+        """Reads the bytes from `start` up to `end` (exclusive) of a Sandbox file with a range request. Fewer
+        bytes are returned if the file ends before `end`."""
+        if end <= start:
+            return b""
+        transport = get_transport(self.toolbox_api.api_client)
+        response = transport.client.get(
+            self.download_url(remote_path),
+            headers={
+                **self.toolbox_api.api_client.default_headers,
+                "Range": f"bytes={start}-{end - 1}",
+                "Accept-Encoding": "identity",
+            },
+            timeout=transport.timeout(timeout),
+        )
+        if response.status_code == 416:
+            return b""
+        response.raise_for_status()
+        if response.status_code != 206:
+            # The server ignored the range and sent the whole file
+            return response.content[start:end]
+        content_range = parse_content_range(response.headers.get("Content-Range"))
+        if content_range is None or content_range.start != start:
+            raise DaytonaError(f"Invalid Content-Range header: {response.headers.get('Content-Range')}")
+        return response.content
+
+    def sha256_files(self, directory: str, timeout: int) -> Dict[str, str]:
+        """Returns the SHA-256 hashes of the files in a Sandbox directory by file name."""
+        quoted = shlex.quote(directory)
+        output = self.run(f"mkdir -p {quoted} && cd {quoted} && sha256sum * 2>/dev/null || true", timeout)
+        hashes = {}
+        for line in output.splitlines():
+            digest, _, name = line.partition("  ")
+            if name:
+                hashes[name.strip()] = digest.strip()
+        return hashes
+
+    def upload(
+        self,
+        files: List[FileUpload],
+        timeout: int = 10 * 60,
+        compression: Optional[Compression] = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        on_read: Optional[Callable[[int, int], None]] = None,
+    ) -> None:
+        """Sends files to the Sandbox in a single multipart request. Streams and iterators are sent as they are
+        read, so the request is not retried if one of the sources is one.
+
+        With `compression`, sources of at least `compression_threshold` bytes (and streams of unknown size) are
+        compressed, sent to a staging file next to their destination and decompressed in the Sandbox by a single
+        command, which reads the (staging file, destination) pairs from a manifest sent along with the files.
+
+        `on_read` is called with the index of a file and the number of its bytes read for sending so far."""
+        data = {}
+        multipart_files = []
+        replayable = True
+        # (staging path, destination) of the compressed files
+        staged: List[Tuple[str, str]] = []
+        with ExitStack() as stack:
+            for i, f in enumerate(files):
+                dst = self.resolve(f.destination)
+                compress = compression is not None and _compressible(f.source, compression_threshold)
+                if compress:
+                    path = f"{dst}.daytona-{uuid.uuid4().hex[:8]}.{compression_utils.extension(compression)}"
+                    staged.append((path, dst))
+                    dst = path
+                # metadata field
+                data[f"files[{i}].path"] = dst
+                # file field: wrap bytes in BytesIO or open file stream, which is sent in chunks
+                if isinstance(f.source, bytes) and compress:
+                    # Compressed up front, so the request can still be retried
+                    stream = io.BytesIO(compression_utils.compress_bytes(f.source, compression))
+                    fname = dst
+                else:
+                    if isinstance(f.source, bytes):
+                        stream = io.BytesIO(f.source)
+                        fname = dst
+                    elif isinstance(f.source, str):
+                        stream = stack.enter_context(open(f.source, "rb"))
+                        fname = os.path.basename(f.source)
+                    elif is_async_iterable(f.source):
+                        raise DaytonaError("Async iterators can only be uploaded with AsyncSandbox")
+                    else:
+                        stream = IteratorStream(read_chunks(f.source) if is_stream(f.source) else f.source)
+                        fname = os.path.basename(dst)
+                        replayable = False
+                    if on_read is not None:
+                        # Count the bytes before compression, which is what the sizes of the sources refer to
+                        stream = CountingReader(stream, lambda count, index=i: on_read(index, count))
+                    if compress:
+                        stream = IteratorStream(compression_utils.compress_chunks(stream, compression))
+                        replayable = False
+                multipart_files.append((f"files[{i}].file", (fname, stream)))
+            if staged:
+                # The pairs the command decompressing the staged files reads, sent with the files
+                manifest = self.staging_path("decompress")
+                data[f"files[{len(files)}].path"] = manifest
+                pairs = path_list([path for pair in staged for path in pair])
+                multipart_files.append((f"files[{len(files)}].file", (manifest, io.BytesIO(pairs))))
+
+            # pylint: disable=protected-access
+            _, url, *_ = self.toolbox_api._upload_files_serialize(self.instance.id, None, None, None, None, None)
+            transport = get_transport(self.toolbox_api.api_client)
+            response = transport.client.post(
+                url,
+                data=data,
+                files=multipart_files,
+                headers=self.toolbox_api.api_client.default_headers,
+                timeout=transport.timeout(timeout),
+                extensions=None if replayable else {NO_RETRY_EXTENSION: True},
+            )
+            response.raise_for_status()
+
+        if staged:
+            self.run(compression_utils.decompress_files_command(manifest, compression), timeout)
+
+
+def _compressible(source: UploadSource, threshold: int) -> bool:
+    """Whether an upload source is large enough to be compressed. Streams are of unknown size and always are."""
+    if isinstance(source, bytes):
+        return len(source) >= threshold
+    if isinstance(source, str):
+        return os.path.getsize(source) >= threshold
+    return True
@@ -0,0 +1,91 @@
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Dict
+
+# Suffix of the journal written next to the local file of a resumable download
+DOWNLOAD_JOURNAL_SUFFIX = ".daytona-journal"
+# Directory of the journals of resumable uploads, which can not be written next to the (possibly read-only) source
+UPLOAD_JOURNAL_DIR = os.path.join(os.path.expanduser("~"), ".cache", "daytona", "uploads")
+
+
+class TransferJournal:
+    """Progress of a resumable transfer, stored as JSON on disk so a failed transfer can continue where it stopped.
+
+    A journal only applies to the transfer it was written for: it is discarded when the identity of the
+    transfer (e.g. paths, sizes and modification times) no longer matches.
+
+    Attributes:
+        path (str): Location of the journal file.
+        identity (Dict[str, Any]): Values describing the transfer.
+        completed (Dict[str, Any]): Completed chunks of the transfer, e.g. by offset or name.
+    """
+
+    def __init__(self, path: str, identity: Dict[str, Any]):
+        self.path = path
+        self.identity = identity
+        self.completed: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_upload(cls, identity: Dict[str, Any]) -> "TransferJournal":
+        """Creates the journal of an upload in `UPLOAD_JOURNAL_DIR`, named after the source and destination."""
+        key = json.dumps([identity.get("sandbox_id"), identity.get("local_path"), identity.get("remote_path")])
+        return cls(os.path.join(UPLOAD_JOURNAL_DIR, f"{hashlib.sha256(key.encode()).hexdigest()[:32]}.json"), identity)
+
+    def load(self) -> bool:
+        """Loads the completed chunks of a previous attempt of the same transfer.
+
+        Returns:
+            bool: Whether a journal of the same transfer was found.
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if not isinstance(data, dict) or data.get("identity") != self.identity:
+            return False
+        self.completed = dict(data.get("completed") or {})
+        return True
+
+    def reset(self) -> None:
+        """Forgets all completed chunks and writes the empty journal."""
+        with self._lock:
+            self.completed = {}
+            self.__save()
+
+    def mark(self, key: str, value: Any = True) -> None:
+        """Records a completed chunk.
+
+        Args:
+            key (str): Identifier of the chunk.
+            value (Any): JSON-serializable details of the chunk, e.g. its hash.
+        """
+        with self._lock:
+            self.completed[key] = value
+            self.__save()
+
+    def discard(self, key: str) -> None:
+        """Forgets a chunk that turned out to be incomplete."""
+        with self._lock:
+            self.completed.pop(key, None)
+            self.__save()
+
+    def delete(self) -> None:
+        """Removes the journal once the transfer has completed."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def __save(self) -> None:
+        parent = os.path.dirname(self.path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        # Write a new file and swap it in, so a crash never leaves a truncated journal behind
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"identity": self.identity, "completed": self.completed}, f)
+        os.replace(temp_path, self.path)
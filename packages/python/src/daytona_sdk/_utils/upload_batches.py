@@ -0,0 +1,212 @@
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import httpx
+
+from ..common.compression import Compression
+from ..common.filesystem import FileUpload, UploadProgress, UploadSource
+from ..transport import get_transport
+from . import compression as compression_utils
+from .aimd import AimdController
+from .multipart import is_replayable
+from .toolbox_files import ToolboxFiles
+from .upload_dedup import UploadDedup
+
+# Limits of the files sent in one request by `upload_files`
+UPLOAD_BATCH_FILES = 100
+UPLOAD_BATCH_BYTES = 64 * 1024 * 1024
+# Maximum number of requests `upload_files` sends at the same time
+DEFAULT_UPLOAD_CONCURRENCY = 4
+# Statuses of failed batches that would fail the files of the batch alike, so they are not split
+_UNSPLITTABLE_STATUSES = (401, 403, 507)
+
+
+class UploadTracker:
+    """Tracks the progress of the files of an `upload_files` call and reports it to a callback."""
+
+    def __init__(
+        self,
+        files: List[FileUpload],
+        sizes: List[Optional[int]],
+        callback: Optional[Callable[[UploadProgress], None]],
+    ):
+        self._files = files
+        self._sizes = sizes
+        self._callback = callback
+        self._total_bytes = None if any(size is None for size in sizes) else sum(sizes)
+        self._sent = [0] * len(files)
+        self._bytes_sent = 0
+        self._files_done = 0
+        self._concurrency = 0
+        self._start = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def reports(self) -> bool:
+        return self._callback is not None
+
+    def update(self, index: int, count: int) -> None:
+        """Records that `count` bytes of a file were read for sending so far."""
+        with self._lock:
+            self._bytes_sent += count - self._sent[index]
+            self._sent[index] = count
+            self.__report(index, False, None)
+
+    def complete(self, index: int, error: Optional[str], concurrency: int) -> None:
+        with self._lock:
+            self._concurrency = concurrency
+            if error is None:
+                self._files_done += 1
+                # Count files whose size was not known from their contents, or that were not wrapped
+                self._bytes_sent += (self._sizes[index] or self._sent[index]) - self._sent[index]
+                self._sent[index] = self._sizes[index] or self._sent[index]
+            self.__report(index, error is None, error)
+
+    def __report(self, index: int, done: bool, error: Optional[str]) -> None:
+        if self._callback is None:
+            return
+        self._callback(
+            UploadProgress(
+                destination=self._files[index].destination,
+                file_bytes_sent=self._sent[index],
+                file_size=self._sizes[index],
+                done=done,
+                error=error,
+                bytes_sent=self._bytes_sent,
+                total_bytes=self._total_bytes,
+                files_done=self._files_done,
+                files_total=len(self._files),
+                throughput=self._bytes_sent / max(time.monotonic() - self._start, 1e-6),
+                concurrency=self._concurrency,
+            )
+        )
+
+
+class BatchUploader:
+    """Uploads files in parallel batches whose number adapts to the throughput, and splits failed batches to
+    retry their halves."""
+
+    def __init__(self, toolbox_files: ToolboxFiles, dedup: UploadDedup):
+        self._files = toolbox_files
+        self._dedup = dedup
+
+    def upload(
+        self,
+        file: FileUpload,
+        timeout: int,
+        compression: Optional[Union[Compression, str]],
+        compression_threshold: int,
+    ) -> None:
+        """Uploads a single file, see `FileSystem.upload_file`."""
+        failed = self.upload_batches(
+            [file], timeout, compression, compression_threshold, 1, 1, UPLOAD_BATCH_BYTES, None
+        )
+        if failed:
+            raise failed[0][1]
+
+    def upload_batches(
+        self,
+        files: List[FileUpload],
+        timeout: int,
+        compression: Optional[Union[Compression, str]],
+        compression_threshold: int,
+        max_concurrency: int,
+        batch_files: int,
+        batch_bytes: int,
+        progress: Optional[Callable[[UploadProgress], None]],
+    ) -> List[Tuple[FileUpload, BaseException]]:
+        """Uploads files in parallel batches, see `FileSystem.upload_files`.
+
+        Returns:
+            List[Tuple[FileUpload, BaseException]]: The files that could not be uploaded with their errors.
+        """
+        if compression is not None:
+            compression = compression_utils.resolve(compression)
+        if not files:
+            return []
+
+        files, digests = self._dedup.upload_from_store(files, timeout)
+        if not files:
+            return []
+
+        sizes = [upload_size(f.source) for f in files]
+        tracker = UploadTracker(files, sizes, progress)
+        controller = AimdController(max_concurrency)
+        pending = split_batches(list(range(len(files))), files, sizes, batch_files, batch_bytes)
+        errors: Dict[int, BaseException] = {}
+
+        def send(batch: List[int]) -> None:
+            on_read = (lambda position, count: tracker.update(batch[position], count)) if tracker.reports else None
+            with self._files.changing(*(self._files.resolve(files[i].destination) for i in batch)):
+                self._files.upload([files[i] for i in batch], timeout, compression, compression_threshold, on_read)
+
+        with ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="daytona-upload") as executor:
+            running: Dict[Future, List[int]] = {}
+            while pending or running:
+                while pending and len(running) < controller.limit:
+                    batch = pending.pop(0)
+                    running[executor.submit(send, batch)] = batch
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    batch = running.pop(future)
+                    error = future.exception()
+                    if error is None:
+                        controller.record_success(sum(sizes[i] or 0 for i in batch))
+                        for i in batch:
+                            tracker.complete(i, None, controller.limit)
+                        continue
+                    controller.record_failure()
+                    if len(batch) > 1 and self._splittable(error, [files[i] for i in batch]):
+                        # Retry the halves on their own, so a single bad file only fails itself
+                        middle = len(batch) // 2
+                        pending[:0] = [batch[:middle], batch[middle:]]
+                        continue
+                    for i in batch:
+                        errors[i] = error
+                        tracker.complete(i, str(error), controller.limit)
+
+        stored = [(digest, files[i].destination) for i, digest in digests.items() if i not in errors]
+        self._dedup.add_to_store(stored, timeout)
+        return [(files[i], error) for i, error in sorted(errors.items())]
+
+    def _splittable(self, error: BaseException, files: List[FileUpload]) -> bool:
+        """Whether a failed batch is split to retry its halves, which takes a retry from the retry budget."""
+        if not all(is_replayable(f.source) for f in files):
+            return False
+        if isinstance(error, httpx.HTTPStatusError) and error.response.status_code in _UNSPLITTABLE_STATUSES:
+            return False
+        return get_transport(self._files.toolbox_api.api_client).try_retry()
+
+
+def upload_size(source: UploadSource) -> Optional[int]:
+    if isinstance(source, bytes):
+        return len(source)
+    if isinstance(source, str):
+        return os.path.getsize(source)
+    return None
+
+
+def split_batches(
+    indices: List[int], files: List[FileUpload], sizes: List[Optional[int]], max_files: int, max_bytes: int
+) -> List[List[int]]:
+    """Groups files into batches of at most `max_files` files and `max_bytes` bytes. Files larger than
+    `max_bytes` and streams, which can not be retried with other files, get a batch of their own."""
+    batches: List[List[int]] = []
+    batch: List[int] = []
+    batch_size = 0
+    for i in indices:
+        size = sizes[i]
+        if size is None or not is_replayable(files[i].source):
+            batches.append([i])
+            continue
+        if batch and (len(batch) >= max_files or batch_size + size > max_bytes):
+            batches.append(batch)
+            batch, batch_size = [], 0
+        batch.append(i)
+        batch_size += size
+    if batch:
+        batches.append(batch)
+    return batches
@@ -0,0 +1,143 @@
+import hashlib
+import os
+import posixpath
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from daytona_api_client import WorkspaceVolume as VolumeMount
+
+from ..common.errors import DaytonaError
+from ..common.filesystem import FileUpload
+from . import blob_store
+from .toolbox_files import ToolboxFiles
+
+# Size in bytes from which uploaded files are deduplicated through the content-addressed store
+DEFAULT_MIN_SIZE = 64 * 1024
+
+
+@dataclass
+class _StoreConfig:
+    """Content-addressed store that uploads are deduplicated through."""
+
+    path: str
+    volume_id: Optional[str]
+    link: bool
+    min_size: int
+
+
+class UploadDedup:
+    """Opt-in deduplication of the files sent by `upload_file` and `upload_files`, available as
+    `sandbox.fs.upload_dedup`. Disabled by default."""
+
+    def __init__(self, files: ToolboxFiles):
+        self._files = files
+        self._config: Optional[_StoreConfig] = None
+        self._index = blob_store.BlobIndex.for_api_client(files.toolbox_api.api_client)
+
+    @property
+    def enabled(self) -> bool:
+        return self._config is not None
+
+    def enable(
+        self,
+        store_dir: Optional[str] = None,
+        *,
+        volume: Optional[VolumeMount] = None,
+        link: bool = False,
+        min_size: int = DEFAULT_MIN_SIZE,
+    ) -> None:
+        """Deduplicates the files sent by `upload_file` and `upload_files` through a content-addressed store of
+        blobs named by their SHA-256 hash.
+
+        Before files are uploaded, the store is checked for their hashes with a single command. Files whose
+        blob exists are created from it in the Sandbox instead of being sent again, and uploaded files are added
+        to the store. The blobs known to exist are remembered by the client, so uploading the same contents
+        again costs no lookup. A store on a volume is shared by all Sandboxes that mount the volume, so a
+        file uploaded to one Sandbox is not sent again to the others. Hashes of local files are cached by their
+        size and modification time.
+
+        Only bytes and local files of at least `min_size` bytes are deduplicated, streams are always sent.
+
+        Args:
+            store_dir (Optional[str]): Directory of the store in the Sandbox. Relative paths are resolved based
+                on the user's root directory. Defaults to `.daytona/blobs`, or `.daytona-blobs` on the volume.
+            volume (Optional[VolumeMount]): Volume mounted in the Sandbox to keep the store on. `store_dir` is
+                then relative to its mount path.
+            link (bool): Whether to create files as hard links to their blobs instead of copies, which takes no
+                space or time. Files created as links share their contents with the store and must not be
+                modified in place, including by uploading to them with deduplication disabled. Links fall back to
+                copies across file systems. Default is False.
+            min_size (int): Size in bytes from which files are deduplicated. Default is 64 KiB.
+
+        Example:
+            ```python
+            # Share the wheels uploaded to any Sandbox that mounts the volume
+            volume = VolumeMount(volume_id=cache.id, mount_path="/mnt/cache")
+            sandbox.fs.upload_dedup.enable(volume=volume)
+            sandbox.fs.upload_files([FileUpload(path, f"wheels/{os.path.basename(path)}") for path in wheels])
+            ```
+        """
+        if min_size < 0:
+            raise DaytonaError("Minimum size must not be negative")
+        if volume is not None:
+            path = posixpath.join(volume.mount_path, store_dir or blob_store.VOLUME_STORE_DIR)
+            self._config = _StoreConfig(path, volume.volume_id, link, min_size)
+        else:
+            self._config = _StoreConfig(store_dir or blob_store.DEFAULT_STORE_DIR, None, link, min_size)
+
+    def disable(self) -> None:
+        """Sends all files of later uploads again. The store in the Sandbox is kept."""
+        self._config = None
+
+    def upload_from_store(self, files: List[FileUpload], timeout: int) -> Tuple[List[FileUpload], Dict[int, str]]:
+        """Creates the files whose contents are in the blob store from their blobs.
+
+        Returns:
+            Tuple[List[FileUpload], Dict[int, str]]: The files that still have to be uploaded, and the hashes of
+            those of them that should be added to the store by the index of the file.
+        """
+        config = self._config
+        if config is None:
+            return files, {}
+        store = self._files.resolve(config.path)
+        key = blob_store.store_key(self._files.instance.id, store, config.volume_id)
+
+        hashes: Dict[int, str] = {}
+        for i, f in enumerate(files):
+            if isinstance(f.source, bytes) and len(f.source) >= config.min_size:
+                hashes[i] = hashlib.sha256(f.source).hexdigest()
+            elif isinstance(f.source, str) and os.path.getsize(f.source) >= config.min_size:
+                hashes[i] = self._index.file_sha256(f.source)
+        if not hashes:
+            return files, {}
+
+        unknown = sorted({digest for digest in hashes.values() if not self._index.contains(key, digest)})
+        for command in blob_store.lookup_commands(store, unknown):
+            self._index.add(key, sorted(blob_store.parse_lines(self._files.run(command, timeout))))
+
+        known = [(i, digest) for i, digest in hashes.items() if self._index.contains(key, digest)]
+        pairs = [(digest, self._files.resolve(files[i].destination)) for i, digest in known]
+        created = set()
+        with self._files.changing(*(destination for _, destination in pairs)):
+            for start, command in blob_store.materialize_commands(store, pairs, config.link):
+                created.update(start + int(line) for line in blob_store.parse_lines(self._files.run(command, timeout)))
+        for position, (i, digest) in enumerate(known):
+            if position not in created:
+                # The blob was removed from the store since it was indexed
+                self._index.discard(key, digest)
+        created_files = {known[position][0] for position in created}
+
+        remaining = [i for i in range(len(files)) if i not in created_files]
+        to_store = {position: hashes[i] for position, i in enumerate(remaining) if i in hashes}
+        return [files[i] for i in remaining], to_store
+
+    def add_to_store(self, files: List[Tuple[str, str]], timeout: int) -> None:
+        """Copies uploaded files, given as (hash, destination) pairs, into the blob store."""
+        config = self._config
+        if config is None or not files:
+            return
+        store = self._files.resolve(config.path)
+        key = blob_store.store_key(self._files.instance.id, store, config.volume_id)
+        pairs = [(digest, self._files.resolve(destination)) for digest, destination in files]
+        for command in blob_store.store_commands(store, pairs):
+            self._index.add(key, sorted(blob_store.parse_lines(self._files.run(command, timeout))))
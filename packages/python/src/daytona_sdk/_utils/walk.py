@@ -0,0 +1,195 @@
+import asyncio
+import posixpath
+import shlex
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import closing
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+
+from daytona_api_client import FileInfo
+
+from ..common.errors import DaytonaError
+from ..common.filesystem import WalkEntry
+from . import streamed_search
+from .toolbox_files import ToolboxFiles
+
+# Type, size, mode bits, owner, group, modification time as seconds since the epoch, its UTC offset and time zone
+# name, depth below the start point and path of an entry. Entries end with a NUL byte and the path comes last,
+# so paths may contain any other character.
+_FORMAT = "%y\\t%s\\t%m\\t%u\\t%g\\t%T@\\t%Tz\\t%TZ\\t%d\\t%p"
+_FIELDS = 10
+# Number of directories walked by one command, which keeps the commands well below the argument size limit
+COMMAND_BATCH = 500
+# Maximum number of directories `walk` lists at the same time
+DEFAULT_CONCURRENCY = 8
+# Number of directories waiting to be listed from which `walk` lists the rest of the tree with a single command
+DEFAULT_FIND_THRESHOLD = 64
+# Letters the Toolbox puts before the permissions of a mode for each file type reported by `find`
+_TYPE_LETTERS = {"d": "d", "l": "L", "p": "p", "s": "S", "b": "D", "c": "Dc"}
+
+
+def find_command(directories: List[str], max_depth: Optional[int]) -> str:
+    """Command that prints every entry below the given directories, without following symbolic links. Entries
+    are separated by NUL bytes and parsed by `parse_find_record`.
+
+    Args:
+        directories (List[str]): Absolute paths of the directories to walk.
+        max_depth (Optional[int]): Depth below the directories to walk to. None walks the whole trees.
+    """
+    depth = f" -maxdepth {max_depth}" if max_depth is not None else ""
+    quoted = " ".join(shlex.quote(d) for d in directories)
+    return f"find {quoted} -mindepth 1{depth} -printf '{_FORMAT}\\0'"
+
+
+def _format_mode(kind: str, bits: int) -> str:
+    """Formats the type and mode bits of an entry the way the Toolbox reports the mode of a file."""
+    flags = _TYPE_LETTERS.get(kind, "")
+    flags += "u" if bits & 0o4000 else ""
+    flags += "g" if bits & 0o2000 else ""
+    flags += "t" if bits & 0o1000 else ""
+    permissions = "".join(letter if bits & (1 << (8 - i)) else "-" for i, letter in enumerate("rwxrwxrwx"))
+    return (flags or "-") + permissions
+
+
+def _format_mod_time(timestamp: str, offset: str, zone: str) -> str:
+    """Formats a modification time the way the Toolbox reports it, e.g. `2024-01-02 03:04:05.5 +0000 UTC`."""
+    seconds, _, fraction = timestamp.partition(".")
+    nanoseconds = fraction[:9].rstrip("0")
+    sign = -1 if offset.startswith("-") else 1
+    utc_offset = timedelta(hours=int(offset[1:3]), minutes=int(offset[3:5])) * sign
+    moment = datetime.fromtimestamp(int(seconds), timezone(utc_offset))
+    return f"{moment:%Y-%m-%d %H:%M:%S}{'.' + nanoseconds if nanoseconds else ''} {offset} {zone}"
+
+
+def parse_find_record(record: bytes) -> Optional[Tuple[str, int, FileInfo]]:
+    """Parses an entry printed by the command built by `find_command`.
+
+    Returns:
+        Optional[Tuple[str, int, FileInfo]]: The absolute path, the depth below its start point and the
+        information of the entry, or None if the record is not an entry.
+    """
+    fields = record.decode(errors="replace").split("\t", _FIELDS - 1)
+    if len(fields) != _FIELDS or not fields[8].isdigit():
+        return None
+    kind, size, bits, owner, group, timestamp, offset, zone, depth, path = fields
+    try:
+        mode_bits = int(bits, 8)
+        mod_time = _format_mod_time(timestamp, offset, zone)
+    except (ValueError, OverflowError, OSError):
+        return None
+    info = FileInfo(
+        name=path.rstrip("/").rsplit("/", 1)[-1],
+        is_dir=kind == "d",
+        size=int(size) if size.isdigit() else 0,
+        mod_time=mod_time,
+        mode=_format_mode(kind, mode_bits),
+        permissions=f"{mode_bits & 0o777:04o}",
+        owner=owner,
+        group=group,
+    )
+    return path, int(depth), info
+
+
+def group_by_depth(directories: List[Tuple[str, int]]) -> Iterator[Tuple[int, List[str]]]:
+    """Groups (path, depth) pairs of directories by their depth, so each group can be walked by one command
+    with one depth limit. Groups hold at most `COMMAND_BATCH` directories."""
+    groups: Dict[int, List[str]] = {}
+    for path, depth in directories:
+        groups.setdefault(depth, []).append(path)
+    for depth, paths in sorted(groups.items()):
+        for i in range(0, len(paths), COMMAND_BATCH):
+            yield depth, paths[i : i + COMMAND_BATCH]
+
+
+def walk_tree(
+    files: ToolboxFiles,
+    list_files: Callable[[str], List[FileInfo]],
+    root: str,
+    max_depth: Optional[int],
+    concurrency: int,
+    find_threshold: Optional[int],
+    timeout: int,
+) -> Iterator[WalkEntry]:
+    """Walks a Sandbox directory tree with concurrent listings, and with `find` commands once more than
+    `find_threshold` directories are waiting to be listed, see `FileSystem.walk`."""
+    _check_limits(max_depth, concurrency)
+    # Directories waiting to be listed and those being listed, with their depth below the root
+    pending: List[Tuple[str, int]] = [(root, 0)]
+    running: Dict[Future, Tuple[str, int]] = {}
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="daytona-walk")
+    try:
+        while pending or running:
+            if find_threshold is not None and len(pending) > find_threshold:
+                yield from _walk_find(files, pending, max_depth, timeout)
+                pending = []
+            while pending and len(running) < concurrency:
+                directory, depth = pending.pop()
+                running[executor.submit(list_files, directory)] = (directory, depth)
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                directory, depth = running.pop(future)
+                for info in future.result():
+                    entry = WalkEntry(posixpath.join(directory, info.name), info, depth + 1)
+                    if info.is_dir and (max_depth is None or entry.depth < max_depth):
+                        pending.append((entry.path, entry.depth))
+                    yield entry
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def walk_tree_async(
+    list_files: Callable[[str], Awaitable[List[FileInfo]]],
+    root: str,
+    max_depth: Optional[int],
+    concurrency: int,
+) -> AsyncIterator[WalkEntry]:
+    """Walks a Sandbox directory tree with concurrent listings, see `AsyncFileSystem.walk`."""
+    _check_limits(max_depth, concurrency)
+    pending: List[Tuple[str, int]] = [(root, 0)]
+    running: Dict["asyncio.Future[List[FileInfo]]", Tuple[str, int]] = {}
+    try:
+        while pending or running:
+            while pending and len(running) < concurrency:
+                directory, depth = pending.pop()
+                running[asyncio.ensure_future(list_files(directory))] = (directory, depth)
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                directory, depth = running.pop(future)
+                for info in future.result():
+                    entry = WalkEntry(posixpath.join(directory, info.name), info, depth + 1)
+                    if info.is_dir and (max_depth is None or entry.depth < max_depth):
+                        pending.append((entry.path, entry.depth))
+                    yield entry
+    finally:
+        for future in running:
+            future.cancel()
+
+
+def _check_limits(max_depth: Optional[int], concurrency: int) -> None:
+    if max_depth is not None and max_depth < 1:
+        raise DaytonaError("max_depth must be at least 1")
+    if concurrency < 1:
+        raise DaytonaError("concurrency must be at least 1")
+
+
+def _walk_find(
+    files: ToolboxFiles, directories: List[Tuple[str, int]], max_depth: Optional[int], timeout: int
+) -> Iterator[WalkEntry]:
+    """Walks the trees below directories at the given depths with `find` commands, whose entries are read
+    from staging files while the commands run."""
+    for depth, paths in group_by_depth(directories):
+        records = streamed_search.stream_records(
+            files.run,
+            files.read_range,
+            find_command(paths, max_depth - depth if max_depth is not None else None),
+            # Only the root may be missing, the other directories were just listed
+            paths[0] if depth == 0 else None,
+            files.staging_path("walk"),
+            streamed_search.FIND_SEPARATOR,
+            timeout,
+        )
+        with closing(records):
+            for entry_path, entry_depth, info in filter(None, map(parse_find_record, records)):
+                yield WalkEntry(entry_path, info, depth + entry_depth)
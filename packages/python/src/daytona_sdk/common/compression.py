@@ -0,0 +1,30 @@
+from enum import Enum
+
+# Size in bytes from which files and command output are compressed for transfer
+DEFAULT_COMPRESSION_THRESHOLD = 64 * 1024
+
+
+class Compression(str, Enum):
+    """Compression algorithms for file transfers and command output.
+
+    `ZSTD` compresses faster and better than `GZIP`, but requires the `zstandard` package
+    (`pip install daytona_sdk[zstd]`) and the `zstd` command in the Sandbox.
+
+    **Enum Members**:
+        - `GZIP` ("gzip")
+        - `ZSTD` ("zstd")
+    """
+
+    GZIP = "gzip"
+    ZSTD = "zstd"
+
+    def __str__(self):
+        return self.value
+
+    def __eq__(self, other):
+        if isinstance(other, str):
+            return self.value == other
+        return super().__eq__(other)
+
+    def __hash__(self):
+        return hash(self.value)
@@ -0,0 +1,116 @@
+from dataclasses import dataclass
+from typing import AsyncIterable, BinaryIO, Iterable, List, Optional, Union
+
+from daytona_api_client import FileInfo
+
+UploadSource = Union[bytes, str, BinaryIO, Iterable[bytes], AsyncIterable[bytes]]
+
+
+@dataclass
+class FileUpload:
+    """Represents a file to be uploaded to the Sandbox.
+
+    Attributes:
+        source (UploadSource): File contents as a bytes object, a local file path, a readable binary stream
+        (e.g. an open file, a pipe or a socket file), or an iterator of bytes chunks (e.g. a generator). Async
+        iterators and async streams are accepted by `AsyncSandbox`. If a bytes object is provided, make sure it
+        fits into memory; all other sources are streamed to the Sandbox with constant memory. Streams and
+        iterators are sent with chunked transfer encoding as they are read, so a failed upload of them can not be
+        retried.
+        destination (str): Absolute destination path in the Sandbox. Relative paths are resolved based on the user's
+        root directory.
+    """
+
+    source: UploadSource
+    destination: str
+
+
+@dataclass
+class UploadProgress:
+    """Progress of an `upload_files` call, passed to its `progress` callback whenever data of a file was
+    sent and when a file completed or failed.
+
+    Attributes:
+        destination (str): Destination path of the file the update is about.
+        file_bytes_sent (int): Number of bytes of the file sent so far.
+        file_size (Optional[int]): Size of the file in bytes, or None if it is a stream of unknown size.
+        done (bool): Whether the file was uploaded completely.
+        error (Optional[str]): Why the file failed to upload, if it did.
+        bytes_sent (int): Number of bytes sent so far across all files.
+        total_bytes (Optional[int]): Total size of all files in bytes, or None if some sizes are unknown.
+        files_done (int): Number of files uploaded completely so far.
+        files_total (int): Number of files to upload.
+        throughput (float): Average upload throughput across all files so far in bytes per second.
+        concurrency (int): Number of requests currently allowed at the same time.
+    """
+
+    destination: str
+    file_bytes_sent: int
+    file_size: Optional[int]
+    done: bool
+    error: Optional[str]
+    bytes_sent: int
+    total_bytes: Optional[int]
+    files_done: int
+    files_total: int
+    throughput: float
+    concurrency: int
+
+
+@dataclass
+class FileDownload:
+    """Represents a file to be downloaded from the Sandbox.
+
+    Attributes:
+        source (str): Path to the file in the Sandbox. Relative paths are resolved based on the user's root directory.
+        destination (str): Local path to save the file to.
+    """
+
+    source: str
+    destination: str
+
+
+@dataclass
+class FileDownloadResult:
+    """Represents the outcome of downloading one of the files passed to `download_files`.
+
+    Attributes:
+        source (str): Path to the file in the Sandbox, as it was requested.
+        destination (str): Local path the file was saved to.
+        error (Optional[str]): Why the file could not be downloaded, or None if it was downloaded.
+    """
+
+    source: str
+    destination: str
+    error: Optional[str] = None
+
+
+@dataclass
+class SyncResult:
+    """Represents the outcome of syncing a local directory to the Sandbox.
+
+    Attributes:
+        uploaded (List[str]): Paths of the files that were added or changed, relative to the synced directory.
+        deleted (List[str]): Paths of the files that were removed from the Sandbox, relative to the synced
+        directory.
+        unchanged (List[str]): Paths of the files that were already up to date, relative to the synced directory.
+    """
+
+    uploaded: List[str]
+    deleted: List[str]
+    unchanged: List[str]
+
+
+@dataclass
+class WalkEntry:
+    """Represents a file or directory found by `FileSystem.walk`.
+
+    Attributes:
+        path (str): Absolute path of the entry in the Sandbox.
+        info (FileInfo): Information about the entry, as returned by `list_files`.
+        depth (int): Depth of the entry below the walked directory, starting at 1 for its direct children.
+    """
+
+    path: str
+    info: FileInfo
+    depth: int
@@ -1,6 +1,9 @@
 import json
+import time
 import warnings
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Annotated, Dict, List, Optional
 
@@ -20,10 +23,16 @@ from environs import Env
 from pydantic import BaseModel, Field, model_validator
 
 from ._utils.enum import to_enum
-from ._utils.timeout import with_timeout
+from ._utils.root_dir_cache import RootDirCache
+from ._utils.root_dir_cache import prefetch_root_dirs as _prefetch_root_dirs
+from ._utils.state_watcher import SandboxStateWatcher
+from ._utils.timeout import remaining_timeout, time_left, with_timeout
 from .code_toolbox.sandbox_python_code_toolbox import SandboxPythonCodeToolbox
 from .code_toolbox.sandbox_ts_code_toolbox import SandboxTsCodeToolbox
+from .instrumentation import InstrumentationHook
+from .rate_limit import RateLimit, RateLimitConfig
 from .sandbox import Sandbox, SandboxTargetRegion
+from .transport import RetryConfig, TransportConfig, get_transport, install_transport
 from .volume import VolumeService
 
 Workspace = Sandbox
@@ -68,6 +77,10 @@ class DaytonaConfig(BaseModel):
             in a future version.
         target (Optional[SandboxTargetRegion]): Target environment for the Sandbox. Defaults to `'us'` if not set here
             or in the environment variable `DAYTONA_TARGET`.
+        transport (Optional[TransportConfig]): HTTP connection pool settings shared by all requests of the client.
+            Defaults to `TransportConfig()`.
+        rate_limits (Optional[RateLimitConfig]): Client-side rate and concurrency limits per class of API endpoints,
+            shared by all Sandboxes of the client. Defaults to no limits.
 
     Example:
         ```python
@@ -90,6 +103,8 @@ class DaytonaConfig(BaseModel):
     target: Optional[SandboxTargetRegion] = None
     jwt_token: Optional[str] = None
     organization_id: Optional[str] = None
+    transport: Optional[TransportConfig] = None
+    rate_limits: Optional[RateLimitConfig] = None
 
     @model_validator(mode="before")
     @classmethod
@@ -202,6 +217,246 @@ class CreateSandboxParams(BaseModel):
         return values
 
 
+@dataclass
+class SandboxCreationFailure:
+    """Describes a Sandbox of a bulk creation request that could not be created or started.
+
+    Attributes:
+        index (int): Position of the Sandbox parameters in the list passed to `create_many`.
+        params (CreateSandboxParams): Parameters the Sandbox was requested with.
+        error (DaytonaError): The reason of the failure.
+        sandbox (Optional[Sandbox]): The Sandbox if it was created but failed to start in time, so it can be
+            inspected or deleted. None if the Sandbox was not created.
+    """
+
+    index: int
+    params: CreateSandboxParams
+    error: DaytonaError
+    sandbox: Optional[Sandbox] = None
+
+
+@dataclass
+class CreateManyResult:
+    """Result of a bulk Sandbox creation.
+
+    Attributes:
+        sandboxes (List[Sandbox]): Sandboxes that were created and started, in the order of the request.
+        failures (List[SandboxCreationFailure]): Sandboxes that failed to be created or started,
+            in the order of the request.
+    """
+
+    sandboxes: List[Sandbox] = field(default_factory=list)
+    failures: List[SandboxCreationFailure] = field(default_factory=list)
+
+
+def _load_config(config: Optional[DaytonaConfig] = None) -> DaytonaConfig:
+    """Resolves the client configuration, falling back to environment variables for missing values.
+
+    Args:
+        config (Optional[DaytonaConfig]): Explicit configuration. Values that are not set are read from
+            `DAYTONA_API_KEY`, `DAYTONA_JWT_TOKEN`, `DAYTONA_ORGANIZATION_ID`, `DAYTONA_API_URL` and
+            `DAYTONA_TARGET`.
+
+    Returns:
+        DaytonaConfig: Fully resolved configuration.
+
+    Raises:
+        DaytonaError: If neither an API key nor a JWT token is provided, or if a JWT token is provided
+            without an organization ID.
+    """
+    default_api_url = "https://app.daytona.io/api"
+    default_target = SandboxTargetRegion.US
+
+    api_key = jwt_token = organization_id = api_url = target = None
+
+    if config is None or (
+        not all([config.api_key, config.api_url, config.target])
+        and not all(
+            [
+                config.jwt_token,
+                config.organization_id,
+                config.api_url,
+                config.target,
+            ]
+        )
+    ):
+        # Initialize env - it automatically reads from .env and .env.local
+        env = Env()
+        env.read_env()  # reads .env
+        # reads .env.local and overrides values
+        env.read_env(".env.local", override=True)
+
+        api_key = env.str("DAYTONA_API_KEY", None)
+        jwt_token = env.str("DAYTONA_JWT_TOKEN", None)
+        organization_id = env.str("DAYTONA_ORGANIZATION_ID", None)
+        api_url = env.str("DAYTONA_API_URL", None) or env.str("DAYTONA_SERVER_URL", default_api_url)
+        target = env.str("DAYTONA_TARGET", default_target)
+
+        if env.str("DAYTONA_SERVER_URL", None) and not env.str("DAYTONA_API_URL", None):
+            warnings.warn(
+                "Environment variable `DAYTONA_SERVER_URL` is deprecated and will be removed in future versions. "
+                + "Use `DAYTONA_API_URL` instead.",
+                DeprecationWarning,
+                stacklevel=3,
+            )
+
+    if config:
+        if not config.api_key and config.jwt_token:
+            api_key = None
+        else:
+            api_key = config.api_key or api_key
+        jwt_token = config.jwt_token or jwt_token
+        organization_id = config.organization_id or organization_id
+        api_url = config.api_url or api_url
+        target = config.target or target
+
+    if not api_key and not jwt_token:
+        raise DaytonaError("API key or JWT token is required")
+
+    if not api_key and not organization_id:
+        raise DaytonaError("Organization ID is required when using JWT token")
+
+    return DaytonaConfig.model_construct(
+        api_key=api_key,
+        jwt_token=jwt_token,
+        organization_id=organization_id,
+        api_url=api_url,
+        target=target,
+        transport=config.transport if config else None,
+        rate_limits=config.rate_limits if config else None,
+    )
+
+
+def _create_api_client(config: DaytonaConfig) -> ApiClient:
+    """Creates the generated API client with the authentication headers for the given configuration.
+    Requests of the client are sent through a pooled `HttpTransport` configured by `config.transport` and
+    `config.rate_limits`.
+
+    Args:
+        config (DaytonaConfig): Resolved configuration as returned by `_load_config`.
+
+    Returns:
+        ApiClient: API client shared by all API groups of a Daytona instance.
+    """
+    # Create API configuration without api_key
+    configuration = Configuration(host=config.api_url)
+    api_client = ApiClient(configuration)
+    install_transport(api_client, config.transport, config.rate_limits)
+    api_client.default_headers["Authorization"] = f"Bearer {config.api_key or config.jwt_token}"
+    api_client.default_headers["X-Daytona-Source"] = "python-sdk"
+    if not config.api_key:
+        api_client.default_headers["X-Daytona-Organization-ID"] = config.organization_id
+    return api_client
+
+
+def _get_code_toolbox(params: Optional[CreateSandboxParams] = None):
+    """Helper method to get the appropriate code toolbox based on language.
+
+    Args:
+        params (Optional[CreateSandboxParams]): Sandbox parameters. If not provided, defaults to Python toolbox.
+
+    Returns:
+        The appropriate code toolbox instance for the specified language.
+
+    Raises:
+        DaytonaError: If an unsupported language is specified.
+    """
+    if not params:
+        return SandboxPythonCodeToolbox()
+
+    enum_language = to_enum(CodeLanguage, params.language)
+    if enum_language is None:
+        raise DaytonaError(f"Unsupported language: {params.language}")
+    params.language = enum_language
+
+    match params.language:
+        case CodeLanguage.JAVASCRIPT | CodeLanguage.TYPESCRIPT:
+            return SandboxTsCodeToolbox()
+        case CodeLanguage.PYTHON:
+            return SandboxPythonCodeToolbox()
+        case _:
+            raise DaytonaError(f"Unsupported language: {params.language}")
+
+
+def _validate_language_label(language: Optional[str]) -> CodeLanguage:
+    """Validates and normalizes the language label.
+
+    Args:
+        language (Optional[str]): The language label to validate.
+
+    Returns:
+        CodeLanguage: The validated language, defaults to "python" if None
+
+    Raises:
+        DaytonaError: If the language is not supported.
+    """
+    if not language:
+        return CodeLanguage.PYTHON
+
+    enum_language = to_enum(CodeLanguage, language)
+    if enum_language is None:
+        raise DaytonaError(f"Invalid code-toolbox-language: {language}")
+    return enum_language
+
+
+def _with_default_language(params: Optional[CreateSandboxParams], language: CodeLanguage) -> CreateSandboxParams:
+    """Returns Sandbox parameters with the default language applied. The given parameters are not modified.
+
+    Args:
+        params (Optional[CreateSandboxParams]): Parameters for Sandbox creation.
+        language (CodeLanguage): Language to use when the parameters do not set one.
+
+    Returns:
+        CreateSandboxParams: Parameters with the language set.
+    """
+    if params is None:
+        return CreateSandboxParams(language=language)
+    if params.language is None:
+        return params.model_copy(update={"language": language})
+    return params
+
+
+def _to_create_request(params: CreateSandboxParams, target: Optional[str], timeout: Optional[float]) -> CreateSandbox:
+    """Validates the creation parameters and converts them to the API request model.
+
+    Args:
+        params (CreateSandboxParams): Parameters for Sandbox creation.
+        target (Optional[str]): Target region of the Sandbox.
+        timeout (Optional[float]): Timeout (in seconds) for sandbox creation.
+
+    Returns:
+        CreateSandbox: The API request model.
+
+    Raises:
+        DaytonaError: If timeout or auto_stop_interval is negative.
+    """
+    if timeout is not None and timeout < 0:
+        raise DaytonaError("Timeout must be a non-negative number")
+
+    if params.auto_stop_interval is not None and params.auto_stop_interval < 0:
+        raise DaytonaError("auto_stop_interval must be a non-negative integer")
+
+    # Create sandbox using dictionary
+    sandbox_data = CreateSandbox(
+        image=params.image,
+        user=params.os_user,
+        env=params.env_vars if params.env_vars else {},
+        labels=params.labels,
+        public=params.public,
+        target=str(target) if target else None,
+        auto_stop_interval=params.auto_stop_interval,
+        volumes=params.volumes,
+    )
+
+    if params.resources:
+        sandbox_data.cpu = params.resources.cpu
+        sandbox_data.memory = params.resources.memory
+        sandbox_data.disk = params.resources.disk
+        sandbox_data.gpu = params.resources.gpu
+
+    return sandbox_data
+
+
 class Daytona:
     """Main class for interacting with the Daytona API.
 
@@ -260,73 +515,16 @@ class Daytona:
             ```
         """
 
-        default_api_url = "https://app.daytona.io/api"
-        default_target = SandboxTargetRegion.US
         self.default_language = CodeLanguage.PYTHON
 
-        if config is None or (
-            not all([config.api_key, config.api_url, config.target])
-            and not all(
-                [
-                    config.jwt_token,
-                    config.organization_id,
-                    config.api_url,
-                    config.target,
-                ]
-            )
-        ):
-            # Initialize env - it automatically reads from .env and .env.local
-            env = Env()
-            env.read_env()  # reads .env
-            # reads .env.local and overrides values
-            env.read_env(".env.local", override=True)
-
-            self.api_key = env.str("DAYTONA_API_KEY", None)
-            self.jwt_token = env.str("DAYTONA_JWT_TOKEN", None)
-            self.organization_id = env.str("DAYTONA_ORGANIZATION_ID", None)
-            self.api_url = env.str("DAYTONA_API_URL", None) or env.str(
-                "DAYTONA_SERVER_URL", default_api_url
-            )
-            self.target = env.str("DAYTONA_TARGET", default_target)
-
-            if env.str("DAYTONA_SERVER_URL", None) and not env.str(
-                "DAYTONA_API_URL", None
-            ):
-                warnings.warn(
-                    "Environment variable `DAYTONA_SERVER_URL` is deprecated and will be removed in future versions. "
-                    + "Use `DAYTONA_API_URL` instead.",
-                    DeprecationWarning,
-                    stacklevel=2,
-                )
+        config = _load_config(config)
+        self.api_key = config.api_key
+        self.jwt_token = config.jwt_token
+        self.organization_id = config.organization_id
+        self.api_url = config.api_url
+        self.target = config.target
 
-        if config:
-            if not config.api_key and config.jwt_token:
-                self.api_key = None
-            else:
-                self.api_key = config.api_key or getattr(self, "api_key", None)
-            self.jwt_token = config.jwt_token or getattr(self, "jwt_token", None)
-            self.organization_id = config.organization_id or getattr(
-                self, "organization_id", None
-            )
-            self.api_url = config.api_url or self.api_url
-            self.target = config.target or self.target
-
-        if not self.api_key and not self.jwt_token:
-            raise DaytonaError("API key or JWT token is required")
-
-        # Create API configuration without api_key
-        configuration = Configuration(host=self.api_url)
-        api_client = ApiClient(configuration)
-        api_client.default_headers[
-            "Authorization"
-        ] = f"Bearer {self.api_key or self.jwt_token}"
-        api_client.default_headers["X-Daytona-Source"] = "python-sdk"
-        if not self.api_key:
-            if not self.organization_id:
-                raise DaytonaError("Organization ID is required when using JWT token")
-            api_client.default_headers[
-                "X-Daytona-Organization-ID"
-            ] = self.organization_id
+        api_client = _create_api_client(config)
 
         # Initialize API clients with the api_client instance
         self.sandbox_api = SandboxApi(api_client)
@@ -335,6 +533,43 @@ class Daytona:
         # Initialize volume service
         self.volume = VolumeService(VolumesApi(api_client))
 
+    def __enter__(self) -> "Daytona":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the HTTP connections held by this client. Sandboxes created by this client can no
+        longer be used afterwards.
+        """
+        get_transport(self.sandbox_api.api_client).close()
+
+    def add_hook(self, hook: InstrumentationHook) -> None:
+        """Registers an instrumentation hook that is notified when any request of this client, or of a
+        Sandbox created by it, starts and ends.
+
+        Args:
+            hook (InstrumentationHook): The hook, e.g. a `LatencyHistogram` or an `OpenTelemetryHook`.
+
+        Example:
+            ```python
+            histogram = LatencyHistogram()
+            daytona.add_hook(histogram)
+            sandbox = daytona.create()
+            print(histogram.summary()["create_workspace"].p50)
+            ```
+        """
+        get_transport(self.sandbox_api.api_client).instrumentation.add(hook)
+
+    def remove_hook(self, hook: InstrumentationHook) -> None:
+        """Unregisters an instrumentation hook added with `add_hook`.
+
+        Args:
+            hook (InstrumentationHook): The hook to remove.
+        """
+        get_transport(self.sandbox_api.api_client).instrumentation.remove(hook)
+
     @intercept_errors(message_prefix="Failed to create sandbox: ")
     def create(
         self,
@@ -375,10 +610,7 @@ class Daytona:
             ```
         """
         # If no params provided, create default params for Python
-        if params is None:
-            params = CreateSandboxParams(language=self.default_language)
-        if params.language is None:
-            params.language = self.default_language
+        params = _with_default_language(params, self.default_language)
 
         effective_timeout = params.timeout if params.timeout else timeout
 
@@ -408,41 +640,36 @@ class Daytona:
         Raises:
             DaytonaError: If timeout or auto_stop_interval is negative; If sandbox fails to start or times out
         """
-        code_toolbox = self._get_code_toolbox(params)
+        sandbox = self._create_sandbox(params, timeout)
 
-        if timeout < 0:
-            raise DaytonaError("Timeout must be a non-negative number")
+        # The overall timeout is enforced by this method
+        sandbox.wait_for_sandbox_start(0)
 
-        if params.auto_stop_interval is not None and params.auto_stop_interval < 0:
-            raise DaytonaError("auto_stop_interval must be a non-negative integer")
-
-        target = self.target
-
-        # Create sandbox using dictionary
-        sandbox_data = CreateSandbox(
-            image=params.image,
-            user=params.os_user,
-            env=params.env_vars if params.env_vars else {},
-            labels=params.labels,
-            public=params.public,
-            target=str(target) if target else None,
-            auto_stop_interval=params.auto_stop_interval,
-            volumes=params.volumes,
-        )
+        # Fill the root directory cache, so the first file system, git or process call does not resolve it
+        sandbox.prefetch_root_dir()
+
+        return sandbox
+
+    def _create_sandbox(self, params: CreateSandboxParams, timeout: Optional[float] = 60) -> Sandbox:
+        """Sends the Sandbox creation request without waiting for the Sandbox to start.
+
+        Args:
+            params (CreateSandboxParams): Parameters for Sandbox creation.
+            timeout (Optional[float]): Timeout (in seconds) for the creation request. 0 means no timeout.
 
-        if params.resources:
-            sandbox_data.cpu = params.resources.cpu
-            sandbox_data.memory = params.resources.memory
-            sandbox_data.disk = params.resources.disk
-            sandbox_data.gpu = params.resources.gpu
+        Returns:
+            Sandbox: The created Sandbox instance.
+        """
+        code_toolbox = _get_code_toolbox(params)
+        sandbox_data = _to_create_request(params, self.target, timeout)
 
         response = self.sandbox_api.create_workspace(
-            sandbox_data, _request_timeout=timeout or None
+            sandbox_data, _request_timeout=remaining_timeout(timeout)
         )
         sandbox_info = Sandbox.to_sandbox_info(response)
         response.info = sandbox_info
 
-        sandbox = Sandbox(
+        return Sandbox(
             response.id,
             response,
             self.sandbox_api,
@@ -450,42 +677,117 @@ class Daytona:
             code_toolbox,
         )
 
-        # Wait for sandbox to start
-        try:
-            sandbox.wait_for_sandbox_start()
-        finally:
-            # If not Daytona SaaS, we don't need to handle pulling image state
-            pass
-
-        return sandbox
+    @intercept_errors(message_prefix="Failed to create sandboxes: ")
+    def create_many(
+        self,
+        params_list: List[Optional[CreateSandboxParams]],
+        concurrency: int = 10,
+        timeout: Optional[float] = 60,
+    ) -> CreateManyResult:
+        """Creates multiple Sandboxes concurrently and waits for all of them to start.
 
-    def _get_code_toolbox(self, params: Optional[CreateSandboxParams] = None):
-        """Helper method to get the appropriate code toolbox based on language.
+        Creation requests are sent in parallel, and all Sandboxes are then awaited by a single
+        poller instead of one polling loop per Sandbox. A Sandbox that fails to be created or started
+        does not fail the whole batch; it is reported in `CreateManyResult.failures` instead.
 
         Args:
-            params (Optional[CreateSandboxParams]): Sandbox parameters. If not provided, defaults to Python toolbox.
+            params_list (List[Optional[CreateSandboxParams]]): Parameters for each Sandbox. None entries
+                create a default Python Sandbox.
+            concurrency (int): Maximum number of creation requests in flight at the same time. Default is 10.
+            timeout (Optional[float]): Timeout (in seconds) for the whole batch to be created and started.
+                0 means no timeout. Default is 60 seconds.
 
         Returns:
-            The appropriate code toolbox instance for the specified language.
+            CreateManyResult: The started Sandboxes and the per-Sandbox failures.
 
         Raises:
-            DaytonaError: If an unsupported language is specified.
+            DaytonaError: If concurrency is not positive or timeout is negative.
+
+        Example:
+            ```python
+            result = daytona.create_many([CreateSandboxParams(language="python")] * 50, concurrency=20)
+            for failure in result.failures:
+                print(f"Sandbox #{failure.index} failed: {failure.error}")
+            for sandbox in result.sandboxes:
+                sandbox.process.exec("echo 'Hello'")
+            ```
         """
-        if not params:
-            return SandboxPythonCodeToolbox()
+        if concurrency < 1:
+            raise DaytonaError("Concurrency must be a positive integer")
+        if timeout is not None and timeout < 0:
+            raise DaytonaError("Timeout must be a non-negative number")
 
-        enum_language = to_enum(CodeLanguage, params.language)
-        if enum_language is None:
-            raise DaytonaError(f"Unsupported language: {params.language}")
-        params.language = enum_language
+        deadline = time.monotonic() + timeout if timeout else None
+        params_list = [_with_default_language(params, self.default_language) for params in params_list]
+        created: Dict[int, Sandbox] = {}
+        failures: List[SandboxCreationFailure] = []
+
+        create = intercept_errors(message_prefix="Failed to create sandbox: ")(
+            lambda params: self._create_sandbox(params, time_left(deadline, timeout))
+        )
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(params_list)))) as executor:
+            futures = {executor.submit(create, params): i for i, params in enumerate(params_list)}
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    created[i] = future.result()
+                except DaytonaError as e:
+                    failures.append(SandboxCreationFailure(i, params_list[i], e))
+
+        errors = self._wait_for_sandboxes_start(list(created.values()), deadline)
+
+        result = CreateManyResult()
+        for i, sandbox in sorted(created.items()):
+            if sandbox.id in errors:
+                failures.append(SandboxCreationFailure(i, params_list[i], errors[sandbox.id], sandbox))
+            else:
+                result.sandboxes.append(sandbox)
+        result.failures = sorted(failures, key=lambda failure: failure.index)
+        _prefetch_root_dirs(result.sandboxes, concurrency)
+        return result
+
+    def _wait_for_sandboxes_start(
+        self, sandboxes: List[Sandbox], deadline: Optional[float] = None
+    ) -> Dict[str, DaytonaError]:
+        """Waits for multiple Sandboxes to reach the 'started' state. The states are polled by the shared
+        state watcher, which fetches Sandboxes with the same labels in one `list_workspaces` call per round.
+
+        Args:
+            sandboxes (List[Sandbox]): Sandboxes to wait for.
+            deadline (Optional[float]): `time.monotonic()` value after which waiting stops. None means no deadline.
+
+        Returns:
+            Dict[str, DaytonaError]: Errors of the Sandboxes that failed to start, keyed by Sandbox ID.
+        """
+        watcher = SandboxStateWatcher.for_api(self.sandbox_api)
+        futures = {
+            sandbox.id: watcher.watch(sandbox.id, {"started"}, labels=sandbox.instance.labels)
+            for sandbox in sandboxes
+        }
+        errors: Dict[str, DaytonaError] = {}
+
+        for sandbox in sandboxes:
+            future = futures[sandbox.id]
+            try:
+                instance = future.result(timeout=None if deadline is None else max(0.0, deadline - time.monotonic()))
+            except FutureTimeoutError:
+                future.cancel()
+                errors[sandbox.id] = DaytonaError(
+                    f"Sandbox {sandbox.id} failed to become ready within the timeout period"
+                )
+                continue
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                errors[sandbox.id] = DaytonaError(f"Failed to get state of sandbox {sandbox.id}: {e}")
+                continue
+
+            sandbox.instance.state = instance.state
+            if instance.state == "error":
+                errors[sandbox.id] = DaytonaError(
+                    f"Sandbox {sandbox.id} failed to start with state: {instance.state}, "
+                    f"error reason: {instance.error_reason}"
+                )
 
-        match params.language:
-            case CodeLanguage.JAVASCRIPT | CodeLanguage.TYPESCRIPT:
-                return SandboxTsCodeToolbox()
-            case CodeLanguage.PYTHON:
-                return SandboxPythonCodeToolbox()
-            case _:
-                raise DaytonaError(f"Unsupported language: {params.language}")
+        return errors
 
     @intercept_errors(message_prefix="Failed to remove sandbox: ")
     def delete(self, sandbox: Sandbox, timeout: Optional[float] = 60) -> None:
@@ -506,6 +808,7 @@ class Daytona:
             daytona.delete(sandbox)  # Clean up when done
             ```
         """
+        RootDirCache.for_api_client(self.sandbox_api.api_client).discard(sandbox.id)
         return self.sandbox_api.delete_workspace(
             sandbox.id, force=True, _request_timeout=timeout or None
         )
@@ -595,11 +898,13 @@ class Daytona:
         return sandboxes[0]
 
     @intercept_errors(message_prefix="Failed to list sandboxes: ")
-    def list(self, labels: Optional[Dict[str, str]] = None) -> List[Sandbox]:
+    def list(self, labels: Optional[Dict[str, str]] = None, prefetch_root_dirs: bool = False) -> List[Sandbox]:
         """Lists Sandboxes filtered by labels.
 
         Args:
             labels (Optional[Dict[str, str]]): Labels to filter Sandboxes.
+            prefetch_root_dirs (bool): Whether to resolve the root directories of the started Sandboxes in
+                parallel before returning, instead of on the first operation of each Sandbox. Default is False.
 
         Returns:
             List[Sandbox]: List of Sandbox instances that match the labels.
@@ -617,15 +922,15 @@ class Daytona:
             sandbox_info = Sandbox.to_sandbox_info(sandbox)
             sandbox.info = sandbox_info
 
-        return [
+        result = [
             Sandbox(
                 sandbox.id,
                 sandbox,
                 self.sandbox_api,
                 self.toolbox_api,
-                self._get_code_toolbox(
+                _get_code_toolbox(
                     CreateSandboxParams(
-                        language=self._validate_language_label(
+                        language=_validate_language_label(
                             sandbox.labels.get("code-toolbox-language")
                         )
                     )
@@ -633,26 +938,9 @@ class Daytona:
             )
             for sandbox in sandboxes
         ]
-
-    def _validate_language_label(self, language: Optional[str]) -> CodeLanguage:
-        """Validates and normalizes the language label.
-
-        Args:
-            language (Optional[str]): The language label to validate.
-
-        Returns:
-            CodeLanguage: The validated language, defaults to "python" if None
-
-        Raises:
-            DaytonaError: If the language is not supported.
-        """
-        if not language:
-            return CodeLanguage.PYTHON
-
-        enum_language = to_enum(CodeLanguage, language)
-        if enum_language is None:
-            raise DaytonaError(f"Invalid code-toolbox-language: {language}")
-        return enum_language
+        if prefetch_root_dirs:
+            _prefetch_root_dirs(result)
+        return result
 
     # def resize(self, sandbox: Sandbox, resources: SandboxResources) -> None:
     #     """Resizes a sandbox.
@@ -695,6 +983,12 @@ __all__ = [
     "Daytona",
     "DaytonaConfig",
     "CreateSandboxParams",
+    "CreateManyResult",
+    "SandboxCreationFailure",
+    "TransportConfig",
+    "RetryConfig",
+    "RateLimit",
+    "RateLimitConfig",
     "CodeLanguage",
     "Sandbox",
     "SessionExecuteRequest",
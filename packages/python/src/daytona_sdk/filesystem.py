@@ -1,34 +1,47 @@
+# pylint: disable=too-many-lines
 import io
-import os
-from contextlib import ExitStack
-from dataclasses import dataclass
-from typing import Callable, List, Union, overload
+import posixpath
+from typing import BinaryIO, Callable, Iterable, Iterator, List, Optional, Tuple, Union, overload
 
-import requests
 from daytona_api_client import FileInfo, Match, ReplaceRequest, ReplaceResult, SearchFilesResponse, ToolboxApi
+from daytona_sdk._utils import archive_transfer
+from daytona_sdk._utils import compression as compression_utils
+from daytona_sdk._utils import delta as delta_utils
+from daytona_sdk._utils import file_transfer, streamed_search, sync
+from daytona_sdk._utils import walk as walk_utils
 from daytona_sdk._utils.errors import intercept_errors
+from daytona_sdk._utils.file_transfer import DEFAULT_PART_SIZE
+from daytona_sdk._utils.metadata_cache import FILE_INFO, LISTING, MetadataCacheControl
 from daytona_sdk._utils.path import prefix_relative_path
-from requests_toolbelt.multipart.encoder import MultipartEncoder
-
+from daytona_sdk._utils.ranged_download import DEFAULT_RANGE_SIZE
+from daytona_sdk._utils.sync import PathFilter
+from daytona_sdk._utils.toolbox_files import ToolboxFiles
+from daytona_sdk._utils.upload_batches import (
+    DEFAULT_UPLOAD_CONCURRENCY,
+    UPLOAD_BATCH_BYTES,
+    UPLOAD_BATCH_FILES,
+    BatchUploader,
+)
+from daytona_sdk._utils.upload_dedup import UploadDedup
+
+from .common.compression import DEFAULT_COMPRESSION_THRESHOLD, Compression
+from .common.errors import DaytonaError
+from .common.filesystem import (
+    FileDownload,
+    FileDownloadResult,
+    FileUpload,
+    SyncResult,
+    UploadProgress,
+    UploadSource,
+    WalkEntry,
+)
 from .protocols import SandboxInstance
 
-
-@dataclass
-class FileUpload:
-    """Represents a file to be uploaded to the Sandbox.
-
-    Attributes:
-        source (Union[bytes, str]): File contents as a bytes object or a local file path. If a bytes object is provided,
-        make sure it fits into memory, otherwise use the local file path which content will be streamed to the Sandbox.
-        destination (str): Absolute destination path in the Sandbox. Relative paths are resolved based on the user's
-        root directory.
-    """
-
-    source: Union[bytes, str]
-    destination: str
+# Size of the read buffer of the streams returned by `open_read`
+DEFAULT_READ_BUFFER_SIZE = 1024 * 1024
 
 
-class FileSystem:
+class FileSystem:  # pylint: disable=too-many-public-methods
     """Provides file system operations within a Sandbox.
 
     This class implements a high-level interface to file system operations that can
@@ -36,6 +49,8 @@ class FileSystem:
 
     Attributes:
         instance (SandboxInstance): The Sandbox instance this file system belongs to.
+        metadata_cache (MetadataCacheControl): Opt-in cache of the results of `get_file_info` and `list_files`.
+        upload_dedup (UploadDedup): Opt-in deduplication of uploads through a content-addressed store.
     """
 
     def __init__(
@@ -54,6 +69,10 @@ class FileSystem:
         self.instance = instance
         self.toolbox_api = toolbox_api
         self._get_root_dir = get_root_dir
+        self.metadata_cache = MetadataCacheControl(get_root_dir)
+        self._files = ToolboxFiles(instance, toolbox_api, get_root_dir, self.metadata_cache)
+        self.upload_dedup = UploadDedup(self._files)
+        self._uploader = BatchUploader(self._files, self.upload_dedup)
 
     @intercept_errors(message_prefix="Failed to create folder: ")
     def create_folder(self, path: str, mode: str) -> None:
@@ -76,11 +95,12 @@ class FileSystem:
         """
         path = prefix_relative_path(self._get_root_dir(), path)
         print(f"Creating folder {path} with mode {mode}")
-        self.toolbox_api.create_folder(
-            self.instance.id,
-            path=path,
-            mode=mode,
-        )
+        with self._files.changing(path):
+            self.toolbox_api.create_folder(
+                self.instance.id,
+                path=path,
+                mode=mode,
+            )
 
     @intercept_errors(message_prefix="Failed to delete file: ")
     def delete_file(self, path: str) -> None:
@@ -95,10 +115,45 @@ class FileSystem:
             sandbox.fs.delete_file("workspace/data/old_file.txt")
             ```
         """
-        self.toolbox_api.delete_file(self.instance.id, path=prefix_relative_path(self._get_root_dir(), path))
+        path = prefix_relative_path(self._get_root_dir(), path)
+        with self._files.changing(path):
+            self.toolbox_api.delete_file(self.instance.id, path=path)
+
+    @intercept_errors(message_prefix="Failed to download directory: ")
+    def download_dir(self, remote_dir: str, local_dir: str, *, compress: bool = True, timeout: int = 10 * 60) -> None:
+        """Downloads a directory tree from the Sandbox into a local directory.
+
+        The directory is packed into a tar archive in the Sandbox, which is unpacked while it is downloaded as a
+        single stream. Existing local files are overwritten.
+
+        Args:
+            remote_dir (str): Path to the directory in the Sandbox. Relative paths are resolved based on the user's
+                root directory.
+            local_dir (str): Path to the local directory, which is created if it does not exist.
+            compress (bool): Whether to gzip the archive. Default is True.
+            timeout (int): Timeout for packing and downloading the archive in seconds. 0 means no timeout.
+                Default is 10 minutes.
+
+        Raises:
+            DaytonaError: If the download fails or the archive contains entries outside of the directory.
+
+        Example:
+            ```python
+            sandbox.fs.download_dir("workspace/results", "./results")
+            ```
+        """
+        remote_dir = prefix_relative_path(self._get_root_dir(), remote_dir)
+        archive_transfer.download_dir(self._files, remote_dir, local_dir, compress, timeout)
 
     @overload
-    def download_file(self, remote_path: str, timeout: int = 10 * 60) -> bytes:
+    def download_file(
+        self,
+        remote_path: str,
+        timeout: int = 10 * 60,
+        *,
+        compression: Optional[Union[Compression, str]] = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+    ) -> bytes:
         """Downloads a file from the Sandbox. Returns the file contents as a bytes object.
         This method is useful when you want to load the file into memory without saving it to disk.
         It can only be used for smaller files.
@@ -107,6 +162,9 @@ class FileSystem:
             remote_path (str): Path to the file in the Sandbox. Relative paths are resolved based on the user's
             root directory.
             timeout (int): Timeout for the download operation in seconds. 0 means no timeout. Default is 10 minutes.
+            compression (Optional[Union[Compression, str]]): Algorithm to compress the file with for the transfer
+                if it is at least `compression_threshold` bytes large. Not compressed by default.
+            compression_threshold (int): Size of the file in bytes from which it is compressed. Default is 64 KiB.
 
         Returns:
             bytes: The file contents as a bytes object.
@@ -125,15 +183,47 @@ class FileSystem:
         """
 
     @overload
-    def download_file(self, remote_path: str, local_path: str, timeout: int = 10 * 60) -> None:
+    def download_file(
+        self,
+        remote_path: str,
+        local_path: str,
+        timeout: int = 10 * 60,
+        *,
+        concurrency: int = 1,
+        range_size: int = DEFAULT_RANGE_SIZE,
+        resume: bool = False,
+        compression: Optional[Union[Compression, str]] = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        delta: bool = False,
+        delta_block_size: int = delta_utils.DEFAULT_BLOCK_SIZE,
+    ) -> None:
         """Downloads a file from the Sandbox and saves it to a local file using stream.
         This method is useful when you want to download larger files that may not fit into memory.
 
+        With a `concurrency` above 1, byte ranges of the file are downloaded in parallel and written straight to
+        their offset in the local file. With `resume`, completed ranges are recorded in a journal next to the
+        local file (`<local_path>.daytona-journal`), so calling the method again after a failure only downloads
+        the missing ones, as long as the remote file did not change. With `delta`, only the blocks that differ
+        from an existing local file are downloaded, like rsync. This needs `python3` in the Sandbox and suits
+        files edited in place or appended to; otherwise the whole file is downloaded.
+
         Args:
             remote_path (str): Path to the file in the Sandbox. Relative paths are resolved based on the user's
             root directory.
             local_path (str): Path to save the file locally.
             timeout (int): Timeout for the download operation in seconds. 0 means no timeout. Default is 10 minutes.
+                With a `concurrency` above 1 or `resume`, the timeout applies to each byte range.
+            concurrency (int): Maximum number of byte ranges downloaded at the same time. 1 streams the file over a
+                single connection. Default is 1.
+            range_size (int): Size of each byte range in bytes. Default is 16 MiB.
+            resume (bool): Whether to continue a previously failed download of the same file. Default is False.
+            compression (Optional[Union[Compression, str]]): Algorithm to compress the file with for the transfer
+                if it is at least `compression_threshold` bytes large. Can not be combined with `concurrency` or
+                `resume`. Not compressed by default.
+            compression_threshold (int): Size of the file in bytes from which it is compressed. Default is 64 KiB.
+            delta (bool): Whether to only download the blocks that differ from the local file. Can not be
+                combined with `concurrency` or `resume`. Default is False.
+            delta_block_size (int): Size of the blocks compared for a delta download in bytes. Default is 64 KiB.
 
         Example:
             ```python
@@ -141,60 +231,116 @@ class FileSystem:
             sandbox.fs.download_file("tmp/large_file.txt", local_path)
             size_mb = os.path.getsize(local_path) / 1024 / 1024
             print(f"Size of the downloaded file {local_path}: {size_mb} MB")
+
+            # Download a large file over 8 connections, continuing where a failed attempt stopped
+            sandbox.fs.download_file("tmp/model.bin", "model.bin", concurrency=8, resume=True)
             ```
         """
 
     @intercept_errors(message_prefix="Failed to download file: ")
-    def download_file(self, *args: str) -> Union[bytes, None]:
+    def download_file(
+        self,
+        *args: str,
+        concurrency: int = 1,
+        range_size: int = DEFAULT_RANGE_SIZE,
+        resume: bool = False,
+        compression: Optional[Union[Compression, str]] = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        delta: bool = False,
+        delta_block_size: int = delta_utils.DEFAULT_BLOCK_SIZE,
+    ) -> Union[bytes, None]:
+        if compression is not None:
+            if concurrency != 1 or resume:
+                raise DaytonaError("Compression can not be combined with concurrency or resume")
+            compression = compression_utils.resolve(compression)
+        if delta and (concurrency != 1 or resume):
+            raise DaytonaError("Delta downloads can not be combined with concurrency or resume")
+
         if len(args) == 1 or (len(args) == 2 and isinstance(args[1], int)):
-            remote_path = args[0]
+            remote_path = prefix_relative_path(self._get_root_dir(), args[0])
             timeout = args[1] if len(args) == 2 else 10 * 60
+            if compression is not None:
+                chunks = file_transfer.download_compressed(
+                    self._files, remote_path, timeout, compression, compression_threshold
+                )
+                if chunks is not None:
+                    return b"".join(chunks)
             return self.toolbox_api.download_file(
                 self.instance.id,
-                path=prefix_relative_path(self._get_root_dir(), remote_path),
+                path=remote_path,
                 _request_timeout=timeout or None,
             )
 
-        remote_path = args[0]
-        local_path = args[1]
+        remote_path = prefix_relative_path(self._get_root_dir(), args[0])
         timeout = args[2] if len(args) == 3 else 10 * 60
-        # pylint: disable=protected-access
-        _, url, *_ = self.toolbox_api._download_file_serialize(
-            self.instance.id,
-            path=prefix_relative_path(self._get_root_dir(), remote_path),
-            x_daytona_organization_id=None,
-            _request_auth=None,
-            _content_type=None,
-            _headers=None,
-            _host_index=None,
-        )
-
-        with requests.get(
-            url,
-            headers=self.toolbox_api.api_client.default_headers,
-            stream=True,
-            timeout=timeout or None,
-        ) as r:
-            r.raise_for_status()
-            parent = os.path.dirname(local_path)
-            if parent:
-                os.makedirs(parent, exist_ok=True)
-            with open(local_path, "wb") as f:
-                for chunk in r.iter_content(chunk_size=10 * 1024):
-                    if chunk:
-                        f.write(chunk)
+        if delta and file_transfer.download_delta(
+            self._files, remote_path, args[1], timeout, delta_block_size, compression, compression_threshold
+        ):
+            return None
+        if compression is not None and file_transfer.download_compressed_to_file(
+            self._files, remote_path, args[1], timeout, compression, compression_threshold
+        ):
+            return None
+        file_transfer.download_ranges(self._files, remote_path, args[1], timeout, concurrency, range_size, resume)
         return None
 
+    @intercept_errors(message_prefix="Failed to download files: ")
+    def download_files(
+        self, files: List[FileDownload], timeout: int = 10 * 60, *, compress: bool = True
+    ) -> List[FileDownloadResult]:
+        """Downloads multiple files from the Sandbox in a single stream. Existing local files are overwritten.
+
+        The files are packed into a tar archive in the Sandbox, which is unpacked to the destinations while it
+        is downloaded. A file that can not be downloaded does not fail the others; its error is in the result.
+
+        Args:
+            files (List[FileDownload]): List of files to download.
+            timeout (int): Timeout for packing and downloading the files in seconds. 0 means no timeout.
+                Default is 10 minutes.
+            compress (bool): Whether to gzip the archive. Default is True.
+
+        Returns:
+            List[FileDownloadResult]: The outcome of each file, in the order of `files`.
+
+        Example:
+            ```python
+            results = sandbox.fs.download_files([
+                FileDownload(source=f"workspace/results/{i}.json", destination=f"results/{i}.json")
+                for i in range(300)
+            ])
+            for result in results:
+                if result.error:
+                    print(f"{result.source}: {result.error}")
+            ```
+        """
+        return archive_transfer.download_files(self._files, files, timeout, compress)
+
     @intercept_errors(message_prefix="Failed to find files: ")
-    def find_files(self, path: str, pattern: str) -> List[Match]:
+    def find_files(
+        self,
+        path: str,
+        pattern: str,
+        *,
+        offset: int = 0,
+        max_results: Optional[int] = None,
+        timeout: int = 10 * 60,
+    ) -> List[Match]:
         """Searches for files containing a pattern, similar to
         the grep command.
 
+        Without `offset` and `max_results`, all matches are returned in one response. With them, the matches are
+        taken from a streamed search, see `iter_find_files`, which stops once the requested page is found.
+        Repeated streamed searches of unchanged files find the matches in the same order, so pages can be
+        requested one after another by increasing `offset`.
+
         Args:
             path (str): Path to the file or directory to search. If the path is a directory,
                 the search will be performed recursively. Relative paths are resolved based on the user's
                 root directory.
             pattern (str): Search pattern to match against file contents.
+            offset (int): Number of matches to skip before the returned ones. Default is 0.
+            max_results (Optional[int]): Maximum number of matches to return. None returns all matches.
+            timeout (int): Timeout for a paged search in seconds. 0 means no timeout. Default is 10 minutes.
 
         Returns:
             List[Match]: List of matches found in files. Each Match object includes:
@@ -208,14 +354,88 @@ class FileSystem:
             matches = sandbox.fs.find_files("workspace/src", "TODO:")
             for match in matches:
                 print(f"{match.file}:{match.line}: {match.content.strip()}")
+
+            # Page through the matches 100 at a time
+            offset = 0
+            while page := sandbox.fs.find_files("workspace", "TODO:", offset=offset, max_results=100):
+                offset += len(page)
             ```
         """
+        if offset or max_results is not None:
+            return list(streamed_search.find_matches(self._files, path, pattern, offset, max_results, timeout))
         return self.toolbox_api.find_in_files(
             self.instance.id,
             path=prefix_relative_path(self._get_root_dir(), path),
             pattern=pattern,
         )
 
+    @intercept_errors(message_prefix="Failed to find files: ")
+    def iter_find_files(
+        self, path: str, pattern: str, *, offset: int = 0, max_results: Optional[int] = None, timeout: int = 10 * 60
+    ) -> Iterator[Match]:
+        """Searches for files containing a pattern like `find_files`, and yields the matches while the Sandbox
+        finds them.
+
+        The search runs with grep in the background of the Sandbox and writes its matches to a staging file,
+        which is read as it grows, so the first matches arrive as soon as they are found and only the matches
+        not yet consumed are held in memory. Stopping the iteration early, or reaching `max_results`, stops the
+        search in the Sandbox. As with `find_files`, the pattern is a literal string; binary files are skipped.
+
+        Args:
+            path (str): Path to the file or directory to search. If the path is a directory,
+                the search will be performed recursively. Relative paths are resolved based on the user's
+                root directory.
+            pattern (str): Search pattern to match against file contents.
+            offset (int): Number of matches to skip before the yielded ones. Default is 0.
+            max_results (Optional[int]): Maximum number of matches to yield. None yields all matches.
+            timeout (int): Timeout for the whole search in seconds. 0 means no timeout. Default is 10 minutes.
+
+        Yields:
+            Match: Each match, with the path to the file, the line number and the content of the line.
+
+        Raises:
+            DaytonaError: If the path does not exist, or the search does not complete in time.
+
+        Example:
+            ```python
+            # Stop after the first ten matches
+            for match in sandbox.fs.iter_find_files("workspace", "TODO:", max_results=10):
+                print(f"{match.file}:{match.line}: {match.content.strip()}")
+            ```
+        """
+        yield from streamed_search.find_matches(self._files, path, pattern, offset, max_results, timeout)
+
+    @intercept_errors(message_prefix="Failed to download files: ")
+    def iter_download_files(
+        self, paths: List[str], timeout: int = 10 * 60, *, compress: bool = True
+    ) -> Iterator[Tuple[str, bytes]]:
+        """Downloads multiple files from the Sandbox in a single stream and yields their contents one by one.
+
+        Like `download_files`, but the files are not saved locally and only one file is held in memory at a
+        time. Files are yielded in the order of `paths`.
+
+        Args:
+            paths (List[str]): Paths to the files in the Sandbox. Relative paths are resolved based on the user's
+                root directory.
+            timeout (int): Timeout for packing and downloading the files in seconds. 0 means no timeout.
+                Default is 10 minutes.
+            compress (bool): Whether to gzip the archive. Default is True.
+
+        Yields:
+            Tuple[str, bytes]: The path, as it was requested, and the contents of each file that was downloaded.
+
+        Raises:
+            DaytonaError: After all other files were yielded, if some files could not be downloaded. The message
+                names each of them with the reason.
+
+        Example:
+            ```python
+            for path, content in sandbox.fs.iter_download_files(["workspace/a.json", "workspace/b.json"]):
+                data = json.loads(content)
+            ```
+        """
+        yield from archive_transfer.iter_download_files(self._files, paths, timeout, compress)
+
     @intercept_errors(message_prefix="Failed to get file info: ")
     def get_file_info(self, path: str) -> FileInfo:
         """Gets detailed information about a file or directory, including its
@@ -250,7 +470,10 @@ class FileSystem:
                 print("Path is a directory")
             ```
         """
-        return self.toolbox_api.get_file_info(self.instance.id, path=prefix_relative_path(self._get_root_dir(), path))
+        path = prefix_relative_path(self._get_root_dir(), path)
+        return self.metadata_cache.fetch(
+            FILE_INFO, path, lambda: self.toolbox_api.get_file_info(self.instance.id, path=path)
+        )
 
     @intercept_errors(message_prefix="Failed to list files: ")
     def list_files(self, path: str) -> List[FileInfo]:
@@ -279,7 +502,52 @@ class FileSystem:
             print("Subdirectories:", ", ".join(d.name for d in dirs))
             ```
         """
-        return self.toolbox_api.list_files(self.instance.id, path=prefix_relative_path(self._get_root_dir(), path))
+        path = prefix_relative_path(self._get_root_dir(), path)
+        return self.metadata_cache.fetch(
+            LISTING, path, lambda: self.toolbox_api.list_files(self.instance.id, path=path)
+        )
+
+    @intercept_errors(message_prefix="Failed to walk directory: ")
+    def walk(
+        self,
+        path: str,
+        max_depth: Optional[int] = None,
+        concurrency: int = walk_utils.DEFAULT_CONCURRENCY,
+        *,
+        find_threshold: Optional[int] = walk_utils.DEFAULT_FIND_THRESHOLD,
+        timeout: int = 10 * 60,
+    ) -> Iterator[WalkEntry]:
+        """Walks a directory tree of the Sandbox and yields its files and directories as they are found.
+
+        Directories are listed with up to `concurrency` `list_files` requests at the same time. When more than
+        `find_threshold` directories are waiting to be listed, the rest of the tree is walked with a single
+        `find` command in the Sandbox, which does not follow symbolic links. Every directory is yielded before
+        the entries below it; the order is otherwise unspecified. Stopping the iteration early stops the walk.
+
+        Args:
+            path (str): Path to the directory to walk. Relative paths are resolved based on the user's
+                root directory.
+            max_depth (Optional[int]): Depth to walk to, 1 yields only the direct children of the directory.
+                None walks the whole tree.
+            concurrency (int): Maximum number of directories listed at the same time. Default is 8.
+            find_threshold (Optional[int]): Number of directories waiting to be listed from which the rest of the
+                tree is walked with `find`. 0 walks the whole tree with `find`, None never uses it. Default is 64.
+            timeout (int): Time each `find` command may take in seconds. 0 means no timeout. Default is 10 minutes.
+
+        Yields:
+            WalkEntry: The path, information and depth of each file and directory below the directory.
+
+        Example:
+            ```python
+            # Only the first two levels of a dataset
+            for entry in sandbox.fs.walk("workspace/data", max_depth=2):
+                print("  " * (entry.depth - 1) + entry.info.name)
+            ```
+        """
+        root = posixpath.normpath(prefix_relative_path(self._get_root_dir(), path))
+        yield from walk_utils.walk_tree(
+            self._files, self.list_files, root, max_depth, concurrency, find_threshold, timeout
+        )
 
     @intercept_errors(message_prefix="Failed to move files: ")
     def move_files(self, source: str, destination: str) -> None:
@@ -312,11 +580,52 @@ class FileSystem:
             )
             ```
         """
-        self.toolbox_api.move_file(
-            self.instance.id,
-            source=prefix_relative_path(self._get_root_dir(), source),
-            destination=prefix_relative_path(self._get_root_dir(), destination),
-        )
+        source = prefix_relative_path(self._get_root_dir(), source)
+        destination = prefix_relative_path(self._get_root_dir(), destination)
+        with self._files.changing(source, destination):
+            self.toolbox_api.move_file(self.instance.id, source=source, destination=destination)
+
+    @intercept_errors(message_prefix="Failed to open file: ")
+    def open_read(
+        self, remote_path: str, *, buffer_size: int = DEFAULT_READ_BUFFER_SIZE, timeout: int = 10 * 60
+    ) -> BinaryIO:
+        """Opens a file in the Sandbox for reading as a binary stream, which downloads the file as it is read,
+        so large files can be processed without holding them in memory. The stream is seekable if the server
+        supports range requests; the next read after a seek requests the file from the new position.
+
+        Args:
+            remote_path (str): Path to the file in the Sandbox. Relative paths are resolved based on the user's
+                root directory.
+            buffer_size (int): Size of the read buffer in bytes. 0 returns the unbuffered stream, which has no
+                `readline`. Default is 1 MiB.
+            timeout (int): Timeout for each request and read in seconds. 0 means no timeout. Default is
+                10 minutes.
+
+        Returns:
+            BinaryIO: An `io.BufferedReader`, or the unbuffered stream if `buffer_size` is 0. Close it to release
+            the connection.
+
+        Raises:
+            DaytonaError: If the file does not exist or can not be read.
+
+        Example:
+            ```python
+            # Process a large log file line by line
+            with sandbox.fs.open_read("workspace/logs/app.log") as f:
+                for line in f:
+                    if b"ERROR" in line:
+                        print(line.decode().rstrip())
+
+            # Read the last KiB of a file
+            with sandbox.fs.open_read("workspace/data/table.parquet") as f:
+                f.seek(-1024, os.SEEK_END)
+                footer = f.read()
+            ```
+        """
+        reader = self._files.open(prefix_relative_path(self._get_root_dir(), remote_path), timeout)
+        if buffer_size <= 0:
+            return reader
+        return io.BufferedReader(reader, buffer_size)
 
     @intercept_errors(message_prefix="Failed to replace in files: ")
     def replace_in_files(self, files: List[str], pattern: str, new_value: str) -> List[ReplaceResult]:
@@ -358,18 +667,35 @@ class FileSystem:
 
         replace_request = ReplaceRequest(files=files, new_value=new_value, pattern=pattern)
 
-        return self.toolbox_api.replace_in_files(self.instance.id, replace_request=replace_request)
+        with self._files.changing(*files):
+            return self.toolbox_api.replace_in_files(self.instance.id, replace_request=replace_request)
 
     @intercept_errors(message_prefix="Failed to search files: ")
-    def search_files(self, path: str, pattern: str) -> SearchFilesResponse:
+    def search_files(
+        self,
+        path: str,
+        pattern: str,
+        *,
+        offset: int = 0,
+        max_results: Optional[int] = None,
+        timeout: int = 10 * 60,
+    ) -> SearchFilesResponse:
         """Searches for files and directories whose names match the
         specified pattern. The pattern can be a simple string or a glob pattern.
 
+        Without `offset` and `max_results`, all paths are returned in one response. With them, the paths are
+        taken from a streamed search, see `iter_search_files`, which stops once the requested page is found.
+        Repeated streamed searches of an unchanged tree find the paths in the same order, so pages can be
+        requested one after another by increasing `offset`.
+
         Args:
             path (str): Path to the root directory to start search from. Relative paths are resolved based on the user's
             root directory.
             pattern (str): Pattern to match against file names. Supports glob
                 patterns (e.g., "*.py" for Python files).
+            offset (int): Number of paths to skip before the returned ones. Default is 0.
+            max_results (Optional[int]): Maximum number of paths to return. None returns all paths.
+            timeout (int): Timeout for a paged search in seconds. 0 means no timeout. Default is 10 minutes.
 
         Returns:
             SearchFilesResponse: Search results containing:
@@ -385,14 +711,53 @@ class FileSystem:
             # Find files with specific prefix
             result = sandbox.fs.search_files("workspace/data", "test_*")
             print(f"Found {len(result.files)} test files")
+
+            # Only the first 1000 JSON files
+            result = sandbox.fs.search_files("workspace/data", "*.json", max_results=1000)
             ```
         """
+        if offset or max_results is not None:
+            return SearchFilesResponse(
+                files=list(streamed_search.search_paths(self._files, path, pattern, offset, max_results, timeout))
+            )
         return self.toolbox_api.search_files(
             self.instance.id,
             path=prefix_relative_path(self._get_root_dir(), path),
             pattern=pattern,
         )
 
+    @intercept_errors(message_prefix="Failed to search files: ")
+    def iter_search_files(
+        self, path: str, pattern: str, *, offset: int = 0, max_results: Optional[int] = None, timeout: int = 10 * 60
+    ) -> Iterator[str]:
+        """Searches for files and directories whose names match a glob pattern like `search_files`, and yields
+        their paths while the Sandbox finds them.
+
+        The search runs with find in the background of the Sandbox and is streamed like `iter_find_files`.
+        Stopping the iteration early, or reaching `max_results`, stops the search in the Sandbox.
+
+        Args:
+            path (str): Path to the root directory to start search from. Relative paths are resolved based on
+                the user's root directory.
+            pattern (str): Glob pattern to match against file names (e.g., "*.py" for Python files).
+            offset (int): Number of paths to skip before the yielded ones. Default is 0.
+            max_results (Optional[int]): Maximum number of paths to yield. None yields all paths.
+            timeout (int): Timeout for the whole search in seconds. 0 means no timeout. Default is 10 minutes.
+
+        Yields:
+            str: Absolute path of each matching file and directory.
+
+        Raises:
+            DaytonaError: If the path does not exist, or the search does not complete in time.
+
+        Example:
+            ```python
+            for file in sandbox.fs.iter_search_files("workspace", "*.py"):
+                print(file)
+            ```
+        """
+        yield from streamed_search.search_paths(self._files, path, pattern, offset, max_results, timeout)
+
     @intercept_errors(message_prefix="Failed to set file permissions: ")
     def set_file_permissions(self, path: str, mode: str = None, owner: str = None, group: str = None) -> None:
         """Sets permissions and ownership for a file or directory. Any of the parameters can be None
@@ -422,25 +787,127 @@ class FileSystem:
             )
             ```
         """
-        self.toolbox_api.set_file_permissions(
-            self.instance.id,
-            path=prefix_relative_path(self._get_root_dir(), path),
-            mode=mode,
-            owner=owner,
-            group=group,
-        )
+        path = prefix_relative_path(self._get_root_dir(), path)
+        with self._files.changing(path):
+            self.toolbox_api.set_file_permissions(self.instance.id, path=path, mode=mode, owner=owner, group=group)
+
+    @intercept_errors(message_prefix="Failed to sync directory: ")
+    def sync_dir(
+        self,
+        local_dir: str,
+        remote_dir: str,
+        *,
+        delete: bool = False,
+        include: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+        respect_gitignore: bool = True,
+        timeout: int = 10 * 60,
+    ) -> SyncResult:
+        """Makes a Sandbox directory match a local directory by uploading only the files that were added
+        or changed since the last sync.
+
+        Files are compared by size and modification time, and hashed on both sides if only the time differs.
+        Empty directories and file permissions are not synced.
+
+        Args:
+            local_dir (str): Path to the local directory.
+            remote_dir (str): Path to the directory in the Sandbox, which is created if it does not exist.
+                Relative paths are resolved based on the user's root directory.
+            delete (bool): Whether to remove files from the Sandbox directory that do not exist locally.
+                Files that are not selected by the filters are never removed. Default is False.
+            include (Optional[List[str]]): Glob patterns of the files to sync, matched against the path relative
+                to `local_dir` and the file name. All files are synced if not set.
+            exclude (Optional[List[str]]): Glob patterns of the files and directories to skip.
+            respect_gitignore (bool): Whether to skip the files ignored by the `.gitignore` files of the local
+                directory and the `.git` directory. Default is True.
+            timeout (int): Timeout for each request in seconds. 0 means no timeout. Default is 10 minutes.
+
+        Returns:
+            SyncResult: The uploaded, deleted and unchanged files.
+
+        Raises:
+            DaytonaError: If the local directory does not exist or the sync fails.
+
+        Example:
+            ```python
+            result = sandbox.fs.sync_dir("./project", "workspace/project", delete=True, exclude=["*.log"])
+            print(f"Uploaded {len(result.uploaded)} files, {len(result.unchanged)} were up to date")
+            ```
+        """
+        remote_dir = prefix_relative_path(self._get_root_dir(), remote_dir)
+        path_filter = PathFilter(include, exclude, respect_gitignore)
+        return sync.sync_dir(self._files, self.upload_files, local_dir, remote_dir, path_filter, delete, timeout)
+
+    @intercept_errors(message_prefix="Failed to upload directory: ")
+    def upload_dir(
+        self,
+        local_dir: str,
+        remote_dir: str,
+        *,
+        include: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+        respect_gitignore: bool = False,
+        compress: bool = True,
+        timeout: int = 10 * 60,
+    ) -> None:
+        """Uploads a local directory tree to the Sandbox.
+
+        The tree is packed into a tar archive while it is sent as a single stream and unpacked in the Sandbox,
+        which is much faster than `upload_files` for many small files. Existing files in the Sandbox are
+        overwritten; other files are left in place.
+
+        Args:
+            local_dir (str): Path to the local directory.
+            remote_dir (str): Path to the directory in the Sandbox, which is created if it does not exist.
+                Relative paths are resolved based on the user's root directory.
+            include (Optional[List[str]]): Glob patterns of the files to upload, matched against the path relative
+                to `local_dir` and the file name. All files are uploaded if not set.
+            exclude (Optional[List[str]]): Glob patterns of the files and directories to skip.
+            respect_gitignore (bool): Whether to skip the files ignored by the `.gitignore` files of the local
+                directory and the `.git` directory. Default is False.
+            compress (bool): Whether to gzip the archive. Default is True.
+            timeout (int): Timeout for uploading and unpacking the archive in seconds. 0 means no timeout.
+                Default is 10 minutes.
+
+        Raises:
+            DaytonaError: If the local directory does not exist or the upload fails.
+
+        Example:
+            ```python
+            sandbox.fs.upload_dir("./dataset", "workspace/dataset", exclude=["*.tmp"])
+            ```
+        """
+        remote_dir = prefix_relative_path(self._get_root_dir(), remote_dir)
+        path_filter = PathFilter(include, exclude, respect_gitignore)
+        archive_transfer.upload_dir(self._files, local_dir, remote_dir, path_filter, compress, timeout)
 
     @overload
-    def upload_file(self, file: bytes, remote_path: str, timeout: int = 10 * 60) -> None:
+    def upload_file(
+        self,
+        file: Union[bytes, BinaryIO, Iterable[bytes]],
+        remote_path: str,
+        timeout: int = 10 * 60,
+        *,
+        compression: Optional[Union[Compression, str]] = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+    ) -> None:
         """Uploads a file to the specified path in the Sandbox. If a file already exists at
         the destination path, it will be overwritten. This method is useful when you want to upload
         small files that fit into memory.
 
+        Data produced on the fly, e.g. by a generator or a subprocess, can be passed as a stream, which is sent as
+        it is read. A failed upload of a stream is not retried.
+
         Args:
-            file (bytes): File contents as a bytes object.
+            file (Union[bytes, BinaryIO, Iterable[bytes]]): File contents as a bytes object, a readable binary
+                stream or an iterator of bytes chunks.
             remote_path (str): Path to the destination file. Relative paths are resolved based on the user's
             root directory.
             timeout (int): Timeout for the upload operation in seconds. 0 means no timeout. Default is 10 minutes.
+            compression (Optional[Union[Compression, str]]): Algorithm to compress the file with for the transfer
+                if it is at least `compression_threshold` bytes large. Streams are always compressed. Not
+                compressed by default.
+            compression_threshold (int): Size of the file in bytes from which it is compressed. Default is 64 KiB.
 
         Example:
             ```python
@@ -458,39 +925,126 @@ class FileSystem:
             data = {"key": "value"}
             content = json.dumps(data).encode('utf-8')
             sandbox.fs.upload_file(content, "tmp/config.json")
+
+            # Upload the output of a local command
+            proc = subprocess.Popen(["pg_dump", "mydb"], stdout=subprocess.PIPE)
+            sandbox.fs.upload_file(proc.stdout, "backup/mydb.sql", compression=Compression.GZIP)
             ```
         """
 
     @overload
-    def upload_file(self, local_path: str, remote_path: str, timeout: int = 10 * 60) -> None:
+    def upload_file(
+        self,
+        local_path: str,
+        remote_path: str,
+        timeout: int = 10 * 60,
+        *,
+        resume: bool = False,
+        part_size: int = DEFAULT_PART_SIZE,
+        compression: Optional[Union[Compression, str]] = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        delta: bool = False,
+        delta_block_size: int = delta_utils.DEFAULT_BLOCK_SIZE,
+    ) -> None:
         """Uploads a file from the local file system to the specified path in the Sandbox.
         If a file already exists at the destination path, it will be overwritten. This method uses
         streaming to upload the file, so it is useful when you want to upload larger files that may
         not fit into memory.
 
+        With `resume`, the file is uploaded in parts to a staging directory next to the destination
+        (`<remote_path>.daytona-parts`), so calling the method again after a failure only uploads the parts that
+        are not intact in the Sandbox yet. With `delta`, only the blocks that differ from an existing Sandbox file
+        are sent, like rsync. This needs `python3` in the Sandbox; otherwise the whole file is sent.
+
         Args:
             local_path (str): Path to the local file to upload.
             remote_path (str): Path to the destination file in the Sandbox. Relative paths are
             resolved based on the user's root directory.
             timeout (int): Timeout for the upload operation in seconds. 0 means no timeout. Default is 10 minutes.
+                With `resume`, the timeout applies to each part.
+            resume (bool): Whether to continue a previously failed upload of the same file. Default is False.
+            part_size (int): Size of the parts of a resumable upload in bytes. Default is 64 MiB.
+            compression (Optional[Union[Compression, str]]): Algorithm to compress the file with for the transfer
+                if it is at least `compression_threshold` bytes large. Can not be combined with `resume`. Not
+                compressed by default.
+            compression_threshold (int): Size of the file in bytes from which it is compressed. Default is 64 KiB.
+            delta (bool): Whether to only send the blocks that differ from the Sandbox file. Can not be combined
+                with `resume`. Default is False.
+            delta_block_size (int): Size of the blocks compared for a delta upload in bytes. Default is 64 KiB.
 
         Example:
             ```python
             sandbox.fs.upload_file("local_file.txt", "tmp/large_file.txt")
+
+            # Upload a large file, continuing where a failed attempt stopped
+            sandbox.fs.upload_file("dataset.tar", "data/dataset.tar", resume=True)
             ```
         """
 
-    def upload_file(self, src: Union[str, bytes], dst: str, timeout: int = 10 * 60) -> None:
-        self.upload_files([FileUpload(src, dst)], timeout)
+    @intercept_errors(message_prefix="Failed to upload file: ")
+    def upload_file(
+        self,
+        src: UploadSource,
+        dst: str,
+        timeout: int = 10 * 60,
+        *,
+        resume: bool = False,
+        part_size: int = DEFAULT_PART_SIZE,
+        compression: Optional[Union[Compression, str]] = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        delta: bool = False,
+        delta_block_size: int = delta_utils.DEFAULT_BLOCK_SIZE,
+    ) -> None:
+        if compression is not None:
+            compression = compression_utils.resolve(compression)
+        if delta or resume:
+            dst = prefix_relative_path(self._get_root_dir(), dst)
+            block_size = delta_block_size if delta else None
+            if file_transfer.upload_in_place(
+                self._files, src, dst, timeout, resume, part_size, compression, compression_threshold, block_size
+            ):
+                return
+        self._uploader.upload(FileUpload(src, dst), timeout, compression, compression_threshold)
 
     @intercept_errors(message_prefix="Failed to upload files: ")
-    def upload_files(self, files: List[FileUpload], timeout: int = 10 * 60) -> None:
+    def upload_files(
+        self,
+        files: List[FileUpload],
+        timeout: int = 10 * 60,
+        *,
+        compression: Optional[Union[Compression, str]] = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        max_concurrency: int = DEFAULT_UPLOAD_CONCURRENCY,
+        batch_files: int = UPLOAD_BATCH_FILES,
+        batch_bytes: int = UPLOAD_BATCH_BYTES,
+        progress: Optional[Callable[[UploadProgress], None]] = None,
+    ) -> None:
         """Uploads multiple files to the Sandbox. If files already exist at the destination paths,
         they will be overwritten.
 
+        The files are sent in batches of at most `batch_files` files and `batch_bytes` bytes over up to
+        `max_concurrency` parallel requests, whose number adapts to the measured throughput. A failed batch is
+        split and retried, taking a retry from the retry budget of the client (see `RetryConfig`), so one bad
+        file does not fail the others. Streams are each sent in a batch of their own and are not retried.
+
         Args:
             files (List[FileUpload]): List of files to upload.
-            timeout (int): Timeout for the upload operation in seconds. 0 means no timeout. Default is 10 minutes.
+            timeout (int): Timeout for each batch in seconds. 0 means no timeout. Default is 10 minutes.
+            compression (Optional[Union[Compression, str]]): Algorithm to compress large files with for the
+                transfer. Not compressed by default.
+            compression_threshold (int): Size of a file in bytes from which it is compressed. Default is 64 KiB.
+            max_concurrency (int): Maximum number of batches uploaded at the same time. 1 uploads the batches
+                one after another. Default is 4.
+            batch_files (int): Maximum number of files per request. Default is 100.
+            batch_bytes (int): Maximum total size of the files of a request in bytes. A larger file is sent in a
+                request of its own. Default is 64 MiB.
+            progress (Optional[Callable[[UploadProgress], None]]): Called with the progress of each file and of
+                the whole upload as data is sent and files complete. Calls come from worker threads, one at a time.
+
+        Raises:
+            DaytonaError: If some files could not be uploaded, after all others were. The message names each
+                failed file with the reason.
+
         Example:
             ```python
             # Upload multiple text files
@@ -511,24 +1065,11 @@ class FileSystem:
             sandbox.fs.upload_files(files)
             ```
         """
-        fields = {}
-        with ExitStack() as stack:
-            for i, f in enumerate(files):
-                dst = prefix_relative_path(self._get_root_dir(), f.destination)
-                # metadata field
-                fields[f"files[{i}].path"] = dst
-                # file field: wrap bytes in BytesIO or open file stream
-                if isinstance(f.source, bytes):
-                    stream = io.BytesIO(f.source)
-                    fname = dst
-                else:
-                    stream = stack.enter_context(open(f.source, "rb"))
-                    fname = os.path.basename(f.source)
-                fields[f"files[{i}].file"] = (fname, stream)
-
-            m = MultipartEncoder(fields=fields)
-            headers = self.toolbox_api.api_client.default_headers.copy()
-            headers["Content-Type"] = m.content_type
-            # pylint: disable=protected-access
-            _, url, *_ = self.toolbox_api._upload_files_serialize(self.instance.id, None, None, None, None, None)
-            requests.post(url, data=m, headers=headers, timeout=timeout or None)
+        if max_concurrency < 1 or batch_files < 1 or batch_bytes < 1:
+            raise DaytonaError("Concurrency and batch limits must be positive integers")
+        failed = self._uploader.upload_batches(
+            files, timeout, compression, compression_threshold, max_concurrency, batch_files, batch_bytes, progress
+        )
+        if failed:
+            reasons = "; ".join(f"{f.destination}: {error}" for f, error in failed)
+            raise DaytonaError(f"{len(failed)} of {len(files)} files could not be uploaded: {reasons}")
@@ -0,0 +1,356 @@
+import errno
+import posixpath
+import shlex
+import tempfile
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from dateutil import parser as date_parser
+from daytona_api_client import FileInfo
+from daytona_api_client.exceptions import NotFoundException
+
+from .common.errors import DaytonaError
+
+try:
+    from fsspec.spec import AbstractBufferedFile, AbstractFileSystem
+except ImportError:
+    raise DaytonaError(  # pylint: disable=raise-missing-from
+        "fsspec support requires the 'fsspec' package. Install it with `pip install daytona_sdk[fsspec]`."
+    )
+
+from .daytona import Daytona
+from .sandbox import Sandbox
+
+# Size of the blocks files are read in
+DEFAULT_BLOCK_SIZE = 4 * 1024 * 1024
+# Number of blocks per open file kept in its LRU cache
+DEFAULT_CACHE_BLOCKS = 16
+# Size up to which written files are buffered in memory before they spill to a temporary file
+SPOOL_SIZE = 16 * 1024 * 1024
+
+
+class DaytonaFileSystem(AbstractFileSystem):
+    """fsspec file system for the files of Daytona Sandboxes, so libraries such as pandas, pyarrow and dask can
+    read and write them directly. Requires the `fsspec` package (`pip install daytona_sdk[fsspec]`).
+
+    Paths have the form `daytona://<sandbox-id>/<absolute path>`. Files are read in blocks with range
+    requests, so columnar readers only fetch the parts of a file they need. Each open file keeps the blocks it
+    read in an LRU cache and fetches the next block in the background while the current one is consumed.
+    Directory listings are cached as well, and are invalidated by the writes of this file system.
+
+    Example:
+        ```python
+        import pandas as pd
+
+        df = pd.read_parquet(f"daytona://{sandbox.id}/home/daytona/data/x.parquet")
+
+        # Use an existing client and keep up to 64 blocks per file
+        df = pd.read_parquet(
+            f"daytona://{sandbox.id}/home/daytona/data/x.parquet",
+            storage_options={"daytona": daytona, "cache_blocks": 64},
+        )
+        ```
+    """
+
+    protocol = "daytona"
+    root_marker = ""
+
+    def __init__(
+        self,
+        daytona: Optional[Daytona] = None,
+        sandbox: Optional[Sandbox] = None,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        cache_blocks: int = DEFAULT_CACHE_BLOCKS,
+        cache_type: str = "background",
+        **kwargs: Any,
+    ):
+        """Initializes the file system.
+
+        Args:
+            daytona (Optional[Daytona]): Client to look up the Sandboxes of the paths with. Defaults to a client
+                configured from environment variables.
+            sandbox (Optional[Sandbox]): Sandbox to use for the paths with its ID, without looking it up.
+            block_size (int): Size of the blocks files are read in, in bytes. Default is 4 MiB.
+            cache_blocks (int): Number of blocks each open file keeps in its LRU cache. Default is 16.
+            cache_type (str): fsspec cache of open files. The default `background` cache is an LRU block cache
+                that reads ahead, `blockcache` does not read ahead.
+            **kwargs: Options of `fsspec.AbstractFileSystem`, e.g. `use_listings_cache` and
+                `listings_expiry_time` to configure the listing cache.
+        """
+        super().__init__(**kwargs)
+        self._daytona = daytona
+        self._sandboxes: Dict[str, Sandbox] = {sandbox.id: sandbox} if sandbox is not None else {}
+        self._lock = threading.Lock()
+        self.blocksize = block_size
+        self.cache_blocks = cache_blocks
+        self.cache_type = cache_type
+        # Client created by this file system when none was passed, closed by `close`
+        self._owned_daytona: Optional[Daytona] = None
+
+    def close(self) -> None:
+        """Closes the HTTP connections of the client this file system created, if any. A client passed to the
+        file system is left open."""
+        with self._lock:
+            daytona, self._owned_daytona = self._owned_daytona, None
+            if daytona is not None:
+                self._daytona = None
+                self._sandboxes.clear()
+        if daytona is not None:
+            daytona.close()
+
+    @classmethod
+    def _strip_protocol(cls, path: Union[str, List[str]]) -> Union[str, List[str]]:
+        if isinstance(path, list):
+            return [cls._strip_protocol(p) for p in path]
+        if path.startswith(f"{cls.protocol}://"):
+            path = path[len(cls.protocol) + 3 :]
+        return path.strip("/")
+
+    def ls(self, path: str, detail: bool = True, **kwargs: Any) -> Union[List[Dict[str, Any]], List[str]]:
+        path = self._strip_protocol(path)
+        entries = None
+        if kwargs.get("refresh") is not True:
+            try:
+                entries = self.dircache[path]
+            except KeyError:
+                pass
+        if entries is None:
+            sandbox_id, remote_path = self.__split(path)
+            files = self.__sandbox(sandbox_id).fs.list_files(remote_path)
+            entries = [self.__entry(posixpath.join(path, f.name), f) for f in files]
+            self.dircache[path] = entries
+        return entries if detail else [entry["name"] for entry in entries]
+
+    def info(self, path: str, **kwargs: Any) -> Dict[str, Any]:
+        path = self._strip_protocol(path)
+        sandbox_id, remote_path = self.__split(path)
+        if remote_path == "/":
+            return {"name": sandbox_id, "size": 0, "type": "directory"}
+        # A cached listing of the parent directory already describes the path
+        for entry in self._ls_from_cache(path) or []:
+            if entry["name"] == path:
+                return entry
+        try:
+            info = self.__sandbox(sandbox_id).fs.get_file_info(remote_path)
+        except DaytonaError as e:
+            message = str(e).lower()
+            if isinstance(e.__context__, NotFoundException) or "not found" in message or "no such file" in message:
+                raise FileNotFoundError(path) from e
+            raise
+        return self.__entry(path, info)
+
+    def modified(self, path: str) -> datetime:
+        mtime = self.info(path).get("mtime")
+        if mtime is None:
+            raise NotImplementedError(f"The modification time of {path} is unknown")
+        return mtime
+
+    def cat_file(self, path: str, start: Optional[int] = None, end: Optional[int] = None, **kwargs: Any) -> bytes:
+        path = self._strip_protocol(path)
+        sandbox_id, remote_path = self.__split(path)
+        fs = self.__sandbox(sandbox_id).fs
+        if start is None and end is None:
+            return fs.download_file(remote_path)
+        size = self.info(path)["size"] if (start or 0) < 0 or end is None or end < 0 else None
+        start = (start or 0) + (size if (start or 0) < 0 else 0)
+        end = size if end is None else end + (size if end < 0 else 0)
+        # pylint: disable=protected-access
+        return fs._files.read_range(remote_path, max(start, 0), end)
+
+    def mkdir(self, path: str, create_parents: bool = True, **kwargs: Any) -> None:
+        path = self._strip_protocol(path)
+        sandbox_id, remote_path = self.__split(path)
+        fs = self.__sandbox(sandbox_id).fs
+        if create_parents:
+            # pylint: disable=protected-access
+            fs._files.run(f"mkdir -p -m {kwargs.get('mode', '755')} -- {shlex.quote(remote_path)}")
+            fs.metadata_cache.invalidate(remote_path)
+        else:
+            fs.create_folder(remote_path, kwargs.get("mode", "755"))
+        self.invalidate_cache(path)
+
+    def makedirs(self, path: str, exist_ok: bool = False) -> None:
+        if not exist_ok and self.exists(path):
+            raise FileExistsError(path)
+        self.mkdir(path, create_parents=True)
+
+    def rm_file(self, path: str) -> None:
+        if self.isdir(path):
+            raise IsADirectoryError(errno.EISDIR, "Is a directory", path)
+        self.__delete(path)
+
+    def _rm(self, path: str) -> None:
+        self.rm_file(path)
+
+    def rm(self, path: Union[str, List[str]], recursive: bool = False, maxdepth: Optional[int] = None) -> None:
+        if recursive and maxdepth is None:
+            # The Sandbox deletes a whole tree in one request
+            for p in self.expand_path(path):
+                self.__delete(p)
+            return
+        for p in reversed(self.expand_path(path, recursive=recursive, maxdepth=maxdepth)):
+            if self.isdir(p):
+                self.rmdir(p)
+            else:
+                self.rm_file(p)
+
+    def rmdir(self, path: str) -> None:
+        path = self._strip_protocol(path)
+        sandbox_id, remote_path = self.__split(path)
+        fs = self.__sandbox(sandbox_id).fs
+        try:
+            fs._files.run(f"rmdir -- {shlex.quote(remote_path)}")  # pylint: disable=protected-access
+        except DaytonaError as e:
+            message = str(e).lower()
+            if "no such file" in message:
+                raise FileNotFoundError(errno.ENOENT, "No such file or directory", path) from e
+            if "not empty" in message:
+                raise OSError(errno.ENOTEMPTY, "Directory not empty", path) from e
+            if "not a directory" in message:
+                raise NotADirectoryError(errno.ENOTDIR, "Not a directory", path) from e
+            raise
+        finally:
+            fs.metadata_cache.invalidate(remote_path)
+            self.invalidate_cache(path)
+
+    def cp_file(self, path1: str, path2: str, **kwargs: Any) -> None:
+        path1, path2 = self._strip_protocol(path1), self._strip_protocol(path2)
+        sandbox_id, source = self.__split(path1)
+        destination_sandbox_id, destination = self.__split(path2)
+        if sandbox_id == destination_sandbox_id:
+            fs = self.__sandbox(sandbox_id).fs
+            # pylint: disable=protected-access
+            fs._files.run(f"cp -- {shlex.quote(source)} {shlex.quote(destination)}")
+            fs.metadata_cache.invalidate(destination)
+        else:
+            with self.open(path1, "rb") as f:
+                self.__sandbox(destination_sandbox_id).fs.upload_file(f, destination)
+        self.invalidate_cache(path2)
+
+    def created(self, path: str) -> datetime:
+        raise NotImplementedError("Sandbox files do not record their creation time")
+
+    @property
+    def fsid(self) -> str:
+        return self.protocol
+
+    def sign(self, path: str, expiration: int = 100, **kwargs: Any) -> str:
+        raise NotImplementedError("Sandbox files can not be shared with signed URLs")
+
+    def mv(self, path1: str, path2: str, recursive: bool = False, maxdepth: Optional[int] = None, **kwargs) -> None:
+        path1, path2 = self._strip_protocol(path1), self._strip_protocol(path2)
+        sandbox_id, source = self.__split(path1)
+        destination_sandbox_id, destination = self.__split(path2)
+        if sandbox_id != destination_sandbox_id:
+            super().mv(path1, path2, recursive=recursive, maxdepth=maxdepth, **kwargs)
+            return
+        self.__sandbox(sandbox_id).fs.move_files(source, destination)
+        self.invalidate_cache(path1)
+        self.invalidate_cache(path2)
+
+    def invalidate_cache(self, path: Optional[str] = None) -> None:
+        if path is None:
+            self.dircache.clear()
+            return
+        path = self._strip_protocol(path)
+        # The listings of the path, of everything below it and of its ancestors, which gain the directories
+        # created with it, change
+        for key in list(self.dircache):
+            if key == path or key.startswith(f"{path}/") or path.startswith(f"{key}/"):
+                self.dircache.pop(key, None)
+
+    def _open(
+        self,
+        path: str,
+        mode: str = "rb",
+        block_size: Optional[int] = None,
+        autocommit: bool = True,
+        cache_options: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> "DaytonaFile":
+        return DaytonaFile(
+            self,
+            self._strip_protocol(path),
+            mode,
+            block_size=block_size or self.blocksize,
+            autocommit=autocommit,
+            cache_type=kwargs.pop("cache_type", self.cache_type),
+            cache_options={"maxblocks": self.cache_blocks, **(cache_options or {})},
+            **kwargs,
+        )
+
+    def __delete(self, path: str) -> None:
+        path = self._strip_protocol(path)
+        sandbox_id, remote_path = self.__split(path)
+        self.__sandbox(sandbox_id).fs.delete_file(remote_path)
+        self.invalidate_cache(path)
+
+    def _sandbox_path(self, path: str) -> Tuple[Sandbox, str]:
+        """Returns the Sandbox of a path and the absolute path within it."""
+        sandbox_id, remote_path = self.__split(self._strip_protocol(path))
+        return self.__sandbox(sandbox_id), remote_path
+
+    def __sandbox(self, sandbox_id: str) -> Sandbox:
+        with self._lock:
+            sandbox = self._sandboxes.get(sandbox_id)
+            if sandbox is None:
+                if self._daytona is None:
+                    self._daytona = self._owned_daytona = Daytona()
+                sandbox = self._sandboxes[sandbox_id] = self._daytona.get_current_sandbox(sandbox_id)
+            return sandbox
+
+    @staticmethod
+    def __split(path: str) -> Tuple[str, str]:
+        sandbox_id, _, remote_path = path.partition("/")
+        if not sandbox_id:
+            raise ValueError(f"Path {path!r} does not start with a Sandbox ID")
+        return sandbox_id, "/" + remote_path
+
+    @staticmethod
+    def __entry(name: str, info: FileInfo) -> Dict[str, Any]:
+        return {
+            "name": name,
+            "size": int(info.size),
+            "type": "directory" if info.is_dir else "file",
+            "mtime": _parse_time(info.mod_time),
+            "mode": info.mode,
+            "permissions": info.permissions,
+            "owner": info.owner,
+            "group": info.group,
+        }
+
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    try:
+        return date_parser.parse(value) if value else None
+    except (ValueError, OverflowError):
+        return None
+
+
+class DaytonaFile(AbstractBufferedFile):
+    """File of a `DaytonaFileSystem`. Reads fetch blocks with range requests, and writes are spooled locally
+    and uploaded when the file is closed."""
+
+    def __init__(self, fs: DaytonaFileSystem, path: str, mode: str = "rb", **kwargs: Any):
+        self._sandbox, self._remote_path = fs._sandbox_path(path)  # pylint: disable=protected-access
+        self._spool: Optional[tempfile.SpooledTemporaryFile] = None
+        super().__init__(fs, path, mode, **kwargs)
+
+    def _fetch_range(self, start: int, end: int) -> bytes:
+        return self._sandbox.fs._files.read_range(self._remote_path, start, end)  # pylint: disable=protected-access
+
+    def _initiate_upload(self) -> None:
+        self._spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_SIZE)  # pylint: disable=consider-using-with
+
+    def _upload_chunk(self, final: bool = False) -> bool:
+        self._spool.write(self.buffer.getvalue())
+        if not final:
+            return True
+        try:
+            self._spool.seek(0)
+            self._sandbox.fs.upload_file(self._spool, self._remote_path)
+        finally:
+            self._spool.close()
+        self.fs.invalidate_cache(self.path)
+        return True
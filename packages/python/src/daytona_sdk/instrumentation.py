@@ -0,0 +1,318 @@
+import math
+import threading
+import warnings
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+from .common.errors import DaytonaError
+
+
+@dataclass
+class OperationEvent:
+    """A single request of a Daytona client, passed to instrumentation hooks when it starts and ends.
+
+    The same object is passed to `on_start` and `on_end`; the fields describing the outcome are only set
+    when the request ends.
+
+    Attributes:
+        operation (str): Name of the API operation, e.g. `create_workspace`, `get_project_dir`,
+            `execute_command` or `upload_file`.
+        method (str): HTTP method.
+        url (str): Request URL.
+        sandbox_id (Optional[str]): ID of the Sandbox the request targets, if any.
+        start_time (float): Start of the request as a Unix timestamp.
+        duration (Optional[float]): Time in seconds until the response was fully read, including retries.
+        bytes_sent (int): Size of the request body in bytes.
+        bytes_received (int): Number of response body bytes received.
+        retries (int): Number of times the request was retried.
+        status (Optional[int]): HTTP status code of the response. None if no response was received.
+        error (Optional[BaseException]): Error that ended the request, if any.
+        context (Dict[str, Any]): Storage for hooks that need to keep state between `on_start` and `on_end`.
+    """
+
+    operation: str
+    method: str
+    url: str
+    sandbox_id: Optional[str]
+    start_time: float
+    duration: Optional[float] = None
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    retries: int = 0
+    status: Optional[int] = None
+    error: Optional[BaseException] = None
+    context: Dict[str, Any] = field(default_factory=dict, repr=False)
+
+
+class InstrumentationHook:
+    """Base class of instrumentation hooks. Override the methods of the events you are interested in.
+
+    Hooks are called synchronously in the thread or task that sends the request, so they should return
+    quickly. Errors raised by hooks are reported as warnings and never fail the request.
+
+    Example:
+        ```python
+        class SlowRequestLogger(InstrumentationHook):
+            def on_end(self, event: OperationEvent) -> None:
+                if event.duration > 1:
+                    print(f"{event.operation} on {event.sandbox_id} took {event.duration:.2f}s")
+
+        daytona.add_hook(SlowRequestLogger())
+        ```
+    """
+
+    def on_start(self, event: OperationEvent) -> None:
+        """Called before a request is sent.
+
+        Args:
+            event (OperationEvent): The request.
+        """
+
+    def on_end(self, event: OperationEvent) -> None:
+        """Called after the response of a request was read or the request failed.
+
+        Args:
+            event (OperationEvent): The request and its outcome.
+        """
+
+
+class Instrumentation:
+    """Hooks registered on a Daytona client."""
+
+    def __init__(self):
+        self._hooks: Tuple[InstrumentationHook, ...] = ()
+        self._lock = threading.Lock()
+
+    @property
+    def hooks(self) -> Tuple[InstrumentationHook, ...]:
+        """Registered hooks, in registration order."""
+        return self._hooks
+
+    def add(self, hook: InstrumentationHook) -> None:
+        with self._lock:
+            self._hooks = self._hooks + (hook,)
+
+    def remove(self, hook: InstrumentationHook) -> None:
+        with self._lock:
+            self._hooks = tuple(registered for registered in self._hooks if registered is not hook)
+
+    def start(self, event: OperationEvent) -> None:
+        for hook in self._hooks:
+            self.__call(hook.on_start, event)
+
+    def end(self, event: OperationEvent) -> None:
+        for hook in self._hooks:
+            self.__call(hook.on_end, event)
+
+    @staticmethod
+    def __call(handler, event: OperationEvent) -> None:
+        try:
+            handler(event)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            warnings.warn(f"Instrumentation hook {handler!r} failed: {e}", RuntimeWarning, stacklevel=2)
+
+
+@dataclass
+class LatencySummary:
+    """Latency statistics of one operation.
+
+    Attributes:
+        count (int): Number of recorded requests.
+        errors (int): Number of requests that failed or got an error response.
+        mean (float): Mean duration in seconds.
+        p50 (float): Median duration in seconds.
+        p95 (float): 95th percentile duration in seconds.
+        p99 (float): 99th percentile duration in seconds.
+        max (float): Longest duration in seconds.
+    """
+
+    count: int
+    errors: int
+    mean: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+
+class _Histogram:
+    """Histogram with logarithmic buckets, accurate to `GROWTH` relative error with constant memory."""
+
+    MIN_VALUE = 1e-4
+    GROWTH = 1.05
+
+    def __init__(self):
+        self.buckets: Dict[int, int] = {}
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, value: float, error: bool) -> None:
+        index = max(0, math.ceil(math.log(max(value, self.MIN_VALUE) / self.MIN_VALUE, self.GROWTH)))
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.errors += int(error)
+        self.total += value
+        self.max = max(self.max, value)
+
+    def percentile(self, percentile: float) -> float:
+        rank = max(1, math.ceil(percentile / 100 * self.count))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                # Upper bound of the bucket, which never exceeds the largest recorded value
+                return min(self.MIN_VALUE * self.GROWTH**index, self.max)
+        return self.max
+
+    def summary(self) -> LatencySummary:
+        return LatencySummary(
+            count=self.count,
+            errors=self.errors,
+            mean=self.total / self.count if self.count else 0.0,
+            p50=self.percentile(50),
+            p95=self.percentile(95),
+            p99=self.percentile(99),
+            max=self.max,
+        )
+
+
+class LatencyHistogram(InstrumentationHook):
+    """In-process collector of request latencies per operation, with p50/p95/p99 percentiles.
+
+    Memory use is constant per operation, so the collector can stay registered in long-running processes.
+
+    Example:
+        ```python
+        histogram = LatencyHistogram()
+        daytona.add_hook(histogram)
+
+        sandbox = daytona.create()
+        sandbox.process.exec("echo hello")
+
+        for operation, summary in histogram.summary().items():
+            print(f"{operation}: p50={summary.p50:.3f}s p99={summary.p99:.3f}s ({summary.count} requests)")
+        ```
+    """
+
+    def __init__(self):
+        self._histograms: Dict[str, _Histogram] = {}
+        self._lock = threading.Lock()
+
+    def on_end(self, event: OperationEvent) -> None:
+        self.record(
+            event.operation,
+            event.duration or 0.0,
+            error=event.error is not None or (event.status is not None and event.status >= 400),
+        )
+
+    def record(self, operation: str, duration: float, error: bool = False) -> None:
+        """Records the duration of a request.
+
+        Args:
+            operation (str): Name of the operation.
+            duration (float): Duration in seconds.
+            error (bool): Whether the request failed.
+        """
+        with self._lock:
+            histogram = self._histograms.get(operation)
+            if histogram is None:
+                histogram = self._histograms[operation] = _Histogram()
+            histogram.record(duration, error)
+
+    def percentile(self, operation: str, percentile: float) -> Optional[float]:
+        """Returns a latency percentile of an operation.
+
+        Args:
+            operation (str): Name of the operation.
+            percentile (float): Percentile between 0 and 100.
+
+        Returns:
+            Optional[float]: The latency in seconds, or None if no request of the operation was recorded.
+        """
+        with self._lock:
+            histogram = self._histograms.get(operation)
+            return histogram.percentile(percentile) if histogram else None
+
+    def summary(self) -> Dict[str, LatencySummary]:
+        """Returns the latency statistics of all recorded operations.
+
+        Returns:
+            Dict[str, LatencySummary]: Statistics by operation name, slowest p99 first.
+        """
+        with self._lock:
+            summaries = {operation: histogram.summary() for operation, histogram in self._histograms.items()}
+        return dict(sorted(summaries.items(), key=lambda item: -item[1].p99))
+
+    def reset(self) -> None:
+        """Discards all recorded latencies."""
+        with self._lock:
+            self._histograms.clear()
+
+
+class OpenTelemetryHook(InstrumentationHook):
+    """Records every request as an OpenTelemetry client span named `daytona.<operation>`.
+
+    Spans are children of the span that is current when the request is sent. Requires the
+    `opentelemetry-api` package (`pip install daytona_sdk[otel]`) and a configured tracer provider.
+
+    Example:
+        ```python
+        daytona.add_hook(OpenTelemetryHook())
+        ```
+    """
+
+    def __init__(self, tracer: Any = None):
+        """Initializes the hook.
+
+        Args:
+            tracer (Any): OpenTelemetry tracer to create the spans with. Defaults to the tracer named
+                `daytona_sdk` of the global tracer provider.
+
+        Raises:
+            DaytonaError: If the `opentelemetry-api` package is not installed.
+        """
+        try:
+            from opentelemetry import trace  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            raise DaytonaError(  # pylint: disable=raise-missing-from
+                "OpenTelemetry support requires the 'opentelemetry-api' package. "
+                "Install it with `pip install daytona_sdk[otel]`."
+            )
+        self._trace = trace
+        self._tracer = tracer or trace.get_tracer("daytona_sdk")
+
+    def on_start(self, event: OperationEvent) -> None:
+        attributes: Dict[str, Any] = {
+            "http.request.method": event.method,
+            "url.full": event.url,
+            "daytona.operation": event.operation,
+        }
+        if event.sandbox_id:
+            attributes["daytona.sandbox.id"] = event.sandbox_id
+        event.context["otel_span"] = self._tracer.start_span(
+            f"daytona.{event.operation}",
+            kind=self._trace.SpanKind.CLIENT,
+            attributes=attributes,
+            start_time=int(event.start_time * 1e9),
+        )
+
+    def on_end(self, event: OperationEvent) -> None:
+        span = event.context.pop("otel_span", None)
+        if span is None:
+            return
+        attributes: Dict[str, Any] = {
+            "daytona.retries": event.retries,
+            "http.request.body.size": event.bytes_sent,
+            "http.response.body.size": event.bytes_received,
+        }
+        if event.status is not None:
+            attributes["http.response.status_code"] = event.status
+        span.set_attributes(attributes)
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, str(event.error)))
+        elif event.status is not None and event.status >= 400:
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+        span.end(end_time=int((event.start_time + (event.duration or 0.0)) * 1e9))
@@ -0,0 +1,419 @@
+import hashlib
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Deque, Dict, List, Optional, Tuple
+
+from ._utils.errors import intercept_errors
+from .common.errors import DaytonaError
+from .daytona import CreateSandboxParams, Daytona, _with_default_language
+from .sandbox import Sandbox
+
+POOL_LABEL = "daytona-pool"
+POOL_PROFILE_LABEL = "daytona-pool-profile"
+
+
+@dataclass
+class SandboxReturnPolicy(str, Enum):
+    """What a `SandboxPool` does with a Sandbox that is checked back in.
+
+    **Enum Members**:
+        - `REUSE` ("reuse"): The Sandbox is put back into the pool as is.
+        - `RESTART` ("restart"): The Sandbox is stopped and started again before it is put back into the pool.
+        - `DELETE` ("delete"): The Sandbox is deleted and replaced by a freshly created one.
+    """
+
+    REUSE = "reuse"
+    RESTART = "restart"
+    DELETE = "delete"
+
+    def __str__(self):
+        return self.value
+
+    def __eq__(self, other):
+        if isinstance(other, str):
+            return self.value == other
+        return super().__eq__(other)
+
+
+@dataclass
+class SandboxPoolMetrics:
+    """Usage statistics of a `SandboxPool`.
+
+    Attributes:
+        hits (int): Checkouts served from a pre-started Sandbox.
+        misses (int): Checkouts that had to create a Sandbox on demand.
+        refills (int): Sandboxes created and started in the background.
+        refill_failures (int): Background creations that failed.
+        recycled (int): Checked in Sandboxes that were put back into the pool.
+        deleted (int): Sandboxes deleted by the pool (on check-in, when expired or on close).
+        refill_latency_total (float): Sum of the background creation latencies in seconds.
+        last_refill_latency (Optional[float]): Latency of the last background creation in seconds.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    refills: int = 0
+    refill_failures: int = 0
+    recycled: int = 0
+    deleted: int = 0
+    refill_latency_total: float = 0.0
+    last_refill_latency: Optional[float] = None
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of checkouts served from the pool, between 0 and 1."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @property
+    def average_refill_latency(self) -> Optional[float]:
+        """Average latency of a background creation in seconds, None if nothing was created yet."""
+        return self.refill_latency_total / self.refills if self.refills else None
+
+
+@dataclass
+class _Profile:
+    params: CreateSandboxParams
+    size: int
+    idle: Deque[Tuple[Sandbox, float]] = field(default_factory=deque)
+    creating: int = 0
+
+
+class SandboxPool:
+    """Keeps pre-started Sandboxes ready to be handed out, so callers do not pay the Sandbox creation
+    and start latency on every request.
+
+    Sandboxes are grouped by profile: every distinct `CreateSandboxParams` gets its own set of `size` idle
+    Sandboxes. Checking out a Sandbox takes one from the profile in constant time, and a background thread
+    creates replacements. Sandboxes created by the pool are labeled with the pool ID and profile so that
+    leftovers can be found with `Daytona.list`.
+
+    Attributes:
+        id (str): Unique identifier of the pool, used as the value of the `daytona-pool` label.
+        size (int): Default number of idle Sandboxes kept per profile.
+        return_policy (SandboxReturnPolicy): Default handling of checked in Sandboxes.
+
+    Example:
+        ```python
+        with SandboxPool(daytona, size=3) as pool:
+            pool.warm(CreateSandboxParams(language="python"))
+            sandbox = pool.checkout(CreateSandboxParams(language="python"))
+            try:
+                sandbox.process.code_run("print('Hello')")
+            finally:
+                pool.checkin(sandbox)
+            print(f"Hit rate: {pool.metrics.hit_rate:.0%}")
+        ```
+    """
+
+    def __init__(
+        self,
+        daytona: Daytona,
+        size: int = 1,
+        return_policy: SandboxReturnPolicy = SandboxReturnPolicy.DELETE,
+        max_uses: Optional[int] = None,
+        max_idle: Optional[float] = 600,
+        refill_concurrency: int = 4,
+        timeout: Optional[float] = 60,
+    ):
+        """Initializes a new Sandbox pool. No Sandboxes are created until a profile is warmed or checked out.
+
+        Args:
+            daytona (Daytona): Client used to create and manage the Sandboxes.
+            size (int): Number of idle Sandboxes to keep per profile. Default is 1.
+            return_policy (SandboxReturnPolicy): Default handling of checked in Sandboxes. Default is
+                `SandboxReturnPolicy.DELETE`, which never hands out a used Sandbox twice.
+            max_uses (Optional[int]): Number of checkouts after which a Sandbox is deleted instead of
+                being put back. None means no limit.
+            max_idle (Optional[float]): Time in seconds after which an idle Sandbox is replaced, which should be
+                shorter than the auto-stop interval of the Sandboxes. None means idle Sandboxes never expire.
+                Default is 600 seconds.
+            refill_concurrency (int): Maximum number of Sandboxes created in the background at the same time.
+                Default is 4.
+            timeout (Optional[float]): Timeout (in seconds) for creating, starting and stopping a Sandbox.
+                0 means no timeout. Default is 60 seconds.
+
+        Raises:
+            DaytonaError: If size is negative or refill_concurrency is not positive.
+        """
+        if size < 0:
+            raise DaytonaError("Pool size must be a non-negative integer")
+        if refill_concurrency < 1:
+            raise DaytonaError("Refill concurrency must be a positive integer")
+
+        self.id = uuid.uuid4().hex[:12]
+        self.size = size
+        self.return_policy = SandboxReturnPolicy(return_policy)
+        self._daytona = daytona
+        self._max_uses = max_uses
+        self._max_idle = max_idle
+        self._timeout = timeout
+        self._metrics = SandboxPoolMetrics()
+        self._profiles: Dict[str, _Profile] = {}
+        self._checked_out: Dict[str, Tuple[str, int]] = {}
+        self._uses: Dict[str, int] = {}
+        self._condition = threading.Condition()
+        self._closed = False
+        self._retry_at = 0.0
+        self._failures = 0
+        self._executor = ThreadPoolExecutor(max_workers=refill_concurrency, thread_name_prefix="daytona-pool")
+        self._refill_thread = threading.Thread(target=self._refill_loop, name="daytona-pool-refill", daemon=True)
+        self._refill_thread.start()
+
+    def __enter__(self) -> "SandboxPool":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @property
+    def metrics(self) -> SandboxPoolMetrics:
+        """Snapshot of the pool usage statistics.
+
+        Returns:
+            SandboxPoolMetrics: Hit/miss counters and background creation latencies.
+        """
+        with self._condition:
+            return SandboxPoolMetrics(**self._metrics.__dict__)
+
+    def warm(self, params: Optional[CreateSandboxParams] = None, size: Optional[int] = None) -> None:
+        """Registers a profile and starts filling it in the background. Profiles are also registered
+        on their first checkout, so warming is only needed to avoid the first miss.
+
+        Args:
+            params (Optional[CreateSandboxParams]): Parameters of the profile. Defaults to a Python Sandbox.
+            size (Optional[int]): Number of idle Sandboxes to keep for this profile. Defaults to the pool size.
+
+        Example:
+            ```python
+            pool.warm(CreateSandboxParams(language="typescript"), size=5)
+            ```
+        """
+        with self._condition:
+            self.__ensure_open()
+            profile = self.__get_profile(params)
+            if size is not None:
+                profile.size = size
+            self._condition.notify_all()
+
+    @intercept_errors(message_prefix="Failed to check out sandbox: ")
+    def checkout(self, params: Optional[CreateSandboxParams] = None) -> Sandbox:
+        """Takes a started Sandbox of the given profile out of the pool. If the pool has no idle Sandbox
+        for the profile, one is created on demand.
+
+        Args:
+            params (Optional[CreateSandboxParams]): Parameters of the profile. Defaults to a Python Sandbox.
+
+        Returns:
+            Sandbox: A started Sandbox, owned by the caller until it is checked in.
+
+        Raises:
+            DaytonaError: If the pool is closed or the Sandbox can not be created.
+
+        Example:
+            ```python
+            sandbox = pool.checkout()
+            response = sandbox.process.exec("echo 'Hello'")
+            pool.checkin(sandbox)
+            ```
+        """
+        with self._condition:
+            self.__ensure_open()
+            key = self.__profile_key(params)
+            profile = self.__get_profile(params)
+            sandbox = profile.idle.popleft()[0] if profile.idle else None
+            if sandbox:
+                self._metrics.hits += 1
+            else:
+                self._metrics.misses += 1
+            # Wake up the refill thread to replace the Sandbox
+            self._condition.notify_all()
+            profile_params = profile.params
+
+        if sandbox is None:
+            sandbox = self._daytona.create(profile_params, self._timeout)
+
+        with self._condition:
+            uses = self._uses.pop(sandbox.id, 0) + 1
+            self._checked_out[sandbox.id] = (key, uses)
+        return sandbox
+
+    @intercept_errors(message_prefix="Failed to check in sandbox: ")
+    def checkin(self, sandbox: Sandbox, return_policy: Optional[SandboxReturnPolicy] = None) -> None:
+        """Returns a checked out Sandbox to the pool. The Sandbox is recycled in the background according to
+        the return policy and must not be used by the caller afterwards.
+
+        Args:
+            sandbox (Sandbox): Sandbox obtained from `checkout`.
+            return_policy (Optional[SandboxReturnPolicy]): Handling of this Sandbox. Defaults to the pool
+                return policy.
+
+        Raises:
+            DaytonaError: If the Sandbox was not checked out from this pool.
+
+        Example:
+            ```python
+            pool.checkin(sandbox, SandboxReturnPolicy.RESTART)
+            ```
+        """
+        policy = SandboxReturnPolicy(return_policy or self.return_policy)
+        with self._condition:
+            if sandbox.id not in self._checked_out:
+                raise DaytonaError(f"Sandbox {sandbox.id} is not checked out from this pool")
+            key, uses = self._checked_out.pop(sandbox.id)
+            closed = self._closed
+            if self._max_uses is not None and uses >= self._max_uses:
+                policy = SandboxReturnPolicy.DELETE
+            if not closed:
+                if policy == SandboxReturnPolicy.REUSE:
+                    self.__put_back(key, sandbox, uses)
+                else:
+                    # Submitted with the lock held, so close() can not shut the executor down in between
+                    self._executor.submit(self._recycle, key, sandbox, uses, policy)
+                return
+
+        self._delete(sandbox)
+
+    def close(self, delete: bool = True) -> None:
+        """Stops the background refill and optionally deletes the idle Sandboxes. Sandboxes that are
+        checked out are left untouched and are deleted when they are checked in.
+
+        Args:
+            delete (bool): Whether to delete the idle Sandboxes. Default is True.
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            idle = [sandbox for profile in self._profiles.values() for sandbox, _ in profile.idle]
+            for profile in self._profiles.values():
+                profile.idle.clear()
+            self._condition.notify_all()
+
+        self._refill_thread.join()
+        if delete:
+            for sandbox in idle:
+                self._executor.submit(self._delete, sandbox)
+        self._executor.shutdown(wait=True)
+
+    def _recycle(self, key: str, sandbox: Sandbox, uses: int, policy: SandboxReturnPolicy) -> None:
+        """Applies the return policy to a checked in Sandbox. Runs on the pool executor."""
+        if policy == SandboxReturnPolicy.RESTART:
+            try:
+                sandbox.stop(self._timeout)
+                sandbox.start(self._timeout)
+            except DaytonaError:
+                self._delete(sandbox)
+                return
+            with self._condition:
+                if not self._closed:
+                    self.__put_back(key, sandbox, uses)
+                    return
+        self._delete(sandbox)
+
+    def _delete(self, sandbox: Sandbox) -> None:
+        """Deletes a Sandbox owned by the pool, ignoring errors. Runs on the pool executor."""
+        try:
+            self._daytona.delete(sandbox, self._timeout)
+        except DaytonaError:
+            return
+        with self._condition:
+            self._metrics.deleted += 1
+            self._condition.notify_all()
+
+    def _refill(self, key: str) -> None:
+        """Creates and starts one Sandbox for a profile. Runs on the pool executor."""
+        start = time.monotonic()
+        with self._condition:
+            params = self._profiles[key].params
+        try:
+            # Creation also resolves the root directory, so the first relative path operation does not pay for it
+            sandbox = self._daytona.create(params, self._timeout)
+        except DaytonaError:
+            with self._condition:
+                self._profiles[key].creating -= 1
+                self._metrics.refill_failures += 1
+                self._failures += 1
+                self._retry_at = time.monotonic() + min(30.0, 2 ** (self._failures - 1))
+                self._condition.notify_all()
+            return
+
+        latency = time.monotonic() - start
+        with self._condition:
+            profile = self._profiles[key]
+            profile.creating -= 1
+            self._metrics.refills += 1
+            self._metrics.refill_latency_total += latency
+            self._metrics.last_refill_latency = latency
+            self._failures = 0
+            if self._closed:
+                closed = True
+            else:
+                closed = False
+                profile.idle.append((sandbox, time.monotonic()))
+            self._condition.notify_all()
+        if closed:
+            self._delete(sandbox)
+
+    def _refill_loop(self) -> None:
+        """Keeps every profile filled up to its size and replaces expired idle Sandboxes."""
+        while True:
+            with self._condition:
+                if self._closed:
+                    return
+                expired = self.__pop_expired()
+                if time.monotonic() >= self._retry_at:
+                    for key, profile in self._profiles.items():
+                        for _ in range(profile.size - len(profile.idle) - profile.creating):
+                            profile.creating += 1
+                            self._executor.submit(self._refill, key)
+                self._condition.wait(timeout=1.0)
+
+            for sandbox in expired:
+                self._executor.submit(self._delete, sandbox)
+
+    def __pop_expired(self) -> List[Sandbox]:
+        """Removes the idle Sandboxes that exceeded the maximum idle time. Must be called with the lock held."""
+        if self._max_idle is None:
+            return []
+        expired = []
+        now = time.monotonic()
+        for profile in self._profiles.values():
+            while profile.idle and now - profile.idle[0][1] >= self._max_idle:
+                expired.append(profile.idle.popleft()[0])
+        return expired
+
+    def __put_back(self, key: str, sandbox: Sandbox, uses: int) -> None:
+        """Returns a Sandbox to its profile. Must be called with the lock held."""
+        self._uses[sandbox.id] = uses
+        self._profiles[key].idle.append((sandbox, time.monotonic()))
+        self._metrics.recycled += 1
+        self._condition.notify_all()
+
+    def __get_profile(self, params: Optional[CreateSandboxParams]) -> _Profile:
+        """Returns the profile for the given parameters, registering it if needed. Must be called with the
+        lock held."""
+        key = self.__profile_key(params)
+        if key not in self._profiles:
+            params = self.__with_pool_labels(params, key)
+            self._profiles[key] = _Profile(params=params, size=self.size)
+        return self._profiles[key]
+
+    def __profile_key(self, params: Optional[CreateSandboxParams]) -> str:
+        params = _with_default_language(params, self._daytona.default_language)
+        data = params.model_dump_json(exclude={"timeout"})
+        return hashlib.sha256(data.encode()).hexdigest()[:16]
+
+    def __with_pool_labels(self, params: Optional[CreateSandboxParams], key: str) -> CreateSandboxParams:
+        params = _with_default_language(params, self._daytona.default_language)
+        labels = {**(params.labels or {}), POOL_LABEL: self.id, POOL_PROFILE_LABEL: key}
+        return params.model_copy(update={"labels": labels})
+
+    def __ensure_open(self) -> None:
+        if self._closed:
+            raise DaytonaError("Sandbox pool is closed")
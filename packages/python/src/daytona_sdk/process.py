@@ -2,20 +2,27 @@ import asyncio
 import base64
 import json
 import warnings
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Union
 
-import httpx
-from daytona_api_client import Command, CreateSessionRequest, ExecuteRequest, Session
+from daytona_api_client import Command, CreateSessionRequest, ExecuteRequest
+from daytona_api_client import ExecuteResponse as ClientExecuteResponse
+from daytona_api_client import Session
 from daytona_api_client import SessionExecuteRequest as ApiSessionExecuteRequest
 from daytona_api_client import SessionExecuteResponse, ToolboxApi
+from daytona_sdk._utils import compression as compression_utils
 from daytona_sdk._utils.errors import intercept_errors
 from pydantic import model_validator
 
 from .charts import parse_chart
 from .code_toolbox.sandbox_python_code_toolbox import SandboxPythonCodeToolbox
 from .common.code_run_params import CodeRunParams
+from .common.compression import DEFAULT_COMPRESSION_THRESHOLD, Compression
 from .common.execute_response import ExecuteResponse, ExecutionArtifacts
 from .protocols import SandboxInstance
+from .transport import get_transport
+
+# First line of the output of a command whose output was compressed
+_COMPRESSED_OUTPUT_MARKER = "__DAYTONA_COMPRESSED_OUTPUT__"
 
 
 class SessionExecuteRequest(ApiSessionExecuteRequest):
@@ -101,6 +108,106 @@ class Process:
 
         return artifacts
 
+    @staticmethod
+    def _build_command(command: str, env: Optional[Dict[str, str]] = None) -> str:
+        """
+        Wrap a shell command so that it can be safely passed to the toolbox API.
+
+        Args:
+            command: The shell command to execute
+            env: Environment variables to export before running the command
+
+        Returns:
+            str: The wrapped command
+        """
+        base64_user_cmd = base64.b64encode(command.encode()).decode()
+        command = f"echo '{base64_user_cmd}' | base64 -d | sh"
+
+        if env and len(env.items()) > 0:
+            safe_env_exports = (
+                ";".join(
+                    [
+                        f"export {key}=$(echo '{base64.b64encode(value.encode()).decode()}' | base64 -d)"
+                        for key, value in env.items()
+                    ]
+                )
+                + ";"
+            )
+            command = f"{safe_env_exports} {command}"
+
+        return f'sh -c "{command}"'
+
+    @staticmethod
+    def _build_compressed_command(
+        command: str, env: Optional[Dict[str, str]], compression: Compression, threshold: int
+    ) -> str:
+        """
+        Wrap a shell command so that its output is compressed and base64-encoded in the Sandbox if it reaches
+        the threshold. Smaller output is returned as it is. The exit code of the command is preserved.
+
+        Args:
+            command: The shell command to execute
+            env: Environment variables to export before running the command
+            compression: The compression algorithm
+            threshold: Size of the output in bytes from which it is compressed
+
+        Returns:
+            str: The wrapped command
+        """
+        script = (
+            "out=$(mktemp) || exit 1\n"
+            f'{Process._build_command(command, env)} > "$out" 2>&1\n'
+            "code=$?\n"
+            f'if [ $(wc -c < "$out") -ge {threshold} ]; then\n'
+            f"  echo '{_COMPRESSED_OUTPUT_MARKER}'\n"
+            f'  {compression_utils.shell_compress(compression)} < "$out" | base64\n'
+            'else cat "$out"; fi\n'
+            'rm -f "$out"\n'
+            "exit $code"
+        )
+        return Process._build_command(script)
+
+    @staticmethod
+    def _decompress_response(response: ClientExecuteResponse, compression: Compression) -> ClientExecuteResponse:
+        """
+        Restore the output of a command built with `_build_compressed_command`.
+
+        Args:
+            response: The response returned by the toolbox API
+            compression: The compression algorithm the command was built with
+
+        Returns:
+            ClientExecuteResponse: The response with the decompressed output
+        """
+        if not response.result.startswith(_COMPRESSED_OUTPUT_MARKER + "\n"):
+            return response
+        data = base64.b64decode(response.result[len(_COMPRESSED_OUTPUT_MARKER) + 1 :])
+        result = compression_utils.decompress_bytes(data, compression).decode("utf-8", errors="replace")
+        return response.model_copy(update={"result": result})
+
+    @staticmethod
+    def _to_execute_response(response: ClientExecuteResponse) -> ExecuteResponse:
+        """
+        Convert the toolbox API response to an ExecuteResponse with parsed artifacts.
+
+        Args:
+            response: The response returned by the toolbox API
+
+        Returns:
+            ExecuteResponse: The response with processed output and charts
+        """
+        # Post-process the output to extract ExecutionArtifacts
+        artifacts = Process._parse_output(response.result.splitlines())
+
+        # Create new response with processed output and charts
+        # TODO: Remove model_construct once everything is migrated to pydantic # pylint: disable=fixme
+        return ExecuteResponse.model_construct(
+            exit_code=response.exit_code,
+            result=artifacts.stdout,
+            artifacts=artifacts,
+            additional_properties=response.additional_properties,
+        )
+
     @intercept_errors(message_prefix="Failed to execute command: ")
     def exec(
         self,
@@ -108,6 +215,8 @@ class Process:
         cwd: Optional[str] = None,
         env: Optional[Dict[str, str]] = None,
         timeout: Optional[int] = None,
+        compression: Optional[Union[Compression, str]] = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
     ) -> ExecuteResponse:
         """Execute a shell command in the Sandbox.
 
@@ -118,6 +227,11 @@ class Process:
             env (Optional[Dict[str, str]]): Environment variables to set for the command.
             timeout (Optional[int]): Maximum time in seconds to wait for the command
                 to complete. 0 means wait indefinitely.
+            compression (Optional[Union[Compression, str]]): Algorithm to compress large output with in the
+                Sandbox before it is sent back, which cuts the transfer of text-heavy output several times.
+                With compression, standard error is merged into the output. Not compressed by default.
+            compression_threshold (int): Size of the output in bytes from which it is compressed. Default is
+                64 KiB.
 
         Returns:
             ExecuteResponse: Command execution results containing:
@@ -137,43 +251,25 @@ class Process:
 
             # Command with timeout
             result = sandbox.process.exec("sleep 10", timeout=5)
+
+            # Command with large output
+            result = sandbox.process.exec("cat data.jsonl", compression=Compression.GZIP)
             ```
         """
-        base64_user_cmd = base64.b64encode(command.encode()).decode()
-        command = f"echo '{base64_user_cmd}' | base64 -d | sh"
-
-        if env and len(env.items()) > 0:
-            safe_env_exports = (
-                ";".join(
-                    [
-                        f"export {key}=$(echo '{base64.b64encode(value.encode()).decode()}' | base64 -d)"
-                        for key, value in env.items()
-                    ]
-                )
-                + ";"
-            )
-            command = f"{safe_env_exports} {command}"
-
-        command = f'sh -c "{command}"'
-        execute_request = ExecuteRequest(
-            command=command, cwd=cwd or self._get_root_dir(), timeout=timeout
-        )
+        if compression is not None:
+            compression = compression_utils.resolve(compression)
+            wrapped = Process._build_compressed_command(command, env, compression, compression_threshold)
+        else:
+            wrapped = Process._build_command(command, env)
+        execute_request = ExecuteRequest(command=wrapped, cwd=cwd or self._get_root_dir(), timeout=timeout)
 
         response = self.toolbox_api.execute_command(
             workspace_id=self.instance.id, execute_request=execute_request
         )
+        if compression is not None:
+            response = Process._decompress_response(response, compression)
 
-        # Post-process the output to extract ExecutionArtifacts
-        artifacts = Process._parse_output(response.result.splitlines())
-
-        # Create new response with processed output and charts
-        # TODO: Remove model_construct once everything is migrated to pydantic # pylint: disable=fixme
-        return ExecuteResponse.model_construct(
-            exit_code=response.exit_code,
-            result=artifacts.stdout,
-            artifacts=artifacts,
-            additional_properties=response.additional_properties,
-        )
+        return Process._to_execute_response(response)
 
     def code_run(
         self,
@@ -419,39 +515,39 @@ class Process:
         )
         headers = self.toolbox_api.api_client.default_headers
 
-        async with httpx.AsyncClient(timeout=None) as client:
-            async with client.stream("GET", url, headers=headers) as response:
-                stream = response.aiter_bytes()
-                next_chunk = None
-                exit_code_seen_count = 0
+        client = get_transport(self.toolbox_api.api_client).async_client()
+        async with client.stream("GET", url, headers=headers, timeout=None) as response:
+            stream = response.aiter_bytes()
+            next_chunk = None
+            exit_code_seen_count = 0
 
-                while True:
-                    if next_chunk is None:
-                        next_chunk = asyncio.create_task(anext(stream, None))
-                    timeout = asyncio.create_task(asyncio.sleep(2))
+            while True:
+                if next_chunk is None:
+                    next_chunk = asyncio.create_task(anext(stream, None))
+                timeout = asyncio.create_task(asyncio.sleep(2))
 
-                    done, pending = await asyncio.wait(
-                        [next_chunk, timeout], return_when=asyncio.FIRST_COMPLETED
-                    )
+                done, pending = await asyncio.wait(
+                    [next_chunk, timeout], return_when=asyncio.FIRST_COMPLETED
+                )
 
-                    if next_chunk in done:
-                        timeout.cancel()
-                        chunk = next_chunk.result()
-                        next_chunk = None
+                if next_chunk in done:
+                    timeout.cancel()
+                    chunk = next_chunk.result()
+                    next_chunk = None
 
-                        if chunk is None:
-                            break
+                    if chunk is None:
+                        break
 
-                        on_logs(chunk.decode("utf-8"))
-                    elif timeout in done:
-                        cmd_status = self.get_session_command(session_id, command_id)
+                    on_logs(chunk.decode("utf-8"))
+                elif timeout in done:
+                    cmd_status = self.get_session_command(session_id, command_id)
 
-                        if cmd_status.exit_code is not None:
-                            exit_code_seen_count += 1
-                            if exit_code_seen_count > 1:
-                                if next_chunk in pending:
-                                    next_chunk.cancel()
-                                break
+                    if cmd_status.exit_code is not None:
+                        exit_code_seen_count += 1
+                        if exit_code_seen_count > 1:
+                            if next_chunk in pending:
+                                next_chunk.cancel()
+                            break
 
     @intercept_errors(message_prefix="Failed to list sessions: ")
     def list_sessions(self) -> List[Session]:
@@ -0,0 +1,238 @@
+import asyncio
+import collections
+import math
+import threading
+import time
+from typing import Callable, Deque, Dict, Optional
+
+from pydantic import BaseModel
+
+from ._utils.routes import FILE_TRANSFER, LIFECYCLE, TOOLBOX
+
+
+class RateLimit(BaseModel):
+    """Limits for one class of Daytona API endpoints.
+
+    Attributes:
+        requests_per_second (Optional[float]): Sustained request rate. Requests above the rate wait for their
+            turn instead of being rejected by the API. None means no rate limit. Default is None.
+        burst (Optional[int]): Number of requests that may be sent at once before the rate applies. Defaults to
+            one second worth of requests.
+        max_in_flight (Optional[int]): Maximum number of concurrent requests. A request holds its slot until its
+            response has been read. None means no limit. Default is None.
+    """
+
+    requests_per_second: Optional[float] = None
+    burst: Optional[int] = None
+    max_in_flight: Optional[int] = None
+
+
+class RateLimitConfig(BaseModel):
+    """Client-side limits for the requests of a Daytona client, per class of API endpoints.
+
+    The limits are shared by all threads, event loops and Sandboxes of the client, so fanning out work
+    keeps the request rate at the limit instead of running into HTTP 429 responses.
+
+    Attributes:
+        lifecycle (RateLimit): Sandbox and volume management, e.g. creating, starting and listing Sandboxes.
+        toolbox (RateLimit): Operations inside a Sandbox, e.g. executing commands, git and file system
+            operations.
+        file_transfer (RateLimit): File uploads and downloads.
+
+    Example:
+        ```python
+        config = DaytonaConfig(
+            api_key="your-api-key",
+            rate_limits=RateLimitConfig(
+                toolbox=RateLimit(requests_per_second=50, max_in_flight=20),
+                file_transfer=RateLimit(max_in_flight=8),
+            ),
+        )
+        daytona = Daytona(config)
+        ```
+    """
+
+    lifecycle: RateLimit = RateLimit()
+    toolbox: RateLimit = RateLimit()
+    file_transfer: RateLimit = RateLimit()
+
+
+class TokenBucket:
+    """Thread-safe token bucket. Callers reserve a token and wait until it becomes available, so waiting
+    callers are served in order and the rate holds across threads and event loops."""
+
+    def __init__(self, rate: float, capacity: Optional[int] = None):
+        self._rate = rate
+        self._capacity = capacity or max(1, math.ceil(rate))
+        self._tokens = float(self._capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, max_delay: Optional[float] = None) -> Optional[float]:
+        """Takes a token.
+
+        Args:
+            max_delay (Optional[float]): Longest acceptable wait in seconds. No token is taken if the next one
+                becomes available later. None means no limit.
+
+        Returns:
+            Optional[float]: Time in seconds to wait before the token may be used, or None if no token was taken.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            delay = 0.0 if self._tokens >= 1 else (1 - self._tokens) / self._rate
+            if max_delay is not None and delay > max_delay:
+                return None
+            self._tokens -= 1
+            return delay
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Blocks until a token is available.
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait in seconds. None means no timeout.
+
+        Returns:
+            bool: Whether a token was taken. No token is taken if none becomes available within the timeout.
+        """
+        delay = self.reserve(timeout)
+        if delay is None:
+            return False
+        if delay > 0:
+            time.sleep(delay)
+        return True
+
+    async def acquire_async(self, timeout: Optional[float] = None) -> bool:
+        """Waits until a token is available without blocking the event loop.
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait in seconds. None means no timeout.
+
+        Returns:
+            bool: Whether a token was taken. No token is taken if none becomes available within the timeout.
+        """
+        delay = self.reserve(timeout)
+        if delay is None:
+            return False
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return True
+
+
+class ConcurrencyLimiter:
+    """Semaphore usable from threads and event loops at the same time. Released slots are handed to the
+    longest waiting caller."""
+
+    def __init__(self, limit: int):
+        self._limit = limit
+        self._active = 0
+        self._waiters: Deque[Callable[[], None]] = collections.deque()
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Blocks until a slot is free.
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait in seconds. None means no timeout.
+
+        Returns:
+            bool: Whether a slot was taken. A caller that times out leaves the queue of waiting callers.
+        """
+        with self._lock:
+            if self._active < self._limit and not self._waiters:
+                self._active += 1
+                return True
+            event = threading.Event()
+            wake = event.set
+            self._waiters.append(wake)
+        if event.wait(timeout):
+            return True
+        with self._lock:
+            if wake in self._waiters:
+                self._waiters.remove(wake)
+                return False
+        # The slot was handed over right after the timeout
+        return True
+
+    async def acquire_async(self, timeout: Optional[float] = None) -> bool:
+        """Waits until a slot is free without blocking the event loop.
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait in seconds. None means no timeout.
+
+        Returns:
+            bool: Whether a slot was taken. A caller that times out leaves the queue of waiting callers.
+        """
+        if timeout is None:
+            await self.__acquire_async()
+            return True
+        try:
+            # On timeout the wait is cancelled, which removes the caller from the queue
+            await asyncio.wait_for(self.__acquire_async(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def __acquire_async(self) -> None:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def wake() -> None:
+            loop.call_soon_threadsafe(self.__hand_over, future)
+
+        with self._lock:
+            if self._active < self._limit and not self._waiters:
+                self._active += 1
+                return
+            self._waiters.append(wake)
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                waiting = wake in self._waiters
+                if waiting:
+                    self._waiters.remove(wake)
+            if not waiting and future.done() and not future.cancelled():
+                # The slot was handed over right before the cancellation
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Frees a slot, handing it to the next waiting caller if there is one."""
+        with self._lock:
+            if not self._waiters:
+                self._active -= 1
+                return
+            wake = self._waiters.popleft()
+        wake()
+
+    def __hand_over(self, future: "asyncio.Future[None]") -> None:
+        if future.cancelled():
+            # The waiter gave up after the slot was handed to it, so pass the slot on
+            self.release()
+        else:
+            future.set_result(None)
+
+
+class RateLimiter:
+    """Token buckets and concurrency limiters of a client, one per class of API endpoints."""
+
+    def __init__(self, config: RateLimitConfig):
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.limiters: Dict[str, ConcurrencyLimiter] = {}
+        for endpoint_class, limit in (
+            (LIFECYCLE, config.lifecycle),
+            (TOOLBOX, config.toolbox),
+            (FILE_TRANSFER, config.file_transfer),
+        ):
+            if limit.requests_per_second:
+                self.buckets[endpoint_class] = TokenBucket(limit.requests_per_second, limit.burst)
+            if limit.max_in_flight:
+                self.limiters[endpoint_class] = ConcurrencyLimiter(limit.max_in_flight)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any limit is configured."""
+        return bool(self.buckets or self.limiters)
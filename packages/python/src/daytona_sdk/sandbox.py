@@ -1,5 +1,4 @@
 import json
-import time
 from dataclasses import dataclass
 from enum import Enum
 from typing import Annotated, Dict, Optional
@@ -15,7 +14,9 @@ from pydantic import Field
 
 from ._utils.enum import to_enum
 from ._utils.errors import intercept_errors
-from ._utils.timeout import with_timeout
+from ._utils.root_dir_cache import RootDirCache
+from ._utils.state_watcher import SandboxStateWatcher
+from ._utils.timeout import remaining_timeout, with_timeout
 from .common.errors import DaytonaError
 from .filesystem import FileSystem
 from .git import Git
@@ -182,7 +183,9 @@ class Sandbox:
         self.sandbox_api = sandbox_api
         self.toolbox_api = toolbox_api
         self._code_toolbox = code_toolbox
-        self._root_dir = ""
+        # Root directories are shared by all Sandbox objects of a client, so only the first one resolves it
+        self._root_dir_cache = RootDirCache.for_api_client(toolbox_api.api_client)
+        self._root_dir = self._root_dir_cache.get(id) or ""
 
         self.fs = FileSystem(instance, toolbox_api, self.__get_root_dir)
         self.git = Git(self, toolbox_api, instance, self.__get_root_dir)
@@ -220,6 +223,7 @@ class Sandbox:
             ```
         """
         response = self.toolbox_api.get_project_dir(self.instance.id)
+        self._root_dir_cache.set(self.id, response.dir)
         return response.dir
 
     @deprecated(
@@ -228,6 +232,22 @@ class Sandbox:
     def get_workspace_root_dir(self) -> str:
         return self.get_user_root_dir()
 
+    def prefetch_root_dir(self) -> None:
+        """Resolves the root directory ahead of the first operation with a relative path, so that operation
+        does not pay for the extra round trip. Does nothing if the root directory is already known. Errors are
+        ignored, as the root directory is then resolved on first use.
+
+        Example:
+            ```python
+            sandbox.prefetch_root_dir()
+            sandbox.fs.upload_file(b"Hello", "hello.txt")
+            ```
+        """
+        try:
+            self.__get_root_dir()
+        except DaytonaError:
+            pass
+
     def create_lsp_server(
         self, language_id: LspLanguageId, path_to_project: str
     ) -> LspServer:
@@ -308,8 +328,9 @@ class Sandbox:
             print("Sandbox started successfully")
             ```
         """
-        self.sandbox_api.start_workspace(self.id, _request_timeout=timeout or None)
-        self.wait_for_sandbox_start()
+        self.sandbox_api.start_workspace(self.id, _request_timeout=remaining_timeout(timeout))
+        # The overall timeout is enforced by this method
+        self.wait_for_sandbox_start(0)
 
     @intercept_errors(message_prefix="Failed to stop sandbox: ")
     @with_timeout(
@@ -333,8 +354,9 @@ class Sandbox:
             print("Sandbox stopped successfully")
             ```
         """
-        self.sandbox_api.stop_workspace(self.id, _request_timeout=timeout or None)
-        self.wait_for_sandbox_stop()
+        self.sandbox_api.stop_workspace(self.id, _request_timeout=remaining_timeout(timeout))
+        # The overall timeout is enforced by this method
+        self.wait_for_sandbox_stop(0)
 
     def delete(self) -> None:
         """Deletes the Sandbox."""
@@ -366,7 +388,7 @@ class Sandbox:
     )
     def wait_for_sandbox_start(
         self,
-        timeout: Optional[float] = 60,  # pylint: disable=unused-argument
+        timeout: Optional[float] = 60,
     ) -> None:
         """Waits for the Sandbox to reach the 'started' state. Polls the Sandbox status until it
         reaches the 'started' state, encounters an error or times out.
@@ -377,17 +399,16 @@ class Sandbox:
         Raises:
             DaytonaError: If timeout is negative; If Sandbox fails to start or times out
         """
-        state = None
-        while state != "started":
-            response = self.sandbox_api.get_workspace(self.id)
-            state = response.state
-
-            if state == "error":
-                raise DaytonaError(
-                    f"Sandbox {self.id} failed to start with state: {state}, error reason: {response.error_reason}"
-                )
+        # State checks of all waiting Sandboxes are batched by the shared watcher
+        response = SandboxStateWatcher.for_api(self.sandbox_api).wait(
+            self.id, {"started"}, remaining_timeout(timeout), labels=self.instance.labels
+        )
+        self.instance.state = response.state
 
-            time.sleep(0.1)  # Wait 100ms between checks
+        if response.state == "error":
+            raise DaytonaError(
+                f"Sandbox {self.id} failed to start with state: {response.state}, error reason: {response.error_reason}"
+            )
 
     @deprecated(
         reason=(
@@ -416,7 +437,7 @@ class Sandbox:
     )
     def wait_for_sandbox_stop(
         self,
-        timeout: Optional[float] = 60,  # pylint: disable=unused-argument
+        timeout: Optional[float] = 60,
     ) -> None:
         """Waits for the Sandbox to reach the 'stopped' state. Polls the Sandbox status until it
         reaches the 'stopped' state, encounters an error or times out. It will wait up to 60 seconds
@@ -428,22 +449,17 @@ class Sandbox:
         Raises:
             DaytonaError: If timeout is negative. If Sandbox fails to stop or times out.
         """
-        state = None
-        while state != "stopped":
-            try:
-                response = self.sandbox_api.get_workspace(self.id)
-                state = response.state
-
-                if state == "error":
-                    raise DaytonaError(
-                        f"Sandbox {self.id} failed to stop with status: {state}, error reason: {response.error_reason}"
-                    )
-            except Exception as e:
-                # If there's a validation error, continue waiting
-                if "validation error" not in str(e):
-                    raise e
-
-            time.sleep(0.1)  # Wait 100ms between checks
+        # State checks of all waiting Sandboxes are batched by the shared watcher; validation errors
+        # are expected while the Sandbox is stopping, so the watcher keeps waiting on them
+        response = SandboxStateWatcher.for_api(self.sandbox_api).wait(
+            self.id, {"stopped"}, remaining_timeout(timeout), ignore_validation_errors=True, labels=self.instance.labels
+        )
+        self.instance.state = response.state
+
+        if response.state == "error":
+            raise DaytonaError(
+                f"Sandbox {self.id} failed to stop with status: {response.state}, error reason: {response.error_reason}"
+            )
 
     @intercept_errors(message_prefix="Failed to set auto-stop interval: ")
     def set_autostop_interval(self, interval: int) -> None:
@@ -553,5 +569,5 @@ class Sandbox:
 
     def __get_root_dir(self) -> str:
         if not self._root_dir:
-            self._root_dir = self.get_user_root_dir()
+            self._root_dir = self._root_dir_cache.get(self.id) or self.get_user_root_dir()
         return self._root_dir
@@ -0,0 +1,915 @@
+import asyncio
+import collections
+import email.utils
+import io
+import json
+import random
+import threading
+import time
+import weakref
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
+
+import httpx
+from daytona_api_client import ApiClient
+from pydantic import BaseModel
+
+from ._utils.routes import Route, classify, sandbox_id
+from ._utils.timeout import remaining_timeout
+from .common.errors import DaytonaError
+from .instrumentation import Instrumentation, OperationEvent
+from .rate_limit import RateLimitConfig, RateLimiter
+
+RequestTimeout = Union[None, float, Tuple[float, float]]
+
+# Request extension that disables retries of a request, e.g. for bodies that can not be sent twice
+NO_RETRY_EXTENSION = "daytona_no_retry"
+# Request extension holding the number of retries a request needed
+RETRIES_EXTENSION = "daytona_retries"
+# Request extension caching the API endpoint of a request
+_ROUTE_EXTENSION = "daytona_route"
+# Request extension holding the instrumentation event of a request
+_EVENT_EXTENSION = "daytona_event"
+
+
+class RetryConfig(BaseModel):
+    """Retry policy for failed requests of a Daytona client.
+
+    Requests that never reached the server (connection failures) and requests rejected with HTTP 429 are
+    retried for every operation. Read errors and HTTP 502, 503 and 504 responses are only retried for
+    operations that are safe to repeat: all GET requests (listing, file info, downloads) and idempotent
+    updates like file uploads and label replacement. Delays grow exponentially with full jitter, and a
+    `Retry-After` header sent by the server takes precedence. Retries never outlast the timeout of the
+    enclosing SDK operation.
+
+    To keep an outage from turning into a retry storm, the retries of a client are capped by a budget:
+    within `budget_window` seconds, at most `budget_min_retries` plus `budget_ratio` times the number
+    of requests sent in that window may be retried.
+
+    Attributes:
+        max_retries (int): Maximum number of retries of a single request. 0 disables retries. Default is 3.
+        backoff_base (float): Upper bound in seconds of the delay before the first retry. Default is 0.5 seconds.
+        backoff_max (float): Upper bound in seconds of the delay before any retry. Default is 10 seconds.
+        max_retry_after (float): Longest `Retry-After` delay in seconds that is honored. Responses asking for a
+            longer delay are returned as they are. Default is 60 seconds.
+        retry_on_status (List[int]): HTTP status codes that are retried. Default is 429, 502, 503 and 504.
+        budget_ratio (float): Share of requests that may be retried within the budget window. Default is 0.1.
+        budget_min_retries (int): Number of retries allowed within the budget window regardless of the
+            number of requests. Default is 10.
+        budget_window (float): Length of the budget window in seconds. Default is 10 seconds.
+
+    Example:
+        ```python
+        config = DaytonaConfig(
+            api_key="your-api-key",
+            transport=TransportConfig(retry=RetryConfig(max_retries=5, backoff_max=30)),
+        )
+        daytona = Daytona(config)
+        ```
+    """
+
+    max_retries: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 10.0
+    max_retry_after: float = 60.0
+    retry_on_status: List[int] = [429, 502, 503, 504]
+    budget_ratio: float = 0.1
+    budget_min_retries: int = 10
+    budget_window: float = 10.0
+
+
+class TransportConfig(BaseModel):
+    """HTTP connection settings of a Daytona client.
+
+    All requests of a client (API calls, file uploads and downloads, log streaming) share one connection
+    pool, so connections are reused instead of paying a new TCP and TLS handshake per request.
+
+    Attributes:
+        max_connections (int): Maximum number of open connections. Default is 100.
+        max_connections_per_host (Optional[int]): Maximum number of concurrent requests to a single host.
+            None means only `max_connections` applies. Default is 20.
+        max_keepalive_connections (int): Maximum number of idle connections kept open for reuse. Default is 20.
+        keepalive_expiry (float): Time in seconds after which an idle connection is closed. Default is 30 seconds.
+        http2 (bool): Whether to negotiate HTTP/2, which multiplexes concurrent requests over a single
+            connection. Requires the `http2` extra (`pip install daytona_sdk[http2]`). Default is False.
+        connect_timeout (Optional[float]): Timeout in seconds for establishing a connection. None means the
+            request timeout applies. Default is None.
+        retry (RetryConfig): Retry policy for failed requests. Default is `RetryConfig()`.
+
+    Example:
+        ```python
+        config = DaytonaConfig(
+            api_key="your-api-key",
+            transport=TransportConfig(max_connections=200, http2=True),
+        )
+        daytona = Daytona(config)
+        ```
+    """
+
+    max_connections: int = 100
+    max_connections_per_host: Optional[int] = 20
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    http2: bool = False
+    connect_timeout: Optional[float] = None
+    retry: RetryConfig = RetryConfig()
+
+
+class HttpxRESTResponse(io.IOBase):
+    """Adapts an `httpx.Response` to the response interface expected by the generated API client."""
+
+    def __init__(self, response: httpx.Response):
+        self.response = response
+        self.status = response.status_code
+        self.reason = response.reason_phrase
+        self.data = response.content
+
+    def read(self):
+        return self.data
+
+    def getheaders(self):
+        return self.response.headers
+
+    def getheader(self, name, default=None):
+        return self.response.headers.get(name, default)
+
+
+class _ReleasingStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Response stream that calls `release` once the response is closed."""
+
+    def __init__(self, stream: Any, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+        self._released = False
+
+    def __iter__(self):
+        yield from self._stream
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            self.__release()
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self.__release()
+
+    def __release(self) -> None:
+        if not self._released:
+            self._released = True
+            self._release()
+
+
+def _route(request: httpx.Request) -> Route:
+    route = request.extensions.get(_ROUTE_EXTENSION)
+    if route is None:
+        route = request.extensions[_ROUTE_EXTENSION] = classify(request.method, request.url.path)
+    return route
+
+
+class _CountingStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Request stream that counts the bytes of the last time it was sent."""
+
+    def __init__(self, stream: Any):
+        self._stream = stream
+        self.count = 0
+
+    def __iter__(self):
+        self.count = 0
+        for chunk in self._stream:
+            self.count += len(chunk)
+            yield chunk
+
+    async def __aiter__(self):
+        self.count = 0
+        async for chunk in self._stream:
+            self.count += len(chunk)
+            yield chunk
+
+
+class _InstrumentedResponseStream(_ReleasingStream):
+    """Response stream that counts the received bytes and records read errors in the event of its request."""
+
+    def __init__(self, stream: Any, event: OperationEvent, end: Callable[[], None]):
+        super().__init__(stream, end)
+        self._event = event
+
+    def __iter__(self):
+        try:
+            for chunk in self._stream:
+                self._event.bytes_received += len(chunk)
+                yield chunk
+        except Exception as e:
+            self._event.error = e
+            raise
+
+    async def __aiter__(self):
+        try:
+            async for chunk in self._stream:
+                self._event.bytes_received += len(chunk)
+                yield chunk
+        except Exception as e:
+            self._event.error = e
+            raise
+
+
+class _Instrumenter:
+    """Reports the requests passing through a transport to the instrumentation hooks of a client."""
+
+    def __init__(self, instrumentation: Instrumentation):
+        self.instrumentation = instrumentation
+
+    def start(self, request: httpx.Request) -> Callable[[Optional[BaseException]], None]:
+        """Reports the start of a request.
+
+        Returns:
+            Callable[[Optional[BaseException]], None]: Function to call with the error, if any, when the
+                request has ended.
+        """
+        route = _route(request)
+        event = OperationEvent(
+            operation=route.operation,
+            method=request.method,
+            url=str(request.url),
+            sandbox_id=sandbox_id(request.url.path),
+            start_time=time.time(),
+        )
+        started = time.monotonic()
+        content_length = request.headers.get("Content-Length")
+        counter = None
+        if content_length is None:
+            # Streamed bodies have no length up front
+            counter = request.stream = _CountingStream(request.stream)
+        request.extensions[_EVENT_EXTENSION] = event
+        self.instrumentation.start(event)
+
+        def end(error: Optional[BaseException] = None) -> None:
+            event.duration = time.monotonic() - started
+            event.bytes_sent = counter.count if counter is not None else int(content_length)
+            event.retries = request.extensions.get(RETRIES_EXTENSION, 0)
+            event.error = error or event.error
+            self.instrumentation.end(event)
+
+        return end
+
+    @staticmethod
+    def wrap(
+        request: httpx.Request, response: httpx.Response, end: Callable[[Optional[BaseException]], None]
+    ) -> httpx.Response:
+        event: OperationEvent = request.extensions[_EVENT_EXTENSION]
+        event.status = response.status_code
+        if response.is_closed:
+            # The body was already loaded by the underlying transport
+            event.bytes_received = len(response.content)
+            end(None)
+        else:
+            response.stream = _InstrumentedResponseStream(response.stream, event, end)
+        return response
+
+
+class _InstrumentedTransport(httpx.BaseTransport):
+    """Reports every request to the instrumentation hooks. A request ends once its response is closed."""
+
+    def __init__(self, transport: httpx.BaseTransport, instrumenter: _Instrumenter):
+        self._transport = transport
+        self._instrumenter = instrumenter
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if not self._instrumenter.instrumentation.hooks:
+            return self._transport.handle_request(request)
+        end = self._instrumenter.start(request)
+        try:
+            response = self._transport.handle_request(request)
+        except BaseException as e:
+            end(e)
+            raise
+        return self._instrumenter.wrap(request, response, end)
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class _AsyncInstrumentedTransport(httpx.AsyncBaseTransport):
+    """Asyncio counterpart of `_InstrumentedTransport`."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, instrumenter: _Instrumenter):
+        self._transport = transport
+        self._instrumenter = instrumenter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if not self._instrumenter.instrumentation.hooks:
+            return await self._transport.handle_async_request(request)
+        end = self._instrumenter.start(request)
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException as e:
+            end(e)
+            raise
+        return self._instrumenter.wrap(request, response, end)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def _slot_timeout(request: httpx.Request) -> Optional[float]:
+    """Time to wait for an in-flight slot: the pool timeout of the request, capped by the deadline of the
+    enclosing timed operation."""
+    return remaining_timeout(request.extensions.get("timeout", {}).get("pool"))
+
+
+def _slot_timeout_error(request: httpx.Request, limit: int) -> httpx.PoolTimeout:
+    return httpx.PoolTimeout(
+        f"Timed out waiting for one of the {limit} in-flight request slots of {request.url.host}. Close "
+        "unused readers, downloads and searches, or raise max_connections_per_host.",
+        request=request,
+    )
+
+
+def _limit_timeout_error(request: httpx.Request, endpoint_class: str) -> httpx.PoolTimeout:
+    return httpx.PoolTimeout(
+        f"Timed out waiting for the client-side limits of {endpoint_class} requests. Close unused readers, "
+        "downloads and searches, or raise the limits in RateLimitConfig.",
+        request=request,
+    )
+
+
+def _time_left(deadline: Optional[float]) -> Optional[float]:
+    return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+
+class _HostLimitedTransport(httpx.BaseTransport):
+    """Limits the number of in-flight requests per host. A slot is held until the response is closed."""
+
+    def __init__(self, transport: httpx.BaseTransport, limit: int):
+        self._transport = transport
+        self._limit = limit
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            semaphore = self._semaphores.setdefault(request.url.host, threading.BoundedSemaphore(self._limit))
+        if not semaphore.acquire(timeout=_slot_timeout(request)):
+            raise _slot_timeout_error(request, self._limit)
+        try:
+            response = self._transport.handle_request(request)
+        except BaseException:
+            semaphore.release()
+            raise
+        if response.is_closed:
+            # The body was already loaded by the underlying transport
+            semaphore.release()
+        else:
+            response.stream = _ReleasingStream(response.stream, semaphore.release)
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class _AsyncHostLimitedTransport(httpx.AsyncBaseTransport):
+    """Asyncio counterpart of `_HostLimitedTransport`."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, limit: int):
+        self._transport = transport
+        self._limit = limit
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        semaphore = self._semaphores.setdefault(request.url.host, asyncio.Semaphore(self._limit))
+        try:
+            await asyncio.wait_for(semaphore.acquire(), _slot_timeout(request))
+        except asyncio.TimeoutError:
+            raise _slot_timeout_error(request, self._limit) from None
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            semaphore.release()
+            raise
+        if response.is_closed:
+            # The body was already loaded by the underlying transport
+            semaphore.release()
+        else:
+            response.stream = _ReleasingStream(response.stream, semaphore.release)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class _ThrottledTransport(httpx.BaseTransport):
+    """Applies the rate limit and in-flight limit of the endpoint class of each request. An in-flight slot is
+    held until the response is closed."""
+
+    def __init__(self, transport: httpx.BaseTransport, limiter: RateLimiter):
+        self._transport = transport
+        self._limiter = limiter
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        endpoint_class = _route(request).endpoint_class
+        concurrency = self._limiter.limiters.get(endpoint_class)
+        bucket = self._limiter.buckets.get(endpoint_class)
+        # Waiting for a slot and a token is bounded like waiting for a connection
+        timeout = _slot_timeout(request)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if concurrency is None:
+            if bucket is not None and not bucket.acquire(timeout):
+                raise _limit_timeout_error(request, endpoint_class)
+            return self._transport.handle_request(request)
+
+        if not concurrency.acquire(timeout):
+            raise _limit_timeout_error(request, endpoint_class)
+        try:
+            if bucket is not None and not bucket.acquire(_time_left(deadline)):
+                raise _limit_timeout_error(request, endpoint_class)
+            response = self._transport.handle_request(request)
+        except BaseException:
+            concurrency.release()
+            raise
+        if response.is_closed:
+            concurrency.release()
+        else:
+            response.stream = _ReleasingStream(response.stream, concurrency.release)
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class _AsyncThrottledTransport(httpx.AsyncBaseTransport):
+    """Asyncio counterpart of `_ThrottledTransport`, sharing its limits with synchronous requests."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, limiter: RateLimiter):
+        self._transport = transport
+        self._limiter = limiter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        endpoint_class = _route(request).endpoint_class
+        concurrency = self._limiter.limiters.get(endpoint_class)
+        bucket = self._limiter.buckets.get(endpoint_class)
+        timeout = _slot_timeout(request)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if concurrency is None:
+            if bucket is not None and not await bucket.acquire_async(timeout):
+                raise _limit_timeout_error(request, endpoint_class)
+            return await self._transport.handle_async_request(request)
+
+        if not await concurrency.acquire_async(timeout):
+            raise _limit_timeout_error(request, endpoint_class)
+        try:
+            if bucket is not None and not await bucket.acquire_async(_time_left(deadline)):
+                raise _limit_timeout_error(request, endpoint_class)
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            concurrency.release()
+            raise
+        if response.is_closed:
+            concurrency.release()
+        else:
+            response.stream = _ReleasingStream(response.stream, concurrency.release)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class _RetryBudget:
+    """Sliding window of sent requests and retries that caps the retries of a client."""
+
+    def __init__(self, config: RetryConfig):
+        self._config = config
+        self._requests: Deque[float] = collections.deque()
+        self._retries: Deque[float] = collections.deque()
+        self._lock = threading.Lock()
+
+    def record_request(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self.__expire(now)
+            self._requests.append(now)
+
+    def try_acquire(self) -> bool:
+        """Takes a retry from the budget.
+
+        Returns:
+            bool: Whether the budget allows another retry.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.__expire(now)
+            if len(self._retries) >= self._config.budget_min_retries + self._config.budget_ratio * len(self._requests):
+                return False
+            self._retries.append(now)
+            return True
+
+    def __expire(self, now: float) -> None:
+        start = now - self._config.budget_window
+        for events in (self._requests, self._retries):
+            while events and events[0] < start:
+                events.popleft()
+
+
+class _RetryPolicy:
+    """Decides whether and when a failed request is retried."""
+
+    # Errors raised before the request reached the server, safe to retry for any operation
+    _UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+    # Errors after the request may have been processed, e.g. a connection reset while reading the response
+    _INTERRUPTED_ERRORS = (httpx.ReadError, httpx.WriteError, httpx.RemoteProtocolError)
+
+    def __init__(self, config: RetryConfig, budget: _RetryBudget):
+        self._config = config
+        self._budget = budget
+
+    def start(self, request: httpx.Request) -> Route:
+        self._budget.record_request()
+        request.extensions[RETRIES_EXTENSION] = 0
+        return _route(request)
+
+    def try_retry(self) -> bool:
+        """Takes a retry from the budget for work that is retried outside of the transport."""
+        return self._config.max_retries > 0 and self._budget.try_acquire()
+
+    def error_delay(self, request: httpx.Request, route: Route, error: Exception, attempt: int) -> Optional[float]:
+        """Returns the delay before retrying a request that raised an error, or None to raise it."""
+        if isinstance(error, self._UNSENT_ERRORS) or (route.idempotent and isinstance(error, self._INTERRUPTED_ERRORS)):
+            return self.__delay(request, attempt, None)
+        return None
+
+    def response_delay(
+        self, request: httpx.Request, route: Route, response: httpx.Response, attempt: int
+    ) -> Optional[float]:
+        """Returns the delay before retrying a request that got an error response, or None to return it."""
+        if response.status_code not in self._config.retry_on_status:
+            return None
+        # A rate limited request was rejected before being processed
+        if response.status_code != 429 and not route.idempotent:
+            return None
+        retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is not None and retry_after > self._config.max_retry_after:
+            return None
+        return self.__delay(request, attempt, retry_after)
+
+    def prepare_retry(self, request: httpx.Request) -> None:
+        request.extensions[RETRIES_EXTENSION] += 1
+        try:
+            remaining = remaining_timeout()
+        except TimeoutError:
+            return
+        if remaining is not None:
+            # The timeout of the request was set for the first attempt, so cap it by the time that is left
+            request.extensions["timeout"] = {
+                key: remaining if value is None else min(value, remaining)
+                for key, value in request.extensions.get("timeout", {}).items()
+            }
+
+    def __delay(self, request: httpx.Request, attempt: int, retry_after: Optional[float]) -> Optional[float]:
+        if attempt >= self._config.max_retries or request.extensions.get(NO_RETRY_EXTENSION):
+            return None
+        if retry_after is not None:
+            delay = retry_after
+        else:
+            delay = random.uniform(0, min(self._config.backoff_max, self._config.backoff_base * 2**attempt))
+        try:
+            remaining = remaining_timeout()
+        except TimeoutError:
+            return None
+        if remaining is not None and delay >= remaining:
+            return None
+        if not self._budget.try_acquire():
+            return None
+        return delay
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    # Retry-After is either a number of seconds or an HTTP date
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+
+
+class _RetryingTransport(httpx.BaseTransport):
+    """Retries failed requests according to a `_RetryPolicy`."""
+
+    def __init__(self, transport: httpx.BaseTransport, policy: _RetryPolicy):
+        self._transport = transport
+        self._policy = policy
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        route = self._policy.start(request)
+        attempt = 0
+        while True:
+            try:
+                response = self._transport.handle_request(request)
+            except httpx.TransportError as e:
+                delay = self._policy.error_delay(request, route, e, attempt)
+                if delay is None:
+                    raise
+            else:
+                delay = self._policy.response_delay(request, route, response, attempt)
+                if delay is None:
+                    response.extensions[RETRIES_EXTENSION] = attempt
+                    return response
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+            self._policy.prepare_retry(request)
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class _AsyncRetryingTransport(httpx.AsyncBaseTransport):
+    """Asyncio counterpart of `_RetryingTransport`."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, policy: _RetryPolicy):
+        self._transport = transport
+        self._policy = policy
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        route = self._policy.start(request)
+        attempt = 0
+        while True:
+            try:
+                response = await self._transport.handle_async_request(request)
+            except httpx.TransportError as e:
+                delay = self._policy.error_delay(request, route, e, attempt)
+                if delay is None:
+                    raise
+            else:
+                delay = self._policy.response_delay(request, route, response, attempt)
+                if delay is None:
+                    response.extensions[RETRIES_EXTENSION] = attempt
+                    return response
+                await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+            self._policy.prepare_retry(request)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class HttpTransport:
+    """Connection pools shared by all requests of a Daytona client.
+
+    Holds one `httpx.Client` for synchronous code and one `httpx.AsyncClient` per event loop, all
+    configured from the same `TransportConfig`.
+
+    Attributes:
+        config (TransportConfig): Connection settings.
+        rate_limiter (RateLimiter): Client-side limits shared by all requests.
+        instrumentation (Instrumentation): Hooks notified about every request.
+        client (httpx.Client): Client used by synchronous code.
+    """
+
+    def __init__(self, config: Optional[TransportConfig] = None, rate_limits: Optional[RateLimitConfig] = None):
+        """Initializes the transport and its synchronous connection pool.
+
+        Args:
+            config (Optional[TransportConfig]): Connection settings. Defaults to `TransportConfig()`.
+            rate_limits (Optional[RateLimitConfig]): Client-side limits per class of API endpoints. None means
+                no limits.
+
+        Raises:
+            DaytonaError: If HTTP/2 is enabled but the `h2` package is not installed.
+        """
+        self.config = config or TransportConfig()
+        if self.config.http2:
+            try:
+                import h2  # noqa: F401  # pylint: disable=import-outside-toplevel,unused-import
+            except ImportError:
+                raise DaytonaError(  # pylint: disable=raise-missing-from
+                    "HTTP/2 support requires the 'h2' package. Install it with `pip install daytona_sdk[http2]`."
+                )
+
+        # Sync and async requests of the client draw from the same retry budget
+        self._retry_policy = _RetryPolicy(self.config.retry, _RetryBudget(self.config.retry))
+        self.rate_limiter = RateLimiter(rate_limits or RateLimitConfig())
+        self.instrumentation = Instrumentation()
+        self._instrumenter = _Instrumenter(self.instrumentation)
+
+        transport: httpx.BaseTransport = httpx.HTTPTransport(limits=self.__limits(), http2=self.config.http2)
+        if self.config.max_connections_per_host:
+            transport = _HostLimitedTransport(transport, self.config.max_connections_per_host)
+        if self.rate_limiter.enabled:
+            # Every attempt of a retried request counts against the limits
+            transport = _ThrottledTransport(transport, self.rate_limiter)
+        if self.config.retry.max_retries > 0:
+            # Retries wait outside of the host limit, so backing off does not hold a connection slot
+            transport = _RetryingTransport(transport, self._retry_policy)
+        # Outermost, so an event covers all attempts of a request
+        transport = _InstrumentedTransport(transport, self._instrumenter)
+        self.client = httpx.Client(transport=transport, timeout=None)
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def async_client(self) -> httpx.AsyncClient:
+        """Returns the asynchronous client of the running event loop, creating it on first use.
+
+        Returns:
+            httpx.AsyncClient: Client bound to the running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None or client.is_closed:
+            transport: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport(
+                limits=self.__limits(), http2=self.config.http2
+            )
+            if self.config.max_connections_per_host:
+                transport = _AsyncHostLimitedTransport(transport, self.config.max_connections_per_host)
+            if self.rate_limiter.enabled:
+                transport = _AsyncThrottledTransport(transport, self.rate_limiter)
+            if self.config.retry.max_retries > 0:
+                transport = _AsyncRetryingTransport(transport, self._retry_policy)
+            transport = _AsyncInstrumentedTransport(transport, self._instrumenter)
+            client = httpx.AsyncClient(transport=transport, timeout=None)
+            self._async_clients[loop] = client
+        return client
+
+    def try_retry(self) -> bool:
+        """Takes a retry from the retry budget of the client, for operations that retry failed work in their
+        own way, e.g. by splitting a failed batch of files.
+
+        Returns:
+            bool: Whether retries are enabled and the budget allows another one.
+        """
+        return self._retry_policy.try_retry()
+
+    def timeout(self, timeout: RequestTimeout) -> httpx.Timeout:
+        """Converts a request timeout of the generated client to an `httpx.Timeout`. A single timeout is
+        capped by the time left to the deadline of the enclosing timed operation.
+
+        Args:
+            timeout (RequestTimeout): Timeout in seconds, a (connect, read) tuple or None for no timeout.
+
+        Returns:
+            httpx.Timeout: The equivalent httpx timeout.
+        """
+        if isinstance(timeout, tuple):
+            return httpx.Timeout(None, connect=timeout[0], read=timeout[1])
+        timeout = remaining_timeout(timeout)
+        connect_timeout = self.config.connect_timeout
+        if timeout is not None and connect_timeout is not None:
+            connect_timeout = min(connect_timeout, timeout)
+        return httpx.Timeout(timeout, connect=connect_timeout or timeout)
+
+    def close(self) -> None:
+        """Closes the synchronous connection pool."""
+        self.client.close()
+
+    async def aclose(self) -> None:
+        """Closes the connection pool of the running event loop."""
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    def __limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.config.max_connections,
+            max_keepalive_connections=self.config.max_keepalive_connections,
+            keepalive_expiry=self.config.keepalive_expiry,
+        )
+
+
+class RESTClient:
+    """Replacement for the urllib3-based REST client of the generated API client that sends
+    requests through an `HttpTransport`.
+
+    Attributes:
+        transport (HttpTransport): Transport used to send the requests.
+    """
+
+    def __init__(self, transport: HttpTransport):
+        self.transport = transport
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        body: Any = None,
+        post_params: Any = None,
+        _request_timeout: RequestTimeout = None,
+    ) -> HttpxRESTResponse:
+        """Sends a request built by the generated API client.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Request URL.
+            headers (Optional[Dict[str, str]]): Request headers.
+            body (Any): Request body, serialized as JSON unless it is already a string or bytes.
+            post_params (Any): Form or multipart parameters.
+            _request_timeout (RequestTimeout): Timeout in seconds, a (connect, read) tuple or None for no timeout.
+
+        Returns:
+            HttpxRESTResponse: The response, with its body loaded.
+        """
+        response = self.transport.client.request(
+            method,
+            url,
+            timeout=self.transport.timeout(_request_timeout),
+            **request_content(headers, body, post_params),
+        )
+        return HttpxRESTResponse(response)
+
+
+def request_content(headers: Optional[Dict[str, str]], body: Any, post_params: Any) -> Dict[str, Any]:
+    """Encodes the body of a request built by the generated API client into httpx request arguments,
+    following the content type rules of the generated REST client.
+
+    Args:
+        headers (Optional[Dict[str, str]]): Request headers.
+        body (Any): Request body.
+        post_params (Any): Form or multipart parameters as a list of (name, value) tuples.
+
+    Returns:
+        Dict[str, Any]: `headers` and `content`, `data` or `files` arguments for `httpx.Client.request`.
+    """
+    headers = dict(headers or {})
+    content_type = headers.get("Content-Type", "")
+
+    if content_type == "multipart/form-data":
+        # httpx generates the content type with the multipart boundary
+        del headers["Content-Type"]
+        data: Dict[str, Any] = {}
+        files: List[Tuple[str, Any]] = []
+        for name, value in post_params or []:
+            if isinstance(value, tuple):
+                files.append((name, value))
+            else:
+                data[name] = json.dumps(value) if isinstance(value, dict) else value
+        return {"headers": headers, "data": data, "files": files}
+    if content_type == "application/x-www-form-urlencoded":
+        return {"headers": headers, "data": dict(post_params or [])}
+    if body is None:
+        return {"headers": headers}
+    if isinstance(body, (str, bytes)):
+        return {"headers": headers, "content": body}
+    if isinstance(body, bool) and content_type.startswith("text/"):
+        return {"headers": headers, "content": "true" if body else "false"}
+
+    headers.setdefault("Content-Type", "application/json")
+    return {"headers": headers, "content": json.dumps(body)}
+
+
+_default_transport: Optional[HttpTransport] = None
+_default_transport_lock = threading.Lock()
+
+
+def get_transport(api_client: ApiClient) -> HttpTransport:
+    """Returns the transport used by the given API client. API clients that were not created by the SDK
+    share a process-wide default transport.
+
+    Args:
+        api_client (ApiClient): Generated API client.
+
+    Returns:
+        HttpTransport: The transport to send raw requests (streams, multipart uploads) with.
+    """
+    global _default_transport  # pylint: disable=global-statement
+
+    if isinstance(api_client.rest_client, RESTClient):
+        return api_client.rest_client.transport
+    with _default_transport_lock:
+        if _default_transport is None:
+            _default_transport = HttpTransport()
+        return _default_transport
+
+
+def install_transport(
+    api_client: ApiClient,
+    config: Optional[TransportConfig] = None,
+    rate_limits: Optional[RateLimitConfig] = None,
+) -> HttpTransport:
+    """Makes the generated API client send its requests through a new `HttpTransport`.
+
+    Args:
+        api_client (ApiClient): Generated API client.
+        config (Optional[TransportConfig]): Connection settings.
+        rate_limits (Optional[RateLimitConfig]): Client-side limits per class of API endpoints.
+
+    Returns:
+        HttpTransport: The installed transport.
+    """
+    transport = HttpTransport(config, rate_limits)
+    api_client.rest_client = RESTClient(transport)
+    return transport
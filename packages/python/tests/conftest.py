@@ -0,0 +1,206 @@
+import json
+import os
+import re
+import shutil
+import subprocess
+from datetime import datetime, timezone
+from typing import Callable, Dict, Optional
+from urllib.parse import parse_qsl
+
+import httpx
+import pytest
+from daytona_api_client import Workspace
+from daytona_sdk import Daytona, DaytonaConfig, RetryConfig, TransportConfig
+from daytona_sdk.code_toolbox.sandbox_python_code_toolbox import SandboxPythonCodeToolbox
+from daytona_sdk.sandbox import Sandbox
+from daytona_sdk.transport import get_transport
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+WORKSPACE = {
+    "id": "sb1",
+    "organizationId": "org",
+    "name": "",
+    "image": "image",
+    "user": "daytona",
+    "env": {},
+    "labels": {},
+    "public": False,
+    "target": "us",
+    "cpu": 1,
+    "gpu": 0,
+    "memory": 1,
+    "disk": 3,
+    "state": "started",
+    "autoStopInterval": 15,
+    "info": {"name": "", "created": "now", "providerMetadata": "{}"},
+}
+
+
+@pytest.fixture(name="retry")
+def fixture_retry() -> RetryConfig:
+    return RetryConfig(max_retries=3, backoff_base=0.0)
+
+
+@pytest.fixture(name="transport")
+def fixture_transport(retry: RetryConfig) -> TransportConfig:
+    return TransportConfig(retry=retry)
+
+
+@pytest.fixture(name="daytona")
+def fixture_daytona(transport: TransportConfig) -> Daytona:
+    return Daytona(DaytonaConfig(api_key="key", api_url="http://api", target="us", transport=transport))
+
+
+@pytest.fixture(name="serve")
+def fixture_serve(daytona: Daytona) -> Callable[[Handler], None]:
+    """Answers the toolbox requests of the client with a handler, below the retry, rate and host limit layers."""
+
+    def install(handler: Handler) -> None:
+        layer = get_transport(daytona.toolbox_api.api_client).client._transport  # pylint: disable=protected-access
+        innermost = (httpx.HTTPTransport, httpx.MockTransport)
+        while not isinstance(layer._transport, innermost):  # pylint: disable=protected-access
+            layer = layer._transport  # pylint: disable=protected-access
+        layer._transport = httpx.MockTransport(handler)  # pylint: disable=protected-access
+
+    return install
+
+
+@pytest.fixture(name="workspace")
+def fixture_workspace() -> Callable[..., Workspace]:
+    """Builds Sandbox API models, overriding the fields of a started Sandbox."""
+    return lambda **fields: Workspace.from_dict({**WORKSPACE, **fields})
+
+
+@pytest.fixture(name="sandbox")
+def fixture_sandbox(
+    daytona: Daytona, serve: Callable[[Handler], None], workspace: Callable[..., Workspace]
+) -> Callable[..., Sandbox]:
+    """Builds a started Sandbox whose toolbox requests are answered by a handler. Its root directory is
+    /home/daytona unless `root_dir` is given."""
+
+    def build(handler: Optional[Handler] = None, root_dir: str = "/home/daytona", **fields) -> Sandbox:
+        def route(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/project-dir"):
+                return httpx.Response(200, json={"dir": root_dir})
+            return handler(request) if handler else httpx.Response(404)
+
+        serve(route)
+        instance = workspace(**fields)
+        return Sandbox(instance.id, instance, daytona.sandbox_api, daytona.toolbox_api, SandboxPythonCodeToolbox())
+
+    return build
+
+
+class LocalToolbox:
+    """Mock toolbox that runs commands with the local shell and serves the files of a local directory, which is
+    the root directory of the Sandbox."""
+
+    def __init__(self, root: str):
+        self.root = root
+        self.commands = []
+        self.uploads = []
+        # Paths of the file info and listing requests
+        self.info_requests = []
+        # (path, Range header) of each download request
+        self.downloads = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        params = dict(parse_qsl(request.url.query.decode()))
+        if path.endswith("/project-dir"):
+            return httpx.Response(200, json={"dir": self.root})
+        if path.endswith("/process/execute"):
+            body = json.loads(request.content)
+            self.commands.append(body["command"])
+            result = subprocess.run(
+                ["sh", "-c", body["command"]], cwd=body.get("cwd") or self.root, capture_output=True, check=False
+            )
+            return httpx.Response(
+                200, json={"exitCode": result.returncode, "result": (result.stdout + result.stderr).decode()}
+            )
+        if path.endswith("/files/download"):
+            return self.__download(request, params["path"])
+        if path.endswith("/files/bulk-upload"):
+            return self.__upload(request)
+        if path.endswith("/files/info"):
+            self.info_requests.append(params["path"])
+            if not os.path.exists(params["path"]):
+                return httpx.Response(404, json={"message": "file not found"})
+            return httpx.Response(200, json=self.__file_info(params["path"]))
+        if path.endswith("/files") and request.method == "GET":
+            self.info_requests.append(params["path"])
+            names = sorted(os.listdir(params["path"]))
+            return httpx.Response(200, json=[self.__file_info(os.path.join(params["path"], name)) for name in names])
+        if path.endswith("/files/move"):
+            os.rename(params["source"], params["destination"])
+            return httpx.Response(200)
+        if path.endswith("/files") and request.method == "DELETE":
+            if os.path.isdir(params["path"]):
+                shutil.rmtree(params["path"])
+            else:
+                os.remove(params["path"])
+            return httpx.Response(200)
+        return httpx.Response(404, json={"message": f"Not found: {path}"})
+
+    def __download(self, request: httpx.Request, path: str) -> httpx.Response:
+        self.downloads.append((path, request.headers.get("Range")))
+        if not os.path.isfile(path):
+            return httpx.Response(404, json={"message": "file not found"})
+        with open(path, "rb") as f:
+            data = f.read()
+        match = re.fullmatch(r"bytes=(\d+)-(\d*)", request.headers.get("Range", ""))
+        if not match:
+            return httpx.Response(200, content=data)
+        start, end = int(match.group(1)), min(int(match.group(2) or len(data) - 1), len(data) - 1)
+        if start >= len(data):
+            return httpx.Response(416, headers={"Content-Range": f"bytes */{len(data)}"})
+        content_range = f"bytes {start}-{end}/{len(data)}"
+        return httpx.Response(206, headers={"Content-Range": content_range}, content=data[start : end + 1])
+
+    def __upload(self, request: httpx.Request) -> httpx.Response:
+        files = self.__parse_upload(request)
+        for destination, data in files.items():
+            os.makedirs(os.path.dirname(destination), exist_ok=True)
+            with open(destination, "wb") as f:
+                f.write(data)
+        self.uploads.append(sorted(files))
+        return httpx.Response(200)
+
+    @staticmethod
+    def __file_info(path: str) -> Dict[str, object]:
+        stat = os.stat(path)
+        return {
+            "name": os.path.basename(path),
+            "isDir": os.path.isdir(path),
+            "size": stat.st_size,
+            "modTime": datetime.fromtimestamp(stat.st_mtime, timezone.utc).isoformat(),
+            "mode": "",
+            "permissions": oct(stat.st_mode & 0o777)[2:],
+            "owner": "daytona",
+            "group": "daytona",
+        }
+
+    @staticmethod
+    def __parse_upload(request: httpx.Request) -> Dict[str, bytes]:
+        boundary = request.headers["content-type"].split("boundary=")[1].encode()
+        fields = {}
+        for part in request.content.split(b"--" + boundary):
+            if b"\r\n\r\n" in part:
+                head, body = part.split(b"\r\n\r\n", 1)
+                fields[re.search(rb'name="([^"]+)"', head).group(1).decode()] = body[:-2]
+        count = sum(1 for name in fields if name.endswith(".path"))
+        return {fields[f"files[{i}].path"].decode(): fields[f"files[{i}].file"] for i in range(count)}
+
+
+@pytest.fixture(name="local_toolbox")
+def fixture_local_toolbox(tmp_path) -> LocalToolbox:
+    root = tmp_path / "sandbox"
+    root.mkdir()
+    return LocalToolbox(str(root))
+
+
+@pytest.fixture(name="local_sandbox")
+def fixture_local_sandbox(sandbox: Callable[..., Sandbox], local_toolbox: LocalToolbox) -> Sandbox:
+    """A started Sandbox backed by the local directory of `local_toolbox`."""
+    return sandbox(local_toolbox, root_dir=local_toolbox.root)
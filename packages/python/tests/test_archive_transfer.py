@@ -0,0 +1,53 @@
+import filecmp
+import os
+
+import pytest
+from daytona_sdk import DaytonaError
+
+
+@pytest.fixture(name="tree")
+def fixture_tree(tmp_path):
+    root = tmp_path / "tree"
+    for i in range(200):
+        path = root / f"d{i % 10}" / f"f{i}.txt"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"file {i}\n" * 10)
+    (root / "empty").mkdir()
+    (root / "skip.tmp").write_text("x")
+    (root / "big.bin").write_bytes(os.urandom(3_000_000))
+    os.symlink("d0/f0.txt", root / "link")
+    return root
+
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_upload_dir_sends_one_archive(local_sandbox, local_toolbox, tree, compress):
+    local_sandbox.fs.upload_dir(str(tree), "tree", exclude=["*.tmp"], compress=compress)
+
+    remote = os.path.join(local_toolbox.root, "tree")
+    assert len(local_toolbox.uploads) == 1
+    assert sum(len(files) for _, _, files in os.walk(remote)) == 202
+    assert os.path.isdir(os.path.join(remote, "empty")) and os.path.islink(os.path.join(remote, "link"))
+    assert not os.path.exists(os.path.join(remote, "skip.tmp"))
+    comparison = filecmp.dircmp(tree, remote)
+    assert comparison.left_only == ["skip.tmp"] and not comparison.right_only and not comparison.diff_files
+    # The staged archive is removed after unpacking
+    assert sorted(os.listdir(local_toolbox.root)) == ["tree"]
+
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_download_dir_round_trip(local_sandbox, local_toolbox, tree, tmp_path, compress):
+    local_sandbox.fs.upload_dir(str(tree), "tree")
+    target = tmp_path / "downloaded"
+
+    local_sandbox.fs.download_dir("tree", str(target), compress=compress)
+
+    comparison = filecmp.dircmp(tree, target)
+    assert not comparison.left_only and not comparison.right_only and not comparison.diff_files
+    assert (target / "big.bin").read_bytes() == (tree / "big.bin").read_bytes()
+    assert os.path.islink(target / "link")
+    assert sorted(os.listdir(local_toolbox.root)) == ["tree"]
+
+
+def test_upload_dir_requires_local_directory(local_sandbox, tmp_path):
+    with pytest.raises(DaytonaError, match="does not exist"):
+        local_sandbox.fs.upload_dir(str(tmp_path / "missing"), "tree")
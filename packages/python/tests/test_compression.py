@@ -0,0 +1,73 @@
+import json
+import os
+
+import pytest
+from daytona_sdk import Compression, DaytonaError, FileUpload
+
+TEXT = "".join(json.dumps({"i": i, "value": "x" * 20}) + "\n" for i in range(5000)).encode()
+
+
+def test_upload_files_decompresses_from_manifest(local_sandbox, local_toolbox):
+    uploads = [FileUpload(TEXT, f"data/{i} it's.jsonl") for i in range(3)] + [FileUpload(b"small", "data/b.txt")]
+
+    local_sandbox.fs.upload_files(uploads, compression="gzip")
+
+    remote = os.path.join(local_toolbox.root, "data")
+    assert sorted(os.listdir(remote)) == ["0 it's.jsonl", "1 it's.jsonl", "2 it's.jsonl", "b.txt"]
+    for i in range(3):
+        with open(os.path.join(remote, f"{i} it's.jsonl"), "rb") as f:
+            assert f.read() == TEXT
+    # The files are decompressed by one command, whatever their number
+    assert len(local_toolbox.commands) == 1 and "it's" not in local_toolbox.commands[0]
+    (upload,) = local_toolbox.uploads
+    assert len(upload) == 5
+
+
+def test_failed_decompression_removes_staged_files(local_sandbox, local_toolbox):
+    os.makedirs(os.path.join(local_toolbox.root, "data", "taken"))
+
+    with pytest.raises(DaytonaError):
+        local_sandbox.fs.upload_files(
+            [FileUpload(TEXT, "data/taken"), FileUpload(TEXT, "data/a.jsonl")], compression=Compression.GZIP
+        )
+
+    remote = os.path.join(local_toolbox.root, "data")
+    assert sorted(os.listdir(remote)) == ["a.jsonl", "taken"]
+    # The staged files and the manifests of the failed batch and of its retries are removed
+    staged = [path for upload in local_toolbox.uploads for path in upload]
+    assert len(staged) == 7 and not any(os.path.exists(path) for path in staged)
+
+
+def test_upload_file_from_path(local_sandbox, local_toolbox, tmp_path):
+    local = tmp_path / "data.jsonl"
+    local.write_bytes(TEXT)
+
+    local_sandbox.fs.upload_file(str(local), "data.jsonl", compression="gzip")
+
+    with open(os.path.join(local_toolbox.root, "data.jsonl"), "rb") as f:
+        assert f.read() == TEXT
+
+
+def test_download_file(local_sandbox, local_toolbox, tmp_path):
+    with open(os.path.join(local_toolbox.root, "data.jsonl"), "wb") as f:
+        f.write(TEXT)
+
+    assert local_sandbox.fs.download_file("data.jsonl", compression="gzip") == TEXT
+    local_sandbox.fs.download_file("data.jsonl", str(tmp_path / "data.jsonl"), compression="gzip")
+    assert (tmp_path / "data.jsonl").read_bytes() == TEXT
+
+
+def test_exec_output(local_sandbox, local_toolbox):
+    with open(os.path.join(local_toolbox.root, "data.jsonl"), "wb") as f:
+        f.write(TEXT)
+
+    response = local_sandbox.process.exec("cat data.jsonl; exit 3", compression="gzip")
+    assert response.exit_code == 3 and response.result.encode() == TEXT
+
+    response = local_sandbox.process.exec("echo hi", compression="gzip")
+    assert response.exit_code == 0 and response.result.strip() == "hi"
+
+
+def test_unsupported_compression(local_sandbox):
+    with pytest.raises(DaytonaError, match="Unsupported compression"):
+        local_sandbox.process.exec("echo", compression="lz4")
@@ -0,0 +1,78 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+from daytona_sdk import AsyncDaytona, CreateSandboxParams, DaytonaConfig, DaytonaError
+from daytona_sdk._async import daytona as async_daytona
+
+BATCH = [CreateSandboxParams(language="python")] * 3
+
+
+@pytest.fixture(name="created")
+def fixture_created(daytona, workspace):
+    """Mocks the Sandbox API so every creation takes 0.3 seconds, and records the timeout of each request."""
+    timeouts = []
+
+    def create_workspace(_request, _request_timeout=None):
+        timeouts.append(_request_timeout)
+        time.sleep(0.3)
+        return workspace(id=f"sb{len(timeouts)}")
+
+    daytona.sandbox_api.create_workspace = create_workspace
+    daytona.sandbox_api.get_workspace = lambda sandbox_id, **kwargs: workspace(id=sandbox_id)
+    daytona.toolbox_api.get_project_dir = lambda *args, **kwargs: SimpleNamespace(dir="/home/daytona")
+    return timeouts
+
+
+def test_waiting_requests_only_get_time_left_of_batch(daytona, created):
+    result = daytona.create_many(BATCH, concurrency=1, timeout=2)
+
+    assert created[0] == pytest.approx(2.0, abs=0.05)
+    assert created[1] == pytest.approx(1.7, abs=0.05)
+    assert created[2] == pytest.approx(1.4, abs=0.05)
+    assert [sandbox.id for sandbox in result.sandboxes] == ["sb1", "sb2", "sb3"]
+
+
+def test_params_left_after_deadline_are_recorded_as_failures(daytona, created):
+    result = daytona.create_many(BATCH, concurrency=1, timeout=0.5)
+
+    # The third request is never sent, and the Sandboxes created in time have no time left to start
+    assert len(created) == 2
+    assert not result.sandboxes
+    assert [failure.index for failure in result.failures] == [0, 1, 2]
+    assert result.failures[2].sandbox is None
+    assert isinstance(result.failures[2].error, DaytonaError)
+    assert "deadline" in str(result.failures[2].error)
+
+
+def test_async_params_left_after_deadline_are_recorded_as_failures(monkeypatch):
+    timeouts = []
+
+    async def prefetch_root_dirs(_sandboxes, _concurrency):
+        pass
+
+    monkeypatch.setattr(async_daytona, "_prefetch_root_dirs", prefetch_root_dirs)
+
+    async def run():
+        async with AsyncDaytona(DaytonaConfig(api_key="key", api_url="http://api", target="us")) as daytona:
+
+            async def create_sandbox(_params, timeout):
+                timeouts.append(timeout)
+                await asyncio.sleep(0.3)
+                return SimpleNamespace(id=f"sb{len(timeouts)}")
+
+            async def wait_for_sandboxes_start(_sandboxes, _deadline):
+                return {}
+
+            daytona._create_sandbox = create_sandbox  # pylint: disable=protected-access
+            daytona._wait_for_sandboxes_start = wait_for_sandboxes_start  # pylint: disable=protected-access
+            return await daytona.create_many(BATCH, concurrency=1, timeout=0.5)
+
+    result = asyncio.run(run())
+
+    assert timeouts[0] == pytest.approx(0.5, abs=0.05)
+    assert timeouts[1] == pytest.approx(0.2, abs=0.05)
+    assert [sandbox.id for sandbox in result.sandboxes] == ["sb1", "sb2"]
+    assert [failure.index for failure in result.failures] == [2]
+    assert "deadline" in str(result.failures[0].error)
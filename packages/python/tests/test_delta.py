@@ -0,0 +1,136 @@
+import io
+import os
+
+import httpx
+import pytest
+from daytona_sdk import DaytonaError
+from daytona_sdk._utils.delta import Signature, apply_delta, data_ranges, file_signature, plan
+
+BLOCK_SIZE = 4
+
+
+def signature(data: bytes, tmp_path) -> Signature:
+    path = tmp_path / "file"
+    path.write_bytes(data)
+    return file_signature(str(path), BLOCK_SIZE)
+
+
+def rebuild(old: bytes, new: bytes, tmp_path) -> bytes:
+    ops = plan(signature(new, tmp_path), signature(old, tmp_path), BLOCK_SIZE)
+    data = b"".join(new[offset : offset + length] for offset, length in data_ranges(ops))
+    target = io.BytesIO()
+    apply_delta(io.BytesIO(old), io.BytesIO(data), ops, BLOCK_SIZE, target)
+    return target.getvalue()
+
+
+def test_plan_copies_unchanged_file(tmp_path):
+    data = b"aaaabbbbcccc"
+    assert plan(signature(data, tmp_path), signature(data, tmp_path), BLOCK_SIZE) == [["c", 0, 3]]
+
+
+def test_plan_sends_changed_blocks(tmp_path):
+    ops = plan(signature(b"aaaaXXXXcccc", tmp_path), signature(b"aaaabbbbcccc", tmp_path), BLOCK_SIZE)
+    assert ops == [["c", 0, 1], ["d", 4, 4], ["c", 2, 1]]
+
+
+def test_plan_merges_new_data_and_short_last_block(tmp_path):
+    ops = plan(signature(b"aaaaXXXXYYYYZ", tmp_path), signature(b"aaaa", tmp_path), BLOCK_SIZE)
+    assert ops == [["c", 0, 1], ["d", 4, 9]]
+
+
+def test_plan_finds_moved_blocks(tmp_path):
+    ops = plan(signature(b"ccccaaaabbbb", tmp_path), signature(b"aaaabbbbcccc", tmp_path), BLOCK_SIZE)
+    assert ops == [["c", 2, 1], ["c", 0, 2]]
+
+
+def test_plan_of_truncated_file(tmp_path):
+    ops = plan(signature(b"aaaabbbb", tmp_path), signature(b"aaaabbbbcccc", tmp_path), BLOCK_SIZE)
+    assert ops == [["c", 0, 2]]
+
+
+def test_delta_rebuilds_new_file(tmp_path):
+    old = b"aaaabbbbccccddddee"
+    for new in (b"", b"aaaa", b"ddddXXaaaabbbbcc", b"aaaabbbbccccddddeeFFFF", b"XYZ"):
+        assert rebuild(old, new, tmp_path) == new
+
+
+class TransferMeter:
+    """Wraps a mock toolbox and counts the bytes of the uploaded and downloaded files."""
+
+    def __init__(self, toolbox):
+        self.toolbox = toolbox
+        self.sent = 0
+        self.received = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        response = self.toolbox(request)
+        if request.url.path.endswith("/files/bulk-upload"):
+            self.sent += len(request.content)
+        if request.url.path.endswith("/files/download"):
+            self.received += len(response.content)
+        return response
+
+
+@pytest.fixture(name="meter")
+def fixture_meter(local_toolbox):
+    return TransferMeter(local_toolbox)
+
+
+@pytest.fixture(name="metered_sandbox")
+def fixture_metered_sandbox(sandbox, meter, local_toolbox):
+    return sandbox(meter, root_dir=local_toolbox.root)
+
+
+@pytest.fixture(name="data")
+def fixture_data():
+    return bytearray(os.urandom(1024 * 1024 + 123))
+
+
+def test_delta_upload_sends_changed_blocks(metered_sandbox, local_toolbox, meter, data, tmp_path):
+    local = tmp_path / "db.bin"
+    remote = os.path.join(local_toolbox.root, "db.bin")
+    local.write_bytes(data)
+    metered_sandbox.fs.upload_file(str(local), "db.bin", delta=True)
+    assert meter.sent > len(data)
+    os.chmod(remote, 0o640)
+
+    data[100_000:100_010] = b"0123456789"
+    data += b"appended"
+    local.write_bytes(data)
+    meter.sent = 0
+    metered_sandbox.fs.upload_file(str(local), "db.bin", delta=True)
+
+    assert meter.sent < 200_000
+    with open(remote, "rb") as f:
+        assert f.read() == data
+    assert os.stat(remote).st_mode & 0o777 == 0o640
+    assert os.listdir(local_toolbox.root) == ["db.bin"]
+
+
+def test_delta_download_receives_changed_blocks(metered_sandbox, local_toolbox, meter, data, tmp_path):
+    local = tmp_path / "db.bin"
+    local.write_bytes(data)
+    data[500_000:500_004] = b"abcd"
+    del data[-50:]
+    with open(os.path.join(local_toolbox.root, "db.bin"), "wb") as f:
+        f.write(data)
+
+    metered_sandbox.fs.download_file("db.bin", str(local), delta=True)
+
+    assert meter.received < 200_000
+    assert local.read_bytes() == data
+    assert os.listdir(tmp_path) == ["db.bin", "sandbox"]
+
+
+def test_delta_download_without_local_file(local_sandbox, local_toolbox, data, tmp_path):
+    with open(os.path.join(local_toolbox.root, "db.bin"), "wb") as f:
+        f.write(data)
+
+    local_sandbox.fs.download_file("db.bin", str(tmp_path / "db.bin"), delta=True)
+
+    assert (tmp_path / "db.bin").read_bytes() == data
+
+
+def test_delta_upload_requires_local_file(local_sandbox):
+    with pytest.raises(DaytonaError):
+        local_sandbox.fs.upload_file(b"data", "db.bin", delta=True)
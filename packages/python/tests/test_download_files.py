@@ -0,0 +1,48 @@
+import os
+
+import pytest
+from daytona_sdk import DaytonaError, FileDownload
+
+
+@pytest.fixture(name="results")
+def fixture_results(local_toolbox):
+    root = os.path.join(local_toolbox.root, "results")
+    os.makedirs(os.path.join(root, "sub"))
+    for i in range(100):
+        with open(os.path.join(root, f"{i}.json"), "w", encoding="utf-8") as f:
+            f.write(f'{{"i": {i}}}')
+    os.symlink(os.path.join(root, "1.json"), os.path.join(root, "link.json"))
+    return root
+
+
+def test_download_files_in_one_stream(local_sandbox, local_toolbox, results, tmp_path):
+    files = [FileDownload(f"results/{i}.json", str(tmp_path / f"{i}.json")) for i in range(100)]
+    files += [
+        FileDownload("results/missing.json", str(tmp_path / "missing.json")),
+        FileDownload("results/sub", str(tmp_path / "sub")),
+        FileDownload("results/link.json", str(tmp_path / "link.json")),
+        FileDownload(f"{results}/5.json", str(tmp_path / "again" / "5.json")),
+    ]
+
+    outcomes = local_sandbox.fs.download_files(files)
+
+    assert [outcome.source for outcome in outcomes] == [f.source for f in files]
+    errors = {outcome.source: outcome.error for outcome in outcomes if outcome.error}
+    assert errors == {"results/missing.json": "not found", "results/sub": "not a regular file"}
+    assert (tmp_path / "99.json").read_text() == '{"i": 99}'
+    assert (tmp_path / "link.json").read_text() == '{"i": 1}'
+    assert (tmp_path / "again" / "5.json").read_text() == '{"i": 5}'
+    # The paths are sent in one list and packed by one command, and the staged files are removed
+    ((listed,),) = local_toolbox.uploads
+    assert len(local_toolbox.commands) == 2
+    assert not os.path.exists(listed) and not os.path.exists(listed[: -len(".paths")])
+
+
+def test_iter_download_files_reports_errors_last(local_sandbox, results):
+    downloaded = []
+    with pytest.raises(DaytonaError, match="results/missing.json: not found"):
+        for path, contents in local_sandbox.fs.iter_download_files(["results/3.json", "results/missing.json"]):
+            downloaded.append((path, contents))
+
+    assert downloaded == [("results/3.json", b'{"i": 3}')]
+    assert os.path.exists(os.path.join(results, "3.json"))
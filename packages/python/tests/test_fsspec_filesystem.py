@@ -0,0 +1,70 @@
+import errno
+import os
+import random
+
+import pytest
+
+pytest.importorskip("fsspec")
+pq = pytest.importorskip("pyarrow.parquet")
+pa = pytest.importorskip("pyarrow")
+
+# pylint: disable=wrong-import-position
+from daytona_sdk.fsspec_filesystem import DaytonaFileSystem
+
+
+@pytest.fixture(name="fs")
+def fixture_fs(local_sandbox):
+    return DaytonaFileSystem(sandbox=local_sandbox, block_size=64 * 1024, skip_instance_cache=True)
+
+
+@pytest.fixture(name="base")
+def fixture_base(local_sandbox, local_toolbox):
+    os.makedirs(os.path.join(local_toolbox.root, "data"))
+    return f"{local_sandbox.id}{local_toolbox.root}/data"
+
+
+def test_columnar_reads_fetch_only_needed_ranges(fs, base, local_toolbox):
+    # Random values that do not compress make up most of the file
+    table = pa.table({"a": [i % 100 for i in range(200_000)], "b": [random.random() for _ in range(200_000)]})
+    pq.write_table(table, os.path.join(local_toolbox.root, "data", "x.parquet"), row_group_size=50_000)
+    size = os.path.getsize(os.path.join(local_toolbox.root, "data", "x.parquet"))
+
+    with fs.open(f"daytona://{base}/x.parquet", "rb") as f:
+        column = pq.read_table(f, columns=["a"]).column("a")
+
+    assert column.to_pylist() == [i % 100 for i in range(200_000)]
+    assert all(header and header.startswith("bytes=") for _, header in local_toolbox.downloads)
+    fetched = 0
+    for _, header in local_toolbox.downloads:
+        start, end = header[len("bytes=") :].split("-")
+        fetched += int(end) - int(start) + 1
+    assert fetched < size / 2
+
+
+def test_listing_info_and_writes(fs, base, local_toolbox):
+    with fs.open(f"{base}/out.txt", "wb") as f:
+        f.write(b"hello " * 1000)
+
+    with open(os.path.join(local_toolbox.root, "data", "out.txt"), "rb") as f:
+        assert f.read() == b"hello " * 1000
+    assert fs.ls(f"daytona://{base}", detail=False) == [f"{base}/out.txt"]
+    assert fs.info(f"{base}/out.txt")["size"] == 6000 and fs.isdir(base) and not fs.exists(f"{base}/nope")
+    assert fs.modified(f"{base}/out.txt").tzinfo is not None
+    assert fs.cat_file(f"{base}/out.txt", 6, 11) == b"hello" and fs.cat_file(f"{base}/out.txt", -6) == b"hello "
+
+
+def test_directory_operations(fs, base):
+    fs.mkdir(f"{base}/a/b")
+    fs.pipe_file(f"{base}/a/b/g.txt", b"g")
+    fs.mv(f"{base}/a/b/g.txt", f"{base}/a/g.txt")
+    fs.cp_file(f"{base}/a/g.txt", f"{base}/a/b/h.txt")
+    assert fs.find(base) == [f"{base}/a/b/h.txt", f"{base}/a/g.txt"]
+
+    with pytest.raises(OSError) as error:
+        fs.rmdir(f"{base}/a")
+    assert error.value.errno == errno.ENOTEMPTY
+    with pytest.raises(OSError):
+        fs.rm(f"{base}/a")
+
+    fs.rm(f"{base}/a", recursive=True, maxdepth=5)
+    assert not fs.exists(f"{base}/a")
@@ -0,0 +1,118 @@
+import sys
+import warnings
+
+import httpx
+import pytest
+from daytona_sdk import DaytonaError, InstrumentationHook, LatencyHistogram, OpenTelemetryHook
+
+
+class Recorder(InstrumentationHook):
+    """Hook that records the events it is notified about."""
+
+    def __init__(self):
+        self.started = []
+        self.ended = []
+
+    def on_start(self, event):
+        self.started.append(event.operation)
+
+    def on_end(self, event):
+        self.ended.append(event)
+
+
+class FailingHook(InstrumentationHook):
+    def on_end(self, event):
+        raise ValueError("broken hook")
+
+
+class ToolboxServer:
+    """Mock toolbox that fails the first request of each path with the given status."""
+
+    def __init__(self, status: int = 503):
+        self.status = status
+        self.seen = set()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path not in self.seen and self.status:
+            self.seen.add(request.url.path)
+            return httpx.Response(self.status)
+        if request.url.path.endswith("/process/execute"):
+            return httpx.Response(200, json={"exitCode": 0, "result": "hello"})
+        return httpx.Response(200, content=b"x" * 1000)
+
+
+@pytest.fixture(name="recorder")
+def fixture_recorder(daytona):
+    recorder = Recorder()
+    daytona.add_hook(recorder)
+    return recorder
+
+
+def test_request_event_describes_operation_and_outcome(sandbox, recorder):
+    sb = sandbox(ToolboxServer(status=0))
+
+    sb.process.exec("echo hello")
+
+    event = recorder.ended[-1]
+    assert recorder.started[-1] == event.operation == "execute_command"
+    assert (event.method, event.sandbox_id, event.status, event.retries) == ("POST", "sb1", 200, 0)
+    assert event.bytes_sent > 0
+    assert event.bytes_received == len(b'{"exitCode":0,"result":"hello"}')
+    assert event.duration >= 0
+    assert event.error is None
+
+
+def test_retried_request_is_one_event(sandbox, recorder):
+    sb = sandbox(ToolboxServer())
+
+    assert sb.fs.download_file("/data/a.txt") == b"x" * 1000
+
+    downloads = [event for event in recorder.ended if event.operation == "download_file"]
+    assert len(downloads) == 1
+    assert (downloads[0].status, downloads[0].retries, downloads[0].bytes_received) == (200, 1, 1000)
+
+
+def test_failing_hook_only_warns(daytona, sandbox, recorder):
+    daytona.add_hook(FailingHook())
+    sb = sandbox(ToolboxServer(status=0))
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        sb.process.exec("echo hello")
+
+    assert any("broken hook" in str(warning.message) for warning in caught)
+    assert recorder.ended[-1].status == 200
+
+
+def test_removed_hook_is_not_notified(daytona, sandbox, recorder):
+    daytona.remove_hook(recorder)
+    sandbox(ToolboxServer(status=0)).process.exec("echo hello")
+
+    assert not recorder.started
+    assert not recorder.ended
+
+
+def test_latency_histogram_percentiles():
+    histogram = LatencyHistogram()
+    for i in range(1, 1001):
+        histogram.record("execute_command", i / 1000, error=i % 100 == 0)
+    histogram.record("get_project_dir", 0.01)
+
+    assert histogram.percentile("execute_command", 50) == pytest.approx(0.5, rel=0.05)
+    assert histogram.percentile("execute_command", 99) == pytest.approx(0.99, rel=0.05)
+    assert histogram.percentile("list_files", 50) is None
+    summary = histogram.summary()
+    assert list(summary) == ["execute_command", "get_project_dir"]
+    assert (summary["execute_command"].count, summary["execute_command"].errors) == (1000, 10)
+    assert summary["execute_command"].max == 1.0
+
+    histogram.reset()
+    assert not histogram.summary()
+
+
+def test_open_telemetry_hook_requires_package(monkeypatch):
+    # A None entry makes the import fail as if the package was not installed
+    monkeypatch.setitem(sys.modules, "opentelemetry", None)
+
+    with pytest.raises(DaytonaError, match=r"pip install daytona_sdk\[otel\]"):
+        OpenTelemetryHook()
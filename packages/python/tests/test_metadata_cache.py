@@ -0,0 +1,83 @@
+from types import SimpleNamespace
+
+import pytest
+from daytona_sdk._utils import metadata_cache
+from daytona_sdk._utils.metadata_cache import FILE_INFO, LISTING, MetadataCache
+
+
+@pytest.fixture(name="clock")
+def fixture_clock(monkeypatch):
+    now = SimpleNamespace(value=100.0)
+    monkeypatch.setattr(metadata_cache, "time", SimpleNamespace(monotonic=lambda: now.value))
+    return now
+
+
+@pytest.mark.usefixtures("clock")
+def test_invalidate_drops_path_descendants_and_ancestors():
+    cache = MetadataCache(ttl=10, max_entries=100)
+    for path in ("/", "/a", "/a/b", "/a/b/c", "/a/bc", "/x"):
+        cache.put(LISTING, path, [path])
+        cache.put(FILE_INFO, path, path)
+
+    cache.invalidate("/a/b/")
+
+    cached = {(kind, path) for kind in (FILE_INFO, LISTING) for path in ("/", "/a", "/a/b", "/a/b/c", "/a/bc", "/x")}
+    cached = {key for key in cached if cache.get(*key) is not None}
+    assert cached == {(FILE_INFO, "/a/bc"), (LISTING, "/a/bc"), (FILE_INFO, "/x"), (LISTING, "/x")}
+    assert cache.stats().invalidations == 8
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = MetadataCache(ttl=5, max_entries=100)
+    cache.put(FILE_INFO, "/a", "info")
+    clock.value += 4
+    assert cache.get(FILE_INFO, "/a") == "info"
+    clock.value += 1
+    assert cache.get(FILE_INFO, "/a") is None
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.expirations, stats.size) == (1, 1, 1, 0)
+
+
+@pytest.mark.usefixtures("clock")
+def test_least_recently_used_entries_are_evicted():
+    cache = MetadataCache(ttl=5, max_entries=2)
+    cache.put(FILE_INFO, "/a", "a")
+    cache.put(FILE_INFO, "/b", "b")
+    cache.get(FILE_INFO, "/a")
+    cache.put(FILE_INFO, "/c", "c")
+    assert cache.get(FILE_INFO, "/b") is None
+    assert cache.get(FILE_INFO, "/a") == "a"
+    assert cache.stats().evictions == 1
+
+
+def test_file_system_writes_invalidate_cached_metadata(local_sandbox, local_toolbox):
+    fs = local_sandbox.fs
+    fs.upload_file(b"1", "data/a.txt")
+    fs.metadata_cache.enable(ttl=60)
+
+    for _ in range(3):
+        assert fs.get_file_info("data/a.txt").size == 1
+        assert [f.name for f in fs.list_files("data")] == ["a.txt"]
+    assert len(local_toolbox.info_requests) == 2
+
+    fs.upload_file(b"22", "data/b.txt")
+    assert fs.get_file_info("data/a.txt").size == 1
+    assert [f.name for f in fs.list_files("data")] == ["a.txt", "b.txt"]
+    assert fs.get_file_info("data/b.txt").size == 2
+    assert len(local_toolbox.info_requests) == 4
+
+    stats = fs.metadata_cache.stats
+    assert (stats.hits, stats.misses) == (5, 4)
+    assert stats.hit_rate == pytest.approx(5 / 9)
+
+
+def test_changes_of_commands_show_after_invalidate(local_sandbox):
+    fs = local_sandbox.fs
+    fs.upload_file(b"1", "a.txt")
+    fs.metadata_cache.enable(ttl=60)
+    assert fs.get_file_info("a.txt").size == 1
+
+    local_sandbox.process.exec("printf 22 > a.txt")
+    assert fs.get_file_info("a.txt").size == 1
+    fs.metadata_cache.invalidate("a.txt")
+    assert fs.get_file_info("a.txt").size == 2
@@ -0,0 +1,67 @@
+import io
+import os
+
+import pytest
+from daytona_sdk import DaytonaError
+
+DATA = b"".join(b"line %d\n" % i for i in range(100_000))
+
+
+@pytest.fixture(name="log_file")
+def fixture_log_file(local_toolbox):
+    with open(os.path.join(local_toolbox.root, "app.log"), "wb") as f:
+        f.write(DATA)
+    return "app.log"
+
+
+def test_iterates_lines_in_one_request(local_sandbox, local_toolbox, log_file):
+    with local_sandbox.fs.open_read(log_file, buffer_size=64 * 1024) as f:
+        lines = list(f)
+
+    assert f.closed
+    assert len(lines) == 100_000 and lines[-1] == b"line 99999\n"
+    assert len(local_toolbox.downloads) == 1
+
+
+def test_seek_requests_new_range(local_sandbox, local_toolbox, log_file):
+    with local_sandbox.fs.open_read(log_file) as f:
+        assert f.seekable()
+        assert f.read(10) == DATA[:10]
+        f.seek(-11, os.SEEK_END)
+        assert f.read() == b"line 99999\n"
+        f.seek(100)
+        assert f.read(5) == DATA[100:105] and f.tell() == 105
+        f.seek(5, os.SEEK_CUR)
+        assert f.read(5) == DATA[110:115]
+
+    assert [header for _, header in local_toolbox.downloads][:2] == ["bytes=0-", f"bytes={len(DATA) - 11}-"]
+
+
+def test_readinto_unbuffered(local_sandbox, log_file):
+    with local_sandbox.fs.open_read(log_file, buffer_size=0) as f:
+        buffer = bytearray(1 << 16)
+        received = bytearray()
+        while True:
+            count = f.readinto(buffer)
+            if not count:
+                break
+            received += buffer[:count]
+        assert bytes(received) == DATA and f.size == len(DATA)
+
+        f.seek(len(DATA) + 10)
+        assert f.read(10) == b""
+
+
+def test_text_and_empty_files(local_sandbox, local_toolbox, log_file):
+    with open(os.path.join(local_toolbox.root, "empty"), "wb"):
+        pass
+
+    with local_sandbox.fs.open_read("empty") as f:
+        assert f.read() == b""
+    with io.TextIOWrapper(local_sandbox.fs.open_read(log_file)) as f:
+        assert f.readline() == "line 0\n"
+
+
+def test_missing_file(local_sandbox):
+    with pytest.raises(DaytonaError):
+        local_sandbox.fs.open_read("missing.log")
@@ -0,0 +1,68 @@
+import pytest
+from daytona_sdk import CreateSandboxParams, DaytonaError, SandboxPool, SandboxReturnPolicy
+from daytona_sdk.pool import POOL_LABEL
+
+
+@pytest.fixture(name="created")
+def fixture_created(daytona, sandbox):
+    """Mocks Sandbox creation and deletion, and records the parameters of each created Sandbox."""
+    created = []
+    deleted = []
+
+    def create(params, _timeout=60):
+        created.append(params)
+        return sandbox(id=f"sb{len(created)}")
+
+    daytona.create = create
+    daytona.delete = lambda sandbox, _timeout=60: deleted.append(sandbox.id)
+    return created, deleted
+
+
+def test_default_language_does_not_modify_caller_params(daytona, created):
+    params = CreateSandboxParams(labels={"team": "a"})
+    with SandboxPool(daytona, size=0) as pool:
+        pool.checkout(params)
+
+    assert params.language is None
+    assert params.labels == {"team": "a"}
+    assert created[0][0].language == "python"
+    assert created[0][0].labels[POOL_LABEL] == pool.id
+
+
+def test_params_without_language_share_profile_of_default_language(daytona, created):
+    with SandboxPool(daytona, size=0, return_policy=SandboxReturnPolicy.REUSE) as pool:
+        pool.checkin(pool.checkout(CreateSandboxParams()))
+        pool.checkout(CreateSandboxParams(language="python"))
+
+    assert pool.metrics.hits == 1
+    assert len(created[0]) == 1
+
+
+def test_checkin_after_close_deletes_sandbox(daytona, created):
+    pool = SandboxPool(daytona, size=0, return_policy=SandboxReturnPolicy.RESTART)
+    sandbox = pool.checkout()
+    pool.close()
+
+    pool.checkin(sandbox)
+
+    assert created[1] == ["sb1"]
+    with pytest.raises(DaytonaError, match="closed"):
+        pool.checkout()
+
+
+def test_recycle_is_submitted_before_close_can_shut_down_executor(daytona, created):
+    pool = SandboxPool(daytona, size=0)
+    submit = pool._executor.submit  # pylint: disable=protected-access
+    locked = []
+
+    def checked_submit(fn, *args):
+        # close() marks the pool closed and shuts the executor down only after it took the lock
+        locked.append(pool._condition._is_owned())  # pylint: disable=protected-access
+        return submit(fn, *args)
+
+    pool._executor.submit = checked_submit  # pylint: disable=protected-access
+    pool.checkin(pool.checkout())
+    pool.close()
+
+    assert locked == [True]
+    assert created[1] == ["sb1"]
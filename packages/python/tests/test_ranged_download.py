@@ -0,0 +1,137 @@
+import asyncio
+import re
+from typing import AsyncIterator, Optional
+
+import httpx
+import pytest
+from daytona_sdk._utils.ranged_download import (
+    ContentRange,
+    download_to_file,
+    download_to_file_async,
+    parse_content_range,
+    split_ranges,
+)
+from daytona_sdk.transport import _AsyncHostLimitedTransport, _HostLimitedTransport
+
+URL = "http://api/toolbox/sb1/toolbox/files/download"
+# Waiting for the in-flight slot fails fast instead of hanging
+TIMEOUT = httpx.Timeout(5, pool=1)
+
+
+def test_parse_content_range():
+    assert parse_content_range("bytes 0-99/1000") == ContentRange(0, 99, 1000)
+    assert parse_content_range(" bytes 100-199/* ") == ContentRange(100, 199, None)
+
+
+def test_parse_content_range_rejects_invalid_values():
+    for value in (None, "", "bytes */1000", "bytes 0-99", "items 0-99/1000", "bytes 0-99/1000 extra"):
+        assert parse_content_range(value) is None
+
+
+def test_split_ranges():
+    assert split_ranges(0, 10, 4) == [(0, 3), (4, 7), (8, 9)]
+    assert split_ranges(8, 10, 4) == [(8, 9)]
+    assert split_ranges(10, 10, 4) == []
+
+
+class FileServer:
+    """Mock file server that answers range requests, or the whole file if ranges are not supported."""
+
+    def __init__(self, content: bytes, ranges: bool = True, fail_at: Optional[int] = None):
+        self.content = content
+        self.ranges = ranges
+        self.fail_at = fail_at
+        self.requests = []
+
+    def response(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request.headers.get("Range"))
+        match = re.fullmatch(r"bytes=(\d+)-(\d+)", request.headers.get("Range", ""))
+        if not self.ranges or match is None:
+            return httpx.Response(200, content=self.content)
+        start, end = int(match.group(1)), min(int(match.group(2)), len(self.content) - 1)
+        if start >= len(self.content):
+            # A streamed body keeps the response open, and its in-flight slot taken, until it is closed
+            return httpx.Response(416, content=iter([b"Range Not Satisfiable"]))
+        if start == self.fail_at:
+            return httpx.Response(500)
+        return httpx.Response(
+            206,
+            content=self.content[start : end + 1],
+            headers={"Content-Range": f"bytes {start}-{end}/{len(self.content)}"},
+        )
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        return self.response(request)
+
+
+class AsyncFileServer(FileServer):
+    """Asynchronous mock file server whose range responses take a while, except the failing one."""
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        response = self.response(request)
+        if response.status_code == 416:
+            return httpx.Response(416, content=self.stream(b"Range Not Satisfiable"))
+        if response.status_code == 206 and not request.headers["Range"].startswith("bytes=0-"):
+            await asyncio.sleep(1)
+        return response
+
+    @staticmethod
+    async def stream(content: bytes) -> AsyncIterator[bytes]:
+        yield content
+
+
+def client(server: FileServer) -> httpx.Client:
+    # A single in-flight slot, so a response that is not closed blocks the next request
+    return httpx.Client(transport=_HostLimitedTransport(httpx.MockTransport(server), 1))
+
+
+def test_download_splits_file_into_ranges(tmp_path):
+    server = FileServer(bytes(range(10)))
+    download_to_file(client(server), URL, {}, str(tmp_path / "file"), TIMEOUT, concurrency=3, range_size=4)
+
+    assert (tmp_path / "file").read_bytes() == bytes(range(10))
+    assert server.requests == ["bytes=0-3", "bytes=4-7", "bytes=8-9"]
+
+
+def test_download_streams_whole_file_without_range_support(tmp_path):
+    server = FileServer(bytes(range(10)), ranges=False)
+    download_to_file(client(server), URL, {}, str(tmp_path / "file"), TIMEOUT, concurrency=3, range_size=4)
+
+    assert (tmp_path / "file").read_bytes() == bytes(range(10))
+    assert len(server.requests) == 1
+
+
+def test_empty_file_falls_back_to_full_download(tmp_path):
+    server = FileServer(b"")
+    download_to_file(client(server), URL, {}, str(tmp_path / "file"), TIMEOUT, concurrency=3, range_size=4)
+
+    assert (tmp_path / "file").read_bytes() == b""
+    assert server.requests == ["bytes=0-3", None]
+
+
+def test_async_failed_range_stops_other_ranges(tmp_path):
+    server = AsyncFileServer(bytes(range(16)), fail_at=8)
+
+    async def main():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(server.handle)) as http_client:
+            with pytest.raises(httpx.HTTPStatusError):
+                await download_to_file_async(
+                    http_client, URL, {}, str(tmp_path / "file"), TIMEOUT, concurrency=4, range_size=4
+                )
+            return [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+
+    assert not asyncio.run(main())
+
+
+def test_async_empty_file_falls_back_to_full_download(tmp_path):
+    server = AsyncFileServer(b"")
+
+    async def main():
+        transport = _AsyncHostLimitedTransport(httpx.MockTransport(server.handle), 1)
+        async with httpx.AsyncClient(transport=transport) as http_client:
+            await download_to_file_async(
+                http_client, URL, {}, str(tmp_path / "file"), TIMEOUT, concurrency=3, range_size=4
+            )
+
+    asyncio.run(main())
+    assert server.requests == ["bytes=0-3", None]
@@ -0,0 +1,145 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from daytona_sdk import rate_limit
+from daytona_sdk._utils.routes import TOOLBOX
+from daytona_sdk.rate_limit import ConcurrencyLimiter, RateLimit, RateLimitConfig, RateLimiter, TokenBucket
+from daytona_sdk.transport import _AsyncThrottledTransport, _ThrottledTransport
+
+EXECUTE_URL = "http://api/toolbox/sb1/toolbox/process/execute"
+
+
+@pytest.fixture(name="clock")
+def fixture_clock(monkeypatch):
+    now = SimpleNamespace(value=100.0)
+    monkeypatch.setattr(rate_limit, "time", SimpleNamespace(monotonic=lambda: now.value))
+    return now
+
+
+@pytest.mark.usefixtures("clock")
+def test_token_bucket_allows_burst_then_spaces_tokens():
+    bucket = TokenBucket(rate=10, capacity=2)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.1)
+    # Waiting callers are queued behind each other
+    assert bucket.reserve() == pytest.approx(0.2)
+
+
+def test_token_bucket_refills_up_to_capacity(clock):
+    bucket = TokenBucket(rate=10, capacity=2)
+    bucket.reserve()
+    bucket.reserve()
+    clock.value += 10
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.1)
+
+
+@pytest.mark.usefixtures("clock")
+def test_token_bucket_capacity_defaults_to_one_second_of_tokens():
+    bucket = TokenBucket(rate=2.5)
+    assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+    assert bucket.reserve() > 0
+
+
+def test_concurrency_limiter_hands_slots_to_waiters_in_order():
+    limiter = ConcurrencyLimiter(1)
+    limiter.acquire()
+    order = []
+
+    def worker(name):
+        limiter.acquire()
+        order.append(name)
+        limiter.release()
+
+    threads = []
+    for name in ("first", "second"):
+        thread = threading.Thread(target=worker, args=(name,))
+        thread.start()
+        threads.append(thread)
+        while len(limiter._waiters) < len(threads):  # pylint: disable=protected-access
+            pass
+    limiter.release()
+    for thread in threads:
+        thread.join(5)
+    assert order == ["first", "second"]
+    assert limiter._active == 0  # pylint: disable=protected-access
+
+
+def test_concurrency_limiter_async_cancellation_passes_slot_on():
+    async def main():
+        limiter = ConcurrencyLimiter(1)
+        await limiter.acquire_async()
+        cancelled = asyncio.ensure_future(limiter.acquire_async())
+        waiting = asyncio.ensure_future(limiter.acquire_async())
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        limiter.release()
+        await asyncio.wait_for(waiting, 5)
+        assert cancelled.cancelled()
+        limiter.release()
+        assert limiter._active == 0  # pylint: disable=protected-access
+
+    asyncio.run(main())
+
+
+@pytest.mark.usefixtures("clock")
+def test_token_bucket_takes_no_token_it_can_not_wait_for():
+    bucket = TokenBucket(rate=10, capacity=1)
+    assert bucket.acquire(timeout=0)
+    assert bucket.reserve(max_delay=0.05) is None
+    assert not bucket.acquire(timeout=0.05)
+    # The refused callers did not push the next token further back
+    assert bucket.reserve() == pytest.approx(0.1)
+
+
+def test_concurrency_limiter_timeout_leaves_queue():
+    limiter = ConcurrencyLimiter(1)
+    limiter.acquire()
+    assert not limiter.acquire(timeout=0.05)
+    assert not limiter._waiters  # pylint: disable=protected-access
+    limiter.release()
+    assert limiter._active == 0  # pylint: disable=protected-access
+
+
+def test_concurrency_limiter_async_timeout_leaves_queue():
+    async def main():
+        limiter = ConcurrencyLimiter(1)
+        await limiter.acquire_async()
+        assert not await limiter.acquire_async(timeout=0.05)
+        assert not limiter._waiters  # pylint: disable=protected-access
+        limiter.release()
+        assert await limiter.acquire_async(timeout=0.05)
+
+    asyncio.run(main())
+
+
+def test_throttled_request_raises_pool_timeout():
+    limiter = RateLimiter(RateLimitConfig(toolbox=RateLimit(max_in_flight=1)))
+    client = httpx.Client(
+        transport=_ThrottledTransport(httpx.MockTransport(lambda request: httpx.Response(200)), limiter)
+    )
+    limiter.limiters[TOOLBOX].acquire()
+
+    with pytest.raises(httpx.PoolTimeout, match="toolbox"):
+        client.get(EXECUTE_URL, timeout=httpx.Timeout(None, pool=0.05))
+
+    limiter.limiters[TOOLBOX].release()
+    assert client.get(EXECUTE_URL, timeout=httpx.Timeout(None, pool=0.05)).status_code == 200
+
+
+def test_async_throttled_request_raises_pool_timeout():
+    limiter = RateLimiter(RateLimitConfig(toolbox=RateLimit(requests_per_second=1)))
+    transport = _AsyncThrottledTransport(httpx.MockTransport(lambda request: httpx.Response(200)), limiter)
+
+    async def main():
+        async with httpx.AsyncClient(transport=transport) as client:
+            assert (await client.get(EXECUTE_URL)).status_code == 200
+            await client.get(EXECUTE_URL, timeout=httpx.Timeout(None, pool=0.05))
+
+    with pytest.raises(httpx.PoolTimeout, match="toolbox"):
+        asyncio.run(main())
@@ -0,0 +1,94 @@
+import hashlib
+import os
+from types import SimpleNamespace
+
+import pytest
+from daytona_sdk import DaytonaError
+from daytona_sdk._utils import transfer_journal
+from daytona_sdk._utils.file_transfer import UPLOAD_PARTS_SUFFIX, upload_resumable
+
+REMOTE_PATH = "/data/file.bin"
+STAGING_DIR = f"{REMOTE_PATH}{UPLOAD_PARTS_SUFFIX}"
+CHUNK_SIZE = 1000
+
+
+class ToolboxFiles:
+    """Mock Sandbox file system that keeps uploaded parts in memory and joins them like the shell command."""
+
+    def __init__(self, fail_at=None):
+        self.instance = SimpleNamespace(id="sb1")
+        self.fail_at = fail_at
+        self.parts = {}
+        self.uploaded = []
+        self.joined = None
+
+    def upload(self, uploads, _timeout):
+        (upload,) = uploads
+        name = os.path.basename(upload.destination)
+        if name == self.fail_at:
+            raise DaytonaError("Connection reset")
+        assert not isinstance(upload.source, bytes)
+        chunks = list(iter(lambda: upload.source.read(CHUNK_SIZE), b""))
+        assert max(len(chunk) for chunk in chunks) <= CHUNK_SIZE
+        self.parts[name] = b"".join(chunks)
+        self.uploaded.append(name)
+
+    def sha256_files(self, _directory, _timeout):
+        return {name: hashlib.sha256(data).hexdigest() for name, data in self.parts.items()}
+
+    def run(self, command, _timeout):
+        if command.startswith("rm -rf"):
+            self.parts.clear()
+            return ""
+        self.joined = b"".join(data for _, data in sorted(self.parts.items()))
+        return f"{len(self.joined)}\n"
+
+
+@pytest.fixture(name="local_file")
+def fixture_local_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(transfer_journal, "UPLOAD_JOURNAL_DIR", str(tmp_path / "journals"))
+    path = tmp_path / "file.bin"
+    path.write_bytes(os.urandom(10_500))
+    return path
+
+
+def test_parts_are_streamed_from_file(local_file):
+    files = ToolboxFiles()
+
+    upload_resumable(files, str(local_file), REMOTE_PATH, 60, part_size=4000)
+
+    assert files.uploaded == ["000000", "000001", "000002"]
+    assert [len(data) for _, data in sorted(files.parts.items())] == [4000, 4000, 2500]
+    assert files.joined == local_file.read_bytes()
+
+
+def test_failed_upload_resumes_with_missing_parts(local_file):
+    files = ToolboxFiles(fail_at="000002")
+    with pytest.raises(DaytonaError):
+        upload_resumable(files, str(local_file), REMOTE_PATH, 60, part_size=4000)
+    assert files.uploaded == ["000000", "000001"]
+
+    files.fail_at = None
+    upload_resumable(files, str(local_file), REMOTE_PATH, 60, part_size=4000)
+
+    # The hashes taken while streaming the first attempt match the parts in the Sandbox
+    assert files.uploaded == ["000000", "000001", "000002"]
+    assert files.joined == local_file.read_bytes()
+
+
+def test_corrupted_part_is_uploaded_again(local_file):
+    files = ToolboxFiles(fail_at="000002")
+    with pytest.raises(DaytonaError):
+        upload_resumable(files, str(local_file), REMOTE_PATH, 60, part_size=4000)
+
+    files.fail_at = None
+    files.parts["000001"] = b"corrupted"
+    upload_resumable(files, str(local_file), REMOTE_PATH, 60, part_size=4000)
+
+    assert files.uploaded == ["000000", "000001", "000001", "000002"]
+    assert files.joined == local_file.read_bytes()
+
+
+def test_only_local_files_can_be_resumed():
+    with pytest.raises(DaytonaError, match="local file"):
+        upload_resumable(ToolboxFiles(), b"data", REMOTE_PATH, 60, part_size=4000)
@@ -0,0 +1,100 @@
+import httpx
+import pytest
+from daytona_sdk import CreateSandboxParams
+from daytona_sdk._utils import root_dir_cache
+from daytona_sdk._utils.root_dir_cache import RootDirCache, prefetch_root_dirs
+from daytona_sdk.code_toolbox.sandbox_python_code_toolbox import SandboxPythonCodeToolbox
+from daytona_sdk.sandbox import Sandbox
+
+
+class ToolboxServer:
+    """Mock toolbox that counts the root directory requests and answers file requests."""
+
+    def __init__(self, status: int = 200):
+        self.status = status
+        self.root_dir_requests = 0
+        self.paths = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/project-dir"):
+            self.root_dir_requests += 1
+            return httpx.Response(self.status, json={"dir": "/home/daytona"})
+        self.paths.append(request.url.params["path"])
+        return httpx.Response(200, json=[])
+
+
+@pytest.fixture(name="server")
+def fixture_server(serve):
+    server = ToolboxServer()
+    serve(server)
+    return server
+
+
+def sandboxes(daytona, workspace, *states):
+    return [
+        Sandbox(
+            f"sb{i}",
+            workspace(id=f"sb{i}", state=state),
+            daytona.sandbox_api,
+            daytona.toolbox_api,
+            SandboxPythonCodeToolbox(),
+        )
+        for i, state in enumerate(states)
+    ]
+
+
+def test_create_resolves_root_dir_before_first_operation(daytona, workspace, server):
+    daytona.sandbox_api.create_workspace = lambda request, _request_timeout=None: workspace(id="sb1")
+    daytona.sandbox_api.get_workspace = lambda sandbox_id, **kwargs: workspace(id=sandbox_id)
+
+    sandbox = daytona.create(CreateSandboxParams(language="python"))
+    assert server.root_dir_requests == 1
+
+    sandbox.fs.list_files("data")
+    assert server.paths == ["/home/daytona/data"]
+    assert server.root_dir_requests == 1
+
+
+def test_root_dir_is_shared_by_sandbox_objects_of_client(daytona, workspace, server):
+    first, second = sandboxes(daytona, workspace, "started", "started")
+    first.prefetch_root_dir()
+    again = sandboxes(daytona, workspace, "started")[0]
+
+    again.fs.list_files("data")
+    second.fs.list_files("data")
+
+    assert server.root_dir_requests == 2
+
+
+def test_prefetch_skips_sandboxes_not_started_or_cached(daytona, workspace, server):
+    started, stopped, cached = sandboxes(daytona, workspace, "started", "stopped", "started")
+    RootDirCache.for_api_client(daytona.toolbox_api.api_client).set(cached.id, "/root")
+
+    prefetch_root_dirs([started, stopped, cached])
+
+    assert server.root_dir_requests == 1
+    stopped.fs.list_files("data")
+    cached.fs.list_files("data")
+    assert server.paths == ["/home/daytona/data", "/root/data"]
+
+
+def test_prefetch_errors_are_ignored(daytona, workspace, server):
+    server.status = 500
+    sandbox = sandboxes(daytona, workspace, "started")[0]
+
+    sandbox.prefetch_root_dir()
+
+    server.status = 200
+    sandbox.fs.list_files("data")
+    assert server.paths == ["/home/daytona/data"]
+
+
+def test_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(root_dir_cache, "MAX_ENTRIES", 2)
+    cache = RootDirCache()
+    cache.set("sb1", "/one")
+    cache.set("sb2", "/two")
+    cache.get("sb1")
+    cache.set("sb3", "/three")
+
+    assert (cache.get("sb1"), cache.get("sb2"), cache.get("sb3")) == ("/one", None, "/three")
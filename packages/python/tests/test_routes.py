@@ -0,0 +1,45 @@
+from daytona_sdk._utils.routes import FILE_TRANSFER, LIFECYCLE, TOOLBOX, classify, sandbox_id
+
+
+def test_classify_known_endpoints():
+    route = classify("get", "/api/toolbox/sb1/toolbox/files/info")
+    assert (route.operation, route.idempotent, route.endpoint_class) == ("get_file_info", True, TOOLBOX)
+
+    route = classify("POST", "/api/toolbox/sb1/toolbox/process/execute")
+    assert (route.operation, route.idempotent, route.endpoint_class) == ("execute_command", False, TOOLBOX)
+
+    route = classify("POST", "/api/workspace/sb1/start")
+    assert (route.operation, route.idempotent, route.endpoint_class) == ("start_workspace", False, LIFECYCLE)
+
+
+def test_classify_prefers_most_specific_route():
+    assert classify("GET", "/api/workspace/sb1").operation == "get_workspace"
+    assert classify("GET", "/api/workspace").operation == "list_workspaces"
+    assert classify("GET", "/api/toolbox/sb1/toolbox/files").operation == "list_files"
+    assert classify("GET", "/api/toolbox/sb1/toolbox/files/download").operation == "download_file"
+
+
+def test_classify_file_transfers():
+    for method, path in (
+        ("GET", "/api/toolbox/sb1/toolbox/files/download"),
+        ("POST", "/api/toolbox/sb1/toolbox/files/bulk-upload"),
+    ):
+        route = classify(method, path)
+        assert route.endpoint_class == FILE_TRANSFER
+        assert route.idempotent
+
+
+def test_classify_unknown_endpoints():
+    route = classify("POST", "/api/toolbox/sb1/toolbox/new")
+    assert (route.operation, route.idempotent, route.endpoint_class) == (
+        "POST /api/toolbox/sb1/toolbox/new",
+        False,
+        TOOLBOX,
+    )
+    assert classify("GET", "/api/other").idempotent
+
+
+def test_sandbox_id():
+    assert sandbox_id("/api/toolbox/sb1/toolbox/files") == "sb1"
+    assert sandbox_id("/api/workspace/sb2/start") == "sb2"
+    assert sandbox_id("/api/volumes") is None
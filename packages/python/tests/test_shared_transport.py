@@ -0,0 +1,88 @@
+import asyncio
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+from daytona_sdk import DaytonaError, FileUpload, TransportConfig
+from daytona_sdk.transport import HttpTransport, get_transport
+
+
+class ToolboxServer:
+    """Mock toolbox that records every request and tracks the requests in flight."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.paths = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        with self.lock:
+            self.paths.append(request.url.path.rsplit("/toolbox/", 1)[-1])
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+        if request.url.path.endswith("/process/execute"):
+            return httpx.Response(200, json={"exitCode": 0, "result": "hello"})
+        if request.url.path.endswith("/files"):
+            return httpx.Response(200, json=[])
+        return httpx.Response(200, content=b"content")
+
+
+@pytest.fixture(name="transport")
+def fixture_transport(retry):
+    return TransportConfig(max_connections_per_host=2, retry=retry)
+
+
+def test_api_and_toolbox_share_one_connection_pool(daytona):
+    transport = get_transport(daytona.sandbox_api.api_client)
+
+    assert get_transport(daytona.toolbox_api.api_client) is transport
+    assert transport.config.max_connections_per_host == 2
+
+
+def test_commands_and_file_transfers_use_shared_client(sandbox):
+    server = ToolboxServer()
+    sb = sandbox(server)
+
+    sb.process.exec("echo hello")
+    sb.fs.upload_files([FileUpload(b"content", "/data/a.txt")])
+    assert sb.fs.download_file("/data/a.txt") == b"content"
+
+    assert server.paths == ["process/execute", "files/bulk-upload", "files/download"]
+
+
+def test_requests_to_one_host_are_limited(sandbox):
+    server = ToolboxServer(delay=0.1)
+    sb = sandbox(server)
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        list(executor.map(lambda _: sb.fs.list_files("/data"), range(6)))
+
+    assert server.max_in_flight == 2
+
+
+def test_async_client_is_shared_within_event_loop(daytona):
+    transport = get_transport(daytona.sandbox_api.api_client)
+
+    async def clients():
+        return transport.async_client(), transport.async_client()
+
+    first, second = asyncio.run(clients())
+
+    assert first is second
+    assert first is not asyncio.run(clients())[0]
+
+
+def test_http2_without_h2_package_is_rejected(monkeypatch):
+    # A None entry makes the import fail as if the package was not installed
+    monkeypatch.setitem(sys.modules, "h2", None)
+
+    with pytest.raises(DaytonaError, match=r"pip install daytona_sdk\[http2\]"):
+        HttpTransport(TransportConfig(http2=True))
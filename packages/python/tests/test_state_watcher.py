@@ -0,0 +1,95 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+
+import pytest
+from daytona_sdk._async.state_watcher import AsyncSandboxStateWatcher
+from daytona_sdk._utils.state_watcher import BATCH_THRESHOLD, MAX_CONCURRENT_FETCHES, SandboxStateWatcher
+
+SANDBOX_IDS = [f"sb{i}" for i in range(2 * MAX_CONCURRENT_FETCHES)]
+
+
+class SandboxApi:
+    """Mock Sandbox API that answers every request after a delay and tracks the requests in flight."""
+
+    def __init__(self, workspace, delay: float = 0.1):
+        self.workspace = workspace
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = []
+
+    def get_workspace(self, sandbox_id, **_kwargs):
+        self.start("get")
+        time.sleep(self.delay)
+        return self.done(self.workspace(id=sandbox_id))
+
+    def list_workspaces(self, **_kwargs):
+        self.start("list")
+        time.sleep(self.delay)
+        return self.done([self.workspace(id=f"sb{i}", labels={"batch": "a"}) for i in range(BATCH_THRESHOLD)])
+
+    def start(self, call):
+        with self.lock:
+            self.calls.append(call)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def done(self, result):
+        with self.lock:
+            self.in_flight -= 1
+        return result
+
+
+class AsyncApiClient:
+    """Mock async API client that answers the requests of a `SandboxApi` without blocking the event loop."""
+
+    async def call(self, sandbox_api, method, _response_type, **kwargs):
+        sandbox_api.start(method)
+        await asyncio.sleep(sandbox_api.delay)
+        return sandbox_api.done(sandbox_api.workspace(id=kwargs["workspace_id"]))
+
+
+def waiters(watcher, sandbox_ids, labels=None):
+    new_waiter = watcher._new_waiter  # pylint: disable=protected-access
+    return [new_waiter(sandbox_id, {"started"}, False, labels, Future()) for sandbox_id in sandbox_ids]
+
+
+@pytest.fixture(name="sandbox_api")
+def fixture_sandbox_api(workspace):
+    return SandboxApi(workspace)
+
+
+def test_single_fetches_run_concurrently_within_bound(sandbox_api):
+    watcher = SandboxStateWatcher(sandbox_api)
+
+    start = time.monotonic()
+    watcher._poll(waiters(watcher, SANDBOX_IDS))  # pylint: disable=protected-access
+
+    assert sorted(watcher._last_states) == sorted(SANDBOX_IDS)  # pylint: disable=protected-access
+    assert sandbox_api.max_in_flight == MAX_CONCURRENT_FETCHES
+    # Two waves of requests in flight instead of one request after another
+    assert time.monotonic() - start < MAX_CONCURRENT_FETCHES * sandbox_api.delay
+
+
+def test_labeled_group_is_listed_with_one_request(sandbox_api):
+    watcher = SandboxStateWatcher(sandbox_api)
+    labeled = waiters(watcher, [f"sb{i}" for i in range(BATCH_THRESHOLD)], {"batch": "a"})
+
+    watcher._poll(labeled + waiters(watcher, ["other"]))  # pylint: disable=protected-access
+
+    assert sorted(sandbox_api.calls) == ["get", "list"]
+
+
+def test_async_single_fetches_run_concurrently_within_bound(sandbox_api):
+    async def run():
+        watcher = AsyncSandboxStateWatcher(sandbox_api, AsyncApiClient())
+        await watcher._poll(waiters(watcher, SANDBOX_IDS))  # pylint: disable=protected-access
+        return watcher
+
+    watcher = asyncio.run(run())
+
+    assert sorted(watcher._last_states) == sorted(SANDBOX_IDS)  # pylint: disable=protected-access
+    assert sandbox_api.max_in_flight == MAX_CONCURRENT_FETCHES
@@ -0,0 +1,96 @@
+import asyncio
+import os
+import subprocess
+from typing import AsyncIterator, Iterator
+
+import httpx
+import pytest
+from daytona_sdk import DaytonaError, FileUpload
+from daytona_sdk._async.api_client import AsyncApiClient
+from daytona_sdk._async.filesystem import AsyncFileSystem
+
+ROWS = b"".join(b"row %d\n" % i for i in range(1000))
+
+
+def rows() -> Iterator[bytes]:
+    for i in range(1000):
+        yield b"row %d\n" % i
+
+
+async def async_rows() -> AsyncIterator[bytes]:
+    for i in range(1000):
+        yield b"row %d\n" % i
+
+
+def read(root: str, path: str) -> bytes:
+    with open(os.path.join(root, path), "rb") as f:
+        return f.read()
+
+
+def test_upload_generator_and_pipe(local_sandbox, local_toolbox):
+    local_sandbox.fs.upload_file(rows(), "rows.txt")
+    with subprocess.Popen(["seq", "1", "50000"], stdout=subprocess.PIPE) as process:
+        local_sandbox.fs.upload_files(
+            [FileUpload(process.stdout, "seq.txt"), FileUpload(b"x", "x.txt")], compression="gzip"
+        )
+
+    assert read(local_toolbox.root, "rows.txt") == ROWS
+    assert read(local_toolbox.root, "seq.txt") == subprocess.check_output(["seq", "1", "50000"])
+    assert sorted(os.listdir(local_toolbox.root)) == ["rows.txt", "seq.txt", "x.txt"]
+
+
+def test_only_replayable_uploads_are_retried(local_sandbox, local_toolbox, serve):
+    def fail(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/files/bulk-upload"):
+            attempts.append(request)
+            return httpx.Response(503)
+        return local_toolbox(request)
+
+    attempts = []
+    serve(fail)
+
+    with pytest.raises(DaytonaError):
+        local_sandbox.fs.upload_file(b"rows", "rows.txt")
+    assert len(attempts) == 4
+
+    attempts.clear()
+    with pytest.raises(DaytonaError):
+        local_sandbox.fs.upload_file(rows(), "rows.txt")
+    assert len(attempts) == 1
+
+
+def test_sync_sandbox_rejects_async_iterators(local_sandbox):
+    with pytest.raises(DaytonaError, match="AsyncSandbox"):
+        local_sandbox.fs.upload_file(async_rows(), "rows.txt")
+
+
+def test_async_upload_of_streams(local_sandbox, local_toolbox, daytona, tmp_path):
+    local = tmp_path / "local.bin"
+    local.write_bytes(os.urandom(100_000))
+
+    async def root_dir() -> str:
+        return local_toolbox.root
+
+    async def main():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(local_toolbox)) as http_client:
+            api = AsyncApiClient(daytona.toolbox_api.api_client, http_client=http_client)
+            fs = AsyncFileSystem(local_sandbox.instance, daytona.toolbox_api, api, root_dir)
+            await fs.upload_files(
+                [
+                    FileUpload(async_rows(), "async.txt"),
+                    FileUpload(rows(), "sync.txt"),
+                    FileUpload(str(local), "local.bin"),
+                    FileUpload(b"quote", 'q"uote.txt'),
+                ]
+            )
+            process = await asyncio.create_subprocess_exec("seq", "1", "1000", stdout=asyncio.subprocess.PIPE)
+            await fs.upload_file(process.stdout, "seq.txt")
+            await process.wait()
+
+    asyncio.run(main())
+
+    assert read(local_toolbox.root, "async.txt") == ROWS
+    assert read(local_toolbox.root, "sync.txt") == ROWS
+    assert read(local_toolbox.root, "local.bin") == local.read_bytes()
+    assert read(local_toolbox.root, 'q"uote.txt') == b"quote"
+    assert read(local_toolbox.root, "seq.txt").splitlines()[-1] == b"1000"
@@ -0,0 +1,110 @@
+import os
+
+import pytest
+from daytona_sdk import DaytonaError
+from daytona_sdk._utils.streamed_search import DONE_MARKER, FIND_SEPARATOR, GREP_SEPARATOR, RecordReader, parse_match
+
+
+def test_record_reader_splits_records_across_chunks():
+    reader = RecordReader(GREP_SEPARATOR)
+    padding = b"x" * len(DONE_MARKER)
+    assert reader.feed(b"/a\x001:one\n/b\x00") == []
+    assert reader.feed(b"2:" + padding + b"\n/c") == [b"/a\x001:one"]
+    assert reader.feed(b"\x003:" + padding) == [b"/b\x002:" + padding]
+    assert not reader.done
+    assert reader.feed(b"\n" + DONE_MARKER) == [b"/c\x003:" + padding]
+    assert reader.done
+
+
+def test_record_reader_detects_marker_split_across_chunks():
+    reader = RecordReader(FIND_SEPARATOR)
+    output = b"/a\0/b\0" + DONE_MARKER
+    records = []
+    for i in range(len(output)):
+        records += reader.feed(output[i : i + 1])
+    assert records == [b"/a", b"/b"]
+    assert reader.done
+
+
+def test_record_reader_drain_drops_incomplete_record():
+    reader = RecordReader(GREP_SEPARATOR)
+    reader.feed(b"/a\x001:x\n/b\x00")
+    assert reader.drain() == [b"/a\x001:x"]
+
+
+def test_parse_match():
+    assert parse_match(b"/a b\x0012:x: y") == ("/a b", 12, "x: y")
+    assert parse_match(b"no separator") is None
+    assert parse_match(b"/a\x00x:y") is None
+
+
+@pytest.fixture(name="notes")
+def fixture_notes(local_toolbox):
+    base = os.path.join(local_toolbox.root, "notes")
+    for i in range(4):
+        os.makedirs(os.path.join(base, f"d{i}"))
+        for j in range(5):
+            with open(os.path.join(base, f"d{i}", f"n{j}.txt"), "w", encoding="utf-8") as f:
+                f.write("keep\nTODO: a.b*\nTODO: axb\n")
+    with open(os.path.join(base, "blob.bin"), "wb") as f:
+        f.write(b"\0TODO: a.b*\n")
+    return base
+
+
+def staged(local_toolbox):
+    """Returns the staged search outputs that were read and are still in the Sandbox."""
+    paths = {path for path, _ in local_toolbox.downloads}
+    assert paths and all(path.endswith(".search") for path in paths)
+    return [path for path in paths if os.path.exists(path)]
+
+
+def test_find_files_pages_follow_streamed_order(local_sandbox, local_toolbox, notes):
+    matches = [(m.file, m.line, m.content) for m in local_sandbox.fs.iter_find_files("notes", "TODO:")]
+    assert len(matches) == 40 and all(file.startswith(notes) for file, _, _ in matches)
+
+    pages = []
+    offset = 0
+    while page := local_sandbox.fs.find_files("notes", "TODO:", offset=offset, max_results=15):
+        pages.append([(m.file, m.line, m.content) for m in page])
+        offset += len(page)
+    assert [len(page) for page in pages] == [15, 15, 10]
+    assert sum(pages, []) == matches
+    assert not staged(local_toolbox)
+
+
+@pytest.mark.usefixtures("notes")
+def test_find_files_pattern_is_literal(local_sandbox):
+    matches = list(local_sandbox.fs.iter_find_files("notes", "a.b*"))
+    assert len(matches) == 20
+    assert all(m.line == 2 and m.content == "TODO: a.b*" for m in matches)
+    assert not any(m.file.endswith("blob.bin") for m in matches)
+
+
+def test_iter_find_files_stops_early(local_sandbox, local_toolbox, notes):
+    local_toolbox.downloads.clear()
+    matches = local_sandbox.fs.iter_find_files("notes", "TODO:")
+    assert next(matches).file.startswith(notes)
+    matches.close()
+    assert not staged(local_toolbox)
+
+    assert len(list(local_sandbox.fs.iter_find_files("notes", "TODO:", offset=38, max_results=5))) == 2
+
+
+def test_search_files_pages(local_sandbox, notes):
+    paths = list(local_sandbox.fs.iter_search_files("notes", "*.txt"))
+    assert sorted(paths) == sorted(os.path.join(notes, f"d{i}", f"n{j}.txt") for i in range(4) for j in range(5))
+    assert local_sandbox.fs.search_files("notes", "*.txt", max_results=7).files == paths[:7]
+    assert local_sandbox.fs.search_files("notes", "*.txt", offset=18, max_results=7).files == paths[18:]
+    assert list(local_sandbox.fs.iter_search_files("notes", "d*")) == [
+        p for p in local_sandbox.fs.iter_search_files("notes", "*") if os.path.basename(p).startswith("d")
+    ]
+
+
+@pytest.mark.usefixtures("notes")
+def test_streamed_search_errors(local_sandbox):
+    with pytest.raises(DaytonaError):
+        list(local_sandbox.fs.iter_find_files("missing", "TODO:"))
+    with pytest.raises(DaytonaError):
+        local_sandbox.fs.search_files("missing", "*", max_results=1)
+    with pytest.raises(DaytonaError, match="must not be negative"):
+        local_sandbox.fs.find_files("notes", "TODO:", offset=-1)
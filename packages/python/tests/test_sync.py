@@ -0,0 +1,100 @@
+import os
+from pathlib import Path
+
+import pytest
+from daytona_sdk._utils.sync import ManifestEntry, compare_manifests, parse_remote_manifest
+
+
+def test_parse_remote_manifest():
+    output = b"10\t1700000000.5\ta.txt\x000\t1700000001.0\tdir/with\ttab\x00"
+    assert parse_remote_manifest(output) == {
+        "a.txt": ManifestEntry(10, 1700000000.5),
+        "dir/with\ttab": ManifestEntry(0, 1700000001.0),
+    }
+
+
+def test_parse_remote_manifest_skips_invalid_records():
+    assert not parse_remote_manifest(b"")
+    assert not parse_remote_manifest(b"x\t1.0\ta\x0010\tnan?\tb\x0010\t1.0\t\x00")
+
+
+def test_compare_manifests():
+    local = {
+        "new": ManifestEntry(1, 1.0),
+        "resized": ManifestEntry(2, 1.0),
+        "same": ManifestEntry(3, 1.0),
+        "touched": ManifestEntry(4, 1.0),
+    }
+    remote = {
+        "resized": ManifestEntry(5, 1.0),
+        "same": ManifestEntry(3, 1.0000000001),
+        "touched": ManifestEntry(4, 2.0),
+        "deleted": ManifestEntry(6, 1.0),
+    }
+    assert compare_manifests(local, remote) == (["new", "resized"], ["same"], ["touched"])
+
+
+def write_tree(root, files):
+    for path, content in files.items():
+        (root / path).parent.mkdir(parents=True, exist_ok=True)
+        (root / path).write_text(content)
+
+
+@pytest.fixture(name="project")
+def fixture_project(tmp_path):
+    root = tmp_path / "project"
+    write_tree(
+        root,
+        {
+            "a.txt": "A",
+            "sub/b.txt": "B",
+            "sub/deep/c.py": "C",
+            "build/x.o": "X",
+            "app.log": "L",
+            "keep.log": "K",
+            ".gitignore": "build/\n*.log\n!keep.log\n",
+            ".git/HEAD": "ref",
+            "sp ace's.txt": "S",
+        },
+    )
+    return root
+
+
+def test_sync_dir_uploads_only_changed_files(local_sandbox, local_toolbox, project):
+    remote = os.path.join(local_toolbox.root, "proj")
+
+    result = local_sandbox.fs.sync_dir(str(project), "proj", respect_gitignore=True)
+    assert result.uploaded == [".gitignore", "a.txt", "keep.log", "sp ace's.txt", "sub/b.txt", "sub/deep/c.py"]
+    assert not os.path.exists(os.path.join(remote, "build")) and not os.path.exists(os.path.join(remote, ".git"))
+
+    local_toolbox.uploads.clear()
+    result = local_sandbox.fs.sync_dir(str(project), "proj", respect_gitignore=True)
+    assert not result.uploaded and len(result.unchanged) == 6
+    assert not local_toolbox.uploads
+
+    # The same size and a different content is found by hashing the file on both sides
+    (project / "a.txt").write_text("Z")
+    (project / "sub/b.txt").write_text("BB")
+    result = local_sandbox.fs.sync_dir(str(project), "proj", respect_gitignore=True)
+    assert result.uploaded == ["a.txt", "sub/b.txt"]
+    assert Path(remote, "a.txt").read_text(encoding="utf-8") == "Z"
+
+
+def test_sync_dir_deletes_selected_files(local_sandbox, local_toolbox, project):
+    remote = os.path.join(local_toolbox.root, "proj")
+    local_sandbox.fs.sync_dir(str(project), "proj", respect_gitignore=True)
+    (project / "sub/deep/c.py").unlink()
+    write_tree(Path(remote), {"build/remote.o": "R"})
+
+    result = local_sandbox.fs.sync_dir(str(project), "proj", delete=True, respect_gitignore=True)
+
+    # Ignored files of the Sandbox directory are kept
+    assert result.deleted == ["sub/deep/c.py"]
+    assert not os.path.exists(os.path.join(remote, "sub/deep/c.py"))
+    assert os.path.exists(os.path.join(remote, "build/remote.o"))
+
+
+def test_sync_dir_include_patterns(local_sandbox, project):
+    result = local_sandbox.fs.sync_dir(str(project), "proj", include=["*.txt"], exclude=["sub"])
+
+    assert result.uploaded == ["a.txt", "sp ace's.txt"]
@@ -0,0 +1,100 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from daytona_sdk import DaytonaError
+from daytona_sdk._utils.timeout import remaining_timeout, time_left, with_timeout
+
+
+class Waiter:  # pylint: disable=unused-argument
+    """Polls like the SDK wait loops, taking the budget of each step from the deadline."""
+
+    def __init__(self):
+        self.budgets = []
+
+    @with_timeout(error_message=lambda self, timeout: f"Waiter timed out after {timeout} seconds")
+    def wait(self, timeout=None, steps=3, step=0.1):
+        for _ in range(steps):
+            self.budgets.append(remaining_timeout(30))
+            time.sleep(step)
+        return "done"
+
+    @with_timeout()
+    def wait_twice(self, timeout=None, inner_timeout=None, steps=3):
+        return self.wait(inner_timeout, steps), remaining_timeout()
+
+    @with_timeout()
+    async def wait_async(self, timeout=None):
+        self.budgets.append(remaining_timeout())
+        await asyncio.sleep(1)
+
+
+def test_remaining_timeout_without_deadline_is_call_timeout():
+    assert remaining_timeout() is None
+    assert remaining_timeout(0) is None
+    assert remaining_timeout(5) == 5
+
+
+def test_requests_get_budget_left_until_deadline():
+    waiter = Waiter()
+
+    assert waiter.wait(1) == "done"
+
+    assert waiter.budgets[0] == pytest.approx(1.0, abs=0.05)
+    assert waiter.budgets[2] == pytest.approx(0.8, abs=0.05)
+    assert remaining_timeout() is None
+
+
+def test_deadline_stops_wait_in_calling_thread():
+    waiter = Waiter()
+    threads = threading.active_count()
+
+    with pytest.raises(TimeoutError, match="Waiter timed out after 0.15 seconds"):
+        waiter.wait(0.15)
+
+    assert len(waiter.budgets) == 2
+    assert threading.active_count() == threads
+
+
+def test_nested_timeout_does_not_extend_outer_deadline():
+    waiter = Waiter()
+
+    with pytest.raises(TimeoutError, match="'wait_twice' exceeded timeout of 0.15 seconds"):
+        waiter.wait_twice(0.15, inner_timeout=10)
+
+    assert waiter.budgets[0] == pytest.approx(0.15, abs=0.05)
+
+
+def test_nested_shorter_timeout_applies_within_outer_deadline():
+    waiter = Waiter()
+
+    result, budget = waiter.wait_twice(10, inner_timeout=1, steps=1)
+
+    assert result == "done"
+    assert waiter.budgets[0] == pytest.approx(1.0, abs=0.05)
+    assert budget == pytest.approx(9.9, abs=0.05)
+
+
+def test_async_wait_is_cancelled_at_deadline():
+    waiter = Waiter()
+    start = time.monotonic()
+
+    with pytest.raises(TimeoutError, match="'wait_async' exceeded timeout of 0.1 seconds"):
+        asyncio.run(waiter.wait_async(0.1))
+
+    assert time.monotonic() - start < 0.5
+    assert waiter.budgets[0] == pytest.approx(0.1, abs=0.05)
+
+
+def test_negative_timeout_is_rejected():
+    with pytest.raises(DaytonaError, match="non-negative"):
+        Waiter().wait(-1)
+
+
+def test_time_left_of_batch():
+    assert time_left(None, 5) == 5
+    assert time_left(None, 0) is None
+    assert time_left(time.monotonic() + 2) == pytest.approx(2, abs=0.05)
+    with pytest.raises(TimeoutError):
+        time_left(time.monotonic() - 1)
@@ -0,0 +1,117 @@
+import asyncio
+
+import httpx
+import pytest
+from daytona_sdk.transport import (
+    NO_RETRY_EXTENSION,
+    RETRIES_EXTENSION,
+    RetryConfig,
+    _AsyncRetryingTransport,
+    _RetryBudget,
+    _RetryingTransport,
+    _RetryPolicy,
+)
+
+FILE_INFO_URL = "http://api/toolbox/sb1/toolbox/files/info"
+EXECUTE_URL = "http://api/toolbox/sb1/toolbox/process/execute"
+
+
+class Server:
+    """Mock server that answers requests with the given responses or errors in turn."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        result = self.results.pop(0) if len(self.results) > 1 else self.results[0]
+        if isinstance(result, Exception):
+            raise result
+        return httpx.Response(result[0], headers=result[1]) if isinstance(result, tuple) else httpx.Response(result)
+
+
+def client(server: Server, **config) -> httpx.Client:
+    retry = RetryConfig(**{"backoff_base": 0.0, **config})
+    return httpx.Client(
+        transport=_RetryingTransport(httpx.MockTransport(server), _RetryPolicy(retry, _RetryBudget(retry)))
+    )
+
+
+def test_retries_failed_safe_requests():
+    server = Server(503, 502, 200)
+    response = client(server).get(FILE_INFO_URL)
+    assert response.status_code == 200
+    assert response.extensions[RETRIES_EXTENSION] == 2
+    assert len(server.requests) == 3
+
+
+def test_returns_last_response_after_max_retries():
+    server = Server(503)
+    assert client(server, max_retries=2).get(FILE_INFO_URL).status_code == 503
+    assert len(server.requests) == 3
+
+
+def test_retries_unsafe_requests_only_if_not_processed():
+    server = Server(503)
+    assert client(server).post(EXECUTE_URL).status_code == 503
+    assert len(server.requests) == 1
+
+    server = Server(429, 200)
+    assert client(server).post(EXECUTE_URL).status_code == 200
+    assert len(server.requests) == 2
+
+    server = Server(httpx.ConnectError("refused"), 200)
+    assert client(server).post(EXECUTE_URL).status_code == 200
+    assert len(server.requests) == 2
+
+
+def test_retries_read_errors_of_safe_requests_only():
+    server = Server(httpx.ReadError("reset"), 200)
+    assert client(server).get(FILE_INFO_URL).status_code == 200
+    assert len(server.requests) == 2
+
+    server = Server(httpx.ReadError("reset"), 200)
+    with pytest.raises(httpx.ReadError):
+        client(server).post(EXECUTE_URL)
+    assert len(server.requests) == 1
+
+
+def test_honors_retry_after_up_to_limit():
+    server = Server((429, {"Retry-After": "0"}), 200)
+    assert client(server).get(FILE_INFO_URL).status_code == 200
+    assert len(server.requests) == 2
+
+    server = Server((429, {"Retry-After": "120"}), 200)
+    assert client(server, max_retry_after=60).get(FILE_INFO_URL).status_code == 429
+    assert len(server.requests) == 1
+
+
+def test_no_retry_extension_disables_retries():
+    server = Server(503, 200)
+    response = client(server).get(FILE_INFO_URL, extensions={NO_RETRY_EXTENSION: True})
+    assert response.status_code == 503
+    assert len(server.requests) == 1
+
+
+def test_retry_budget_caps_retries():
+    server = Server(503)
+    http_client = client(server, budget_min_retries=2, budget_ratio=0.0)
+    http_client.get(FILE_INFO_URL)
+    assert len(server.requests) == 3
+    http_client.get(FILE_INFO_URL)
+    assert len(server.requests) == 4
+
+
+def test_async_retries_failed_safe_requests():
+    server = Server(httpx.ConnectError("refused"), 503, 200)
+    retry = RetryConfig(backoff_base=0.0)
+    transport = _AsyncRetryingTransport(httpx.MockTransport(server), _RetryPolicy(retry, _RetryBudget(retry)))
+
+    async def main():
+        async with httpx.AsyncClient(transport=transport) as http_client:
+            return await http_client.get(FILE_INFO_URL)
+
+    response = asyncio.run(main())
+    assert response.status_code == 200
+    assert response.extensions[RETRIES_EXTENSION] == 2
@@ -0,0 +1,74 @@
+import re
+
+import httpx
+import pytest
+from daytona_sdk import DaytonaError, FileUpload, RetryConfig
+from daytona_sdk._utils.upload_batches import split_batches, upload_size
+
+_PATH_FIELD = re.compile(rb'name="files\[\d+\]\.path"\r\n\r\n([^\r]*)')
+
+
+class UploadServer:
+    """Mock toolbox that records the destinations of each upload request and fails those with bad files."""
+
+    def __init__(self, status: int = 500):
+        self.status = status
+        self.batches = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = request.read()
+        self.batches.append([path.decode() for path in _PATH_FIELD.findall(body)])
+        return httpx.Response(self.status if b"bad" in body else 200)
+
+
+def uploads(*names):
+    return [FileUpload(b"bad" if name.startswith("bad") else b"good", f"/data/{name}") for name in names]
+
+
+def test_failed_batch_is_split_until_bad_file_is_isolated(sandbox):
+    server = UploadServer()
+    with pytest.raises(DaytonaError, match=r"1 of 4 files could not be uploaded: /data/bad"):
+        sandbox(server).fs.upload_files(uploads("a", "bad", "c", "d"), max_concurrency=1)
+    assert server.batches == [
+        ["/data/a", "/data/bad", "/data/c", "/data/d"],
+        ["/data/a", "/data/bad"],
+        ["/data/a"],
+        ["/data/bad"],
+        ["/data/c", "/data/d"],
+    ]
+
+
+def test_batches_failing_for_all_files_are_not_split(sandbox):
+    server = UploadServer(status=403)
+    with pytest.raises(DaytonaError, match=r"2 of 2 files could not be uploaded"):
+        sandbox(server).fs.upload_files(uploads("a", "bad"), max_concurrency=1)
+    assert len(server.batches) == 1
+
+
+@pytest.mark.parametrize("retry", [RetryConfig(max_retries=0)])
+def test_batches_are_not_split_without_retries(sandbox):
+    server = UploadServer()
+    with pytest.raises(DaytonaError, match=r"2 of 2 files could not be uploaded"):
+        sandbox(server).fs.upload_files(uploads("a", "bad"), max_concurrency=1)
+    assert len(server.batches) == 1
+
+
+def test_batches_report_progress(local_sandbox, local_toolbox):
+    updates = []
+    files = [FileUpload(bytes(1000 + i), f"data/{i}.bin") for i in range(20)]
+
+    local_sandbox.fs.upload_files(files, max_concurrency=3, batch_files=5, batch_bytes=4000, progress=updates.append)
+
+    assert sorted(len(batch) for batch in local_toolbox.uploads) == [2] + [3] * 6
+    assert {update.destination for update in updates if update.done} == {f.destination for f in files}
+    last = updates[-1]
+    assert last.files_done == last.files_total == 20
+    assert last.bytes_sent == last.total_bytes == sum(1000 + i for i in range(20))
+    assert not any(update.error for update in updates)
+
+
+def test_split_batches_respects_limits():
+    files = uploads("a", "b", "c", "d") + [FileUpload(iter([b"stream"]), "/data/s"), FileUpload(b"x" * 10, "/data/big")]
+    sizes = [upload_size(f.source) for f in files]
+    assert sorted(split_batches(list(range(len(files))), files, sizes, 3, 8)) == [[0, 1], [2, 3], [4], [5]]
+    assert split_batches(list(range(4)), files, sizes, 3, 100) == [[0, 1, 2], [3]]
@@ -0,0 +1,80 @@
+import os
+import shutil
+
+import pytest
+from daytona_sdk import FileUpload, VolumeMount
+
+BLOB = os.urandom(100_000)
+
+
+def uploaded(toolbox):
+    return [os.path.relpath(path, toolbox.root) for batch in toolbox.uploads for path in batch]
+
+
+def read(root: str, path: str) -> bytes:
+    with open(os.path.join(root, path), "rb") as f:
+        return f.read()
+
+
+@pytest.fixture(name="wheel")
+def fixture_wheel(tmp_path):
+    path = tmp_path / "pkg.whl"
+    path.write_bytes(os.urandom(200_000))
+    return path
+
+
+def test_known_blobs_are_copied_instead_of_sent(local_sandbox, local_toolbox, wheel):
+    local_sandbox.fs.upload_dedup.enable()
+    local_sandbox.fs.upload_files([FileUpload(str(wheel), "a/pkg.whl"), FileUpload(BLOB, "a/blob.bin")])
+    assert len(os.listdir(os.path.join(local_toolbox.root, ".daytona", "blobs"))) == 2
+
+    local_toolbox.uploads.clear()
+    local_sandbox.fs.upload_files(
+        [FileUpload(str(wheel), "b/pkg.whl"), FileUpload(BLOB, "b/blob.bin"), FileUpload(b"small", "b/small.txt")]
+    )
+
+    # Files below the minimum size are always sent
+    assert uploaded(local_toolbox) == ["b/small.txt"]
+    assert read(local_toolbox.root, "b/pkg.whl") == wheel.read_bytes()
+    assert read(local_toolbox.root, "b/blob.bin") == BLOB
+
+
+def test_removed_blobs_are_sent_again(local_sandbox, local_toolbox, wheel):
+    local_sandbox.fs.upload_dedup.enable()
+    local_sandbox.fs.upload_file(str(wheel), "a/pkg.whl")
+    shutil.rmtree(os.path.join(local_toolbox.root, ".daytona"))
+
+    local_toolbox.uploads.clear()
+    local_sandbox.fs.upload_file(str(wheel), "b/pkg.whl")
+
+    assert uploaded(local_toolbox)
+    assert read(local_toolbox.root, "b/pkg.whl") == wheel.read_bytes()
+    assert len(os.listdir(os.path.join(local_toolbox.root, ".daytona", "blobs"))) == 1
+
+
+def test_volume_store_is_shared_by_sandboxes(local_sandbox, local_toolbox, sandbox):
+    volume = VolumeMount(volume_id="v1", mount_path=os.path.join(local_toolbox.root, "mnt"))
+    os.makedirs(volume.mount_path)
+    local_sandbox.fs.upload_dedup.enable(volume=volume, link=True)
+    local_sandbox.fs.upload_file(BLOB, "a/blob.bin")
+
+    other = sandbox(local_toolbox, root_dir=local_toolbox.root, id="sb2")
+    other.fs.upload_dedup.enable(volume=volume, link=True)
+    local_toolbox.uploads.clear()
+    other.fs.upload_file(BLOB, "b/blob.bin")
+
+    assert not local_toolbox.uploads
+    assert read(local_toolbox.root, "b/blob.bin") == BLOB
+    assert os.stat(os.path.join(local_toolbox.root, "b/blob.bin")).st_nlink == 2
+    assert len(os.listdir(os.path.join(volume.mount_path, ".daytona-blobs"))) == 1
+
+
+def test_disabled_dedup_sends_files(local_sandbox, local_toolbox):
+    local_sandbox.fs.upload_dedup.enable()
+    local_sandbox.fs.upload_file(BLOB, "a/blob.bin")
+    local_sandbox.fs.upload_dedup.disable()
+
+    local_toolbox.uploads.clear()
+    local_sandbox.fs.upload_file(BLOB, "b/blob.bin")
+
+    assert uploaded(local_toolbox) == ["b/blob.bin"]
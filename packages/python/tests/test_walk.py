@@ -0,0 +1,94 @@
+import os
+import threading
+import time
+
+import httpx
+import pytest
+from daytona_sdk import DaytonaError
+
+
+class SlowListings:
+    """Wraps a mock toolbox, delays directory listings and records how many are answered at the same time."""
+
+    def __init__(self, toolbox):
+        self.toolbox = toolbox
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if not (request.url.path.endswith("/files") and request.method == "GET"):
+            return self.toolbox(request)
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(0.02)
+            return self.toolbox(request)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+@pytest.fixture(name="tree")
+def fixture_tree(local_toolbox):
+    base = os.path.join(local_toolbox.root, "tree")
+    for i in range(5):
+        for j in range(5):
+            os.makedirs(os.path.join(base, f"d{i}", f"e{j}"))
+            with open(os.path.join(base, f"d{i}", f"e{j}", "f\tweird name.txt"), "w", encoding="utf-8") as f:
+                f.write("x" * j)
+    paths = {}
+    for directory, dirnames, filenames in os.walk(base):
+        for name in dirnames + filenames:
+            path = os.path.join(directory, name)
+            paths[path] = os.path.relpath(path, base).count(os.sep) + 1
+    return paths
+
+
+def walk(sandbox, path="tree", **kwargs):
+    return {entry.path: entry.depth for entry in sandbox.fs.walk(path, **kwargs)}
+
+
+def test_listings_fan_out(sandbox, local_toolbox, tree):
+    server = SlowListings(local_toolbox)
+    fs_sandbox = sandbox(server, root_dir=local_toolbox.root)
+
+    assert walk(fs_sandbox, find_threshold=None, concurrency=4) == tree
+    assert len(local_toolbox.info_requests) == 31 and not local_toolbox.commands
+    assert server.max_active == 4
+
+
+def test_find_fallback_walks_rest_of_tree(local_sandbox, local_toolbox, tree):
+    entries = list(local_sandbox.fs.walk("tree", find_threshold=0))
+
+    assert {entry.path: entry.depth for entry in entries} == tree
+    # The tree is listed by a find command, whose output is streamed from one staged file
+    assert not local_toolbox.info_requests and len({path for path, _ in local_toolbox.downloads}) == 1
+    file = next(entry for entry in entries if not entry.info.is_dir)
+    assert file.info.name == "f\tweird name.txt" and file.depth == 3
+    assert file.info.size == int(os.path.basename(os.path.dirname(file.path))[1:])
+
+    local_toolbox.downloads.clear()
+    assert walk(local_sandbox, max_depth=3, find_threshold=3) == tree
+    assert local_toolbox.info_requests and local_toolbox.downloads
+
+
+@pytest.mark.parametrize("find_threshold", [0, None])
+def test_max_depth(local_sandbox, tree, find_threshold):
+    expected = {path: depth for path, depth in tree.items() if depth <= 2}
+    assert walk(local_sandbox, max_depth=2, find_threshold=find_threshold) == expected
+
+
+def test_directories_come_before_their_entries(local_sandbox, tree):
+    seen = set()
+    for entry in local_sandbox.fs.walk("tree"):
+        assert os.path.dirname(entry.path) in seen or entry.depth == 1
+        seen.add(entry.path)
+    assert seen == set(tree)
+
+
+@pytest.mark.parametrize("find_threshold", [0, None])
+def test_missing_directory(local_sandbox, find_threshold):
+    with pytest.raises(DaytonaError):
+        walk(local_sandbox, "missing", find_threshold=find_threshold)